@@ -0,0 +1,84 @@
+"""
+Benchmark: derivatives by forward-mode AD versus central differences.
+
+Central differencing calls CalculatorEngine.calculate twice per variable
+and point; the gradient kernel returns the value and every partial
+derivative in one evaluation, for a single point or an array of points.
+Also reports the largest difference between the two derivatives.
+
+Usage:
+    python -m benchmarks.bench_autodiff [points]
+"""
+import math
+import sys
+import time
+
+from src.calculator.logic import kernel as kernel_module
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.logic.evaluator import SafeEvaluator
+from src.calculator.config.constants import ANGLE_MODE_RADIANS
+
+
+SOURCE = "x^2*y+sin(x*y)+e^(x/3)-sqrt(y+4)"
+VARIABLES = ("x", "y")
+STEP = 1e-6
+
+
+def build_points(count: int) -> list:
+    """Points (x, y) spread over [-2, 2] x [-1, 3]."""
+    return [(-2 + 4 * i / count, -1 + 4 * ((i * 7) % count) / count) for i in range(count)]
+
+
+def central_differences(engine: CalculatorEngine, points: list) -> list:
+    """Gradients by central differences on calculate() (2 calls per partial)."""
+    def value(x, y):
+        source = SOURCE.replace("x", f"({x!r})").replace("y", f"({y!r})")
+        return float(engine.calculate(source)["result"])
+
+    gradients = []
+    for x, y in points:
+        dx = (value(x + STEP, y) - value(x - STEP, y)) / (2 * STEP)
+        dy = (value(x, y + STEP) - value(x, y - STEP)) / (2 * STEP)
+        gradients.append((dx, dy))
+    return gradients
+
+
+def main():
+    """Print the time per gradient for each method."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    points = build_points(count)
+
+    engine = CalculatorEngine()
+    engine.evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+    start = time.perf_counter()
+    reference = central_differences(engine, points)
+    differencing = time.perf_counter() - start
+
+    evaluator = SafeEvaluator()
+    evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+    gradient_kernel = evaluator.compile_gradient(SOURCE, VARIABLES)
+    start = time.perf_counter()
+    pointwise = [gradient_kernel([x], [y]) for x, y in points]
+    single = time.perf_counter() - start
+
+    xs, ys = [x for x, _ in points], [y for _, y in points]
+    start = time.perf_counter()
+    _, (dx, dy) = gradient_kernel(xs, ys)
+    batched = time.perf_counter() - start
+
+    worst = max(
+        max(abs(a - float(b)), abs(c - float(d)))
+        for (a, c), b, d in zip(reference, dx, dy)
+    )
+    assert all(math.isfinite(values[0]) for values, _ in pointwise)
+
+    mode = "NumPy" if kernel_module.numpy_available() else "scalar"
+    print(f"points:               {count} ({mode} kernels)")
+    print(f"central differences:  {differencing / count * 1e6:10,.1f} us/gradient")
+    print(f"AD, one point a call: {single / count * 1e6:10,.1f} us/gradient")
+    print(f"AD, all points:       {batched / count * 1e6:10,.1f} us/gradient")
+    print(f"max |AD - differences|: {worst:.1e}")
+
+
+if __name__ == "__main__":
+    main()
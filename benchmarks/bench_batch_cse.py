@@ -0,0 +1,64 @@
+"""
+Benchmark: batch evaluation with common-subexpression elimination.
+
+Builds a corpus where costly subexpressions repeat heavily within and
+across lines, then compares calculate() per line against calculate_batch().
+
+Usage:
+    python -m benchmarks.bench_batch_cse [lines]
+"""
+import random
+import sys
+import time
+
+from src.calculator.logic.calculator import CalculatorEngine
+
+
+# Costly subexpressions shared by many lines
+SHARED_TERMS = [
+    "factorial(50)",
+    "factorial(120)/factorial(118)",
+    "sqrt(3^2+4^2)",
+    "sin(pi/180*30)^2+cos(pi/180*30)^2",
+    "ln(e^5)*log(1000)",
+]
+
+
+def build_corpus(lines: int, seed: int = 42) -> list:
+    """Build a corpus of expressions with heavy subexpression repetition."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(lines):
+        a, b = rng.sample(SHARED_TERMS, 2)
+        # Unique literal per line, so whole-line caching cannot help
+        corpus.append(f"({a})+({b})*{rng.randint(1, 10**6)}-({a})")
+    return corpus
+
+
+def main():
+    """Run the benchmark and print timings and hit rate."""
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    corpus = build_corpus(lines)
+
+    engine = CalculatorEngine()
+    start = time.perf_counter()
+    baseline = [engine.calculate(expression) for expression in corpus]
+    baseline_time = time.perf_counter() - start
+
+    engine = CalculatorEngine()
+    start = time.perf_counter()
+    batch = engine.calculate_batch(corpus)
+    batch_time = time.perf_counter() - start
+
+    assert batch["results"] == baseline, "batch results differ from calculate()"
+
+    stats = batch["stats"]
+    print(f"lines:            {lines}")
+    print(f"calculate():      {baseline_time:.3f} s ({lines / baseline_time:,.0f} lines/s)")
+    print(f"calculate_batch:  {batch_time:.3f} s ({lines / batch_time:,.0f} lines/s)")
+    print(f"speedup:          {baseline_time / batch_time:.2f}x")
+    print(f"subexpr hits:     {stats['hits']}/{stats['lookups']} ({stats['hit_rate']:.1%})")
+
+
+if __name__ == "__main__":
+    main()
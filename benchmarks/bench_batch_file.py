@@ -0,0 +1,61 @@
+"""
+Benchmark: lines per second for a large expression file.
+
+Compares a plain `for line in file: engine.calculate(line)` loop with the
+memory-mapped runner, in-process and with worker processes.
+
+Usage:
+    python -m benchmarks.bench_batch_file [lines] [workers]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from src.calculator.batch.runner import evaluate_file
+from src.calculator.logic.calculator import CalculatorEngine
+
+
+def write_corpus(path: str, lines: int, seed: int = 7) -> None:
+    """Write a file of mixed expressions, unique per line."""
+    rng = random.Random(seed)
+    templates = ["{a}+{b}*{c}", "sqrt({a})/{b}", "sin({a})^2+cos({a})^2", "({a}-{b})/({c}-{c})",
+                 "log({a})*ln({b})", "factorial(20)/{a}"]
+    with open(path, "w") as file:
+        for _ in range(lines):
+            template = rng.choice(templates)
+            file.write(template.format(a=rng.randint(1, 10**6), b=rng.randint(1, 999),
+                                       c=rng.randint(1, 99)) + "\n")
+
+
+def plain_loop(path: str, output) -> float:
+    """Evaluate line by line with ordinary iteration; returns seconds."""
+    engine = CalculatorEngine()
+    start = time.perf_counter()
+    with open(path) as file:
+        for line in file:
+            result = engine.calculate(line.strip())
+            output.write(((result["result"] if result["success"] else result["error"]) + "\n").encode())
+    return time.perf_counter() - start
+
+
+def main():
+    """Generate the corpus and print lines/s for each approach."""
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.txt")
+        write_corpus(path, lines)
+        with open(os.devnull, "wb") as sink:
+            plain = plain_loop(path, sink)
+            in_process = evaluate_file(path, sink, workers=0)
+            parallel = evaluate_file(path, sink, workers=workers)
+
+    print(f"{lines:,} lines, {workers} workers")
+    print(f"{'plain loop':<18}{lines / plain:>12,.0f} lines/s")
+    print(f"{'mmap in-process':<18}{in_process['lines_per_second']:>12,.0f} lines/s")
+    print(f"{'mmap parallel':<18}{parallel['lines_per_second']:>12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: columnar result file vs. JSON per line.
+
+Evaluates a corpus once, then writes the same results (offset, result or
+error, timing) as JSON lines and as a columnar file, and compares write
+time and file size. The columnar time includes building the ResultBlock,
+which the parallel pipeline already has for free.
+
+Usage:
+    python -m benchmarks.bench_columnar [lines]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from benchmarks.bench_batch_file import write_corpus
+from src.calculator.batch.columnar import ColumnarWriter, ColumnarFile
+from src.calculator.batch.reader import MappedFile, iter_lines
+from src.calculator.batch.transport import ResultBlock
+from src.calculator.logic.calculator import CalculatorEngine
+
+
+def evaluate(path: str) -> tuple:
+    """Evaluate a corpus; returns (results, offsets, timings in µs)."""
+    engine = CalculatorEngine()
+    results, offsets, timings = [], [], []
+    with MappedFile(path) as mapped:
+        for offset, expression in iter_lines(mapped.buffer, 0, len(mapped)):
+            start = time.perf_counter()
+            results.append(engine.calculate(expression))
+            timings.append((time.perf_counter() - start) * 1e6)
+            offsets.append(offset)
+    return results, offsets, timings
+
+
+def write_json_lines(path: str, results, offsets, timings) -> None:
+    with open(path, "w", encoding="utf-8") as output:
+        for result, offset, timing in zip(results, offsets, timings):
+            output.write(json.dumps(dict(result, offset=offset, time_us=timing),
+                                    ensure_ascii=False) + "\n")
+
+
+def write_columnar(path: str, results, offsets, timings) -> None:
+    block = ResultBlock.write(results, offsets, timings)
+    try:
+        with ColumnarWriter(path) as writer:
+            writer.append_block(block)
+    finally:
+        block.close()
+        block.unlink()
+
+
+def main():
+    """Print write time and size of both formats."""
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = os.path.join(directory, "corpus.txt")
+        write_corpus(corpus, lines)
+        data = evaluate(corpus)
+
+        rows = []
+        for name, writer, suffix in (("JSON lines", write_json_lines, ".jsonl"),
+                                     ("columnar", write_columnar, ".scol")):
+            path = os.path.join(directory, "results" + suffix)
+            start = time.perf_counter()
+            writer(path, *data)
+            rows.append((name, time.perf_counter() - start, os.path.getsize(path)))
+
+        start = time.perf_counter()
+        with ColumnarFile(os.path.join(directory, "results.scol")) as columns:
+            total = sum(columns.value)
+        read_time = time.perf_counter() - start
+
+    print(f"{lines:,} results")
+    for name, seconds, size in rows:
+        print(f"{name:<12}{seconds * 1000:>10.1f} ms {size / 2**20:>10.2f} MiB")
+    print(f"columnar: summed value column in {read_time * 1000:.1f} ms (sum {total:.3g})")
+
+
+if __name__ == "__main__":
+    main()
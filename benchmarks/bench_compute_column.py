@@ -0,0 +1,74 @@
+"""
+Benchmark: applying a formula to every row of a large CSV file.
+
+Compares a plain loop (csv module, calculate() with the row values
+substituted into the formula text) with compute_file (chunked parsing and
+one kernel call per chunk), in-process and with worker processes.
+
+Usage:
+    python -m benchmarks.bench_compute_column [rows] [workers]
+"""
+import csv
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from src.calculator.batch.runner import compute_file
+from src.calculator.logic.calculator import CalculatorEngine
+
+
+FORMULA = "sqrt(a^2+b^2)*sin(c)+ln(a)"
+
+
+def write_csv(path: str, rows: int, seed: int = 7) -> None:
+    """Write a CSV file with columns a, b, c (a few rows fail in ln)."""
+    rng = random.Random(seed)
+    with open(path, "w") as file:
+        file.write("a,b,c\n")
+        for _ in range(rows):
+            file.write(f"{rng.uniform(-1, 100):.6f},{rng.uniform(0, 100):.6f},"
+                       f"{rng.uniform(0, 360):.3f}\n")
+
+
+def plain_loop(path: str) -> float:
+    """Substitute every row into the formula and calculate(); returns seconds."""
+    engine = CalculatorEngine()
+    output = io.StringIO()
+    start = time.perf_counter()
+    with open(path, newline="") as file:
+        for row in csv.DictReader(file):
+            expression = FORMULA
+            for name, value in row.items():
+                expression = expression.replace(name, f"({value})")
+            result = engine.calculate(expression)
+            output.write((result["result"] if result["success"] else result["error"]) + "\n")
+    return time.perf_counter() - start
+
+
+def main():
+    """Print rows per second for each approach."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "data.csv")
+        write_csv(path, rows)
+        size = os.path.getsize(path) / 2 ** 20
+        print(f"rows: {rows:,} ({size:.1f} MiB), formula: {FORMULA}")
+
+        subset = os.path.join(directory, "subset.csv")
+        write_csv(subset, max(rows // 100, 1))  # The plain loop is much slower
+        seconds = plain_loop(subset) * 100
+        print(f"plain loop:         {seconds:8.2f} s extrapolated ({rows / seconds:,.0f} rows/s)")
+
+        for label, count in [("compute in-process", 0), (f"compute {workers} workers", workers)]:
+            with open(os.devnull, "wb") as output:
+                stats = compute_file(path, FORMULA, output, workers=count)
+            print(f"{label:<20}{stats['seconds']:8.2f} s ({stats['lines_per_second']:,.0f} rows/s, "
+                  f"{size / stats['seconds']:.0f} MiB/s, {stats['errors']:,} row errors)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark: lazy piecewise kernels versus arithmetic emulation.
+
+The emulation (x<0)*A + (x>=0)*B evaluates both branches at every point
+(and is undefined wherever either branch is); piecewise() evaluates each
+branch only on the points that select it. Both run as NumPy kernels
+when NumPy is installed, point by point otherwise.
+
+Usage:
+    python -m benchmarks.bench_conditional [points]
+"""
+import math
+import sys
+import time
+
+from src.calculator.logic import kernel as kernel_module
+from src.calculator.logic.evaluator import SafeEvaluator
+from src.calculator.config.constants import ANGLE_MODE_RADIANS
+
+
+# (label, condition, branch if true, branch if false) over x in [-1, 1]:
+# a costly branch taken on 10% of the points, and a branch undefined for x <= 0
+CASES = [
+    ("cheap + costly", "x>0.8", "sin(x)^2*e^(-x)+cos(3*x)*ln(1+x^2)+sqrt(1+x^4)", "x"),
+    ("domain-invalid branch", "x>0", "sqrt(x)*ln(x)", "-x"),
+]
+
+
+def time_best(function, repeats: int = 5) -> float:
+    """Best wall time of several runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    """Print time and number of undefined points per formulation."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    if not kernel_module.numpy_available():
+        count = min(count, 100_000)  # Point-by-point kernels
+    points = [-1 + 2 * i / count for i in range(count)]
+    if kernel_module.numpy_available():
+        import numpy as np
+        points = np.array(points)
+
+    evaluator = SafeEvaluator()
+    evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+    print(f"points: {count:,} ({'NumPy' if kernel_module.numpy_available() else 'scalar'} kernels)")
+    print(f"{'case':<24}{'piecewise ms':>14}{'emulated ms':>13}  undefined (piecewise / emulated)")
+    for label, condition, taken, otherwise in CASES:
+        lazy = evaluator.compile_kernel(f"if({condition}, {taken}, {otherwise})", ("x",))
+        emulated = evaluator.compile_kernel(
+            f"({condition})*({taken})+(1-({condition}))*({otherwise})", ("x",))
+        lazy_ms = time_best(lambda: lazy(points))
+        emulated_ms = time_best(lambda: emulated(points))
+        undefined = [sum(1 for value in compiled(points) if math.isnan(value))
+                     for compiled in (lazy, emulated)]
+        print(f"{label:<24}{lazy_ms:14.1f}{emulated_ms:13.1f}  {undefined[0]:,} / {undefined[1]:,}")
+
+
+if __name__ == "__main__":
+    main()
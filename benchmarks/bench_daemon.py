@@ -0,0 +1,81 @@
+"""
+Benchmark: cold start vs. the warm daemon.
+
+Reports median wall time per invocation for:
+- cold: `python -m src.calculator.repl --pipe` (interpreter + engine startup)
+- client: `python -m src.calculator.service.client` talking to a warm daemon
+- round trip: one request on an open daemon connection (no process startup)
+
+Usage:
+    python -m benchmarks.bench_daemon [runs]
+"""
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from src.calculator.service.client import DaemonClient
+
+EXPRESSION = "sqrt(2)*sin(45)+log(1000)"
+
+
+def time_process(command: list, stdin: str = "") -> float:
+    """Wall time of one subprocess run."""
+    start = time.perf_counter()
+    subprocess.run(command, input=stdin, capture_output=True, text=True, check=False)
+    return time.perf_counter() - start
+
+
+def wait_for_socket(path: str, timeout: float = 10.0) -> None:
+    """Block until the daemon socket exists."""
+    deadline = time.perf_counter() + timeout
+    while not os.path.exists(path):
+        if time.perf_counter() > deadline:
+            raise RuntimeError("daemon did not start")
+        time.sleep(0.01)
+
+
+def main():
+    """Start a daemon, run all three measurements and print medians."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    directory = tempfile.mkdtemp(prefix="scb")
+    socket_path = os.path.join(directory, "bench.sock")
+    daemon = subprocess.Popen(
+        [sys.executable, "-m", "src.calculator.service.daemon", "--socket", socket_path]
+    )
+    try:
+        wait_for_socket(socket_path)
+
+        cold = [
+            time_process([sys.executable, "-m", "src.calculator.repl", "--pipe"], EXPRESSION + "\n")
+            for _ in range(runs)
+        ]
+        client = [
+            time_process([sys.executable, "-m", "src.calculator.service.client",
+                          "--socket", socket_path, EXPRESSION])
+            for _ in range(runs)
+        ]
+
+        connection = DaemonClient(socket_path)
+        connection.calculate(EXPRESSION)  # Connect and warm the cache
+        round_trips = []
+        for _ in range(runs * 50):
+            start = time.perf_counter()
+            connection.calculate(EXPRESSION)
+            round_trips.append(time.perf_counter() - start)
+        connection.close()
+    finally:
+        daemon.terminate()
+        daemon.wait()
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"{'mode':<12}{'median ms':>12}")
+    print(f"{'cold':<12}{statistics.median(cold) * 1000:>12.2f}")
+    print(f"{'client':<12}{statistics.median(client) * 1000:>12.2f}")
+    print(f"{'round trip':<12}{statistics.median(round_trips) * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
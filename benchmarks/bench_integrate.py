@@ -0,0 +1,90 @@
+"""
+Benchmark: integrate() on smooth and oscillatory integrands.
+
+Compares the vectorized adaptive Gauss-Kronrod integration (NumPy
+kernels) with the same algorithm on the scalar fallback kernel (one
+Python call per node), and with scipy.integrate.quad on the scalar
+kernel when SciPy is installed.
+
+Usage:
+    python -m benchmarks.bench_integrate [repeats]
+"""
+import sys
+import time
+
+from src.calculator.logic import kernel as kernel_module
+from src.calculator.logic import quadrature
+from src.calculator.logic.evaluator import SafeEvaluator
+from src.calculator.config.constants import ANGLE_MODE_RADIANS
+
+
+# (label, integrand, lower, upper), radians mode
+INTEGRANDS = [
+    ("smooth: e^(-x^2)", "e^(-x^2)", -5, 5),
+    ("smooth: sqrt(1+x^3)", "sqrt(1+x^3)", 0, 4),
+    ("oscillatory: x*sin(50*x)", "x*sin(50*x)", 0, 10),
+    ("oscillatory: cos(200*x)*e^(-x)", "cos(200*x)*e^(-x)", 0, 20),
+    ("singular: 1/sqrt(x)", "1/sqrt(x)", 0, 1),
+]
+
+
+def time_best(function, repeats: int) -> float:
+    """Best wall time of several runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def scalar_kernels_of() -> dict:
+    """Scalar (pure Python) kernels of the integrands."""
+    saved = kernel_module._numpy_module
+    kernel_module._numpy_module = False
+    try:
+        evaluator = SafeEvaluator()
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        kernels = {source: evaluator.compile_kernel(source, ("x",)) for _, source, _, _ in INTEGRANDS}
+    finally:
+        kernel_module._numpy_module = saved
+    return kernels
+
+
+def main():
+    """Print timings, results and error estimates per integrand."""
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    evaluator = SafeEvaluator()
+    evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+    if not kernel_module.numpy_available():
+        print("NumPy is not installed; only the scalar kernel is measured")
+    scalar_kernels = scalar_kernels_of()
+
+    try:
+        from scipy.integrate import quad
+    except ImportError:
+        quad = None
+
+    header = f"{'integrand':<34}{'vector ms':>10}{'scalar ms':>11}{'quad ms':>9}  value / error estimate"
+    print(header)
+    for label, source, lower, upper in INTEGRANDS:
+        vector = evaluator.compile_kernel(source, ("x",))
+        scalar = scalar_kernels[source]
+        report = quadrature.integrate(vector, lower, upper)
+
+        vector_ms = time_best(lambda: quadrature.integrate(vector, lower, upper), repeats)
+        scalar_ms = time_best(lambda: quadrature.integrate(scalar, lower, upper), repeats)
+        if quad is not None:
+            point = lambda x: scalar([x])[0]
+            quad_ms = f"{time_best(lambda: quad(point, lower, upper, limit=2000), repeats):9.2f}"
+        else:
+            quad_ms = f"{'-':>9}"
+
+        print(f"{label:<34}{vector_ms:10.2f}{scalar_ms:11.2f}{quad_ms}  "
+              f"{report['value']:.12g} / {report['error_estimate']:.1e} "
+              f"({report['evaluations']} evaluations)")
+
+
+if __name__ == "__main__":
+    main()
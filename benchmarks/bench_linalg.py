@@ -0,0 +1,68 @@
+"""
+Benchmark: matrix operations on large matrices.
+
+Times det, inv, solve, eig and @ through CalculatorEngine.evaluator (the
+whole array goes to NumPy/LAPACK in one call), and compares the matrix
+product with a pure-Python triple loop extrapolated from a small size to
+show the per-element cost that the array path avoids.
+
+Usage:
+    python -m benchmarks.bench_linalg [n]
+"""
+import random
+import sys
+import time
+
+from src.calculator.logic import kernel as kernel_module
+from src.calculator.logic.calculator import CalculatorEngine
+
+
+def python_matmul_seconds(n: int) -> float:
+    """Seconds of a pure-Python n x n matrix product."""
+    rng = random.Random(1)
+    a = [[rng.random() for _ in range(n)] for _ in range(n)]
+    b = [[rng.random() for _ in range(n)] for _ in range(n)]
+    start = time.perf_counter()
+    columns = list(zip(*b))
+    [[sum(x * y for x, y in zip(row, column)) for column in columns] for row in a]
+    return time.perf_counter() - start
+
+
+def main():
+    """Print the time of each operation at size n."""
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    if not kernel_module.numpy_available():
+        print("NumPy is not installed: matrices are unavailable")
+        return
+
+    engine = CalculatorEngine()
+    evaluator = engine.evaluator
+    # A = n*I + 1/2 is well conditioned (diagonally dominant)
+    matrix = f"({n}*eye({n})+ones({n}, {n})/2)"
+    print(f"n = {n} ({n * n:,} elements)")
+    print(f"{'operation':<20}{'s':>10}  result")
+    for label, expression in [
+        ("build A", matrix),
+        ("det(A)/n^n", f"det({matrix}/{n})"),
+        ("inv(A)", f"inv({matrix})"),
+        ("solve(A, b)", f"solve({matrix}, ones({n}))"),
+        ("eig(A)", f"eig({matrix})"),
+        ("A @ A", f"{matrix}@{matrix}"),
+    ]:
+        start = time.perf_counter()
+        result = engine.calculate(expression)
+        seconds = time.perf_counter() - start
+        text = result["result"] or result["error"]
+        print(f"{label:<20}{seconds:10.3f}  {text[:60]}")
+
+    small = 120
+    python_seconds = python_matmul_seconds(small) * (n / small) ** 3
+    start = time.perf_counter()
+    evaluator.evaluate(f"{matrix}@{matrix}")
+    numpy_seconds = time.perf_counter() - start
+    print(f"A @ A pure Python (extrapolated from n={small}): {python_seconds:.1f} s, "
+          f"{python_seconds / numpy_seconds:.0f}x slower")
+
+
+if __name__ == "__main__":
+    main()
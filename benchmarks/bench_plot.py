@@ -0,0 +1,55 @@
+"""
+Benchmark: plot sampling of typical functions.
+
+Times CalculatorEngine.plot (compiled kernel, adaptive refinement, LTTB
+downsampling to 1000 points) per function against the 50 ms interactive
+target, and reports evaluations, returned points and gaps. The baseline is
+a uniform grid of the same number of evaluations through evaluate().
+
+Usage:
+    python -m benchmarks.bench_plot [repeats]
+"""
+import math
+import sys
+import time
+
+from src.calculator.logic.calculator import CalculatorEngine
+
+FUNCTIONS = [
+    ("sin(x)", -360, 360),
+    ("tan(x)", -360, 360),
+    ("1/x", -5, 5),
+    ("sqrt(x)", -4, 4),
+    ("x^3 - 2*x", -3, 3),
+    ("ln(x)", -1, 5),
+    ("sin(1/x)", -1, 1),
+    ("1/(x^2 - 1)", -3, 3),
+]
+
+
+def main():
+    """Print the best time of each plot and of the point-by-point baseline."""
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    engine = CalculatorEngine()
+    print(f"{'function':<14}{'ms':>8}{'evals':>8}{'points':>8}{'gaps':>6}{'baseline ms':>13}")
+    for expression, lower, upper in FUNCTIONS:
+        best = math.inf
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = engine.plot(expression, lower, upper)
+            best = min(best, time.perf_counter() - start)
+        gaps = sum(1 for y in result["y"] if math.isnan(y))
+
+        count = result["evaluations"]
+        step = (upper - lower) / (count - 1)
+        start = time.perf_counter()
+        for i in range(count):
+            engine.evaluator.evaluate(expression, {"x": lower + i * step})
+        baseline = time.perf_counter() - start
+        flag = "" if best < 0.05 else "  (over 50 ms)"
+        print(f"{expression:<14}{best * 1e3:8.2f}{count:8}{len(result['x']):8}{gaps:6}"
+              f"{baseline * 1e3:13.1f}{flag}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: expanded polynomials with and without Horner evaluation.
+
+Times random expanded polynomials (a*x^n + ... + z) of growing degree,
+evaluated at single points through SafeEvaluator.evaluate and over many
+points through compiled kernels. The baseline is the same tree with
+polynomial recognition turned off (every power computed separately).
+Also times products of long polynomials.
+
+Usage:
+    python -m benchmarks.bench_polynomial [points]
+"""
+import random
+import sys
+import time
+from unittest import mock
+
+from src.calculator.logic import optimizer as optimizer_module
+from src.calculator.logic.evaluator import SafeEvaluator
+from src.calculator.logic.polynomial import Polynomial
+
+
+def expression(degree: int, rng: random.Random) -> str:
+    """Random expanded polynomial of the given degree."""
+    terms = [f"{rng.randint(1, 9)}*x^{k}" for k in range(degree, 1, -1)]
+    return " + ".join(terms + [f"{rng.randint(1, 9)}*x", str(rng.randint(1, 9))])
+
+
+def measure(source: str, points) -> tuple:
+    """(seconds per evaluate call, seconds per kernel call) on a fresh evaluator."""
+    evaluator = SafeEvaluator()
+    evaluator.evaluate(source, {"x": 0.5})
+    calls = 200
+    start = time.perf_counter()
+    for i in range(calls):
+        evaluator.evaluate(source, {"x": 1 + i / calls})
+    single = (time.perf_counter() - start) / calls
+
+    kernel = evaluator.compile_kernel(source, ("x",))
+    kernel(points[:10])
+    start = time.perf_counter()
+    kernel(points)
+    return single, time.perf_counter() - start
+
+
+def main():
+    """Print evaluate and kernel times per degree, then product times."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(3)
+    step = 2.0 / count
+    points = [-1 + i * step for i in range(count)]
+    try:
+        import numpy
+        points = numpy.asarray(points)
+    except ImportError:
+        print("NumPy is not installed: kernels run point by point")
+
+    print(f"points per kernel call: {count:,}")
+    print(f"{'degree':>6}{'evaluate us':>14}{'baseline':>10}{'kernel ms':>12}{'baseline':>10}")
+    for degree in (3, 8, 20, 50):
+        source = expression(degree, rng)
+        single, vector = measure(source, points)
+        # Baseline: never recognize polynomials
+        with mock.patch.object(optimizer_module, "from_tree", lambda node, cache=None: None):
+            plain_single, plain_vector = measure(source, points)
+        print(f"{degree:>6}{single * 1e6:14.1f}{plain_single * 1e6:10.1f}"
+              f"{vector * 1e3:12.1f}{plain_vector * 1e3:10.1f}")
+
+    print(f"{'product degree':>14}{'ms (float)':>12}{'ms (int)':>10}")
+    for degree in (100, 1000, 5000):
+        floats = [Polynomial([rng.random() for _ in range(degree + 1)]) for _ in range(2)]
+        ints = [Polynomial([rng.randint(-99, 99) for _ in range(degree + 1)]) for _ in range(2)]
+        timings = []
+        for a, b in (floats, ints):
+            start = time.perf_counter()
+            a * b
+            timings.append(time.perf_counter() - start)
+        print(f"{2 * degree:>14}{timings[0] * 1e3:12.2f}{timings[1] * 1e3:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
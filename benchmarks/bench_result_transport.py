@@ -0,0 +1,117 @@
+"""
+Benchmark: returning batch results from worker processes.
+
+Workers hold precomputed, distinct calculate() results (evaluation is
+excluded; repeated objects would let pickle memoize them) and send them to the parent either as a pickled list of dicts or as a shared
+memory ResultBlock. The parent touches every result value in both cases.
+
+Reported separately: the per-chunk cost in the worker (pickle.dumps vs.
+ResultBlock.write), which parallelizes over workers, and in the parent
+(pickle.loads + reading vs. attaching + reading columns), which does not.
+
+Usage:
+    python -m benchmarks.bench_result_transport [results] [chunk]
+"""
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.calculator.batch.transport import ResultBlock
+from src.calculator.logic.calculator import CalculatorEngine
+
+TEMPLATES = ["{n}/7", "sqrt({n})", "{n}/0", "2^{n}", "sin({n})", "({n}+1", "ln({n})", "{n}*3"]
+
+_results = []
+
+
+def _init(count: int):
+    """Precompute the distinct results a worker sends."""
+    engine = CalculatorEngine()
+    _results.extend(
+        engine.calculate(TEMPLATES[n % len(TEMPLATES)].format(n=n % 400 + n // 8))
+        for n in range(count)
+    )
+
+
+def _chunk_results(count: int) -> list:
+    return _results[:count]
+
+
+def send_pickled(count: int) -> list:
+    """Worker: return the result dicts themselves."""
+    return _chunk_results(count)
+
+
+def send_block(count: int) -> str:
+    """Worker: write a ResultBlock and return its name."""
+    block = ResultBlock.write(_chunk_results(count), list(range(count)))
+    name = block.name
+    block.close()
+    return name
+
+
+def run(pool, task, total: int, chunk: int, read) -> float:
+    """Move `total` results in chunks; returns seconds."""
+    start = time.perf_counter()
+    for payload in pool.map(task, [chunk] * (total // chunk)):
+        read(payload)
+    return time.perf_counter() - start
+
+
+def read_pickled(results: list) -> None:
+    for result in results:
+        result["result"] if result["success"] else result["error"]
+
+
+def read_block(name: str) -> None:
+    with ResultBlock.attach(name) as block:
+        sum(block.values)  # Numeric column, read in place
+        block.error_count()
+
+
+def stage_timings(chunk: int) -> dict:
+    """Time worker and parent side of one chunk in this process."""
+    _init(chunk)
+    results = _chunk_results(chunk)
+
+    start = time.perf_counter()
+    payload = pickle.dumps(results)
+    pickled_worker = time.perf_counter() - start
+    start = time.perf_counter()
+    read_pickled(pickle.loads(payload))
+    pickled_parent = time.perf_counter() - start
+
+    start = time.perf_counter()
+    name = send_block(chunk)
+    shared_worker = time.perf_counter() - start
+    start = time.perf_counter()
+    read_block(name)
+    shared_parent = time.perf_counter() - start
+
+    _results.clear()
+    return {
+        "pickled dicts": (pickled_worker, pickled_parent),
+        "shared memory": (shared_worker, shared_parent),
+    }
+
+
+def main():
+    """Print per-stage and end-to-end timings for both transports."""
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    chunk = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+
+    print(f"one chunk of {chunk:,} results (ms)   worker   parent")
+    for name, (worker, parent) in stage_timings(chunk).items():
+        print(f"  {name:<30}{worker * 1000:>8.1f}{parent * 1000:>9.1f}")
+
+    with ProcessPoolExecutor(max_workers=2, initializer=_init, initargs=(chunk,)) as pool:
+        list(pool.map(send_pickled, [1] * 8))  # Start and initialize the workers
+        pickled = run(pool, send_pickled, total, chunk, read_pickled)
+        shared = run(pool, send_block, total, chunk, read_block)
+    print(f"end to end, {total:,} results, 2 workers")
+    print(f"{'pickled dicts':<16}{pickled:>8.2f} s {total / pickled:>14,.0f} results/s")
+    print(f"{'shared memory':<16}{shared:>8.2f} s {total / shared:>14,.0f} results/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: sum() and prod() over long index ranges.
+
+Series with a recognized term (arithmetic, geometric) are evaluated in
+closed form; the others run on a kernel in fixed-size chunks. Compares
+NumPy kernels with the scalar fallback kernel (same chunks, one Python
+call per term) and reports the peak memory of the chunked evaluation.
+
+Usage:
+    python -m benchmarks.bench_series [terms]
+"""
+import sys
+import time
+import tracemalloc
+
+from src.calculator.logic import kernel as kernel_module
+from src.calculator.logic.evaluator import SafeEvaluator
+from src.calculator.config.constants import ANGLE_MODE_RADIANS
+
+
+# (label, expression template with {n} terms)
+SERIES = [
+    ("arithmetic (closed form)", "sum(3*k+1, k, 1, {n})"),
+    ("geometric (closed form)", "sum(0.999^k, k, 0, {n})"),
+    ("basel", "sum(1/k^2, k, 1, {n})"),
+    ("alternating log", "sum((-1)^k*ln(k)/k, k, 1, {n})"),
+    ("wallis product", "prod(4*k^2/(4*k^2-1), k, 1, {n})"),
+]
+
+
+def run(expression: str, vectorized: bool) -> tuple:
+    """Evaluate once; returns (seconds, peak traced MiB, result, closed form)."""
+    saved = kernel_module._numpy_module
+    if not vectorized:
+        kernel_module._numpy_module = False
+    try:
+        evaluator = SafeEvaluator()
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = evaluator.evaluate(expression)
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+        value = result["result"] if result["success"] else result["error"]
+        report = evaluator.last_series
+        return seconds, peak, value, report is not None and report["closed_form"] is not None
+    finally:
+        kernel_module._numpy_module = saved
+
+
+def main():
+    """Print time, peak memory and value per series."""
+    terms = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 8
+    scalar_terms = max(terms // 100, 1)  # The scalar path is much slower
+
+    print(f"terms: {terms:,} (scalar: {scalar_terms:,}, extrapolated)")
+    print(f"{'series':<26}{'vector s':>10}{'peak MiB':>10}{'scalar s':>10}  value")
+    for label, template in SERIES:
+        if kernel_module.numpy_available():
+            seconds, peak, value, _ = run(template.format(n=terms), vectorized=True)
+            vector = f"{seconds:10.3f}{peak:10.1f}"
+        else:
+            vector, value = f"{'-':>10}{'-':>10}", "-"
+        closed = run(template.format(n=10), vectorized=False)[3]  # Does not depend on n
+        if closed:
+            scalar = run(template.format(n=terms), vectorized=False)[0]
+        else:
+            scalar = run(template.format(n=scalar_terms), vectorized=False)[0] * terms / scalar_terms
+        print(f"{label:<26}{vector}{scalar:10.3f}  {value}")
+
+
+if __name__ == "__main__":
+    main()
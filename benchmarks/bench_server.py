@@ -0,0 +1,97 @@
+"""
+Load generator for the network calculation service.
+
+Starts `python -m src.calculator.service.server` on a free port, opens
+several connections that each keep a window of pipelined requests in flight,
+and reports throughput and latency percentiles. Every `heavy_every`-th
+request is a large power (offloaded to the process pool); 0 sends only
+cheap requests and measures the event loop alone.
+
+Usage:
+    python -m benchmarks.bench_server [connections] [requests_per_connection] [depth] [heavy_every]
+"""
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+CHEAP = "sqrt(2)*sin({n})+log(1000)/{n}"
+HEAVY = "2^200000+{n}"
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    index = min(len(samples) - 1, int(fraction * len(samples)))
+    return samples[index]
+
+
+async def connection(host: str, port: int, count: int, depth: int, heavy_every: int,
+                     latencies: list) -> None:
+    """Send `count` requests keeping up to `depth` in flight."""
+    reader, writer = await asyncio.open_connection(host, port)
+    sent_at = {}
+    window = asyncio.Semaphore(depth)
+
+    async def send():
+        for n in range(1, count + 1):
+            await window.acquire()
+            heavy = heavy_every and n % heavy_every == 0
+            expression = (HEAVY if heavy else CHEAP).format(n=n)
+            sent_at[n] = time.perf_counter()
+            writer.write(json.dumps({"id": n, "expression": expression}).encode() + b"\n")
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for _ in range(count):
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - sent_at.pop(response["id"]))
+        window.release()
+    await sender
+    writer.close()
+    await writer.wait_closed()
+
+
+async def load(host: str, port: int, connections: int, count: int, depth: int,
+               heavy_every: int) -> tuple:
+    """Run all connections concurrently; returns (elapsed, latencies)."""
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        connection(host, port, count, depth, heavy_every, latencies) for _ in range(connections)
+    ))
+    return time.perf_counter() - start, latencies
+
+
+def main():
+    """Start the server, run the load and print the summary."""
+    connections = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    depth = int(sys.argv[3]) if len(sys.argv) > 3 else 32
+    heavy_every = int(sys.argv[4]) if len(sys.argv) > 4 else 50
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "src.calculator.service.server", "--port", "0"],
+        stdout=subprocess.PIPE, text=True
+    )
+    try:
+        host, port = server.stdout.readline().strip().rsplit(":", 1)
+        elapsed, latencies = asyncio.run(load(host, int(port), connections, count, depth, heavy_every))
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"{total} requests, {connections} connections, pipeline depth {depth}, "
+          f"heavy every {heavy_every or 'never'}")
+    print(f"throughput   {total / elapsed:>10.0f} req/s")
+    print(f"latency p50  {statistics.median(latencies) * 1000:>10.2f} ms")
+    print(f"latency p99  {percentile(latencies, 0.99) * 1000:>10.2f} ms")
+    print(f"latency p999 {percentile(latencies, 0.999) * 1000:>10.2f} ms")
+    print(f"latency max  {latencies[-1] * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
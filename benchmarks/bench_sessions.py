@@ -0,0 +1,49 @@
+"""
+Benchmark: memory and throughput of 100,000 concurrent headless sessions.
+
+Every session types "12+sin(30)" and presses =, so each holds an expression
+and one history entry. Memory is measured with tracemalloc and compared with
+SESSION_MEMORY_BUDGET.
+
+Usage:
+    python -m benchmarks.bench_sessions [sessions]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from src.calculator.config.constants import SESSION_MEMORY_BUDGET
+from src.calculator.service.sessions import SessionStore
+
+LABELS = ("1", "2", "+", "sin", "3", "0", ")", "=")
+
+
+def main():
+    """Drive all sessions and print memory and click rate."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    store = SessionStore()
+    for label in LABELS:
+        store.on_button_click(-1, label)  # Warm the shared engine
+    store.remove(-1)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for session_id in range(count):
+        for label in LABELS:
+            store.on_button_click(session_id, label)
+    elapsed = time.perf_counter() - start
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    per_session = used / count
+    print(f"sessions          {len(store):>12,}")
+    print(f"memory            {used / 2**20:>12.1f} MiB")
+    print(f"per session       {per_session:>12.0f} B   (budget {SESSION_MEMORY_BUDGET} B)")
+    print(f"clicks/s          {count * len(LABELS) / elapsed:>12,.0f}   (under tracemalloc)")
+    sys.exit(0 if per_session < SESSION_MEMORY_BUDGET else 1)
+
+
+if __name__ == "__main__":
+    main()
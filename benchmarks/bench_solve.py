@@ -0,0 +1,79 @@
+"""
+Benchmark: solving many equations f(x) = 0 for all roots in an interval.
+
+Each formula is compiled once, sampled on the bracketing grid and its
+brackets refined with Brent's method. Compares NumPy kernels (grid and
+all brackets vectorized) with the scalar fallback kernel (same algorithm,
+one Python call per point).
+
+Usage:
+    python -m benchmarks.bench_solve [formulas]
+"""
+import random
+import sys
+import time
+
+from src.calculator.logic import kernel as kernel_module
+from src.calculator.logic.evaluator import SafeEvaluator
+from src.calculator.logic.roots import find_roots
+from src.calculator.config.constants import ANGLE_MODE_RADIANS
+
+
+# Formula templates: polynomial, trig, masked domains (ln, sqrt), poles
+TEMPLATES = [
+    "x^3-{a}*x+{b}",
+    "sin({a}*x)-{b}/10",
+    "ln(x)-{b}/3",
+    "sqrt(x+{a})-{b}",
+    "1/(x-{a})+{b}",
+    "cos(x)*e^(-x/{a})-0.01*{b}",
+]
+
+
+def build_formulas(count: int, seed: int = 7) -> list:
+    """Random formulas from the templates."""
+    rng = random.Random(seed)
+    return [
+        rng.choice(TEMPLATES).format(a=rng.randint(1, 9), b=rng.randint(1, 9))
+        for _ in range(count)
+    ]
+
+
+def solve_all(formulas: list, vectorized: bool) -> tuple:
+    """Solve every formula on [-10, 10]; returns (seconds, roots found)."""
+    saved = kernel_module._numpy_module
+    if not vectorized:
+        kernel_module._numpy_module = False
+    try:
+        evaluator = SafeEvaluator()
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        start = time.perf_counter()
+        found = 0
+        for formula in formulas:
+            kernel = evaluator.compile_kernel(formula, ("x",))
+            found += len(find_roots(kernel, -10, 10)["roots"])
+        return time.perf_counter() - start, found
+    finally:
+        kernel_module._numpy_module = saved
+
+
+def main():
+    """Print the time per formula for both kernels."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    formulas = build_formulas(count)
+
+    print(f"formulas:  {count}")
+    if kernel_module.numpy_available():
+        seconds, found = solve_all(formulas, vectorized=True)
+        print(f"vectorized: {seconds:.3f} s ({seconds / count * 1e6:,.0f} us/formula), {found} roots")
+    else:
+        print("vectorized: NumPy is not installed")
+
+    subset = formulas[:max(count // 10, 1)]  # The scalar path is much slower
+    seconds, found = solve_all(subset, vectorized=False)
+    print(f"scalar:     {seconds / len(subset) * count:.3f} s extrapolated "
+          f"({seconds / len(subset) * 1e6:,.0f} us/formula on {len(subset)} formulas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: GUI startup for the eager and the lazy window design.
+
+Each run happens in a fresh interpreter and reports:
+- import time of the window module (customtkinter + UI modules)
+- construction time of CalculatorWindow
+- time to first paint (window mapped and first update processed)
+
+Requires a display (e.g. run under xvfb-run on headless machines).
+
+Usage:
+    python -m benchmarks.bench_startup [runs]
+"""
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+
+def measure(lazy: bool) -> dict:
+    """Measure one startup in the current interpreter."""
+    start = time.perf_counter()
+    from src.calculator.ui.calculator_window import CalculatorWindow
+    imported = time.perf_counter()
+
+    window = CalculatorWindow(lazy=lazy)
+    constructed = time.perf_counter()
+
+    # First paint: process events until the window is mapped and drawn
+    window.update()
+    while not window.winfo_viewable():
+        window.update()
+    painted = time.perf_counter()
+
+    window.destroy()
+    return {
+        "import": imported - start,
+        "construct": constructed - imported,
+        "first_paint": painted - start,
+    }
+
+
+def run_child(lazy: bool) -> dict:
+    """Run measure() in a fresh interpreter so imports are cold."""
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--child", "lazy" if lazy else "eager"],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    """Run both designs and print median timings."""
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        print(json.dumps(measure(sys.argv[2] == "lazy")))
+        return
+
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    try:
+        results = {
+            design: [run_child(design == "lazy") for _ in range(runs)]
+            for design in ("eager", "lazy")
+        }
+    except subprocess.CalledProcessError as error:
+        print("Startup benchmark needs a display:", error.stderr.strip().splitlines()[-1])
+        sys.exit(1)
+
+    print(f"{'design':<8}{'import':>12}{'construct':>12}{'first paint':>14}   (median of {runs}, ms)")
+    for design, samples in results.items():
+        row = {key: statistics.median(s[key] for s in samples) * 1000 for key in samples[0]}
+        print(f"{design:<8}{row['import']:>12.1f}{row['construct']:>12.1f}{row['first_paint']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: statistics over a large data file, streamed in one pass.
+
+Writes a file of lognormal values, then computes the mean, standard
+deviation and percentiles with CalculatorEngine.statistic (memory-mapped,
+chunked parsing, t-digest quantiles). Reports throughput, the peak traced
+memory of one pass and the quantile error against exact values from a
+full sort.
+
+Usage:
+    python -m benchmarks.bench_statistics [values]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src.calculator.logic import kernel as kernel_module
+from src.calculator.logic.calculator import CalculatorEngine
+
+
+def write_values(path: str, count: int, seed: int = 11) -> list:
+    """Write `count` lognormal values, one per line; returns them sorted."""
+    rng = random.Random(seed)
+    values = [rng.lognormvariate(0, 1) for _ in range(count)]
+    with open(path, "w") as file:
+        file.write("\n".join(repr(value) for value in values))
+    return sorted(values)
+
+
+def run(engine: CalculatorEngine, path: str, name: str, p=None) -> tuple:
+    """Compute one statistic; returns (seconds, result)."""
+    start = time.perf_counter()
+    result = engine.statistic(name, path, p=p)
+    return time.perf_counter() - start, result
+
+
+def peak_memory(engine: CalculatorEngine, path: str) -> float:
+    """Peak traced MiB of one pass (tracing slows parsing, so timed apart)."""
+    tracemalloc.start()
+    engine.statistic("median", path)
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Print time, memory and accuracy per statistic."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3_000_000
+    if not kernel_module.numpy_available():
+        print("NumPy is not installed: the scalar path parses line by line")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "values.txt")
+        ordered = write_values(path, count)
+        size = os.path.getsize(path) / 2 ** 20
+        print(f"values: {count:,} ({size:.1f} MiB file)")
+        engine = CalculatorEngine()
+        print(f"peak memory per pass: {peak_memory(engine, path):.1f} MiB")
+        print(f"{'statistic':<16}{'s':>8}{'MiB/s':>8}{'rel. error':>12}  result")
+        for name, p in [("mean", None), ("stdev", None), ("median", None),
+                        ("percentile", 1), ("percentile", 99), ("percentile", 99.9)]:
+            seconds, result = run(engine, path, name, p)
+            error = ""
+            if p is not None or name == "median":
+                exact = ordered[round((50 if p is None else p) / 100 * (count - 1))]
+                error = f"{abs(float(result['result']) - exact) / exact:12.1e}"
+            label = name if p is None else f"{name}({p})"
+            print(f"{label:<16}{seconds:8.2f}{size / seconds:8.0f}{error:>12}  "
+                  f"{result['result'] or result['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""
+Batch module - Parallel evaluation of large expression files.
+"""
@@ -0,0 +1,271 @@
+"""
+Compact binary columnar file for batch results.
+Fixed header followed by one contiguous, 8-byte aligned region per column,
+all little-endian, so the file can be memory-mapped and each column viewed
+in place (memoryview casts, or numpy.memmap with the dtypes below).
+
+Header (128 bytes):
+    magic           8s      b"SCICOL01"
+    row_count       int64
+    arena_size      int64
+    column offsets  int64 x 6, in COLUMNS order
+
+Columns (row codes and the string arena as in transport.ResultBlock):
+    input_offset    int64[n]        byte offset of the input line
+    value           float64[n]      numeric result or positional error argument
+    timing          float32[n]      evaluation time in microseconds
+    text_offset     int64[n + 1]    row i text is arena[text_offset[i]:text_offset[i + 1]]
+    code            uint8[n]
+    arena           uint8[arena_size]
+"""
+
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from src.calculator.batch.transport import decode_result
+
+
+MAGIC = b"SCICOL01"
+HEADER_SIZE = 128
+
+# Column name -> (array typecode, NumPy dtype)
+COLUMNS = {
+    "input_offset": ("q", "<i8"),
+    "value": ("d", "<f8"),
+    "timing": ("f", "<f4"),
+    "text_offset": ("q", "<i8"),
+    "code": ("B", "u1"),
+    "arena": ("B", "u1"),
+}
+
+_HEADER = struct.Struct("<8sqq6q")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _align(position: int) -> int:
+    """Round a file position up to a multiple of 8."""
+    return (position + 7) & ~7
+
+
+class ColumnarWriter:
+    """
+    Streams ResultBlocks into a columnar file.
+
+    Each column is appended to its own spill file next to the output while
+    blocks arrive (the row count is unknown until the end); close() writes
+    the header and concatenates the spills with sequential copies into a
+    temporary file, which then replaces the output. Leaving a with block
+    through an exception discards the spills and writes no output, so a
+    failed run never leaves a well-formed but truncated file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Start a new file.
+
+        Args:
+            path: Output path (written on close, never on discard)
+        """
+        self.path = path
+        self.row_count = 0
+        self.arena_size = 0
+        self._directory = tempfile.mkdtemp(prefix=".scicol-", dir=os.path.dirname(path) or ".")
+        self._spills = {
+            name: open(os.path.join(self._directory, name), "w+b") for name in COLUMNS
+        }
+        self._spills["text_offset"].write(array("q", [0]).tobytes())
+
+    def append_block(self, block) -> None:
+        """
+        Append the rows of a ResultBlock.
+
+        Args:
+            block: Attached transport.ResultBlock
+        """
+        spills = self._spills
+        spills["input_offset"].write(_little(block.line_offsets))
+        spills["value"].write(_little(block.values))
+        spills["timing"].write(_little(block.timings))
+        spills["code"].write(block.codes)
+        spills["arena"].write(block.arena)
+
+        # Text offsets are relative to the block arena; rebase onto the file arena
+        base = self.arena_size
+        rebased = array("q", block.text_offsets[1:])
+        if base:
+            rebased = array("q", [offset + base for offset in rebased])
+        spills["text_offset"].write(_little(rebased))
+
+        self.row_count += len(block)
+        self.arena_size += len(block.arena)
+
+    def close(self) -> None:
+        """Write the header and the columns, then remove the spill files."""
+        positions = []
+        position = HEADER_SIZE
+        for name in COLUMNS:
+            positions.append(position)
+            position = _align(position + self._spills[name].tell())
+
+        # Written next to the spills, then renamed: the output appears complete or not at all
+        partial = os.path.join(self._directory, "output")
+        try:
+            with open(partial, "wb") as output:
+                output.write(_HEADER.pack(MAGIC, self.row_count, self.arena_size, *positions)
+                             .ljust(HEADER_SIZE, b"\0"))
+                for name, start in zip(COLUMNS, positions):
+                    output.write(b"\0" * (start - output.tell()))
+                    spill = self._spills[name]
+                    spill.seek(0)
+                    shutil.copyfileobj(spill, output)
+            os.replace(partial, self.path)
+        finally:
+            self.discard()
+
+    def discard(self) -> None:
+        """Remove the spill files without writing the output."""
+        for spill in self._spills.values():
+            spill.close()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def _little(column) -> bytes:
+    """Column bytes in little-endian order."""
+    if _LITTLE_ENDIAN:
+        return column
+    typecode = column.typecode if isinstance(column, array) else column.format
+    swapped = array(typecode, column)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def read_header(buffer) -> dict:
+    """
+    Parse the header of a columnar file.
+
+    Args:
+        buffer: File contents (mmap or bytes)
+
+    Returns:
+        dict: row_count, arena_size and the byte position of every column
+
+    Raises:
+        ValueError: If the buffer is not a columnar result file
+    """
+    if len(buffer) < HEADER_SIZE:
+        raise ValueError("not a SciCalc columnar file")
+    magic, row_count, arena_size, *positions = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("not a SciCalc columnar file")
+    header = {"row_count": row_count, "arena_size": arena_size}
+    header.update(zip(COLUMNS, positions))
+    return header
+
+
+def _lengths(header: dict) -> dict:
+    """Number of items of each column."""
+    count = header["row_count"]
+    return {
+        "input_offset": count, "value": count, "timing": count,
+        "text_offset": count + 1, "code": count, "arena": header["arena_size"],
+    }
+
+
+class ColumnarFile:
+    """
+    Memory-mapped columnar file with zero-copy column views.
+
+    Column views are zero-copy on little-endian hosts; on big-endian hosts
+    the multi-byte columns are read into byte-swapped arrays instead.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a columnar file.
+
+        Args:
+            path: File written by ColumnarWriter
+        """
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        header = read_header(self._mmap)
+        self._count = header["row_count"]
+        view = memoryview(self._mmap)
+        self._views = [view]
+        for name, length in _lengths(header).items():
+            typecode = COLUMNS[name][0]
+            start = header[name]
+            size = length * struct.calcsize(typecode)
+            if _LITTLE_ENDIAN or struct.calcsize(typecode) == 1:
+                column = view[start:start + size].cast(typecode)
+                self._views.append(column)
+            else:
+                column = array(typecode)
+                with view[start:start + size] as region:
+                    column.frombytes(region)
+                column.byteswap()
+            setattr(self, name, column)
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return self._count
+
+    def text(self, row: int) -> str:
+        """Arena text of a row."""
+        return bytes(self.arena[self.text_offset[row]:self.text_offset[row + 1]]).decode("utf-8")
+
+    def result(self, row: int) -> dict:
+        """Result of a row in CalculatorEngine format."""
+        return decode_result(self.code[row], self.value[row], self.text(row))
+
+    def close(self) -> None:
+        """Release the views and unmap the file."""
+        for view in reversed(self._views):
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_numpy(path: str) -> dict:
+    """
+    Open every column of a columnar file as a read-only numpy.memmap.
+
+    NumPy is an optional dependency, imported only here.
+
+    Args:
+        path: File written by ColumnarWriter
+
+    Returns:
+        dict: Column name -> numpy.memmap (empty arrays for empty columns)
+    """
+    import numpy as np
+
+    with open(path, "rb") as file:
+        header = read_header(file.read(HEADER_SIZE))
+    columns = {}
+    for name, length in _lengths(header).items():
+        dtype = COLUMNS[name][1]
+        if length:
+            columns[name] = np.memmap(path, dtype=dtype, mode="r", offset=header[name],
+                                      shape=(length,))
+        else:  # Zero-length regions cannot be mapped
+            columns[name] = np.empty(0, dtype=dtype)
+    return columns
@@ -0,0 +1,146 @@
+"""
+Numeric data files read in bounded chunks.
+A file holds one number per line, or CSV columns named by a header line.
+It is memory-mapped and parsed one line-aligned byte range at a time
+(with np.loadtxt when NumPy is installed), so files larger than memory
+can be streamed into statistics or kernels.
+"""
+import io
+import math
+from src.calculator.batch.reader import MappedFile, find_chunks
+from src.calculator.logic.kernel import numpy_available
+from src.calculator.config.constants import DATASET_CHUNK_BYTES
+from src.calculator.config.locale import ERROR_DATA_UNKNOWN_COLUMN
+
+
+class Dataset:
+    """
+    Numeric columns of a text file, usable as a context manager.
+
+    Blank lines are skipped; missing or non-numeric fields read as NaN so
+    callers decide how to report them.
+
+    Attributes:
+        columns: Column names from the header line (empty without header)
+        delimiter: Field separator
+        data_start: Byte offset of the first data line
+    """
+
+    def __init__(self, path: str, header: bool = False, delimiter: str = ","):
+        """
+        Map a data file.
+
+        Args:
+            path: File to read
+            header: Whether the first line names the columns
+            delimiter: Field separator of CSV lines
+
+        Raises:
+            OSError: If the file cannot be opened
+        """
+        self._mapped = MappedFile(path)
+        self.delimiter = delimiter
+        self.columns = []
+        self.data_start = 0
+        if header:
+            buffer = self._mapped.buffer
+            newline = buffer.find(b"\n")
+            self.data_start = len(buffer) if newline == -1 else newline + 1
+            line = buffer[:self.data_start].decode("utf-8-sig", errors="replace")
+            self.columns = [name.strip() for name in line.strip().split(delimiter)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self._mapped.close()
+
+    def column_index(self, name: str) -> int:
+        """
+        Position of a named column.
+
+        Raises:
+            ValueError: If there is no such column
+        """
+        try:
+            return self.columns.index(name)
+        except ValueError:
+            raise ValueError(ERROR_DATA_UNKNOWN_COLUMN) from None
+
+    def chunks(self, names: tuple = None, chunk_size: int = DATASET_CHUNK_BYTES):
+        """
+        Read columns chunk by chunk.
+
+        Args:
+            names: Column names, or None for the first (only) column
+            chunk_size: Nominal bytes per chunk
+
+        Returns:
+            generator: Per chunk, a tuple of one float sequence per requested
+                column (NumPy arrays when NumPy is installed, lists
+                otherwise), all of one length
+
+        Raises:
+            ValueError: If a column name is unknown (raised by this call,
+                before any chunk is read)
+        """
+        indices = self._indices(names)
+        buffer = self._mapped.buffer
+        ranges = find_chunks(buffer, chunk_size, self.data_start)
+        return (self._parse(buffer[start:end], indices) for start, end in ranges)
+
+    def read(self, start: int, end: int, names: tuple = None) -> tuple:
+        """
+        Read columns of one line-aligned byte range (see reader.find_chunks).
+
+        Args:
+            start: Range start (a data line start)
+            end: Range end
+            names: Column names, or None for the first (only) column
+
+        Returns:
+            tuple: One float sequence per requested column, as chunks()
+
+        Raises:
+            ValueError: If a column name is unknown
+        """
+        return self._parse(self._mapped.buffer[start:end], self._indices(names))
+
+    def _indices(self, names: tuple) -> list:
+        """Column positions of names (None = the first column)."""
+        return [self.column_index(name) for name in names] if names else [0]
+
+    def _parse(self, data: bytes, indices: list) -> tuple:
+        """Parse the selected columns of a byte range."""
+        if numpy_available():
+            import numpy as np
+            if data.strip():
+                try:
+                    table = np.loadtxt(io.BytesIO(data), delimiter=self.delimiter,
+                                       usecols=indices, ndmin=2, comments=None, dtype=float)
+                    return tuple(table[:, i] for i in range(len(indices)))
+                except ValueError:
+                    pass  # Short rows or non-numeric fields: parse line by line
+            return tuple(np.array(column, dtype=float)
+                         for column in self._parse_lines(data, indices))
+        return self._parse_lines(data, indices)
+
+    def _parse_lines(self, data: bytes, indices: list) -> tuple:
+        """Parse line by line; bad or missing fields become NaN."""
+        delimiter = self.delimiter.encode()
+        columns = tuple([] for _ in indices)
+        for line in data.split(b"\n"):
+            line = line.strip()
+            if not line:
+                continue
+            fields = line.split(delimiter)
+            for column, index in zip(columns, indices):
+                try:
+                    column.append(float(fields[index]))
+                except (IndexError, ValueError):
+                    column.append(math.nan)
+        return columns
@@ -0,0 +1,96 @@
+"""
+Memory-mapped reader for expression files (one expression per line).
+Splits a file into line-aligned byte ranges without reading or copying it.
+"""
+
+import mmap
+
+
+class MappedFile:
+    """
+    Read-only memory map of a file, usable as a context manager.
+
+    Empty files cannot be mapped; they are exposed as an empty bytes object
+    so callers need no special case.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a file.
+
+        Args:
+            path: File to map
+        """
+        self._file = open(path, "rb")
+        try:
+            self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            self.buffer = b""
+
+    def __len__(self) -> int:
+        """File size in bytes."""
+        return len(self.buffer)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self._file.close()
+
+
+def find_chunks(buffer, chunk_size: int, start: int = 0) -> list:
+    """
+    Split a buffer into line-aligned byte ranges of about chunk_size bytes.
+
+    Each nominal boundary is moved forward to just after the next newline,
+    found with buffer.find (no data is copied). Every line lies in exactly
+    one range.
+
+    Args:
+        buffer: mmap or bytes
+        chunk_size: Nominal range length in bytes
+        start: Offset of the first range (a line start, e.g. after a header)
+
+    Returns:
+        list: (start, end) byte offsets, covering the buffer from start
+    """
+    size = len(buffer)
+    chunks = []
+    while start < size:
+        boundary = start + chunk_size
+        if boundary >= size:
+            end = size
+        else:
+            newline = buffer.find(b"\n", boundary - 1)
+            end = size if newline == -1 else newline + 1
+        chunks.append((start, end))
+        start = end
+    return chunks
+
+
+def iter_lines(buffer, start: int, end: int):
+    """
+    Iterate over the non-empty lines of a byte range.
+
+    Args:
+        buffer: mmap or bytes
+        start: Range start (a line start)
+        end: Range end (after a newline, or the buffer end)
+
+    Yields:
+        tuple: (byte offset of the line, decoded text without line ending)
+    """
+    position = start
+    while position < end:
+        newline = buffer.find(b"\n", position, end)
+        line_end = end if newline == -1 else newline
+        text = buffer[position:line_end].decode("utf-8", errors="replace").strip()
+        if text:
+            yield position, text
+        position = line_end + 1
@@ -0,0 +1,575 @@
+"""
+SciCalc - Parallel batch evaluation of expression files
+The input file is memory-mapped and split into line-aligned byte ranges;
+worker processes map the same file, evaluate their range with
+CalculatorEngine and return the rendered output, which an ordered merger
+writes in input order.
+
+Output matches `python -m src.calculator.repl --pipe`: one result or error
+message per non-empty input line. evaluate_file_blocks() hands structured
+results to the caller instead, through shared memory (see transport.py);
+`--format columnar` writes them to a binary columnar file (see columnar.py).
+
+`--compute EXPR` applies one formula to every row of a CSV file instead:
+header column names are variables, each chunk is parsed into arrays and
+evaluated by one compiled kernel call, and the output is the computed
+column (see compute_file()).
+
+Usage:
+    python -m src.calculator.batch.runner INPUT [-o OUTPUT] [--workers N]
+    python -m src.calculator.batch.runner INPUT -o OUTPUT --format columnar
+    python -m src.calculator.batch.runner DATA.csv --compute "sqrt(a^2+b^2)" [--name c]
+"""
+
+import ast
+import functools
+import math
+import os
+import sys
+import time
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.config.constants import (
+    DEFAULT_ANGLE_MODE,
+    BATCH_CHUNK_BYTES,
+    BATCH_CHUNKS_IN_FLIGHT,
+    DATASET_CHUNK_BYTES
+)
+from src.calculator.config.locale import (
+    INFO_BATCH_SUMMARY,
+    INFO_COMPUTE_SUMMARY,
+    ERROR_INVALID_EXPRESSION,
+    ERROR_UNDEFINED_VARIABLE,
+    ERROR_STATS_INVALID_VALUE,
+    ERROR_DATA_RESERVED_COLUMN
+)
+from src.calculator.batch.reader import MappedFile, find_chunks, iter_lines
+from src.calculator.batch.transport import ResultBlock
+from src.calculator.batch.columnar import ColumnarWriter
+from src.calculator.batch.dataset import Dataset
+
+
+# Engine of the current (worker) process, created by _init_worker
+_worker_engine = None
+
+# Whole floats below this magnitude are exact ints
+_EXACT_FLOAT_INTS = 2 ** 53
+
+
+def _init_worker(angle_mode: str) -> None:
+    """Create the engine of a worker process."""
+    global _worker_engine
+    _worker_engine = CalculatorEngine()
+    _worker_engine.set_angle_mode(angle_mode)
+
+
+def evaluate_chunk(path: str, start: int, end: int) -> tuple:
+    """
+    Evaluate the lines of one byte range (runs in a worker process).
+
+    Args:
+        path: Input file (mapped again in the worker, nothing is pickled)
+        start: Range start offset
+        end: Range end offset
+
+    Returns:
+        tuple: (rendered output bytes, line count, error count)
+    """
+    # calculate() rather than calculate_batch(): on typical files (few
+    # repeated subexpressions) the batch memo costs more than it saves
+    calculate = _worker_engine.calculate
+    lines = []
+    errors = 0
+    with MappedFile(path) as mapped:
+        for _, expression in iter_lines(mapped.buffer, start, end):
+            result = calculate(expression)
+            if result["success"]:
+                lines.append(result["result"])
+            else:
+                lines.append(result["error"])
+                errors += 1
+    output = "".join(line + "\n" for line in lines).encode("utf-8")
+    return output, len(lines), errors
+
+
+def evaluate_chunk_block(path: str, start: int, end: int) -> tuple:
+    """
+    Evaluate one byte range into a shared memory ResultBlock (worker side).
+
+    Args:
+        path: Input file
+        start: Range start offset
+        end: Range end offset
+
+    Returns:
+        tuple: (block name, line count, error count)
+    """
+    calculate = _worker_engine.calculate
+    clock = time.perf_counter
+    offsets = []
+    results = []
+    timings = []  # Microseconds per expression
+    with MappedFile(path) as mapped:
+        for offset, expression in iter_lines(mapped.buffer, start, end):
+            offsets.append(offset)
+            started = clock()
+            results.append(calculate(expression))
+            timings.append((clock() - started) * 1e6)
+
+    block = ResultBlock.write(results, offsets, timings)
+    name = block.name
+    errors = block.error_count()
+    block.close()  # The parent attaches by name and unlinks
+    return name, len(results), errors
+
+
+def compute_chunk(expression: str, variables: tuple, path: str, start: int, end: int) -> tuple:
+    """
+    Compute the formula for the rows of one byte range (worker side).
+
+    The columns are evaluated by one kernel call; rows whose value is not
+    finite, and every row of formulas that have no kernel (integrate,
+    solve, ...), are evaluated again one by one so they get calculate()'s
+    error message. So are rows of whole fields with a whole value beyond
+    float precision (a^b, factorial(n)), which calculate() keeps as exact
+    ints; whole fields are passed as ints, as if typed. Rows with a missing
+    or non-numeric field get ERROR_STATS_INVALID_VALUE.
+
+    Args:
+        expression: Formula in the column names
+        variables: Column names used by the formula (kernel argument order)
+        path: CSV file with a header line
+        start: Range start offset (a data line start)
+        end: Range end offset
+
+    Returns:
+        tuple: (rendered output bytes, row count, error count)
+    """
+    engine = _worker_engine
+    with Dataset(path, header=True) as dataset:
+        columns = dataset.read(start, end, variables or None)
+    rows = len(columns[0])
+    columns = columns[:len(variables)]
+    invalid = _invalid_rows(columns)
+
+    values = None
+    if variables:
+        try:
+            values = engine.evaluator.compile_kernel(expression, variables)(*columns)
+            values = values.tolist() if hasattr(values, "tolist") else values
+        except SyntaxError:
+            pass  # Forms without a kernel: every row one by one
+    if values is None:
+        values = [math.nan] * rows  # Constant formulas are calculated once below
+    columns = [column.tolist() if hasattr(column, "tolist") else column for column in columns]
+
+    format_value = engine.format_value
+    constant = None
+    lines = []
+    errors = 0
+    for row, value in enumerate(values):
+        if row in invalid:
+            lines.append(ERROR_STATS_INVALID_VALUE)
+            errors += 1
+            continue
+        if math.isfinite(value) and (abs(value) < _EXACT_FLOAT_INTS
+                                     or not value.is_integer()
+                                     or not all(column[row].is_integer() for column in columns)):
+            lines.append(format_value(value))
+            continue
+        if variables:
+            point = {name: _field_value(column[row]) for name, column in zip(variables, columns)}
+            result = engine.calculate(expression, point)
+        else:
+            constant = constant or engine.calculate(expression)
+            result = constant
+        if result["success"]:
+            lines.append(result["result"])
+        else:
+            lines.append(result["error"])
+            errors += 1
+    output = "".join(line + "\n" for line in lines).encode("utf-8")
+    return output, rows, errors
+
+
+def _field_value(field: float):
+    """A CSV field as calculate() would see it typed: whole numbers as ints."""
+    return int(field) if field.is_integer() else field
+
+
+def _invalid_rows(columns: list) -> set:
+    """Rows with a missing or non-numeric field (NaN) in any column."""
+    if columns and hasattr(columns[0], "tolist"):
+        import numpy as np  # Arrays imply NumPy is installed
+        mask = np.zeros(len(columns[0]), dtype=bool)
+        for column in columns:
+            mask |= np.isnan(column)
+        return set(np.flatnonzero(mask).tolist())
+    return {row for column in columns for row, field in enumerate(column) if field != field}
+
+
+class OrderedMerger:
+    """
+    Writes chunk outputs in chunk order, whatever order they arrive in.
+
+    Out-of-order chunks are held until every earlier chunk has been
+    written; the caller bounds how many chunks are in flight.
+    """
+
+    def __init__(self, write):
+        """
+        Initialize the merger.
+
+        Args:
+            write: Function writing one chunk output
+        """
+        self._write = write
+        self._next = 0  # Index of the next chunk to write
+        self._pending = {}  # index -> output received early
+
+    @property
+    def pending_count(self) -> int:
+        """Number of chunks waiting for an earlier chunk."""
+        return len(self._pending)
+
+    def add(self, index: int, output) -> None:
+        """
+        Accept the output of a chunk and write everything now in order.
+
+        Args:
+            index: Chunk index
+            output: Chunk output
+        """
+        self._pending[index] = output
+        while self._next in self._pending:
+            self._write(self._pending.pop(self._next))
+            self._next += 1
+
+
+def evaluate_file(path: str, output, workers: int = None, chunk_size: int = BATCH_CHUNK_BYTES,
+                  angle_mode: str = DEFAULT_ANGLE_MODE) -> dict:
+    """
+    Evaluate every line of an expression file.
+
+    Args:
+        path: Input file, one expression per line
+        output: Binary stream receiving the results
+        workers: Worker processes (None = CPU count, 0 = evaluate in-process)
+        chunk_size: Nominal byte range per task
+        angle_mode: Angle mode for trigonometric functions
+
+    Returns:
+        dict with keys:
+            - lines (int): Number of evaluated expressions
+            - errors (int): Number of failed expressions
+            - seconds (float): Wall time
+            - lines_per_second (float): Throughput
+    """
+    started = time.perf_counter()
+    totals = {"lines": 0, "errors": 0}
+    merger = OrderedMerger(output.write)
+
+    def collect(index, chunk_result):
+        chunk_output, lines, errors = chunk_result
+        merger.add(index, chunk_output)
+        totals["lines"] += lines
+        totals["errors"] += errors
+
+    _run_chunks(path, evaluate_chunk, chunk_size, workers, angle_mode, collect)
+    return _stats(totals, started)
+
+
+def evaluate_file_blocks(path: str, consume, workers: int = None,
+                         chunk_size: int = BATCH_CHUNK_BYTES,
+                         angle_mode: str = DEFAULT_ANGLE_MODE) -> dict:
+    """
+    Evaluate every line of an expression file into shared memory ResultBlocks.
+
+    Workers return only a block name; consume() reads the columns in place.
+    Blocks are passed in input order and freed when consume() returns. If
+    consume() raises or the run is interrupted, every block produced but
+    not consumed yet is freed before the exception propagates.
+
+    Args:
+        path: Input file, one expression per line
+        consume: Called with each attached ResultBlock
+        workers: Worker processes (None = CPU count, 0 = evaluate in-process)
+        chunk_size: Nominal byte range per task
+        angle_mode: Angle mode for trigonometric functions
+
+    Returns:
+        dict: Same statistics as evaluate_file()
+    """
+    started = time.perf_counter()
+    totals = {"lines": 0, "errors": 0}
+    unconsumed = set()  # Names received but not yet handed to consume()
+
+    def consume_block(name):
+        unconsumed.discard(name)
+        with ResultBlock.attach(name) as block:  # Freed even if consume() raises
+            consume(block)
+
+    merger = OrderedMerger(consume_block)
+
+    def collect(index, chunk_result):
+        name, lines, errors = chunk_result
+        unconsumed.add(name)
+        totals["lines"] += lines
+        totals["errors"] += errors
+        merger.add(index, name)
+
+    def discard(chunk_result):
+        _free_block(chunk_result[0])
+
+    try:
+        _run_chunks(path, evaluate_chunk_block, chunk_size, workers, angle_mode, collect,
+                    discard=discard)
+    finally:
+        for name in unconsumed:
+            _free_block(name)
+    return _stats(totals, started)
+
+
+def _free_block(name: str) -> None:
+    """Unlink a ResultBlock by name (ignored if it is already gone)."""
+    try:
+        with ResultBlock.attach(name):
+            pass
+    except FileNotFoundError:
+        pass
+
+
+def compute_file(path: str, expression: str, output, name: str = "result",
+                 workers: int = None, chunk_size: int = DATASET_CHUNK_BYTES,
+                 angle_mode: str = DEFAULT_ANGLE_MODE) -> dict:
+    """
+    Apply a formula to every row of a CSV file (computed column).
+
+    Column names from the header line are the formula's variables. The
+    output is the new column: a header line `name`, then one result per
+    data row, in input order. Rows that fail get their error message and
+    do not stop the job.
+
+    Args:
+        path: CSV file with a header line
+        expression: Formula in the column names, e.g. "sqrt(a^2+b^2)"
+        output: Binary stream receiving the column
+        name: Header of the computed column
+        workers: Worker processes (None = CPU count, 0 = evaluate in-process)
+        chunk_size: Nominal byte range per task
+        angle_mode: Angle mode for trigonometric functions
+
+    Returns:
+        dict: Same statistics as evaluate_file() (lines = data rows)
+
+    Raises:
+        ValueError: If the formula is invalid, uses a name that is not a
+            column, or uses a column named like a constant or function
+            (e, pi, sin, ...), which would not be read (message in Polish)
+    """
+    engine = CalculatorEngine()
+    engine.set_angle_mode(angle_mode)
+    validation = engine.validator.validate(expression)
+    if not validation["valid"]:
+        raise ValueError(validation["error"])
+    try:
+        compiled = engine.evaluator.compile(expression)
+    except Exception:
+        raise ValueError(ERROR_INVALID_EXPRESSION) from None
+    tree = compiled.optimized
+
+    evaluator = engine.evaluator
+    reserved = set(evaluator.names) | set(evaluator.functions) | set(evaluator.forms)
+    with Dataset(path, header=True) as dataset:
+        # Names of the parsed tree: folding removes constants such as e
+        written = {node.id for node in ast.walk(compiled.tree) if isinstance(node, ast.Name)}
+        for column in dataset.columns:
+            if column in written and column in reserved:
+                raise ValueError(ERROR_DATA_RESERVED_COLUMN.format(column))
+        used = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+        variables = tuple(column for column in dataset.columns if column in used)
+        start = dataset.data_start
+    try:
+        engine.evaluator.compile_kernel(tree, variables)
+    except SyntaxError:
+        pass  # No kernel (integrate, solve, ...): rows are evaluated one by one
+    except Exception:
+        raise ValueError(ERROR_UNDEFINED_VARIABLE) from None
+
+    started = time.perf_counter()
+    totals = {"lines": 0, "errors": 0}
+    output.write((name + "\n").encode("utf-8"))
+    merger = OrderedMerger(output.write)
+
+    def collect(index, chunk_result):
+        chunk_output, rows, errors = chunk_result
+        merger.add(index, chunk_output)
+        totals["lines"] += rows
+        totals["errors"] += errors
+
+    task = functools.partial(compute_chunk, expression, variables)
+    _run_chunks(path, task, chunk_size, workers, angle_mode, collect, start)
+    return _stats(totals, started)
+
+
+def _stats(totals: dict, started: float) -> dict:
+    """Build the statistics dict of a finished run."""
+    seconds = time.perf_counter() - started
+    return {
+        "lines": totals["lines"],
+        "errors": totals["errors"],
+        "seconds": seconds,
+        "lines_per_second": totals["lines"] / seconds if seconds else 0.0
+    }
+
+
+def _run_chunks(path: str, task, chunk_size: int, workers: int, angle_mode: str, collect,
+                start: int = 0, discard=None) -> None:
+    """
+    Split the file and run task(path, start, end) for every chunk.
+
+    Args:
+        path: Input file
+        task: Chunk function (evaluate_chunk, evaluate_chunk_block or compute_chunk)
+        chunk_size: Nominal byte range per task
+        workers: Worker processes (None = CPU count, 0 = in-process)
+        angle_mode: Angle mode for the engines
+        collect: Called with (index, task result) as chunks finish
+        start: Offset of the first line to process (e.g. after a header)
+        discard: Called with the result of every chunk that finishes after
+            the run failed (to free what it holds); None to drop them
+    """
+    with MappedFile(path) as mapped:
+        chunks = find_chunks(mapped.buffer, chunk_size, start)
+
+    if workers == 0:
+        _init_worker(angle_mode)
+        for index, (start, end) in enumerate(chunks):
+            collect(index, task(path, start, end))
+    else:
+        _evaluate_parallel(path, chunks, task, workers or os.cpu_count() or 1, angle_mode,
+                           collect, discard)
+
+
+def _evaluate_parallel(path: str, chunks: list, task, workers: int, angle_mode: str,
+                       collect, discard=None) -> None:
+    """
+    Evaluate chunks in a process pool, keeping a bounded number in flight.
+
+    Args:
+        path: Input file
+        chunks: (start, end) byte ranges
+        task: Chunk function run in the workers
+        workers: Pool size
+        angle_mode: Angle mode for the worker engines
+        collect: Called with (index, task result) as chunks finish
+        discard: Called with the results still in flight when the run
+            fails (see _run_chunks)
+    """
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+    window = workers * BATCH_CHUNKS_IN_FLIGHT
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(angle_mode,)) as pool:
+        in_flight = {}  # future -> chunk index
+        next_chunk = 0
+        try:
+            while next_chunk < len(chunks) or in_flight:
+                while next_chunk < len(chunks) and len(in_flight) < window:
+                    start, end = chunks[next_chunk]
+                    in_flight[pool.submit(task, path, start, end)] = next_chunk
+                    next_chunk += 1
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(in_flight.pop(future), future.result())
+        except BaseException:
+            _drain(in_flight, discard)
+            raise
+
+
+def _drain(in_flight: dict, discard) -> None:
+    """Cancel queued futures and discard the results of the running ones."""
+    for future in in_flight:
+        future.cancel()
+    for future in in_flight:
+        if future.cancelled():
+            continue
+        try:
+            result = future.result()
+        except BaseException:
+            continue
+        if discard is not None:
+            discard(result)
+
+
+def main(argv=None) -> int:
+    """
+    Batch entry point; prints the throughput summary to stderr.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        int: 0 if every expression succeeded, 1 otherwise (argparse exits
+            with 2 on a wrong command line)
+    """
+    import argparse  # Only the command line needs it
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.calculator.batch.runner",
+        description="Evaluate an expression file, or a formula over a CSV file."
+    )
+    parser.add_argument("input", help="expression file, or CSV file with --compute")
+    parser.add_argument("-o", dest="output", help="output file (default: standard output)")
+    parser.add_argument("--format", choices=("text", "columnar"), default="text")
+    parser.add_argument("--workers", type=int, help="worker processes (0 = in-process)")
+    parser.add_argument("--compute", metavar="EXPR", help="formula in the CSV column names")
+    parser.add_argument("--name", default="result", help="header of the computed column")
+    arguments = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    path = arguments.input
+    output_path = arguments.output
+    output_format = arguments.format
+    workers = arguments.workers
+    expression = arguments.compute
+    name = arguments.name
+
+    if expression is not None:
+        if output_format != "text":
+            sys.stderr.write("--compute writes a text column (no --format)\n")
+            return 2
+        try:
+            if output_path is None:
+                stats = compute_file(path, expression, sys.stdout.buffer, name, workers)
+                sys.stdout.flush()
+            else:
+                with open(output_path, "wb") as output:
+                    stats = compute_file(path, expression, output, name, workers)
+        except ValueError as e:
+            sys.stderr.write(str(e) + "\n")
+            return 2
+        sys.stderr.write(INFO_COMPUTE_SUMMARY.format(
+            stats["lines"], stats["errors"], stats["seconds"], stats["lines_per_second"]
+        ) + "\n")
+        return 1 if stats["errors"] else 0
+
+    if output_format == "columnar":
+        if output_path is None:
+            sys.stderr.write("--format columnar requires -o OUTPUT\n")
+            return 2
+        with ColumnarWriter(output_path) as writer:
+            stats = evaluate_file_blocks(path, writer.append_block, workers)
+    elif output_path is None:
+        stats = evaluate_file(path, sys.stdout.buffer, workers)
+        sys.stdout.flush()
+    else:
+        with open(output_path, "wb") as output:
+            stats = evaluate_file(path, output, workers)
+
+    sys.stderr.write(INFO_BATCH_SUMMARY.format(
+        stats["lines"], stats["errors"], stats["seconds"], stats["lines_per_second"]
+    ) + "\n")
+    return 1 if stats["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Shared-memory transport for batch results.
+A worker writes the results of one chunk into a multiprocessing.shared_memory
+block in columnar form; the parent attaches to the block by name and reads
+the columns in place instead of unpickling one dict per result.
+
+Block layout (native byte order, every column 8-byte aligned):
+    header        int64[2]        row count, arena size
+    values        float64[n]      numeric result, or the argument of a positional error
+    line_offsets  int64[n]        byte offset of the input line
+    text_offsets  int64[n + 1]    row i text is arena[text_offsets[i]:text_offsets[i + 1]]
+    timings       float32[n]      evaluation time in microseconds
+    codes         uint8[n]        RESULT_NUMBER, RESULT_TEXT, ERROR_OTHER or a locale error code
+    arena         bytes           UTF-8 texts of rows that do not fit a float64
+"""
+
+import struct
+from array import array
+from multiprocessing import shared_memory, resource_tracker
+from src.calculator.config import locale
+
+
+# Row codes; numbering is part of the block (and file) format, append only
+RESULT_NUMBER = 0  # Result text is exactly _float_text(value)
+RESULT_TEXT = 1  # Result text in the arena (too many digits for float64)
+ERROR_OTHER = 2  # Error message in the arena
+
+# Error code -> Polish message; codes start after the fixed codes above
+ERROR_MESSAGES = (
+    locale.ERROR_DIVISION_BY_ZERO,
+    locale.ERROR_INVALID_EXPRESSION,
+    locale.ERROR_SYNTAX_ERROR,
+    locale.ERROR_UNDEFINED_FUNCTION,
+    locale.ERROR_UNDEFINED_VARIABLE,
+    locale.ERROR_MATH_DOMAIN,
+    locale.ERROR_OVERFLOW,
+    locale.ERROR_INVALID_ANGLE_MODE,
+    locale.ERROR_EXPRESSION_TOO_LONG,
+    locale.ERROR_EMPTY_EXPRESSION,
+    locale.ERROR_UNBALANCED_PARENTHESES,
+    locale.ERROR_MISSING_CLOSING_PARENTHESIS,
+    locale.ERROR_MISSING_OPENING_PARENTHESIS,
+    locale.ERROR_FACTORIAL_NOT_INTEGER,
+    locale.ERROR_FACTORIAL_NEGATIVE,
+    locale.ERROR_FACTORIAL_TOO_LARGE,
+    locale.ERROR_INTEGRAL_NOT_CONVERGED,
+    locale.ERROR_NO_ROOT,
+    locale.ERROR_SERIES_BOUNDS,
+    locale.ERROR_SERIES_TOO_LONG,
+    locale.ERROR_STATS_NO_DATA,
+    locale.ERROR_STATS_INVALID_VALUE,
+    locale.ERROR_DATA_UNKNOWN_COLUMN,
+    locale.ERROR_DATA_FILE,
+    locale.ERROR_MATRIX_NUMPY,
+    locale.ERROR_MATRIX_SHAPE,
+    locale.ERROR_MATRIX_SINGULAR,
+    locale.ERROR_MATRIX_TOO_LARGE,
+)
+FIRST_ERROR_CODE = 3
+
+_HEADER = struct.Struct("qq")
+
+# Plain messages -> code, and positional templates as (code, prefix, suffix)
+_ERROR_CODES = {}
+_ERROR_TEMPLATES = []
+for _index, _message in enumerate(ERROR_MESSAGES):
+    if "{}" in _message:
+        _prefix, _suffix = _message.split("{}")
+        _ERROR_TEMPLATES.append((FIRST_ERROR_CODE + _index, _prefix, _suffix))
+    else:
+        _ERROR_CODES[_message] = FIRST_ERROR_CODE + _index
+
+
+def _float_text(value: float) -> str:
+    """Result text for a value stored as RESULT_NUMBER."""
+    text = repr(value)
+    return text[:-2] if text.endswith(".0") else text
+
+
+def encode_result(result: dict) -> tuple:
+    """
+    Encode a calculate() result as one row.
+
+    Args:
+        result: CalculatorEngine.calculate() result
+
+    Returns:
+        tuple: (code, value, text) where text is the arena string ("" if none)
+    """
+    if result["success"]:
+        text = result["result"]
+        try:
+            value = float(text)
+        except ValueError:
+            return RESULT_TEXT, 0.0, text
+        if _float_text(value) == text:
+            return RESULT_NUMBER, value, ""
+        return RESULT_TEXT, 0.0, text
+
+    message = result["error"]
+    code = _ERROR_CODES.get(message)
+    if code is not None:
+        return code, 0.0, ""
+    for code, prefix, suffix in _ERROR_TEMPLATES:
+        if message.startswith(prefix) and message.endswith(suffix):
+            argument = message[len(prefix):len(message) - len(suffix)]
+            if argument.isdigit():
+                return code, float(argument), ""
+    return ERROR_OTHER, 0.0, message
+
+
+def decode_result(code: int, value: float, text: str) -> dict:
+    """
+    Rebuild a calculate() result from a row (inverse of encode_result).
+
+    Args:
+        code: Row code
+        value: Value column entry
+        text: Arena text of the row
+
+    Returns:
+        dict: Result in CalculatorEngine format
+    """
+    if code == RESULT_NUMBER:
+        return {"success": True, "result": _float_text(value), "error": None}
+    if code == RESULT_TEXT:
+        return {"success": True, "result": text, "error": None}
+    if code == ERROR_OTHER:
+        message = text
+    else:
+        message = ERROR_MESSAGES[code - FIRST_ERROR_CODE]
+        if "{}" in message:
+            message = message.format(int(value))
+    return {"success": False, "result": None, "error": message}
+
+
+class ResultBlock:
+    """
+    Columnar results of one chunk in a shared memory block.
+
+    Column properties are memoryviews over the shared buffer (no copy).
+    Call close() when done; the reader also calls unlink() to free the
+    block.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, tracked: bool = True):
+        """
+        Wrap a shared memory block holding the layout described above.
+
+        Args:
+            shm: Created or attached block
+            tracked: Whether this process's resource tracker knows the block
+        """
+        self._shm = shm
+        self._tracked = tracked
+        buffer = shm.buf
+        count, arena_size = _HEADER.unpack_from(buffer, 0)
+        self._count = count
+
+        position = _HEADER.size
+        self.values = buffer[position:position + 8 * count].cast("d")
+        position += 8 * count
+        self.line_offsets = buffer[position:position + 8 * count].cast("q")
+        position += 8 * count
+        self.text_offsets = buffer[position:position + 8 * (count + 1)].cast("q")
+        position += 8 * (count + 1)
+        self.timings = buffer[position:position + 4 * count].cast("f")
+        position += 4 * count
+        self.codes = buffer[position:position + count]
+        position += count
+        self.arena = buffer[position:position + arena_size]
+
+    @classmethod
+    def write(cls, results: list, line_offsets: list, timings=None) -> "ResultBlock":
+        """
+        Create a block holding results (called by the producing process).
+
+        The block is not registered with this process's resource tracker,
+        so it survives the producer; the reader unlinks it.
+
+        Args:
+            results: calculate() results
+            line_offsets: Input byte offset of each result
+            timings: Evaluation time of each result in microseconds (default 0)
+
+        Returns:
+            ResultBlock: The new block (close it after handing over its name)
+        """
+        count = len(results)
+        codes = bytearray(count)
+        values = array("d", bytes(8 * count))
+        text_offsets = array("q", bytes(8 * (count + 1)))
+        texts = []
+        arena_size = 0
+        for row, result in enumerate(results):
+            code, value, text = encode_result(result)
+            codes[row] = code
+            values[row] = value
+            if text:
+                encoded = text.encode("utf-8")
+                texts.append(encoded)
+                arena_size += len(encoded)
+            text_offsets[row + 1] = arena_size
+        arena = b"".join(texts)
+
+        columns = (
+            _HEADER.pack(count, arena_size),
+            values.tobytes(),
+            array("q", line_offsets).tobytes(),
+            text_offsets.tobytes(),
+            array("f", timings if timings is not None else bytes(4 * count)).tobytes(),
+            bytes(codes),
+            arena,
+        )
+        size = sum(len(column) for column in columns)
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        resource_tracker.unregister(shm._name, "shared_memory")
+        position = 0
+        for column in columns:
+            shm.buf[position:position + len(column)] = column
+            position += len(column)
+        return cls(shm, tracked=False)
+
+    @classmethod
+    def attach(cls, name: str) -> "ResultBlock":
+        """Attach to a block created by another process."""
+        return cls(shared_memory.SharedMemory(name=name))
+
+    @property
+    def name(self) -> str:
+        """Shared memory name to pass to the reader."""
+        return self._shm.name
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return self._count
+
+    def text(self, row: int) -> str:
+        """Arena text of a row ("" for rows without text)."""
+        return bytes(self.arena[self.text_offsets[row]:self.text_offsets[row + 1]]).decode("utf-8")
+
+    def result(self, row: int) -> dict:
+        """Result of a row in CalculatorEngine format."""
+        return decode_result(self.codes[row], self.values[row], self.text(row))
+
+    def error_count(self) -> int:
+        """Number of failed rows."""
+        codes = bytes(self.codes)
+        return self._count - codes.count(RESULT_NUMBER) - codes.count(RESULT_TEXT)
+
+    def close(self) -> None:
+        """Release the views and detach from the block."""
+        for view in (self.values, self.line_offsets, self.text_offsets, self.timings,
+                     self.codes, self.arena):
+            view.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the block (normally reader side, after close)."""
+        if not self._tracked:
+            # SharedMemory.unlink() unregisters; keep the tracker balanced
+            resource_tracker.register(self._shm._name, "shared_memory")
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        self.unlink()
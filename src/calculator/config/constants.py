@@ -22,6 +22,9 @@ OPERATORS = {
 # Expression limits
 MAX_EXPRESSION_LENGTH = 1000  # Maximum input length
 MAX_RECURSION_DEPTH = 100  # Maximum function nesting depth
+MAX_COMPILE_CACHE_ENTRIES = 1024  # Optimized expression trees kept per evaluator
+MAX_KERNEL_CACHE_ENTRIES = 256  # Compiled array kernels kept per evaluator
+MAX_MEMO_SUBTREES = 4096  # Distinct subtrees memoized per batch before the memo restarts
 
 # Angle modes
 ANGLE_MODE_DEGREES = 'degrees'
@@ -40,6 +43,43 @@ BASIC_FUNCTIONS = ['sin', 'cos', 'tan', 'sqrt', 'log', 'ln', 'abs', 'factorial']
 ADVANCED_FUNCTIONS = ['asin', 'acos', 'atan', 'sinh', 'cosh', 'tanh']
 ALL_FUNCTIONS = BASIC_FUNCTIONS + ADVANCED_FUNCTIONS
 
+# Numerical integration (adaptive Gauss-Kronrod 7/15)
+INTEGRATE_ABS_TOLERANCE = 1e-12  # Below the 10 displayed decimals
+INTEGRATE_REL_TOLERANCE = 1e-12
+INTEGRATE_INITIAL_INTERVALS = 8  # First pass: 8 x 15 nodes in one kernel call
+INTEGRATE_MAX_INTERVALS = 2000  # Subdivision limit before giving up
+
+# Equation solving (grid bracketing + Brent's method)
+SOLVE_GRID_POINTS = 2049  # Samples per interval; sign changes between them bracket roots
+SOLVE_X_TOLERANCE = 1e-12  # Absolute root tolerance
+SOLVE_MAX_ITERATIONS = 100  # Brent iterations per bracket
+
+# Series sum/prod (chunked kernel evaluation)
+SERIES_CHUNK_SIZE = 1 << 18  # Terms per kernel call (bounded memory)
+SERIES_MAX_TERMS = 10 ** 9  # Longest series evaluated term by term
+SERIES_MAX_BOUND = 2 ** 53  # Larger indices are not exact as floats
+
+# Polynomials (Horner evaluation of expanded polynomials)
+POLY_MAX_DEGREE = 4096  # Higher-degree subtrees are left to the evaluator
+POLY_BLOCK_SIZE = 16384  # Points per Horner pass over arrays (128 KB, stays in cache)
+POLY_CONVOLVE_MIN = 16  # Coefficients above which products use NumPy
+
+# Plot sampling (adaptive refinement + LTTB downsampling)
+PLOT_POINTS = 1000  # Points returned (about one per pixel column)
+PLOT_INITIAL_POINTS = 257  # Uniform first pass
+PLOT_MAX_DEPTH = 12  # Interval halvings where the curve bends
+PLOT_TOLERANCE = 1e-3  # Allowed deviation from a straight segment (fraction of y span)
+PLOT_MAX_EVALUATIONS = 12_000  # Evaluation budget (keeps plots interactive)
+
+# Matrices and vectors (NumPy arrays)
+MATRIX_MAX_ELEMENTS = 16_000_000  # Largest eye/zeros/ones (4000 x 4000, 128 MB)
+MATRIX_DISPLAY_ELEMENTS = 16  # Arrays up to this size are displayed in full
+MATRIX_DISPLAY_EDGE = 2  # Rows/columns shown at each end of larger arrays
+
+# Streaming statistics (one pass, bounded memory)
+STATS_EXACT_VALUES = 100_000  # Quantiles are exact up to this many values
+STATS_DIGEST_COMPRESSION = 1000  # t-digest size (about half as many centroids)
+
 # Factorial limits
 MAX_FACTORIAL_INPUT = 170  # math.factorial(171) overflows float
 
@@ -86,6 +126,15 @@ BUTTON_COLORS = {
 # History
 MAX_HISTORY_ENTRIES = 100
 
+# Live result preview while typing
+PREVIEW_DEBOUNCE_MS = 150  # Idle time before a preview is computed
+PREVIEW_POLL_MS = 15  # Interval for checking the background computation
+PREVIEW_TEXT_COLOR = "gray"  # Result label color for tentative results
+INVALID_EXPRESSION_COLOR = "#FF6B6B"  # Expression label color while invalid
+
+# Cursor shown in the expression display when editing mid-expression
+CURSOR_MARKER = "\u258f"
+
 # History panel styling
 HISTORY_PANEL_WIDTH = 250
 FONT_HISTORY_TITLE = 14
@@ -94,3 +143,24 @@ FONT_HISTORY_ENTRY = 13
 # Updated window geometry to accommodate history panel
 WINDOW_WITH_HISTORY_WIDTH = 700
 WINDOW_WITH_HISTORY_MIN_WIDTH = 650
+
+# Warm calculation daemon (Unix domain socket)
+DAEMON_SOCKET_ENV = "SCICALC_SOCKET"  # Environment variable overriding the socket path
+DAEMON_SOCKET_NAME = "scicalc.sock"  # Socket file name in the runtime directory
+DAEMON_CONNECT_TIMEOUT = 0.5  # Seconds before the client falls back to in-process
+
+# Network calculation service (asyncio, JSON lines over TCP)
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 7878
+SERVER_PIPELINE_DEPTH = 64  # Requests in flight per connection before reading pauses
+SERVER_MAX_LINE_BYTES = 64 * 1024  # Longest accepted request line
+SERVER_INLINE_MAX_LENGTH = 200  # Longer expressions are evaluated in the process pool
+
+# Headless sessions
+SESSION_IDLE_TIMEOUT = 30 * 60  # Seconds without activity before a session is evicted
+SESSION_MEMORY_BUDGET = 1024  # Bytes per session with a short history (100k sessions < 100 MiB)
+
+# Batch evaluation of expression files
+BATCH_CHUNK_BYTES = 4 * 1024 * 1024  # Nominal chunk size handed to one worker
+BATCH_CHUNKS_IN_FLIGHT = 2  # Chunks queued per worker (bounds merger memory)
+DATASET_CHUNK_BYTES = 4 * 1024 * 1024  # Bytes of a numeric data file parsed at once
@@ -23,6 +23,32 @@ ERROR_UNBALANCED_PARENTHESES = "Niezrównoważone nawiasy na pozycji {}"
 ERROR_MISSING_CLOSING_PARENTHESIS = "Brak zamykającego nawiasu"
 ERROR_MISSING_OPENING_PARENTHESIS = "Brak otwierającego nawiasu na pozycji {}"
 
+# Numerical integration errors
+ERROR_INTEGRAL_NOT_CONVERGED = "Błąd: Całka nie jest zbieżna"
+
+# Equation solving errors
+ERROR_NO_ROOT = "Błąd: Brak pierwiastka w przedziale"
+
+# Series (sum/prod) errors
+ERROR_SERIES_BOUNDS = "Błąd: Granice sumy/iloczynu muszą być liczbami całkowitymi"
+ERROR_SERIES_TOO_LONG = "Błąd: Zbyt wiele wyrazów sumy/iloczynu"
+
+# Plot errors
+ERROR_PLOT_RANGE = "Błąd: Nieprawidłowy zakres wykresu"
+
+# Statistics and data file errors
+ERROR_STATS_NO_DATA = "Błąd: Za mało danych"
+ERROR_STATS_INVALID_VALUE = "Błąd: Nieprawidłowa wartość w danych"
+ERROR_DATA_UNKNOWN_COLUMN = "Błąd: Nieznana kolumna"
+ERROR_DATA_RESERVED_COLUMN = "Błąd: Nazwa kolumny {} jest zarezerwowana dla stałej lub funkcji"
+ERROR_DATA_FILE = "Błąd: Nie można odczytać pliku"
+
+# Matrix errors
+ERROR_MATRIX_NUMPY = "Błąd: Macierze wymagają pakietu NumPy"
+ERROR_MATRIX_SHAPE = "Błąd: Niezgodne wymiary macierzy"
+ERROR_MATRIX_SINGULAR = "Błąd: Macierz osobliwa"
+ERROR_MATRIX_TOO_LARGE = "Błąd: Macierz zbyt duża"
+
 # Factorial errors
 ERROR_FACTORIAL_NOT_INTEGER = "Silnia wymaga liczby całkowitej"
 ERROR_FACTORIAL_NEGATIVE = "Silnia nie jest zdefiniowana dla liczb ujemnych"
@@ -34,6 +60,10 @@ INFO_ANGLE_MODE_CHANGED = "Tryb kątów zmieniony na: {}"
 INFO_MEMORY_STORED = "Zapisano do pamięci: {}"
 INFO_MEMORY_RECALLED = "Przywołano z pamięci: {}"
 INFO_MEMORY_CLEARED = "Pamięć wyczyszczona"
+INFO_BATCH_SUMMARY = "Przetworzono {} wyrażeń ({} błędów) w {:.2f} s - {:.0f} wyrażeń/s"
+INFO_COMPUTE_SUMMARY = "Przetworzono {} wierszy ({} błędów) w {:.2f} s - {:.0f} wierszy/s"
+INFO_MATRIX_SUMMARY = "Macierz {}×{}: {}"
+INFO_VECTOR_SUMMARY = "Wektor ({}): {}"
 
 # Help messages
 HELP_USAGE = """
@@ -42,6 +72,8 @@ Użycie:
   - Użyj funkcji: sin(), cos(), tan(), sqrt(), log(), ln()
   - Stałe: pi, e
   - Operatory: +, -, *, /, ^, %
+  - deg / rad / grad - zmiana trybu kątów
+  - history - historia obliczeń
   - quit - wyjście z programu
 """
 
@@ -64,6 +96,11 @@ BTN_POWER = "x^y"
 BTN_FACTORIAL = "n!"
 BTN_SQRT = "\u221a"
 BTN_NEGATE = "+/-"
+BTN_DELETE = "\u2326"
+BTN_CURSOR_LEFT = "\u2190"
+BTN_CURSOR_RIGHT = "\u2192"
+BTN_CURSOR_HOME = "\u21e4"
+BTN_CURSOR_END = "\u21e5"
 
 # Mode labels
 BTN_MODE_BASIC = "Podstawowy"
@@ -2,10 +2,22 @@
 MVC Controller connecting UI events to CalculatorEngine operations.
 """
 
-import customtkinter as ctk
 from src.calculator.logic.calculator import CalculatorEngine
-from src.calculator.ui.calculator_window import CalculatorWindow
-from src.calculator.config.constants import MAX_HISTORY_ENTRIES
+from src.calculator.controller.expression_buffer import ExpressionBuffer
+from src.calculator.config.constants import (
+    MAX_HISTORY_ENTRIES,
+    PREVIEW_DEBOUNCE_MS,
+    PREVIEW_POLL_MS,
+    CURSOR_MARKER
+)
+from src.calculator.config.locale import (
+    BTN_BACKSPACE,
+    BTN_DELETE,
+    BTN_CURSOR_LEFT,
+    BTN_CURSOR_RIGHT,
+    BTN_CURSOR_HOME,
+    BTN_CURSOR_END
+)
 
 
 # Label-to-token mapping for button transformations
@@ -22,11 +34,28 @@ LABEL_TO_TOKEN = {
     "e": "e",
 }
 
+# Cursor movement labels -> ExpressionBuffer operation
+CURSOR_MOVES = {
+    BTN_CURSOR_LEFT: ExpressionBuffer.move_left,
+    BTN_CURSOR_RIGHT: ExpressionBuffer.move_right,
+    BTN_CURSOR_HOME: ExpressionBuffer.move_home,
+    BTN_CURSOR_END: ExpressionBuffer.move_end,
+}
+
 
 class CalculatorController:
     """
     Controller mediating between CalculatorWindow (view) and CalculatorEngine (model).
     Handles button clicks, expression building, and display updates.
+
+    The expression is edited through an ExpressionBuffer, so tokens can be
+    inserted or removed at the cursor position in O(1).
+
+    While typing, a tentative result is computed in a background thread
+    after a short idle period and shown with view.update_preview(). Pressing
+    = reuses that result if it was computed for the same expression.
+    Previews run on a separate engine, so = never waits for a stale preview
+    that is still running.
     """
 
     def __init__(self, engine=None, view=None):
@@ -37,20 +66,34 @@ class CalculatorController:
             engine: CalculatorEngine instance (or mock for testing)
             view: CalculatorWindow instance (or mock for testing)
         """
-        # Set appearance before creating window
+        # GUI modules are imported only when a real window is needed
         if view is None:
+            import customtkinter as ctk
+            from src.calculator.ui.calculator_window import CalculatorWindow
+
+            # Set appearance before creating window
             ctk.set_appearance_mode("dark")
             ctk.set_default_color_theme("blue")
+            view = CalculatorWindow()
 
         self.engine = engine or CalculatorEngine()
-        self.view = view or CalculatorWindow()
+        self.view = view
 
         # State
-        self.expression = ""
+        self._buffer = ExpressionBuffer()  # Expression text with cursor
         self.last_result = "0"
         self.error_state = False
         self.history = []  # List of (expression, result) tuples
 
+        # Live preview state
+        self._expression_valid = True  # Last state sent to the validity indicator
+        self._angle_mode = None  # Last mode set (None = engine default)
+        self._preview_engine = None  # Used only by the preview thread
+        self._preview_executor = None  # Created on first preview
+        self._preview_after_id = None  # Pending debounce/poll callback
+        self._preview_future = None
+        self._preview_expression = None
+
         # Wire up callbacks
         self.view.set_button_callback(self.on_button_click)
         self.view.set_mode_callback(self.on_mode_change)
@@ -62,14 +105,28 @@ class CalculatorController:
         self.view.update_expression("")
         self.view.update_result("0")
 
+    @property
+    def expression(self):
+        """Current expression text."""
+        return self._buffer.text
+
+    @expression.setter
+    def expression(self, text):
+        """Replace the expression (cursor moves to the end)."""
+        self._buffer.set_text(text)
+
     def on_button_click(self, label):
         """Route button clicks to appropriate handlers."""
         if label == "=":
             self._calculate()
         elif label == "C":
             self._clear()
-        elif label == "\u232b":  # backspace
+        elif label == BTN_BACKSPACE:
             self._backspace()
+        elif label == BTN_DELETE:
+            self._delete()
+        elif label in CURSOR_MOVES:
+            self._move_cursor(label)
         else:
             self._append(label)
 
@@ -80,7 +137,10 @@ class CalculatorController:
 
     def on_angle_mode_change(self, mode):
         """Handle angle mode change from DEG/RAD toggle."""
+        self._angle_mode = mode
         self.engine.set_angle_mode(mode)
+        # A preview computed in the old mode is stale
+        self._schedule_preview()
 
     def _append(self, label):
         """Append button label to expression."""
@@ -91,20 +151,24 @@ class CalculatorController:
         # Transform label to token if needed
         token = LABEL_TO_TOKEN.get(label, label)
 
-        # Append to expression
-        self.expression += token
+        # Insert at cursor
+        self._buffer.insert(token)
 
         # Update display
-        self.view.update_expression(self.expression)
+        self._show_expression()
         self.view.update_result(self.last_result)
+        self._update_validity()
+        self._schedule_preview()
 
     def _calculate(self):
         """Evaluate current expression."""
         if not self.expression:
             return  # Empty expression, do nothing
 
-        # Call engine
-        result = self.engine.calculate(self.expression)
+        # Reuse the preview result if it matches, otherwise call engine
+        result = self._take_preview(self.expression)
+        if result is None:
+            result = self.engine.calculate(self.expression)
 
         if result["success"]:
             # Update display with result
@@ -128,18 +192,40 @@ class CalculatorController:
 
     def _clear(self):
         """Clear expression and reset display."""
-        self.expression = ""
         self.last_result = "0"
         self.error_state = False
+        self._buffer.clear()
+        self._cancel_preview()
 
         self.view.update_expression("")
         self.view.update_result("0")
+        self._update_validity()
 
     def _backspace(self):
-        """Remove last character from expression."""
-        if self.expression:
-            self.expression = self.expression[:-1]
-            self.view.update_expression(self.expression)
+        """Remove the token before the cursor (e.g. a whole "sin(")."""
+        if self._buffer.backspace():
+            self._on_edited()
+
+    def _delete(self):
+        """Remove the token after the cursor."""
+        if self._buffer.delete():
+            self._on_edited()
+
+    def _move_cursor(self, label):
+        """Move the cursor by one token or to either end."""
+        CURSOR_MOVES[label](self._buffer)
+        self._show_expression()
+
+    def _on_edited(self):
+        """Refresh display, validity and preview after an edit."""
+        self._show_expression()
+        self.view.update_result(self.last_result)  # Drop the stale preview
+        self._update_validity()
+        self._schedule_preview()
+
+    def _show_expression(self):
+        """Show the expression, with a cursor marker unless it is at the end."""
+        self.view.update_expression(self._buffer.display_text(CURSOR_MARKER))
 
     def on_history_recall(self, result):
         """Handle click on history entry - insert result into expression."""
@@ -147,14 +233,110 @@ class CalculatorController:
         if self.error_state:
             self._clear()
 
-        # Append result to expression
-        self.expression += result
-        self.view.update_expression(self.expression)
+        # Insert result at cursor
+        self._buffer.insert(result)
+        self._on_edited()
 
     def _on_history_cleared(self):
         """Handle history clear button - clear internal history list."""
         self.history.clear()
 
+    def _evaluate_preview(self, expression, angle_mode):
+        """Calculate an expression on the preview engine (preview thread)."""
+        if self._preview_engine is None:
+            self._preview_engine = type(self.engine)()
+        engine = self._preview_engine
+        if angle_mode is not None and engine.evaluator.angle_mode != angle_mode:
+            engine.set_angle_mode(angle_mode)
+        return engine.calculate(expression)
+
+    # Live preview
+
+    def _schedule_preview(self):
+        """Restart the idle debounce; stale preview work is dropped."""
+        self._cancel_preview()
+        self._preview_after_id = self.view.after(PREVIEW_DEBOUNCE_MS, self._start_preview)
+
+    def _cancel_preview(self):
+        """Cancel the pending callback and forget any in-flight preview."""
+        if self._preview_after_id is not None:
+            self.view.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+        if self._preview_future is not None:
+            # A running computation cannot be interrupted; it finishes on the
+            # preview engine and its result is ignored
+            self._preview_future.cancel()
+            self._preview_future = None
+            self._preview_expression = None
+
+    def _update_validity(self):
+        """Update the live validity indicator when the state changes."""
+        # An empty expression is not flagged as invalid
+        valid = not len(self._buffer) or self._buffer.valid
+        if valid != self._expression_valid:
+            self._expression_valid = valid
+            self.view.update_validity(valid)
+
+    def _is_previewable(self, expression):
+        """Cheap check whether the expression can possibly evaluate."""
+        if not expression or self.error_state:
+            return False
+        return self._buffer.valid
+
+    def _start_preview(self):
+        """Start computing the current expression in the background."""
+        self._preview_after_id = None
+        expression = self.expression
+        if not self._is_previewable(expression):
+            return
+
+        if self._preview_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._preview_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="preview"
+            )
+
+        self._preview_expression = expression
+        self._preview_future = self._preview_executor.submit(
+            self._evaluate_preview, expression, self._angle_mode
+        )
+        self._preview_after_id = self.view.after(PREVIEW_POLL_MS, self._poll_preview)
+
+    def _poll_preview(self):
+        """Show the preview once the background computation finishes (Tk thread)."""
+        self._preview_after_id = None
+        future = self._preview_future
+        if future is None:
+            return
+        if not future.done():
+            self._preview_after_id = self.view.after(PREVIEW_POLL_MS, self._poll_preview)
+            return
+
+        result = future.result()
+        if result["success"]:
+            self.view.update_preview(result["result"])
+
+    def _take_preview(self, expression):
+        """
+        Return the preview result for expression, if one was started.
+
+        Waits for a running computation of the same expression instead of
+        starting a second one; a queued one (behind a stale preview) is
+        cancelled.
+
+        Returns:
+            dict: calculate() result, or None if no matching preview exists
+        """
+        future = self._preview_future
+        matches = future is not None and self._preview_expression == expression
+        result = None
+        if matches and not future.cancel():
+            result = future.result()  # Running or done
+        self._cancel_preview()
+        return result
+
     def run(self):
         """Start the GUI main loop."""
         self.view.mainloop()
+        if self._preview_executor is not None:
+            self._preview_executor.shutdown(wait=False, cancel_futures=True)
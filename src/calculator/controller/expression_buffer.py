@@ -0,0 +1,198 @@
+"""
+Token gap buffer for the expression being edited.
+Supports cursor movement and editing anywhere with O(1) edits at the cursor.
+"""
+
+import re
+from src.calculator.logic.validator import IncrementalValidator
+
+
+# Function names (with their opening parenthesis) and constants are single
+# tokens; everything else is one character. Names never start inside a
+# number, so "2e5" stays three tokens.
+TOKEN_PATTERN = re.compile(r'(?<![\d.])[A-Za-z_]\w*\(?|.', re.DOTALL)
+
+
+class ExpressionBuffer:
+    """
+    Expression text stored as a gap buffer of tokens.
+
+    Tokens left of the cursor live on one stack and tokens right of the
+    cursor on another (in reverse order), so inserting, backspacing and
+    moving the cursor by one token are O(1). Backspace removes a whole
+    token, e.g. "sin(" at once.
+
+    An IncrementalValidator mirrors the text left of the cursor, so the
+    validity check is O(1) while the cursor is at the end (the usual case)
+    and O(k) for k characters right of the cursor otherwise.
+    """
+
+    def __init__(self):
+        """Initialize an empty buffer with the cursor at the end."""
+        self._left = []  # Tokens before the cursor
+        self._right = []  # Tokens after the cursor, nearest last
+        self._left_length = 0  # Characters before the cursor
+        self._right_length = 0  # Characters after the cursor
+        self._text = ""  # Cached full text (None when stale)
+        self._validator = IncrementalValidator()
+
+    def __len__(self) -> int:
+        """Number of characters in the buffer."""
+        return self._left_length + self._right_length
+
+    @property
+    def text(self) -> str:
+        """Full expression text."""
+        if self._text is None:
+            self._text = "".join(self._left) + "".join(reversed(self._right))
+        return self._text
+
+    @property
+    def cursor(self) -> int:
+        """Cursor position as a character offset."""
+        return self._left_length
+
+    @property
+    def at_end(self) -> bool:
+        """True if the cursor is after the last token."""
+        return not self._right
+
+    def display_text(self, marker: str) -> str:
+        """
+        Text with a cursor marker, shown only when the cursor is not at the end.
+
+        Args:
+            marker: Character drawn at the cursor position
+
+        Returns:
+            str: Text for the expression display
+        """
+        if self.at_end:
+            return self.text
+        return "".join(self._left) + marker + "".join(reversed(self._right))
+
+    # Editing
+
+    def insert(self, text: str) -> None:
+        """
+        Insert text at the cursor (split into tokens).
+
+        Args:
+            text: Token or pasted text
+        """
+        for token in TOKEN_PATTERN.findall(text):
+            self._push_left(token)
+        self._text = None
+
+    def backspace(self) -> str:
+        """
+        Remove the token before the cursor.
+
+        Returns:
+            str: Removed token ("" if the cursor is at the start)
+        """
+        if not self._left:
+            return ""
+        token = self._pop_left()
+        self._text = None
+        return token
+
+    def delete(self) -> str:
+        """
+        Remove the token after the cursor.
+
+        Returns:
+            str: Removed token ("" if the cursor is at the end)
+        """
+        if not self._right:
+            return ""
+        token = self._right.pop()
+        self._right_length -= len(token)
+        self._text = None
+        return token
+
+    def clear(self) -> None:
+        """Remove all text."""
+        self._left.clear()
+        self._right.clear()
+        self._left_length = 0
+        self._right_length = 0
+        self._text = ""
+        self._validator.reset()
+
+    def set_text(self, text: str) -> None:
+        """
+        Replace all text and put the cursor at the end.
+
+        Args:
+            text: New expression text
+        """
+        self.clear()
+        self.insert(text)
+
+    # Cursor movement
+
+    def move_left(self) -> bool:
+        """Move the cursor one token left. Returns False at the start."""
+        if not self._left:
+            return False
+        token = self._pop_left()
+        self._right.append(token)
+        self._right_length += len(token)
+        return True
+
+    def move_right(self) -> bool:
+        """Move the cursor one token right. Returns False at the end."""
+        if not self._right:
+            return False
+        token = self._right.pop()
+        self._right_length -= len(token)
+        self._push_left(token)
+        return True
+
+    def move_home(self) -> None:
+        """Move the cursor before the first token."""
+        while self.move_left():
+            pass
+
+    def move_end(self) -> None:
+        """Move the cursor after the last token."""
+        while self.move_right():
+            pass
+
+    # Validation
+
+    @property
+    def valid(self) -> bool:
+        """True if the full text would pass InputValidator.validate."""
+        if self.at_end:
+            return self._validator.valid
+        return self._with_right(lambda: self._validator.valid)
+
+    def status(self) -> dict:
+        """Validation result for the full text (InputValidator format)."""
+        if self.at_end:
+            return self._validator.status()
+        return self._with_right(self._validator.status)
+
+    def _with_right(self, read):
+        """Temporarily feed the text right of the cursor to the validator."""
+        for token in reversed(self._right):
+            self._validator.push(token)
+        try:
+            return read()
+        finally:
+            self._validator.pop(self._right_length)
+
+    def _push_left(self, token: str) -> None:
+        """Append a token left of the cursor."""
+        self._left.append(token)
+        self._left_length += len(token)
+        self._validator.push(token)
+
+    def _pop_left(self) -> str:
+        """Remove and return the token left of the cursor."""
+        token = self._left.pop()
+        self._left_length -= len(token)
+        self._validator.pop(len(token))
+        return token
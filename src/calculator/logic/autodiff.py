@@ -0,0 +1,358 @@
+"""
+Forward-mode automatic differentiation of expression trees.
+The optimized tree is compiled with kernel.compile_closure over dual-number
+tables: every value carries one tangent per variable, so one evaluation
+yields the value and the full gradient, for single points or NumPy arrays.
+"""
+import ast
+import math
+from src.calculator.logic.kernel import compile_closure, lazy, piecewise_python
+
+
+class Dual:
+    """
+    Value with its partial derivatives.
+
+    Attributes:
+        value: float or ndarray
+        tangents: One partial derivative per variable (float or ndarray)
+    """
+
+    __slots__ = ("value", "tangents")
+
+    def __init__(self, value, tangents: tuple):
+        self.value = value
+        self.tangents = tangents
+
+
+def _split(x) -> tuple:
+    """(value, tangents) of a Dual, or (x, None) for a constant."""
+    if isinstance(x, Dual):
+        return x.value, x.tangents
+    return x, None
+
+
+def _dual(value, tangents):
+    """A Dual, or the plain value if it does not depend on any variable."""
+    return value if tangents is None else Dual(value, tangents)
+
+
+def _scaled(tangents, factor):
+    """Tangents times a common factor (None stays None)."""
+    if tangents is None:
+        return None
+    return tuple(factor * t for t in tangents)
+
+
+def _combined(left, right, left_factor, right_factor):
+    """left * left_factor + right * right_factor for tangent tuples (None = 0)."""
+    if left is None:
+        return _scaled(right, right_factor)
+    if right is None:
+        return _scaled(left, left_factor)
+    return tuple(l * left_factor + r * right_factor for l, r in zip(left, right))
+
+
+class _Scalar:
+    """Primitives for point-by-point differentiation."""
+
+    sin = staticmethod(math.sin)
+    cos = staticmethod(math.cos)
+    log = staticmethod(math.log)
+
+    @staticmethod
+    def sign(x):
+        return math.copysign(1.0, x) if x else 0.0
+
+    @staticmethod
+    def undefined(t):
+        """Tangent through a non-differentiable function (0 stays 0)."""
+        return 0.0 if t == 0 else math.nan
+
+    @staticmethod
+    def factor(compute, *args):
+        """Derivative factor; NaN where Python raises instead of returning inf/NaN."""
+        try:
+            return compute(*args)
+        except (ArithmeticError, ValueError):
+            return math.nan
+
+
+class _Vector:
+    """Primitives for array differentiation (built on NumPy)."""
+
+    def __init__(self, np):
+        self.sin = np.sin
+        self.cos = np.cos
+        self.log = np.log
+        self.sign = np.sign
+        self.undefined = lambda t: np.where(np.equal(t, 0), 0.0, np.nan)
+        self.factor = lambda compute, *args: compute(*args)
+
+
+def dual_tables(angle_factor: float, functions: dict, binary: dict, unary: dict,
+                vectorized: bool) -> tuple:
+    """
+    Build dual-number function and operator tables.
+
+    Values are computed with the given value tables (the ones of the
+    matching ExpressionKernel), so values are identical to kernel values;
+    only the tangents are added here.
+
+    Args:
+        angle_factor: Radians per unit of the current angle mode
+        functions: Value function table (scalar or NumPy)
+        binary: Value binary operator table
+        unary: Value unary operator table
+        vectorized: Whether values are NumPy arrays
+
+    Returns:
+        tuple: (functions, binary operators, unary operators) over Duals
+    """
+    if vectorized:
+        import numpy as np  # Vectorized tables imply NumPy is installed
+        primitives = _Vector(np)
+    else:
+        primitives = _Scalar
+    k = angle_factor
+
+    def chain(name, derivative):
+        """Function applying d(name)/dx = derivative(x, value) by the chain rule."""
+        function = functions[name]
+
+        def apply(x):
+            value, tangents = _split(x)
+            result = function(value)
+            if tangents is None:
+                return result
+            return Dual(result, _scaled(tangents, primitives.factor(derivative, value, result)))
+
+        return apply
+
+    def non_differentiable(name):
+        """Function whose tangent is 0 for constant arguments and NaN otherwise."""
+        function = functions[name]
+
+        def apply(*args):
+            parts = [_split(arg) for arg in args]
+            result = function(*[value for value, _ in parts])
+            tangent_sets = [tangents for _, tangents in parts if tangents is not None]
+            if not tangent_sets:
+                return result
+            combined = tangent_sets[0]
+            for tangents in tangent_sets[1:]:
+                combined = _combined(combined, tangents, 1, 1)
+            return Dual(result, tuple(primitives.undefined(t) for t in combined))
+
+        return apply
+
+    dual_functions = {
+        name: non_differentiable(name) for name, function in functions.items()
+        if not hasattr(function, "lazy_min_args")
+    }
+    dual_functions.update({
+        # Angle-mode chain factor: d/dx sin(k*x) = k*cos(k*x)
+        'sin': chain('sin', lambda x, v: k * primitives.cos(k * x)),
+        'cos': chain('cos', lambda x, v: -k * primitives.sin(k * x)),
+        'tan': chain('tan', lambda x, v: k / primitives.cos(k * x) ** 2),
+        'sqrt': chain('sqrt', lambda x, v: 0.5 / v),
+        'log': chain('log', lambda x, v: 1 / (x * math.log(10))),
+        'ln': chain('ln', lambda x, v: 1 / x),
+        'abs': chain('abs', lambda x, v: primitives.sign(x)),
+        'float': chain('float', lambda x, v: 1.0),
+    })
+    if 'int' in functions:
+        dual_functions['int'] = lambda x: functions['int'](_split(x)[0])  # Derivative 0
+    # Scalar points take one branch (which works on Duals unchanged)
+    dual_functions['piecewise'] = _piecewise_numpy(np) if vectorized else piecewise_python
+
+    add, sub, mul, div = (binary[ast.Add], binary[ast.Sub], binary[ast.Mult], binary[ast.Div])
+    power, mod, floordiv = binary[ast.Pow], binary[ast.Mod], binary[ast.FloorDiv]
+
+    def dual_add(a, b):
+        (av, at), (bv, bt) = _split(a), _split(b)
+        return _dual(add(av, bv), _combined(at, bt, 1, 1))
+
+    def dual_sub(a, b):
+        (av, at), (bv, bt) = _split(a), _split(b)
+        return _dual(sub(av, bv), _combined(at, bt, 1, -1))
+
+    def dual_mul(a, b):
+        (av, at), (bv, bt) = _split(a), _split(b)
+        return _dual(mul(av, bv), _combined(at, bt, bv, av))
+
+    def dual_div(a, b):
+        (av, at), (bv, bt) = _split(a), _split(b)
+        value = div(av, bv)
+        if at is None and bt is None:
+            return value
+        return Dual(value, _combined(at, bt, 1 / bv, -value / bv))
+
+    def dual_pow(a, b):
+        (av, at), (bv, bt) = _split(a), _split(b)
+        value = power(av, bv)
+        if at is None and bt is None:
+            return value
+        # d(a^b) = b*a^(b-1) da + a^b*ln(a) db; ln(a) only when b varies
+        base_factor = exponent_factor = 0
+        if at is not None:
+            base_factor = primitives.factor(lambda: bv * power(av, bv - 1))
+        if bt is not None:
+            exponent_factor = primitives.factor(lambda: value * primitives.log(av))
+        return Dual(value, _combined(at, bt, base_factor, exponent_factor))
+
+    def dual_mod(a, b):
+        (av, at), (bv, bt) = _split(a), _split(b)
+        value = mod(av, bv)
+        return _dual(value, _combined(at, bt, 1, -floordiv(av, bv)))
+
+    def dual_floordiv(a, b):
+        return floordiv(_split(a)[0], _split(b)[0])  # Piecewise constant
+
+    negative, positive = unary[ast.USub], unary[ast.UAdd]
+
+    def dual_neg(a):
+        value, tangents = _split(a)
+        return _dual(negative(value), _scaled(tangents, -1))
+
+    def dual_pos(a):
+        value, tangents = _split(a)
+        return _dual(positive(value), tangents)
+
+    dual_binary = {
+        ast.Add: dual_add,
+        ast.Sub: dual_sub,
+        ast.Mult: dual_mul,
+        ast.Div: dual_div,
+        ast.Pow: dual_pow,
+        ast.Mod: dual_mod,
+        ast.FloorDiv: dual_floordiv,
+    }
+    def comparison(compare):
+        """Comparison of values (piecewise constant: no tangent)."""
+        return lambda a, b: compare(_split(a)[0], _split(b)[0])
+
+    for op in (ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq):
+        if op in binary:
+            dual_binary[op] = comparison(binary[op])
+
+    dual_unary = {ast.USub: dual_neg, ast.UAdd: dual_pos}
+    return dual_functions, dual_binary, dual_unary
+
+
+def _piecewise_numpy(np):
+    """
+    piecewise() over dual arrays.
+
+    Every branch is evaluated on all points and the selected values and
+    tangents are kept (values of branches not taken are discarded).
+    """
+    @lazy(2)
+    def piecewise(point, *branches):
+        count = len(point)
+        zeros = (0.0,) * count
+        if len(branches) % 2:
+            value, tangents = _split(branches[-1](point))
+        else:
+            value, tangents = np.nan, None
+        tangents = tangents or zeros
+        for index in range(len(branches) // 2 * 2 - 2, -1, -2):  # Last pair first
+            condition = np.asarray(_split(branches[index](point))[0], dtype=float)
+            branch_value, branch_tangents = _split(branches[index + 1](point))
+            taken = condition != 0
+            value = np.where(taken, branch_value, value)
+            tangents = tuple(np.where(taken, t, previous)
+                             for t, previous in zip(branch_tangents or zeros, tangents))
+            undefined = np.isnan(condition)
+            value = np.where(undefined, np.nan, value)
+            tangents = tuple(np.where(undefined, np.nan, t) for t in tangents)
+        return Dual(value, tangents)
+
+    return piecewise
+
+
+class GradientKernel:
+    """
+    Expression compiled into a function returning its value and gradient.
+
+    Calling the kernel with one value sequence per variable returns
+    (values, gradients), gradients holding one sequence per variable.
+    Same conventions as ExpressionKernel: NumPy arrays when vectorized,
+    lists otherwise; undefined values or derivatives are NaN or inf.
+
+    Attributes:
+        variables: Variable names, in call argument order
+        vectorized: Whether NumPy evaluates the kernel
+    """
+
+    __slots__ = ("variables", "vectorized", "_root")
+
+    def __init__(self, tree: ast.AST, variables: tuple, tables: tuple, constants: dict,
+                 vectorized: bool):
+        """
+        Compile an expression tree over dual numbers.
+
+        Args:
+            tree: Expression node (optimized tree from SafeEvaluator.compile)
+            variables: Variable names
+            tables: dual_tables() result
+            constants: Named constants (pi, e)
+            vectorized: Whether the tables operate on NumPy arrays
+
+        Raises:
+            UndefinedName: If the tree uses an unknown name
+            KernelError: If the tree uses an unsupported construct
+        """
+        self.variables = tuple(variables)
+        self.vectorized = vectorized
+        slots = {name: index for index, name in enumerate(self.variables)}
+        functions, binary, unary = tables
+        self._root = compile_closure(tree, slots, functions, binary, unary, constants)
+
+    def _seeds(self, point: tuple) -> tuple:
+        """Variable values as Duals with unit tangents."""
+        count = len(point)
+        return tuple(
+            Dual(value, tuple(1.0 if j == i else 0.0 for j in range(count)))
+            for i, value in enumerate(point)
+        )
+
+    def __call__(self, *columns) -> tuple:
+        """
+        Evaluate the expression and its gradient at every point.
+
+        Args:
+            *columns: One sequence (or array) of values per variable
+
+        Returns:
+            tuple: (values, [partial derivatives per variable])
+        """
+        count = len(self.variables)
+        if self.vectorized:
+            import numpy as np
+            columns = tuple(np.asarray(column, dtype=float) for column in columns)
+            shape = np.broadcast_shapes(*(column.shape for column in columns))
+            with np.errstate(all="ignore"):
+                value, tangents = _split(self._root(self._seeds(columns)))
+                if tangents is None:
+                    tangents = (0.0,) * count
+                values = np.broadcast_to(np.asarray(value, dtype=float), shape).copy()
+                gradients = [np.broadcast_to(np.asarray(t, dtype=float), shape).copy()
+                             for t in tangents]
+            return values, gradients
+
+        values = []
+        gradients = [[] for _ in range(count)]
+        for point in zip(*columns):
+            try:
+                value, tangents = _split(self._root(self._seeds(point)))
+                value = float(value)
+                tangents = [float(t) for t in tangents] if tangents else [0.0] * count
+            except (ValueError, TypeError):
+                value, tangents = math.nan, [math.nan] * count
+            except (ZeroDivisionError, OverflowError):
+                value, tangents = math.inf, [math.nan] * count
+            values.append(value)
+            for column, tangent in zip(gradients, tangents):
+                column.append(tangent)
+        return values, gradients
@@ -4,7 +4,45 @@ Main calculator engine with Decimal precision and formatted output.
 """
 from decimal import Decimal, getcontext, ROUND_HALF_UP
 from src.calculator.logic.validator import InputValidator
-from src.calculator.logic.evaluator import SafeEvaluator
+from src.calculator.logic.evaluator import SafeEvaluator, _to_decimal
+from src.calculator.logic import linalg
+from src.calculator.config.locale import ERROR_DATA_FILE
+from src.calculator.config.constants import PLOT_POINTS
+
+
+def _format_result(decimal_result: Decimal) -> str:
+    """
+    Format a result as a normalized string (no trailing zeros).
+
+    Args:
+        decimal_result: Evaluated result (a NumPy array for matrices and
+            vectors, summarized by linalg.summarize)
+
+    Returns:
+        str: Result without trailing zeros or scientific notation
+    """
+    if linalg.is_array(decimal_result):
+        return linalg.summarize(decimal_result,
+                                lambda value: _format_result(_to_decimal(value)))
+
+    # Use normalize() to remove trailing zeros
+    # e.g., Decimal("3.00") -> Decimal("3")
+    #       Decimal("0.30") -> Decimal("0.3")
+    normalized = decimal_result.normalize()
+
+    # Convert to string, avoiding scientific notation
+    result_string = str(normalized)
+
+    # Check if normalized used scientific notation (e.g., "2E+1")
+    if 'E' in result_string or 'e' in result_string:
+        # Format without scientific notation
+        # Use a large number of decimal places, then strip trailing zeros
+        result_string = format(normalized, '.20f')
+        # Only strip trailing zeros after decimal point
+        if '.' in result_string:
+            result_string = result_string.rstrip('0').rstrip('.')
+
+    return result_string
 
 
 class CalculatorEngine:
@@ -38,7 +76,7 @@ class CalculatorEngine:
         """
         self.evaluator.set_angle_mode(mode)
 
-    def calculate(self, expression: str) -> dict:
+    def calculate(self, expression: str, point: dict = None) -> dict:
         """
         Calculate the result of a mathematical expression.
 
@@ -49,6 +87,7 @@ class CalculatorEngine:
 
         Args:
             expression: The expression string to calculate
+            point: Variable name -> value (see SafeEvaluator.evaluate)
 
         Returns:
             dict with keys:
@@ -68,7 +107,7 @@ class CalculatorEngine:
             }
 
         # Step 2: Evaluate expression
-        evaluation = self.evaluator.evaluate(expression)
+        evaluation = self.evaluator.evaluate(expression, point)
 
         if not evaluation["success"]:
             # Evaluation failed - return error
@@ -79,29 +118,107 @@ class CalculatorEngine:
             }
 
         # Step 3: Format result
-        decimal_result = evaluation["result"]
-
-        # Use normalize() to remove trailing zeros
-        # e.g., Decimal("3.00") -> Decimal("3")
-        #       Decimal("0.30") -> Decimal("0.3")
-        normalized = decimal_result.normalize()
-
-        # Convert to string, avoiding scientific notation
-        result_string = str(normalized)
-
-        # Check if normalized used scientific notation (e.g., "2E+1")
-        if 'E' in result_string or 'e' in result_string:
-            # Format without scientific notation
-            # Use a large number of decimal places, then strip trailing zeros
-            result_string = format(normalized, '.20f')
-            # Only strip trailing zeros after decimal point
-            if '.' in result_string:
-                result_string = result_string.rstrip('0').rstrip('.')
-            else:
-                result_string = result_string
-
         return {
             "success": True,
-            "result": result_string,
+            "result": _format_result(evaluation["result"]),
             "error": None
         }
+
+    def plot(self, expression: str, lower: float, upper: float,
+             points: int = PLOT_POINTS, variable: str = "x") -> dict:
+        """
+        Validate an expression and sample it for plotting.
+
+        Args:
+            expression: Function of `variable`
+            lower: Range start
+            upper: Range end
+            points: Largest number of points returned
+            variable: Variable name
+
+        Returns:
+            dict with the keys of SafeEvaluator.plot
+        """
+        validation = self.validator.validate(expression)
+        if not validation["valid"]:
+            return {"success": False, "x": None, "y": None, "error": validation["error"],
+                    "evaluations": None}
+        return self.evaluator.plot(expression, lower, upper, points, variable)
+
+    def format_value(self, value: float) -> str:
+        """
+        Format a computed float exactly as calculate() formats its results.
+
+        Args:
+            value: Finite value (e.g. from an expression kernel)
+
+        Returns:
+            str: Result string
+        """
+        return _format_result(_to_decimal(value))
+
+    def statistic(self, name: str, data, p=None, column: str = None) -> dict:
+        """
+        Compute a statistic over a list of numbers or a data file.
+
+        Files are streamed in bounded chunks (see batch.dataset), so their
+        size is not limited by memory.
+
+        Args:
+            name: mean, variance, stdev, min, max, median or percentile
+            data: Sequence of numbers, or path of a data file (one number
+                per line, or CSV with a header line when column is given)
+            p: Percent for percentile (0 to 100)
+            column: CSV column name
+
+        Returns:
+            dict with the keys of calculate() plus:
+                - count (int): Number of values (None if failed)
+        """
+        if not isinstance(data, str):
+            evaluation = self.evaluator.statistic(name, [data], p)
+        else:
+            from src.calculator.batch.dataset import Dataset  # Only file statistics need it
+            try:
+                with Dataset(data, header=column is not None) as dataset:
+                    names = None if column is None else (column,)
+                    chunks = (columns[0] for columns in dataset.chunks(names))
+                    evaluation = self.evaluator.statistic(name, chunks, p)
+            except OSError:
+                evaluation = {"success": False, "result": None, "error": ERROR_DATA_FILE,
+                              "count": None}
+            except ValueError as e:  # Unknown column
+                evaluation = {"success": False, "result": None, "error": str(e),
+                              "count": None}
+
+        if evaluation["success"]:
+            evaluation["result"] = _format_result(evaluation["result"])
+        return evaluation
+
+    def calculate_batch(self, expressions) -> dict:
+        """
+        Calculate many expressions, sharing work between them.
+
+        Structurally identical subexpressions (e.g. sqrt(2), factorial(50))
+        are computed once per batch and reused within and across
+        expressions. Results are identical to calling calculate() on each
+        expression.
+
+        Args:
+            expressions: Iterable of expression strings
+
+        Returns:
+            dict with keys:
+                - results (list): One calculate() result dict per expression
+                - stats (dict): Subexpression reuse (lookups, hits, hit_rate)
+        """
+        self.evaluator.start_batch()
+        try:
+            results = [self.calculate(expression) for expression in expressions]
+        finally:
+            stats = self.evaluator.end_batch()
+
+        return {
+            "results": results,
+            "stats": stats
+        }
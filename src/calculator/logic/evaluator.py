@@ -2,12 +2,17 @@
 SafeEvaluator - safely evaluates mathematical expressions using simpleeval.
 Converts results to Decimal for precision arithmetic.
 Supports scientific functions with angle mode and power operator.
+Parsed expressions are optimized once and cached in compiled form.
+Special forms (integrate, solve, diff, sum, prod, piecewise/if) receive their
+arguments unevaluated and run on array kernels compiled from the optimized tree.
 """
 import ast
+import copy
 import math
 import operator
+import re
+from collections import OrderedDict
 from decimal import Decimal
-from simpleeval import SimpleEval, DEFAULT_FUNCTIONS, InvalidExpression, NameNotDefined
 from src.calculator.config.locale import (
     ERROR_DIVISION_BY_ZERO,
     ERROR_INVALID_EXPRESSION,
@@ -17,7 +22,18 @@ from src.calculator.config.locale import (
     ERROR_FACTORIAL_NEGATIVE,
     ERROR_FACTORIAL_TOO_LARGE,
     ERROR_MATH_DOMAIN,
-    ERROR_OVERFLOW
+    ERROR_OVERFLOW,
+    ERROR_INTEGRAL_NOT_CONVERGED,
+    ERROR_NO_ROOT,
+    ERROR_SERIES_BOUNDS,
+    ERROR_SERIES_TOO_LONG,
+    ERROR_STATS_NO_DATA,
+    ERROR_STATS_INVALID_VALUE,
+    ERROR_MATRIX_NUMPY,
+    ERROR_MATRIX_SHAPE,
+    ERROR_MATRIX_SINGULAR,
+    ERROR_MATRIX_TOO_LARGE,
+    ERROR_PLOT_RANGE
 )
 from src.calculator.config.constants import (
     DEFAULT_ANGLE_MODE,
@@ -25,8 +41,141 @@ from src.calculator.config.constants import (
     ANGLE_MODE_RADIANS,
     ANGLE_MODE_GRADIANS,
     MATH_CONSTANTS,
-    MAX_FACTORIAL_INPUT
+    MAX_FACTORIAL_INPUT,
+    MAX_COMPILE_CACHE_ENTRIES,
+    MAX_KERNEL_CACHE_ENTRIES,
+    PLOT_POINTS
 )
+from src.calculator.logic.optimizer import ExpressionOptimizer, BINDING_FORMS
+from src.calculator.logic.kernel import (
+    ExpressionKernel,
+    KernelError,
+    UndefinedName,
+    numpy_available,
+    numpy_tables,
+    scalar_tables
+)
+from src.calculator.logic.autodiff import GradientKernel, dual_tables
+from src.calculator.logic.polynomial import PolynomialNode, finite as polynomial_finite
+from src.calculator.logic import quadrature, roots, series, statistics, linalg, plotting
+
+
+def _simpleeval():
+    """
+    Import simpleeval on first use.
+
+    Keeps `import src.calculator.logic` cheap for code paths that never
+    evaluate anything (validation, editing, CLI startup).
+    """
+    import simpleeval
+    return simpleeval
+
+
+# if( call, rewritten to piecewise( before parsing (if is a Python keyword)
+_IF_CALL = re.compile(r'\bif\s*\(')
+
+
+def _to_decimal(result) -> Decimal:
+    """
+    Convert an evaluation result to Decimal.
+
+    Args:
+        result: int or float computed by simpleeval
+
+    Returns:
+        Decimal: Exact for ints, rounded to 10 decimals for floats
+    """
+    # simpleeval uses float internally, so we need to convert
+    if isinstance(result, int):
+        # Direct conversion for integers (no precision loss)
+        return Decimal(result)
+    # Use round(result, 10) to handle float precision issues before conversion
+    return Decimal(str(round(result, 10)))
+
+
+def _check_gradient(value: float, partials: list) -> None:
+    """
+    Raise the evaluator's error for an undefined value or derivative.
+
+    Raises:
+        ValueError: If the value is NaN or a partial derivative is not finite
+        OverflowError: If the value is infinite
+    """
+    if math.isnan(value):
+        raise ValueError(ERROR_MATH_DOMAIN)
+    if math.isinf(value):
+        raise OverflowError(ERROR_OVERFLOW)
+    if not all(math.isfinite(partial) for partial in partials):
+        raise ValueError(ERROR_MATH_DOMAIN)
+
+
+def _bind(node: ast.AST, point: dict, bound: frozenset = frozenset()) -> ast.AST:
+    """
+    Copy of a tree with variable names replaced by values.
+
+    Names bound by an enclosing form (integrate, sum, ...) are kept; only
+    nodes on the path to a replaced name are copied, the rest is shared.
+
+    Args:
+        node: Tree (not modified)
+        point: Variable name -> value
+        bound: Names bound by enclosing forms
+
+    Returns:
+        ast.AST: Bound tree (node itself if nothing was replaced)
+    """
+    if isinstance(node, ast.Name):
+        if node.id in point and node.id not in bound:
+            return ast.copy_location(ast.Constant(point[node.id]), node)
+        return node
+
+    index = None
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        index = BINDING_FORMS.get(node.func.id)
+        if index is not None and (index >= len(node.args)
+                                  or not isinstance(node.args[index], ast.Name)):
+            index = None
+
+    copied = None
+    for field, value in ast.iter_fields(node):
+        if isinstance(value, list):
+            new = []
+            for position, item in enumerate(value):
+                if not isinstance(item, ast.AST) or (field == "args" and position == index):
+                    new.append(item)
+                elif field == "args" and index is not None and position < index:
+                    # The body sees the bound variable; the other arguments do not
+                    new.append(_bind(item, point, bound | {node.args[index].id}))
+                else:
+                    new.append(_bind(item, point, bound))
+            changed = any(a is not b for a, b in zip(new, value))
+        elif isinstance(value, ast.AST):
+            new = _bind(value, point, bound)
+            changed = new is not value
+        else:
+            continue
+        if changed:
+            copied = copied or copy.copy(node)
+            setattr(copied, field, new)
+    return copied or node
+
+
+class CompiledExpression:
+    """
+    Compiled form of an expression: parsed tree plus optimized tree.
+
+    Attributes:
+        source: Original expression string
+        tree: Node tree as parsed by simpleeval (^ already mapped to **)
+        optimized: Tree after constant folding and simplification
+    """
+
+    __slots__ = ("source", "tree", "optimized")
+
+    def __init__(self, source: str, tree: ast.AST, optimized: ast.AST):
+        self.source = source
+        self.tree = tree
+        self.optimized = optimized
 
 
 class SafeEvaluator:
@@ -41,6 +190,18 @@ class SafeEvaluator:
     - Mathematical constants (pi, e)
     - Converts float results to Decimal for precision
     - Returns Polish error messages
+    - Constant folding / simplification with a bounded compile cache
+    - integrate(expr, var, a, b) via vectorized adaptive Gauss-Kronrod
+    - solve(expr, var, lo, hi) via grid bracketing and vectorized Brent
+    - diff(expr, var, x0) and gradients via forward-mode dual numbers
+    - sum/prod(expr, k, a, b) in closed form or in vectorized chunks
+    - Comparisons and lazy if(cond, a, b) / piecewise(c1, v1, ..., default)
+    - mean/variance/stdev/min/max/median/percentile over arguments or
+      streamed data chunks
+    - Matrix/vector literals ([[1, 2], [3, 4]]), @, det, inv, transpose,
+      eig and solve(A, b) on NumPy arrays
+    - Expanded polynomials evaluated with Horner's scheme (see optimizer)
+    - Plot data for y = f(x): adaptive sampling with gaps, LTTB downsampling
     """
 
     def __init__(self):
@@ -48,7 +209,16 @@ class SafeEvaluator:
         self.angle_mode = DEFAULT_ANGLE_MODE
         self.functions = self._build_functions()
         self.names = self._build_names()
+        self.forms = self._build_forms()
         self._evaluator = self._build_evaluator()
+        self._optimizer = ExpressionOptimizer(self._evaluator)
+        self._compiled = OrderedDict()  # expression -> CompiledExpression (LRU)
+        self._kernels = OrderedDict()  # (tree dump, variables) -> ExpressionKernel (LRU)
+        self._kernel_tables = None  # Function/operator tables for kernels (per angle mode)
+        self._gradient_tables = None  # Dual-number tables for gradient kernels (per angle mode)
+        self.last_integration = None  # quadrature.integrate() report of the last integrate()
+        self.last_solve = None  # roots.find_roots() report of the last solve()
+        self.last_series = None  # series report of the last sum()/prod()
 
     def _build_functions(self) -> dict:
         """
@@ -58,7 +228,7 @@ class SafeEvaluator:
             dict: Function name -> function mapping
         """
         # Start with simpleeval's default safe functions
-        functions = DEFAULT_FUNCTIONS.copy()
+        functions = _simpleeval().DEFAULT_FUNCTIONS.copy()
 
         # Add angle-aware trigonometric functions
         functions.update({
@@ -76,6 +246,12 @@ class SafeEvaluator:
             'factorial': self._safe_factorial,
         })
 
+        # Statistics over their arguments: mean(1, 2, 3), percentile(90, ...)
+        functions.update(statistics.literal_functions())
+
+        # Matrix functions (NumPy is imported when one is first called)
+        functions.update(linalg.functions())
+
         return functions
 
     def _build_names(self) -> dict:
@@ -87,22 +263,84 @@ class SafeEvaluator:
         """
         return MATH_CONSTANTS.copy()
 
-    def _build_evaluator(self) -> SimpleEval:
+    def _build_forms(self) -> dict:
+        """
+        Build the special forms: calls evaluated from their unevaluated
+        argument nodes (the optimizer leaves their bound variable alone,
+        see optimizer.BINDING_FORMS).
+
+        Returns:
+            dict: Form name -> handler(argument nodes)
+        """
+        return {
+            'integrate': self._integrate_form,
+            'solve': self._solve_form,
+            'diff': self._diff_form,
+            'sum': lambda args: self._series_form(args, product=False),
+            'prod': lambda args: self._series_form(args, product=True),
+            'piecewise': self._piecewise_form,
+        }
+
+    def _build_evaluator(self) -> "simpleeval.SimpleEval":
         """
         Build a SimpleEval instance.
 
         Returns:
             SimpleEval: Configured evaluator instance
         """
-        evaluator = SimpleEval()
+        evaluator = _simpleeval().SimpleEval()
         evaluator.functions = self.functions
         evaluator.names = self.names
 
+        # Route special forms before simpleeval evaluates call arguments
+        eval_call = evaluator.nodes[ast.Call]
+        forms = self.forms
+
+        def eval_call_or_form(node):
+            if isinstance(node.func, ast.Name) and node.func.id in forms:
+                return forms[node.func.id](node.args)
+            return eval_call(node)
+
+        evaluator.nodes[ast.Call] = eval_call_or_form
+
+        # Matrix/vector literals and array-aware operators (@ = matrix product)
+        evaluator.nodes[ast.List] = lambda node: linalg.from_elements(
+            [evaluator._eval(element) for element in node.elts]
+        )
+        evaluator.operators = linalg.array_operators(evaluator.operators)
+
+        # Polynomials found by the optimizer (Horner's scheme)
+        evaluator.nodes[PolynomialNode] = self._eval_polynomial
+
         # Note: ^ operator is replaced with ** in preprocessing (see evaluate method)
         # This ensures correct operator precedence for exponentiation
 
         return evaluator
 
+    def _eval_polynomial(self, node: PolynomialNode):
+        """
+        Evaluate a PolynomialNode with Horner's scheme.
+
+        Plain numbers use Python arithmetic (int stays exact); other values
+        (arrays) go through the evaluator's operators. A non-finite operand
+        evaluates the expanded tree instead (Horner differs there).
+
+        Raises:
+            OverflowError: If a finite argument gives an infinite value,
+                as the expanded powers would
+        """
+        x = self._evaluator._eval(node.operand)
+        if not polynomial_finite(x):
+            return self._evaluator._eval(_bind(node.expanded, {node.variable: x}))
+        if type(x) in (int, float):
+            value = node.polynomial(x)
+            if type(value) is float and not math.isfinite(value) and math.isfinite(x):
+                raise OverflowError(ERROR_OVERFLOW)
+            return value
+        operators = self._evaluator.operators
+        return node.polynomial.evaluate(x, operators[ast.Add], operators[ast.Mult],
+                                        operators[ast.Pow])
+
     def _to_radians(self, angle: float) -> float:
         """
         Convert angle to radians based on current angle mode.
@@ -164,42 +402,509 @@ class SafeEvaluator:
         # Rebuild functions to capture new angle mode
         self.functions = self._build_functions()
         self._evaluator = self._build_evaluator()
+        self._kernels.clear()
+        self._kernel_tables = None
+        self._gradient_tables = None
+        optimizer = ExpressionOptimizer(self._evaluator)
+        if self._optimizer.memo_active:
+            # Mode changed mid-batch: values memoized so far are stale
+            optimizer.start_memo()
+        self._optimizer = optimizer
+        # Folded trig values depend on the angle mode
+        self._compiled.clear()
+
+    def start_batch(self) -> None:
+        """
+        Start a batch: subexpressions folded from now on are computed once
+        and reused across all expressions until end_batch().
+        """
+        self._optimizer.start_memo()
+
+    def end_batch(self) -> dict:
+        """
+        End a batch and release its subexpression memo.
+
+        Returns:
+            dict with lookups, hits and hit_rate of the subexpression memo
+        """
+        return self._optimizer.stop_memo()
+
+    def compile(self, expression: str) -> CompiledExpression:
+        """
+        Parse and optimize an expression, reusing the cached compiled form.
+
+        Args:
+            expression: The expression string to compile
+
+        Returns:
+            CompiledExpression: Parsed and optimized trees
+
+        Raises:
+            SyntaxError: If the expression cannot be parsed
+            InvalidExpression: If the expression is empty
+        """
+        compiled = self._compiled.get(expression)
+        if compiled is not None:
+            self._compiled.move_to_end(expression)
+            return compiled
+
+        # Preprocess: replace ^ with ** for correct power operator precedence
+        # BitXor (^) has wrong precedence, so we use ** which has correct precedence
+        processed_expr = expression.replace('^', '**')
+        # if is a Python keyword; if(c, a, b) is piecewise(c, a, b)
+        processed_expr = _IF_CALL.sub('piecewise(', processed_expr)
+        tree = self._evaluator.parse(processed_expr)
+        compiled = CompiledExpression(
+            expression, tree, self._optimizer.optimize(tree)
+        )
+
+        self._compiled[expression] = compiled
+        if len(self._compiled) > MAX_COMPILE_CACHE_ENTRIES:
+            self._compiled.popitem(last=False)  # Evict least recently used
+
+        return compiled
+
+    def compile_kernel(self, expression, variables) -> ExpressionKernel:
+        """
+        Compile an expression into an array kernel of the given variables.
+
+        The optimized tree is compiled once per angle mode and cached;
+        kernels use NumPy when it is installed.
+
+        Args:
+            expression: Expression string, or an optimized tree node
+            variables: Variable names (kernel argument order)
+
+        Returns:
+            ExpressionKernel: Compiled kernel
+
+        Raises:
+            SyntaxError: If the expression cannot be parsed or compiled
+            NameNotDefined: If the expression uses an unknown name
+        """
+        return self._cached_kernel(expression, variables, gradient=False)
+
+    def compile_gradient(self, expression, variables) -> GradientKernel:
+        """
+        Compile an expression into a kernel returning value and gradient.
+
+        Forward-mode automatic differentiation: one evaluation gives the
+        value and every partial derivative, for single points or arrays.
+
+        Args:
+            expression: Expression string, or an optimized tree node
+            variables: Variable names (kernel argument order)
+
+        Returns:
+            GradientKernel: Compiled kernel
+
+        Raises:
+            SyntaxError: If the expression cannot be parsed or compiled
+            NameNotDefined: If the expression uses an unknown name
+        """
+        return self._cached_kernel(expression, variables, gradient=True)
+
+    def _cached_kernel(self, expression, variables, gradient: bool):
+        """Compile (or reuse) a value or gradient kernel."""
+        tree = self.compile(expression).optimized if isinstance(expression, str) else expression
+        variables = tuple(variables)
+        key = (ast.dump(tree), variables, gradient)
+        kernel = self._kernels.get(key)
+        if kernel is not None:
+            self._kernels.move_to_end(key)
+            return kernel
+
+        vectorized = numpy_available()
+        if self._kernel_tables is None:
+            if vectorized:
+                self._kernel_tables = numpy_tables(self._to_radians(1.0), self.functions)
+            else:
+                self._kernel_tables = scalar_tables(self.functions, self._evaluator.operators,
+                                                    self._evaluator.operators)
+        try:
+            if gradient:
+                if self._gradient_tables is None:
+                    self._gradient_tables = dual_tables(self._to_radians(1.0),
+                                                        *self._kernel_tables, vectorized)
+                kernel = GradientKernel(tree, variables, self._gradient_tables, self.names,
+                                        vectorized)
+            else:
+                functions, binary, unary = self._kernel_tables
+                kernel = ExpressionKernel(tree, variables, functions, binary, unary,
+                                          self.names, vectorized)
+        except UndefinedName as e:
+            raise _simpleeval().NameNotDefined(e.name, ast.unparse(tree))
+        except KernelError:
+            raise SyntaxError(ERROR_INVALID_EXPRESSION)
+
+        self._kernels[key] = kernel
+        if len(self._kernels) > MAX_KERNEL_CACHE_ENTRIES:
+            self._kernels.popitem(last=False)
+        return kernel
+
+    def _bound_variable(self, node: ast.AST) -> str:
+        """
+        Name of the variable bound by a special form.
+
+        Raises:
+            SyntaxError: If the node is not a free name (constants such as
+                pi and functions cannot be bound)
+        """
+        if (
+            not isinstance(node, ast.Name)
+            or node.id in self.names
+            or node.id in self.functions
+            or node.id in self.forms
+        ):
+            raise SyntaxError(ERROR_INVALID_EXPRESSION)
+        return node.id
+
+    def _integrate_form(self, args: list) -> float:
+        """
+        Evaluate integrate(expr, var, a, b).
+
+        The integrand is compiled once into a kernel and integrated with
+        adaptive Gauss-Kronrod; the report (including the error estimate)
+        is kept in last_integration.
+
+        Args:
+            args: Argument nodes (integrand, variable, lower, upper)
+
+        Returns:
+            float: Integral value
+
+        Raises:
+            SyntaxError: On a wrong number of arguments or a bad variable
+            ValueError: If the integrand is undefined on the interval or
+                the integral does not converge
+        """
+        if len(args) != 4:
+            raise SyntaxError(ERROR_INVALID_EXPRESSION)
+        self.last_integration = None
+        body, variable, lower, upper = args
+        kernel = self.compile_kernel(body, (self._bound_variable(variable),))
+        lower = float(self._evaluator._eval(lower))
+        upper = float(self._evaluator._eval(upper))
+
+        report = quadrature.integrate(kernel, lower, upper)
+        self.last_integration = report
+        if not report["converged"]:
+            raise ValueError(ERROR_INTEGRAL_NOT_CONVERGED)
+        return report["value"]
+
+    def integrate(self, expression: str, variable: str, lower, upper) -> dict:
+        """
+        Integrate an expression over [lower, upper].
+
+        Args:
+            expression: Integrand
+            variable: Integration variable name
+            lower: Lower bound (number or expression)
+            upper: Upper bound (number or expression)
+
+        Returns:
+            dict with the keys of evaluate() plus:
+                - error_estimate (float): Absolute error estimate, None if failed
+        """
+        result = self.evaluate(f"integrate({expression}, {variable}, {lower}, {upper})")
+        report = self.last_integration
+        result["error_estimate"] = report["error_estimate"] if result["success"] else None
+        return result
+
+    def _solve_form(self, args: list):
+        """
+        Evaluate solve(expr, var, lo, hi): the smallest root of expr = 0.
+
+        Every root in the interval is kept in last_solve. Points where the
+        expression is undefined are masked, not errors. With two arguments,
+        solve(A, b) solves the linear system A @ x = b instead.
+
+        Args:
+            args: Argument nodes (expression, variable, lower, upper), or
+                (matrix, right-hand side)
+
+        Returns:
+            float: Smallest root (ndarray x for a linear system)
+
+        Raises:
+            SyntaxError: On a wrong number of arguments or a bad variable
+            ValueError: If there is no root in the interval
+        """
+        if len(args) == 2:
+            return linalg.solve(*(self._evaluator._eval(arg) for arg in args))
+        if len(args) != 4:
+            raise SyntaxError(ERROR_INVALID_EXPRESSION)
+        self.last_solve = None
+        body, variable, lower, upper = args
+        kernel = self.compile_kernel(body, (self._bound_variable(variable),))
+        lower = float(self._evaluator._eval(lower))
+        upper = float(self._evaluator._eval(upper))
+
+        report = roots.find_roots(kernel, lower, upper)
+        self.last_solve = report
+        if not report["roots"]:
+            raise ValueError(ERROR_NO_ROOT)
+        return report["roots"][0]
+
+    def solve(self, expression: str, variable: str, lower, upper) -> dict:
+        """
+        Find every root of expression = 0 in [lower, upper].
+
+        Args:
+            expression: Left-hand side of the equation
+            variable: Unknown
+            lower: Interval start (number or expression)
+            upper: Interval end (number or expression)
+
+        Returns:
+            dict with the keys of evaluate() (result = smallest root) plus:
+                - roots (list): Every root as Decimal, None if failed
+        """
+        result = self.evaluate(f"solve({expression}, {variable}, {lower}, {upper})")
+        if result["success"]:
+            result["roots"] = [_to_decimal(root) for root in self.last_solve["roots"]]
+        else:
+            result["roots"] = None
+        return result
+
+    def _series_form(self, args: list, product: bool) -> float:
+        """
+        Evaluate sum(expr, k, a, b) or prod(expr, k, a, b) over k = a..b.
+
+        Arithmetic and geometric series are evaluated in closed form;
+        other terms run on a kernel in fixed-size chunks. The report is
+        kept in last_series.
+
+        Args:
+            args: Argument nodes (term, index variable, first, last)
+            product: Product instead of sum
+
+        Returns:
+            float: Sum or product (0 / 1 for an empty range)
+
+        Raises:
+            SyntaxError: On a wrong number of arguments or a bad variable
+            ValueError: On non-integer bounds, too many terms or an
+                undefined term
+            OverflowError: If a term or the result is infinite
+        """
+        if len(args) != 4:
+            raise SyntaxError(ERROR_INVALID_EXPRESSION)
+        self.last_series = None
+        body, variable, lower, upper = args
+        variable = self._bound_variable(variable)
+        lower, upper = series.integer_bounds(self._evaluator._eval(lower),
+                                             self._evaluator._eval(upper))
+
+        report = series.closed_form(body, variable, self._evaluator._eval, lower, upper,
+                                    product, max_bits=_simpleeval().MAX_POWER)
+        if report is None:
+            kernel = self.compile_kernel(body, (variable,))
+            term = lambda k: self._evaluator._eval(_bind(body, {variable: k}))
+            report = series.evaluate_series(kernel, lower, upper, product, term=term)
+        self.last_series = report
+        return report["value"]
+
+    def _piecewise_form(self, args: list):
+        """
+        Evaluate piecewise(c1, v1, c2, v2, ..., [default]) (and if(c, a, b)).
+
+        Conditions are evaluated in order; only the value of the first
+        true condition (or the default) is evaluated.
+
+        Args:
+            args: Argument nodes (condition/value pairs, optional default)
+
+        Returns:
+            Value of the selected branch
+
+        Raises:
+            SyntaxError: With fewer than two arguments
+            ValueError: If no condition holds and there is no default
+        """
+        if len(args) < 2:
+            raise SyntaxError(ERROR_INVALID_EXPRESSION)
+        evaluate = self._evaluator._eval
+        for index in range(0, len(args) - 1, 2):
+            if evaluate(args[index]):
+                return evaluate(args[index + 1])
+        if len(args) % 2:
+            return evaluate(args[-1])
+        raise ValueError(ERROR_MATH_DOMAIN)
+
+    def _diff_form(self, args: list) -> float:
+        """
+        Evaluate diff(expr, var, x0): the derivative of expr at var = x0.
+
+        Args:
+            args: Argument nodes (expression, variable, point)
+
+        Returns:
+            float: Derivative value
+
+        Raises:
+            SyntaxError: On a wrong number of arguments or a bad variable
+            ValueError: If the expression or its derivative is undefined at x0
+            OverflowError: If the expression is infinite at x0
+        """
+        if len(args) != 3:
+            raise SyntaxError(ERROR_INVALID_EXPRESSION)
+        body, variable, point = args
+        kernel = self.compile_gradient(body, (self._bound_variable(variable),))
+        point = float(self._evaluator._eval(point))
+
+        values, gradients = kernel([point])
+        _check_gradient(values[0], [gradients[0][0]])
+        return float(gradients[0][0])
+
+    def gradient(self, expression: str, point: dict) -> dict:
+        """
+        Evaluate an expression and its gradient at a point.
+
+        Args:
+            expression: Expression in the variables of `point`
+            point: Variable name -> value
+
+        Returns:
+            dict with the keys of evaluate() plus:
+                - gradient (dict): Variable name -> partial derivative as
+                  Decimal, None if failed
+        """
+        variables = tuple(point)
+        try:
+            kernel = self.compile_gradient(expression, variables)
+            values, gradients = kernel(*[[float(point[name])] for name in variables])
+            partials = [column[0] for column in gradients]
+            _check_gradient(values[0], partials)
+        except (ValueError, OverflowError) as e:
+            error = ERROR_OVERFLOW if isinstance(e, OverflowError) else ERROR_MATH_DOMAIN
+            return {"success": False, "result": None, "error": error, "gradient": None}
+        except Exception:
+            return {"success": False, "result": None, "error": ERROR_INVALID_EXPRESSION,
+                    "gradient": None}
+
+        return {
+            "success": True,
+            "result": _to_decimal(float(values[0])),
+            "error": None,
+            "gradient": {
+                name: _to_decimal(float(partial)) for name, partial in zip(variables, partials)
+            }
+        }
+
+    def statistic(self, name: str, chunks, p=None) -> dict:
+        """
+        Compute a statistic over a stream of value chunks in one pass.
+
+        Args:
+            name: Statistic name (mean, variance, stdev, min, max, median,
+                percentile)
+            chunks: Iterable of sequences or arrays of numbers
+            p: Percent for percentile (0 to 100)
+
+        Returns:
+            dict with the keys of evaluate() plus:
+                - count (int): Number of values read (None if failed)
+        """
+        if name not in statistics.STATISTICS or (p is None) != (name != 'percentile'):
+            return {"success": False, "result": None, "error": ERROR_INVALID_EXPRESSION,
+                    "count": None}
+        try:
+            summary = statistics.summarize(chunks)
+            parameters = () if p is None else (float(p),)
+            value = statistics.STATISTICS[name](summary, *parameters)
+        except ValueError as e:
+            error = str(e)
+            if error not in (ERROR_STATS_NO_DATA, ERROR_STATS_INVALID_VALUE):
+                error = ERROR_MATH_DOMAIN
+            return {"success": False, "result": None, "error": error, "count": None}
+
+        return {
+            "success": True,
+            "result": _to_decimal(value),
+            "error": None,
+            "count": summary.count
+        }
+
+    def plot(self, expression: str, lower: float, upper: float,
+             points: int = PLOT_POINTS, variable: str = "x") -> dict:
+        """
+        Sample y = expression over [lower, upper] for plotting.
+
+        The expression is compiled into a kernel (current angle mode) and
+        sampled densely where the curve bends; undefined points and
+        asymptotes are gaps (NaN in y).
+
+        Args:
+            expression: Function of `variable`
+            lower: Range start
+            upper: Range end
+            points: Largest number of points returned
+            variable: Variable name
+
+        Returns:
+            dict with keys:
+                - success (bool): True if sampling succeeded
+                - x (list): Abscissas, None if failed
+                - y (list): Values (NaN at gaps), None if failed
+                - error (str): Error message if failed, None if successful
+                - evaluations (int): Function evaluations, None if failed
+        """
+        try:
+            kernel = self.compile_kernel(expression, (variable,))
+            report = plotting.sample(kernel, float(lower), float(upper), int(points))
+        except _simpleeval().NameNotDefined:
+            error = ERROR_UNDEFINED_VARIABLE
+        except ValueError:
+            error = ERROR_PLOT_RANGE  # Bad range or point count
+        except Exception:
+            error = ERROR_INVALID_EXPRESSION
+        else:
+            return {
+                "success": True,
+                "x": report["x"],
+                "y": report["y"],
+                "error": None,
+                "evaluations": report["evaluations"]
+            }
+        return {"success": False, "x": None, "y": None, "error": error, "evaluations": None}
 
-    def evaluate(self, expression: str) -> dict:
+    def evaluate(self, expression: str, point: dict = None) -> dict:
         """
         Safely evaluate a mathematical expression.
 
         Args:
             expression: The expression string to evaluate
+            point: Variable name -> value, substituted into a copy of the
+                compiled tree (cached trees and kernels stay unbound)
 
         Returns:
             dict with keys:
                 - success (bool): True if evaluation succeeded
                 - result (Decimal): The result if successful, None otherwise
+                  (a float64 NumPy array for matrix and vector results)
                 - error (str): Error message if failed, None if successful
         """
+        simpleeval = _simpleeval()
         try:
-            # Preprocess: replace ^ with ** for correct power operator precedence
-            # BitXor (^) has wrong precedence, so we use ** which has correct precedence
-            processed_expr = expression.replace('^', '**')
+            # Parse + optimize once, then evaluate the optimized tree
+            compiled = self.compile(expression)
+            tree = compiled.optimized
+            if point:
+                tree = _bind(tree, point)
 
             # Use SimpleEval for safe evaluation
             # This prevents code injection and limits to mathematical operations
-            result = self._evaluator.eval(processed_expr)
-
-            # Convert to Decimal for precision
-            # simpleeval uses float internally, so we need to convert
-            # Handle both int and float results
-            if isinstance(result, int):
-                # Direct conversion for integers (no precision loss)
-                decimal_result = Decimal(result)
+            result = self._evaluator.eval(expression, previously_parsed=tree)
+            if linalg.is_array(result):
+                # Matrices and vectors are returned as float arrays
+                linalg.check_finite(result)
             else:
-                # Use round(result, 10) to handle float precision issues before conversion
-                decimal_result = Decimal(str(round(result, 10)))
+                result = _to_decimal(result)
 
             return {
                 "success": True,
-                "result": decimal_result,
+                "result": result,
                 "error": None
             }
 
@@ -215,7 +920,12 @@ class SafeEvaluator:
             # Math domain errors or factorial validation errors
             # Check if it's one of our custom error messages
             error_msg = str(e)
-            if error_msg in [ERROR_FACTORIAL_NOT_INTEGER, ERROR_FACTORIAL_NEGATIVE]:
+            if error_msg in [ERROR_FACTORIAL_NOT_INTEGER, ERROR_FACTORIAL_NEGATIVE,
+                             ERROR_INTEGRAL_NOT_CONVERGED, ERROR_NO_ROOT,
+                             ERROR_SERIES_BOUNDS, ERROR_SERIES_TOO_LONG,
+                             ERROR_STATS_NO_DATA, ERROR_STATS_INVALID_VALUE,
+                             ERROR_MATRIX_NUMPY, ERROR_MATRIX_SHAPE, ERROR_MATRIX_SINGULAR,
+                             ERROR_MATRIX_TOO_LARGE]:
                 return {
                     "success": False,
                     "result": None,
@@ -245,7 +955,7 @@ class SafeEvaluator:
                     "error": ERROR_OVERFLOW
                 }
 
-        except (InvalidExpression, SyntaxError):
+        except (simpleeval.InvalidExpression, SyntaxError):
             # Invalid expression syntax
             return {
                 "success": False,
@@ -253,7 +963,7 @@ class SafeEvaluator:
                 "error": ERROR_INVALID_EXPRESSION
             }
 
-        except NameNotDefined:
+        except simpleeval.NameNotDefined:
             # Undefined variable or function
             return {
                 "success": False,
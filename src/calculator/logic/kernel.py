@@ -0,0 +1,392 @@
+"""
+ExpressionKernel - expression trees compiled into functions of variables.
+Each node of an optimized tree becomes one closure, built once; calling
+the kernel evaluates the whole tree over a batch of points with one NumPy
+operation per node. Without NumPy the same closures run point by point
+on the evaluator's own functions and operators.
+Conditionals (piecewise) are lazy: only the selected branch is evaluated,
+per point in scalar kernels and on the selected subset of points
+(masked evaluation) in NumPy kernels.
+"""
+import ast
+from operator import itemgetter
+from src.calculator.config.locale import ERROR_MATH_DOMAIN
+from src.calculator.logic.polynomial import PolynomialNode, finite
+
+
+# Result of the first NumPy import attempt (None = not tried yet)
+_numpy_module = None
+
+
+def _numpy():
+    """
+    Import NumPy on first use.
+
+    NumPy is optional; returns False if it is not installed.
+    """
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+            _numpy_module = numpy
+        except ImportError:
+            _numpy_module = False
+    return _numpy_module
+
+
+def numpy_available() -> bool:
+    """Check whether kernels are evaluated with NumPy."""
+    return bool(_numpy())
+
+
+def lazy(min_args: int):
+    """
+    Mark a table function as lazy.
+
+    Lazy functions receive the point and their argument closures instead
+    of argument values, and decide what to evaluate.
+
+    Args:
+        min_args: Smallest accepted number of arguments
+    """
+    def mark(function):
+        function.lazy_min_args = min_args
+        return function
+
+    return mark
+
+
+@lazy(2)
+def piecewise_python(point, *branches):
+    """
+    piecewise(c1, v1, c2, v2, ..., [default]) on one point.
+
+    Returns the value of the first branch whose condition is true (only
+    that branch is evaluated), else the default.
+
+    Raises:
+        ValueError: If a condition is undefined, or no condition holds
+            and there is no default
+    """
+    for index in range(0, len(branches) - 1, 2):
+        condition = branches[index](point)
+        if condition != condition:  # NaN
+            raise ValueError(ERROR_MATH_DOMAIN)
+        if condition:
+            return branches[index + 1](point)
+    if len(branches) % 2:
+        return branches[-1](point)
+    raise ValueError(ERROR_MATH_DOMAIN)
+
+
+def scalar_tables(functions: dict, binary: dict, unary: dict) -> tuple:
+    """
+    Build the point-by-point tables for kernels (NumPy not installed).
+
+    Args:
+        functions: Scalar function table of the evaluator
+        binary: Binary (and comparison) operator table of the evaluator
+        unary: Unary operator table of the evaluator
+
+    Returns:
+        tuple: (functions, binary operators, unary operators)
+    """
+    return dict(functions, piecewise=piecewise_python), binary, unary
+
+
+class KernelError(Exception):
+    """Expression uses a construct that cannot be compiled into a kernel."""
+
+
+class UndefinedName(KernelError):
+    """Expression uses a name that is neither a variable nor a constant."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.name = name
+
+
+def numpy_tables(angle_factor: float, functions: dict) -> tuple:
+    """
+    Build the NumPy function and operator tables for kernels.
+
+    Functions without a NumPy equivalent (factorial, rand, ...) are applied
+    element by element with the scalar implementation; points where it
+    raises become NaN.
+
+    Args:
+        angle_factor: Radians per unit of the current angle mode
+        functions: Scalar function table of the evaluator
+
+    Returns:
+        tuple: (functions, binary operators, unary operators)
+    """
+    np = _numpy()
+
+    def trig(function):
+        if angle_factor == 1.0:
+            return function
+        return lambda x: function(x * angle_factor)
+
+    vector_functions = {name: _elementwise(np, function) for name, function in functions.items()}
+    vector_functions.update({
+        'sin': trig(np.sin),
+        'cos': trig(np.cos),
+        'tan': trig(np.tan),
+        'sqrt': np.sqrt,
+        'log': np.log10,
+        'ln': np.log,
+        'abs': np.abs,
+        'int': np.trunc,
+        'float': np.asarray,
+    })
+
+    binary = {
+        ast.Add: np.add,
+        ast.Sub: np.subtract,
+        ast.Mult: np.multiply,
+        ast.Div: np.true_divide,
+        ast.FloorDiv: np.floor_divide,
+        ast.Mod: np.mod,
+        ast.Pow: np.power,
+        ast.Lt: _comparison(np, np.less),
+        ast.LtE: _comparison(np, np.less_equal),
+        ast.Gt: _comparison(np, np.greater),
+        ast.GtE: _comparison(np, np.greater_equal),
+        ast.Eq: _comparison(np, np.equal),
+        ast.NotEq: _comparison(np, np.not_equal),
+    }
+    vector_functions['piecewise'] = _piecewise_numpy(np)
+    unary = {
+        ast.USub: np.negative,
+        ast.UAdd: np.positive,
+    }
+    return vector_functions, binary, unary
+
+
+def _comparison(np, function):
+    """NumPy comparison as 1.0 / 0.0, NaN where an operand is NaN."""
+    def compare(a, b):
+        return np.where(np.isnan(a) | np.isnan(b), np.nan, function(a, b))
+
+    return compare
+
+
+def _piecewise_numpy(np):
+    """piecewise() over arrays: each branch runs only on its own points."""
+    @lazy(2)
+    def piecewise(point, *branches):
+        shape = np.broadcast_shapes(*(np.shape(column) for column in point))
+        columns = [np.broadcast_to(column, shape).ravel() for column in point]
+        result = np.full(columns[0].size if columns else 1, np.nan)
+        pending = np.arange(result.size)  # Points without a selected branch
+
+        def run(closure, indices):
+            value = closure(tuple(column[indices] for column in columns))
+            return np.broadcast_to(np.asarray(value, dtype=float), indices.shape)
+
+        for index in range(0, len(branches) - 1, 2):
+            if not pending.size:
+                break
+            condition = run(branches[index], pending)
+            taken = (condition != 0) & ~np.isnan(condition)
+            if taken.any():
+                result[pending[taken]] = run(branches[index + 1], pending[taken])
+            pending = pending[condition == 0]  # Undefined conditions stay NaN
+        if len(branches) % 2 and pending.size:
+            result[pending] = run(branches[-1], pending)
+        return result.reshape(shape)
+
+    return piecewise
+
+
+def _elementwise(np, function):
+    """Apply a scalar function to every element (errors become NaN)."""
+    def safe(*args):
+        try:
+            return float(function(*args))
+        except (ValueError, TypeError, ArithmeticError):
+            return float("nan")
+
+    ufuncs = {}  # Argument count -> ufunc
+
+    def apply(*args):
+        if not args:
+            return function()
+        if len(args) not in ufuncs:
+            ufuncs[len(args)] = np.frompyfunc(safe, len(args), 1)
+        return np.asarray(ufuncs[len(args)](*args), dtype=float)
+
+    return apply
+
+
+class ExpressionKernel:
+    """
+    Expression compiled into a function of named variables.
+
+    Calling the kernel with one value sequence per variable returns the
+    expression value at every point:
+    - vectorized (NumPy): a float64 array; undefined points are NaN
+      (domain errors) or +/-inf (division by zero, overflow)
+    - scalar fallback: a list of floats with the same NaN/inf convention
+
+    Attributes:
+        variables: Variable names, in call argument order
+        vectorized: Whether NumPy evaluates the kernel
+    """
+
+    __slots__ = ("variables", "vectorized", "_root")
+
+    def __init__(self, tree: ast.AST, variables: tuple, functions: dict, binary: dict,
+                 unary: dict, constants: dict, vectorized: bool):
+        """
+        Compile an expression tree.
+
+        Args:
+            tree: Expression node (optimized tree from SafeEvaluator.compile)
+            variables: Variable names
+            functions: Name -> function table
+            binary: ast operator type -> binary function
+            unary: ast operator type -> unary function
+            constants: Named constants (pi, e)
+            vectorized: Whether the tables operate on NumPy arrays
+
+        Raises:
+            UndefinedName: If the tree uses an unknown name
+            KernelError: If the tree uses an unsupported construct
+        """
+        self.variables = tuple(variables)
+        self.vectorized = vectorized
+        slots = {name: index for index, name in enumerate(self.variables)}
+        self._root = compile_closure(tree, slots, functions, binary, unary, constants)
+
+    def __call__(self, *columns):
+        """
+        Evaluate the expression at every point.
+
+        Args:
+            *columns: One sequence (or array) of values per variable
+
+        Returns:
+            ndarray or list: Expression value per point
+        """
+        if self.vectorized:
+            np = _numpy()
+            columns = tuple(np.asarray(column, dtype=float) for column in columns)
+            with np.errstate(all="ignore"):
+                result = np.asarray(self._root(columns), dtype=float)
+            shape = np.broadcast_shapes(*(column.shape for column in columns))
+            if result.shape != shape:
+                result = np.full(shape, result)  # Expression without variables
+            return result
+
+        root = self._root
+        results = []
+        for point in zip(*columns):
+            try:
+                results.append(float(root(point)))
+            except (ValueError, TypeError):
+                results.append(float("nan"))
+            except (ZeroDivisionError, OverflowError):
+                results.append(float("inf"))
+        return results
+
+
+def compile_closure(node: ast.AST, slots: dict, functions: dict, binary: dict, unary: dict,
+                    constants: dict):
+    """
+    Build the closure evaluating a node from a tuple of variable values.
+
+    The closures only apply the given tables, so the same tree compiles to
+    scalar, array or dual-number (autodiff) evaluation.
+
+    Args:
+        node: Expression node
+        slots: Variable name -> index in the point tuple
+        functions: Name -> function table
+        binary: ast operator type -> binary function
+        unary: ast operator type -> unary function
+        constants: Named constants
+
+    Returns:
+        callable: point -> value
+
+    Raises:
+        UndefinedName: If the tree uses an unknown name
+        KernelError: If the tree uses an unsupported construct
+    """
+    def visit(child):
+        return compile_closure(child, slots, functions, binary, unary, constants)
+
+    if isinstance(node, ast.Expr):
+        return visit(node.value)
+
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = node.value
+        return lambda point: value
+
+    if isinstance(node, ast.Name):
+        if node.id in slots:
+            return itemgetter(slots[node.id])
+        if node.id in constants:
+            value = constants[node.id]
+            return lambda point: value
+        raise UndefinedName(node.id)
+
+    if isinstance(node, ast.BinOp) and type(node.op) in binary:
+        function = binary[type(node.op)]
+        left, right = visit(node.left), visit(node.right)
+        return lambda point: function(left(point), right(point))
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in unary:
+        function = unary[type(node.op)]
+        operand = visit(node.operand)
+        return lambda point: function(operand(point))
+
+    if isinstance(node, PolynomialNode):
+        # Horner's scheme with the table operations (in place over arrays)
+        polynomial, operand = node.polynomial, visit(node.operand)
+        add, mul, power = binary[ast.Add], binary[ast.Mult], binary[ast.Pow]
+        fallback = []  # Expanded tree, compiled on the first non-finite operand
+
+        def horner(point):
+            x = operand(point)
+            if finite(x):
+                return polynomial.evaluate(x, add, mul, power)
+            if not fallback:
+                fallback.append(compile_closure(node.expanded, {node.variable: 0}, functions,
+                                                binary, unary, constants))
+            return fallback[0]((x,))
+        return horner
+
+    if isinstance(node, ast.Compare) and all(type(op) in binary for op in node.ops):
+        # a < b < c is (a < b) * (b < c)
+        comparisons = [binary[type(op)] for op in node.ops]
+        operands = [visit(node.left)] + [visit(child) for child in node.comparators]
+        both = binary[ast.Mult]
+
+        def compare(point):
+            values = [operand(point) for operand in operands]
+            result = comparisons[0](values[0], values[1])
+            for index in range(1, len(comparisons)):
+                result = both(result, comparisons[index](values[index], values[index + 1]))
+            return result
+
+        return compare
+
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+        function = functions.get(node.func.id)
+        if function is None:
+            raise KernelError(node.func.id)
+        args = [visit(arg) for arg in node.args]
+        min_args = getattr(function, "lazy_min_args", None)
+        if min_args is not None:
+            if len(args) < min_args:
+                raise KernelError(node.func.id)
+            return lambda point: function(point, *args)
+        if len(args) == 1:
+            arg = args[0]
+            return lambda point: function(arg(point))
+        return lambda point: function(*[arg(point) for arg in args])
+
+    raise KernelError(type(node).__name__)
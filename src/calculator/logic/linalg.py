@@ -0,0 +1,314 @@
+"""
+Matrix and vector values backed by NumPy arrays.
+Literals ([1, 2], [[1, 2], [3, 4]]) evaluate to float arrays; operators
+and functions hand whole arrays to NumPy/LAPACK, so there is no Python
+work per element. + - * / ^ are elementwise (with scalar broadcasting),
+@ is the matrix product. NumPy is imported on first use only; without it
+matrix expressions fail with ERROR_MATRIX_NUMPY.
+"""
+import ast
+from src.calculator.logic.kernel import numpy_available
+from src.calculator.config.constants import (
+    MATRIX_MAX_ELEMENTS,
+    MATRIX_DISPLAY_ELEMENTS,
+    MATRIX_DISPLAY_EDGE
+)
+from src.calculator.config.locale import (
+    ERROR_MATH_DOMAIN,
+    ERROR_OVERFLOW,
+    ERROR_MATRIX_NUMPY,
+    ERROR_MATRIX_SHAPE,
+    ERROR_MATRIX_SINGULAR,
+    ERROR_MATRIX_TOO_LARGE,
+    INFO_MATRIX_SUMMARY,
+    INFO_VECTOR_SUMMARY
+)
+
+
+# Operand types handled by the scalar operators without any check
+_NUMBERS = (int, float)
+
+
+def _np():
+    """NumPy module, or ValueError(ERROR_MATRIX_NUMPY) if not installed."""
+    if not numpy_available():
+        raise ValueError(ERROR_MATRIX_NUMPY)
+    import numpy as np
+    return np
+
+
+def is_array(value) -> bool:
+    """Check whether a value is a matrix or vector (not a scalar)."""
+    return getattr(value, "ndim", 0) > 0
+
+
+def _matrix(value, square: bool = False):
+    """
+    Validate a function argument as a 2-D array.
+
+    Raises:
+        ValueError: If it is not a matrix (or not square when required)
+    """
+    if not is_array(value) or value.ndim != 2 or (square and value.shape[0] != value.shape[1]):
+        raise ValueError(ERROR_MATRIX_SHAPE)
+    return value
+
+
+def _linalg_call(function, *args):
+    """Call a numpy.linalg function, mapping its errors to locale messages."""
+    np = _np()
+    try:
+        with np.errstate(all="ignore"):
+            return function(*args)
+    except np.linalg.LinAlgError as e:
+        if "singular" in str(e).lower():
+            raise ValueError(ERROR_MATRIX_SINGULAR) from None
+        raise ValueError(ERROR_MATRIX_SHAPE) from None
+
+
+def from_elements(elements: list):
+    """
+    Build an array from evaluated literal elements ([...] in expressions).
+
+    Args:
+        elements: Numbers (a vector) or equal-length vectors (a matrix)
+
+    Returns:
+        ndarray: float64 vector or matrix
+
+    Raises:
+        ValueError: If the literal is empty, ragged or nested too deeply
+    """
+    np = _np()
+    try:
+        array = np.array(elements, dtype=float)
+    except (ValueError, TypeError):
+        raise ValueError(ERROR_MATRIX_SHAPE) from None
+    if array.size == 0 or array.ndim > 2:
+        raise ValueError(ERROR_MATRIX_SHAPE)
+    return array
+
+
+def array_operators(operators: dict) -> dict:
+    """
+    Make a binary operator table array-aware.
+
+    Scalar operands keep the given (simpleeval) operators. When an operand
+    is an array, the NumPy operation is applied to the whole array; shape
+    mismatches, division by zero and non-finite values are reported with
+    the evaluator's messages. Adds @ (matrix product).
+
+    Args:
+        operators: Operator table of the evaluator
+
+    Returns:
+        dict: New operator table
+    """
+    arithmetic = {
+        ast.Add: "add",
+        ast.Sub: "subtract",
+        ast.Mult: "multiply",
+        ast.Div: "true_divide",
+        ast.FloorDiv: "floor_divide",
+        ast.Mod: "mod",
+        ast.Pow: "power",
+    }
+    dividing = (ast.Div, ast.FloorDiv, ast.Mod)
+
+    def aware(operator, name, divides):
+        def apply(a, b):
+            if type(a) in _NUMBERS and type(b) in _NUMBERS:
+                return operator(a, b)
+            if not (is_array(a) or is_array(b)):
+                return operator(a, b)
+            np = _np()
+            if divides and not np.all(b):
+                raise ZeroDivisionError()
+            try:
+                with np.errstate(all="ignore"):
+                    return getattr(np, name)(a, b)
+            except ValueError:
+                raise ValueError(ERROR_MATRIX_SHAPE) from None
+
+        return apply
+
+    table = dict(operators)
+    for op, name in arithmetic.items():
+        if op in operators:
+            table[op] = aware(operators[op], name, op in dividing)
+    table[ast.MatMult] = matmul
+    return table
+
+
+def matmul(a, b):
+    """Matrix product a @ b (matrices or vectors)."""
+    np = _np()
+    if not (is_array(a) and is_array(b)):
+        raise ValueError(ERROR_MATRIX_SHAPE)
+    try:
+        with np.errstate(all="ignore"):
+            return np.matmul(a, b)
+    except ValueError:
+        raise ValueError(ERROR_MATRIX_SHAPE) from None
+
+
+def det(a) -> float:
+    """Determinant of a square matrix."""
+    return float(_linalg_call(_np().linalg.det, _matrix(a, square=True)))
+
+
+def inv(a):
+    """Inverse of a square matrix."""
+    return _linalg_call(_np().linalg.inv, _matrix(a, square=True))
+
+
+def transpose(a):
+    """Transpose of a matrix (a vector is returned unchanged)."""
+    if not is_array(a):
+        raise ValueError(ERROR_MATRIX_SHAPE)
+    return a.T.copy()
+
+
+def trace(a) -> float:
+    """Sum of the diagonal of a square matrix."""
+    return float(_matrix(a, square=True).trace())
+
+
+def solve(a, b):
+    """
+    Solve the linear system a @ x = b.
+
+    Args:
+        a: Square matrix
+        b: Vector (or matrix of right-hand sides) with matching rows
+
+    Returns:
+        ndarray: x
+    """
+    if not is_array(b) or b.shape[0] != _matrix(a, square=True).shape[0]:
+        raise ValueError(ERROR_MATRIX_SHAPE)
+    return _linalg_call(_np().linalg.solve, a, b)
+
+
+def eig(a):
+    """
+    Eigenvalues of a square matrix, ascending.
+
+    Symmetric matrices use the symmetric solver (faster, always real).
+
+    Raises:
+        ValueError: If an eigenvalue is complex (ERROR_MATH_DOMAIN)
+    """
+    np = _np()
+    a = _matrix(a, square=True)
+    if np.array_equal(a, a.T):
+        return _linalg_call(np.linalg.eigvalsh, a)
+    values = _linalg_call(np.linalg.eigvals, a)
+    if np.iscomplexobj(values):
+        if np.any(np.abs(values.imag) > 1e-12 * max(np.abs(values).max(), 1.0)):
+            raise ValueError(ERROR_MATH_DOMAIN)
+        values = values.real
+    return np.sort(values)
+
+
+def _shape(rows, columns) -> tuple:
+    """Validated (rows, columns) for the constructors."""
+    shape = []
+    for size in (rows, columns):
+        if isinstance(size, bool) or not float(size).is_integer() or size < 1:
+            raise ValueError(ERROR_MATRIX_SHAPE)
+        shape.append(int(size))
+    if shape[0] * shape[1] > MATRIX_MAX_ELEMENTS:
+        raise ValueError(ERROR_MATRIX_TOO_LARGE)
+    return tuple(shape)
+
+
+def eye(n):
+    """n x n identity matrix."""
+    return _np().eye(*_shape(n, n))
+
+
+def zeros(rows, columns=None):
+    """Matrix of zeros (rows x columns; a vector without columns)."""
+    if columns is None:
+        return _np().zeros(_shape(rows, 1)[0])
+    return _np().zeros(_shape(rows, columns))
+
+
+def ones(rows, columns=None):
+    """Matrix of ones (rows x columns; a vector without columns)."""
+    if columns is None:
+        return _np().ones(_shape(rows, 1)[0])
+    return _np().ones(_shape(rows, columns))
+
+
+def functions() -> dict:
+    """
+    Matrix functions for the evaluator's function table.
+
+    solve(A, b) is dispatched by the evaluator's solve form (2 arguments).
+
+    Returns:
+        dict: Function name -> function
+    """
+    return {
+        'det': det,
+        'inv': inv,
+        'transpose': transpose,
+        'trace': trace,
+        'eig': eig,
+        'eye': eye,
+        'zeros': zeros,
+        'ones': ones,
+    }
+
+
+def check_finite(array) -> None:
+    """
+    Raise the evaluator's error for undefined or infinite elements.
+
+    Raises:
+        ValueError: If an element is NaN
+        OverflowError: If an element is infinite
+    """
+    np = _np()
+    if np.isnan(array).any():
+        raise ValueError(ERROR_MATH_DOMAIN)
+    if np.isinf(array).any():
+        raise OverflowError(ERROR_OVERFLOW)
+
+
+def summarize(array, format_value) -> str:
+    """
+    Display text of a matrix or vector.
+
+    Small arrays (up to MATRIX_DISPLAY_ELEMENTS elements) are shown in
+    full as a literal that can be typed back in. Larger ones show their
+    size and the first and last MATRIX_DISPLAY_EDGE rows/columns, so the
+    text stays short whatever the size.
+
+    Args:
+        array: Vector or matrix
+        format_value: Function formatting one float
+
+    Returns:
+        str: Summary text
+    """
+    edge = MATRIX_DISPLAY_EDGE
+    full = array.size <= MATRIX_DISPLAY_ELEMENTS
+
+    def items(values):
+        """Formatted elements of a vector, elided in the middle."""
+        if full or len(values) <= 2 * edge:
+            return [format_value(float(value)) for value in values]
+        return ([format_value(float(value)) for value in values[:edge]] + ["…"]
+                + [format_value(float(value)) for value in values[-edge:]])
+
+    if array.ndim == 1:
+        text = "[" + ", ".join(items(array)) + "]"
+        return text if full else INFO_VECTOR_SUMMARY.format(len(array), text)
+
+    rows = array if full or len(array) <= 2 * edge else list(array[:edge]) + [None] + list(array[-edge:])
+    text = "[" + ", ".join("…" if row is None else "[" + ", ".join(items(row)) + "]"
+                           for row in rows) + "]"
+    return text if full else INFO_MATRIX_SUMMARY.format(array.shape[0], array.shape[1], text)
@@ -0,0 +1,485 @@
+"""
+ExpressionOptimizer - simplifies parsed expressions before evaluation.
+Folds constant subtrees, removes arithmetic identities, turns
+repeated multiplications into powers and expanded polynomials into
+Horner-evaluated nodes while preserving error semantics.
+"""
+import ast
+from src.calculator.config.constants import MAX_MEMO_SUBTREES
+from src.calculator.logic.polynomial import PolynomialNode, expanded, from_tree
+
+
+# Functions whose result must never be folded into a constant
+IMPURE_FUNCTIONS = {'rand', 'randint'}
+
+# Calls whose argument at this index names a bound variable (never rewritten)
+BINDING_FORMS = {'integrate': 1, 'solve': 1, 'diff': 1, 'sum': 1, 'prod': 1}
+
+# Nodes worth memoizing during a batch (leaves are cheaper than a lookup)
+_MEMO_NODES = (ast.BinOp, ast.UnaryOp, ast.Call)
+
+
+class ExpressionOptimizer:
+    """
+    Optimization pass over an expression tree produced by simpleeval.
+
+    Passes (applied bottom-up in a single walk):
+    - Constant folding (literals, pi/e, pure function calls)
+    - Identity simplification (x*1, 1*x, x+0, 0+x, x-0, x^1)
+    - Repeated multiplication to power (x*x*x -> x^3)
+    - Expanded polynomials in one variable (3*x^3 - x + 2) to a
+      PolynomialNode evaluated with Horner's scheme
+
+    Folding is done with the same SimpleEval instance that evaluates the
+    expression, so folded values are bit-for-bit identical to runtime
+    values. A subtree whose evaluation raises (e.g. 1/0, sqrt(-1)) is
+    left unfolded, so the error is still reported at evaluation time.
+
+    Between start_memo() and stop_memo() folded subtrees are memoized
+    (common-subexpression elimination): each subtree is keyed by its
+    structure (interned bottom-up, so spacing does not matter) and looked up
+    top-down before its children are visited, so a subexpression repeated
+    within or across expressions is computed once. The memo restarts after
+    MAX_MEMO_SUBTREES distinct subtrees.
+    """
+
+    def __init__(self, evaluator):
+        """
+        Initialize the optimizer.
+
+        Args:
+            evaluator: SimpleEval instance used to fold constant subtrees
+        """
+        self._evaluator = evaluator
+        self._memo = None  # Subtree key -> folded value (None = disabled)
+        self._subtrees = {}  # Structural form -> subtree key (interned)
+        self._keys = {}  # Node id -> subtree key, for the tree being optimized
+        self._lookups = 0
+        self._hits = 0
+        self._polynomials = {}  # Node id -> polynomial.from_tree result
+
+    def start_memo(self) -> None:
+        """Start memoizing folded subtrees and reset the hit counters."""
+        self._memo = {}
+        self._subtrees = {}
+        self._lookups = 0
+        self._hits = 0
+
+    def stop_memo(self) -> dict:
+        """
+        Stop memoizing folded subtrees and drop the memo.
+
+        Returns:
+            dict with keys:
+                - lookups (int): Number of foldable subtrees seen
+                - hits (int): Number of subtrees reused from the memo
+                - hit_rate (float): hits / lookups (0.0 if no lookups)
+        """
+        stats = {
+            "lookups": self._lookups,
+            "hits": self._hits,
+            "hit_rate": self._hits / self._lookups if self._lookups else 0.0
+        }
+        self._memo = None
+        self._subtrees = {}
+        return stats
+
+    @property
+    def memo_active(self) -> bool:
+        """Whether folded subtrees are currently being memoized."""
+        return self._memo is not None
+
+    def optimize(self, tree: ast.AST) -> ast.AST:
+        """
+        Optimize a parsed expression tree.
+
+        The input tree is not modified; a new tree is returned.
+
+        Args:
+            tree: Node returned by SimpleEval.parse()
+
+        Returns:
+            ast.AST: Optimized node tree
+        """
+        if self._memo is not None:
+            if len(self._subtrees) > MAX_MEMO_SUBTREES:
+                # Bound the batch memo: start over
+                self._memo.clear()
+                self._subtrees.clear()
+            self._key(tree)
+        try:
+            return self._visit(tree)
+        finally:
+            self._polynomials = {}
+            self._keys = {}
+
+    def _visit(self, node: ast.AST) -> ast.AST:
+        """Visit a node, consulting the batch memo first if active."""
+        if self._memo is not None and isinstance(node, _MEMO_NODES):
+            return self._visit_memoized(node)
+        return self._dispatch(node)
+
+    def _visit_memoized(self, node: ast.AST) -> ast.AST:
+        """
+        Reuse the folded value of an identical subtree seen earlier in the batch.
+
+        Args:
+            node: Unvisited operator or call node
+
+        Returns:
+            ast.AST: Constant node on a memo hit, otherwise the visited node
+        """
+        key = self._keys.get(id(node))
+        if key is None:  # Node created by the optimizer
+            return self._dispatch(node)
+
+        self._lookups += 1
+        value = self._memo.get(key)
+        if value is not None:
+            self._hits += 1
+            return _constant(value, node)
+
+        result = self._dispatch(node)
+        if _is_constant(result):
+            # Only successfully folded subtrees are shared; errors are re-raised
+            # at evaluation time by each expression that contains them
+            self._memo[key] = result.value
+        return result
+
+    def _key(self, node: ast.AST) -> int:
+        """
+        Intern the structure of a parsed subtree, bottom-up.
+
+        A subtree's form is its node type, its scalar fields (by repr, so 1,
+        1.0 and True differ) and the keys of its children; equal forms get
+        the same small int key. Each node is visited once, and the key is
+        recorded for the top-down memo lookups.
+
+        Args:
+            node: Parsed node
+
+        Returns:
+            int: Subtree key
+        """
+        form = [type(node).__name__]
+        for _, value in ast.iter_fields(node):
+            if isinstance(value, ast.AST):
+                form.append(self._key(value))
+            elif isinstance(value, list):
+                form.append(tuple(self._key(item) if isinstance(item, ast.AST) else repr(item)
+                                  for item in value))
+            else:
+                form.append(repr(value))
+        key = self._subtrees.setdefault(tuple(form), len(self._subtrees))
+        self._keys[id(node)] = key
+        return key
+
+    def _dispatch(self, node: ast.AST) -> ast.AST:
+        """Dispatch a node to its optimization handler."""
+        if isinstance(node, ast.Expr):
+            return _located(ast.Expr(value=self._visit(node.value)), node)
+        if isinstance(node, ast.Name):
+            return self._visit_name(node)
+        if isinstance(node, ast.UnaryOp):
+            return self._visit_unaryop(node)
+        if isinstance(node, ast.BinOp):
+            return self._visit_binop(node)
+        if isinstance(node, ast.Call):
+            return self._visit_call(node)
+        if isinstance(node, ast.Compare):
+            return self._visit_compare(node)
+        # Constants and unsupported nodes are left untouched
+        return node
+
+    def _visit_name(self, node: ast.Name) -> ast.AST:
+        """Replace known constant names (pi, e) with their values."""
+        names = self._evaluator.names
+        if isinstance(names, dict) and node.id in names:
+            value = names[node.id]
+            if _is_number(value):
+                return _constant(value, node)
+        return node
+
+    def _visit_unaryop(self, node: ast.UnaryOp) -> ast.AST:
+        """Fold unary operators applied to constants."""
+        operand = self._visit(node.operand)
+        if _is_constant(operand):
+            operator = self._evaluator.operators.get(type(node.op))
+            folded = self._fold(operator, (operand.value,), node)
+            if folded is not None:
+                return folded
+        return _located(ast.UnaryOp(op=node.op, operand=operand), node)
+
+    def _visit_binop(self, node: ast.BinOp) -> ast.AST:
+        """Fold, simplify and rewrite binary operators."""
+        left = self._visit(node.left)
+        right = self._visit(node.right)
+
+        if _is_constant(left) and _is_constant(right):
+            operator = self._evaluator.operators.get(type(node.op))
+            folded = self._fold(operator, (left.value, right.value), node)
+            if folded is not None:
+                return folded
+
+        new_node = _located(ast.BinOp(left=left, op=node.op, right=right), node)
+
+        simplified = self._simplify_identity(new_node)
+        if simplified is not new_node:
+            return simplified
+
+        if isinstance(node.op, ast.Mult):
+            return self._combine_powers(new_node)
+
+        if isinstance(node.op, (ast.Add, ast.Sub)):
+            return self._horner(new_node)
+
+        return new_node
+
+    def _visit_call(self, node: ast.Call) -> ast.AST:
+        """Fold calls to pure functions with constant arguments."""
+        bound = BINDING_FORMS.get(node.func.id) if isinstance(node.func, ast.Name) else None
+        args = [
+            arg if index == bound else self._visit(arg)
+            for index, arg in enumerate(node.args)
+        ]
+
+        if (
+            isinstance(node.func, ast.Name)
+            and node.func.id not in IMPURE_FUNCTIONS
+            and not node.keywords
+            and all(_is_constant(arg) for arg in args)
+        ):
+            function = self._evaluator.functions.get(node.func.id)
+            folded = self._fold(function, [arg.value for arg in args], node)
+            if folded is not None:
+                return folded
+
+        return _located(
+            ast.Call(func=node.func, args=args, keywords=node.keywords),
+            node
+        )
+
+    def _horner(self, node: ast.AST) -> ast.AST:
+        """
+        Replace an expanded polynomial (two or more terms, degree 2 or more)
+        with a PolynomialNode.
+
+        Tried at sums and differences only (every such polynomial has one
+        at its top). Subtrees that are already PolynomialNodes are
+        absorbed, so a long sum is converted once per term, not once per
+        level.
+
+        Args:
+            node: Visited sum or difference
+
+        Returns:
+            ast.AST: PolynomialNode, or the same node
+        """
+        recognized = from_tree(node, self._polynomials)
+        if recognized is None:
+            return node
+        variable, polynomial = recognized
+        if variable is None or polynomial.degree < 2 or polynomial.terms < 2:
+            return node
+        operand = _located(ast.Name(id=variable, ctx=ast.Load()), node)
+        rewritten = _located(PolynomialNode(polynomial=polynomial, operand=operand), node)
+        rewritten.expanded = expanded(node)  # Used where the operand is not finite
+        rewritten.variable = variable
+        return rewritten
+
+    def _visit_compare(self, node: ast.Compare) -> ast.AST:
+        """Optimize comparison operands (comparisons themselves are not folded)."""
+        return _located(
+            ast.Compare(
+                left=self._visit(node.left),
+                ops=node.ops,
+                comparators=[self._visit(child) for child in node.comparators]
+            ),
+            node
+        )
+
+    def _fold(self, function, args, source: ast.AST):
+        """
+        Compute a constant subtree with the evaluator's own operator or
+        function, so the folded value is exactly the runtime value.
+
+        Args:
+            function: Operator/function from the SimpleEval tables (or None)
+            args: Constant argument values
+            source: Node being folded (for position information)
+
+        Returns:
+            ast.Constant: Folded value, or None if the callable is unknown,
+                raised or produced a non-numeric value
+        """
+        if function is None:
+            return None
+
+        try:
+            value = function(*args)
+        except Exception:
+            # Keep the subtree so the error surfaces during evaluation
+            return None
+
+        if not _is_number(value):
+            return None
+
+        return _constant(value, source)
+
+    def _simplify_identity(self, node: ast.BinOp) -> ast.AST:
+        """
+        Remove arithmetic identities.
+
+        Only exact integer neutral elements are removed, so the type of the
+        other operand (and therefore int/float semantics) is unchanged.
+
+        Args:
+            node: Binary operation with at least one non-constant side
+
+        Returns:
+            ast.AST: Simplified node, or the same node if nothing applies
+        """
+        left, op, right = node.left, node.op, node.right
+
+        if isinstance(op, ast.Add):
+            if _is_int_constant(right, 0):
+                return left
+            if _is_int_constant(left, 0):
+                return right
+        elif isinstance(op, ast.Sub):
+            if _is_int_constant(right, 0):
+                return left
+        elif isinstance(op, ast.Mult):
+            if _is_int_constant(right, 1):
+                return left
+            if _is_int_constant(left, 1):
+                return right
+        elif isinstance(op, ast.Pow):
+            if _is_int_constant(right, 1):
+                return left
+
+        return node
+
+    def _combine_powers(self, node: ast.BinOp) -> ast.AST:
+        """
+        Rewrite repeated factors of a multiplication chain as powers.
+
+        x*x*x becomes x**3 and x**2*x becomes x**3. Factors are grouped by
+        structural equality and kept in order of first appearance; factors
+        with a rand/randint call are never grouped (each call is a new draw).
+
+        Args:
+            node: Multiplication node
+
+        Returns:
+            ast.AST: Rewritten node, or the same node if no factor repeats
+        """
+        factors = []
+        _flatten_product(node, factors)
+
+        # Group factors: structural key -> [base node, exponent]
+        groups = {}
+        for factor in factors:
+            base, exponent = _split_power(factor)
+            key = id(factor) if _has_impure_call(base) else ast.dump(base)
+            if key in groups:
+                groups[key][1] += exponent
+            else:
+                groups[key] = [base, exponent]
+
+        if len(groups) == len(factors):
+            return node  # No repeated factor
+
+        result = None
+        for base, exponent in groups.values():
+            if exponent == 1:
+                term = base
+            else:
+                term = _located(
+                    ast.BinOp(left=base, op=ast.Pow(), right=_constant(exponent, base)),
+                    base
+                )
+            if result is None:
+                result = term
+            else:
+                result = _located(
+                    ast.BinOp(left=result, op=ast.Mult(), right=term),
+                    node
+                )
+
+        return result
+
+
+def _is_number(value) -> bool:
+    """Check whether a value is a plain int or float (not bool)."""
+    return type(value) in (int, float)
+
+
+def _is_constant(node: ast.AST) -> bool:
+    """Check whether a node is a numeric constant."""
+    return isinstance(node, ast.Constant) and _is_number(node.value)
+
+
+def _has_impure_call(node: ast.AST) -> bool:
+    """Check whether a subtree calls a function of IMPURE_FUNCTIONS."""
+    return any(
+        isinstance(child, ast.Call)
+        and isinstance(child.func, ast.Name)
+        and child.func.id in IMPURE_FUNCTIONS
+        for child in ast.walk(node)
+    )
+
+
+def _is_int_constant(node: ast.AST, value: int) -> bool:
+    """Check whether a node is the exact integer constant `value`."""
+    return (
+        isinstance(node, ast.Constant)
+        and type(node.value) is int
+        and node.value == value
+    )
+
+
+def _located(node: ast.AST, source: ast.AST) -> ast.AST:
+    """
+    Copy position information from `source` to `node`.
+
+    Faster equivalent of ast.copy_location for nodes that always carry
+    positions (every node here descends from a parsed tree).
+    """
+    node.lineno = source.lineno
+    node.col_offset = source.col_offset
+    node.end_lineno = source.end_lineno
+    node.end_col_offset = source.end_col_offset
+    return node
+
+
+def _constant(value, source: ast.AST) -> ast.Constant:
+    """Create a Constant node located at `source`."""
+    return _located(ast.Constant(value=value), source)
+
+
+def _flatten_product(node: ast.AST, factors: list) -> None:
+    """Collect the factors of a (left- or right-nested) multiplication chain."""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult):
+        _flatten_product(node.left, factors)
+        _flatten_product(node.right, factors)
+    else:
+        factors.append(node)
+
+
+def _split_power(node: ast.AST) -> tuple:
+    """
+    Split a factor into (base, exponent).
+
+    Powers with a positive integer constant exponent are split, every
+    other factor is treated as base**1.
+    """
+    if (
+        isinstance(node, ast.BinOp)
+        and isinstance(node.op, ast.Pow)
+        and isinstance(node.right, ast.Constant)
+        and type(node.right.value) is int
+        and node.right.value > 0
+    ):
+        return node.left, node.right.value
+    return node, 1
@@ -0,0 +1,292 @@
+"""
+Plot data for y = f(x) from an expression kernel.
+A uniform first pass is refined adaptively: every interval whose midpoint
+is off the straight segment between its ends (or that straddles the edge
+of the domain) is halved, and all midpoints of one round are evaluated in
+a single kernel call. Undefined points and unresolved jumps (asymptotes)
+become gaps (NaN). The result is downsampled to the requested number of
+points with Largest-Triangle-Three-Buckets, separately on each segment
+between gaps, so peaks and gap edges are kept.
+"""
+import math
+from src.calculator.config.constants import (
+    PLOT_POINTS,
+    PLOT_INITIAL_POINTS,
+    PLOT_MAX_DEPTH,
+    PLOT_TOLERANCE,
+    PLOT_MAX_EVALUATIONS
+)
+from src.calculator.config.locale import ERROR_PLOT_RANGE
+
+
+def sample(kernel, lower: float, upper: float, points: int = PLOT_POINTS,
+           initial: int = PLOT_INITIAL_POINTS, max_depth: int = PLOT_MAX_DEPTH,
+           tolerance: float = PLOT_TOLERANCE,
+           max_evaluations: int = PLOT_MAX_EVALUATIONS) -> dict:
+    """
+    Sample a one-variable kernel for plotting over [lower, upper].
+
+    Args:
+        kernel: ExpressionKernel of one variable
+        lower: Range start
+        upper: Range end
+        points: Largest number of points returned (at least 3)
+        initial: Points of the uniform first pass
+        max_depth: Largest number of halvings of a first-pass interval
+        tolerance: Allowed midpoint deviation, as a fraction of the y span
+        max_evaluations: Evaluation budget, shared equally by the rounds
+            (the largest jumps are refined first when a round runs short)
+
+    Returns:
+        dict with keys:
+            - x (list): Increasing abscissas
+            - y (list): Values; NaN marks a gap (undefined, or an asymptote)
+            - evaluations (int): Number of function evaluations
+            - gaps (int): Number of gaps
+
+    Raises:
+        ValueError: If the range is empty or not finite, or points < 3
+    """
+    if (not (math.isfinite(lower) and math.isfinite(upper)) or lower >= upper
+            or points < 3):
+        raise ValueError(ERROR_PLOT_RANGE)
+
+    step = (upper - lower) / (initial - 1)
+    xs = [lower + i * step for i in range(initial - 1)] + [upper]
+    ys = _values(kernel, xs)
+    evaluations = initial
+    scale = _span(ys)
+    limit = tolerance * scale
+    finest = step / 2 ** max_depth  # Interval width after max_depth halvings
+
+    found = list(zip(xs, ys))
+    pending = list(zip(xs, ys, xs[1:], ys[1:]))
+    for depth in range(max_depth):
+        pending = [interval for interval in pending if _needs_midpoint(interval)]
+        # Each remaining round gets an equal part of the budget
+        room = (max_evaluations - evaluations) // (max_depth - depth)
+        if len(pending) > room:
+            # Refine the largest jumps (poles, domain edges) first
+            pending.sort(key=_jump, reverse=True)
+            del pending[room:]
+        if not pending:
+            break
+        middles = [(x0 + x1) / 2 for x0, _, x1, _ in pending]
+        values = _values(kernel, middles)
+        evaluations += len(middles)
+        halves = []
+        for (x0, y0, x1, y1), xm, ym in zip(pending, middles, values):
+            found.append((xm, ym))
+            if _bends(y0, ym, y1, limit):
+                halves.append((x0, y0, xm, ym))
+                halves.append((xm, ym, x1, y1))
+            else:
+                if math.isfinite(y0) != math.isfinite(ym):
+                    halves.append((x0, y0, xm, ym))
+                if math.isfinite(ym) != math.isfinite(y1):
+                    halves.append((xm, ym, x1, y1))
+        pending = halves
+
+    # A sign change over more than the y span at the finest width is a pole
+    for x0, y0, x1, y1 in pending:
+        if (x1 - x0 <= finest * 1.5 and y0 * y1 < 0 and abs(y1 - y0) > scale):
+            found.append(((x0 + x1) / 2, math.nan))
+
+    found.sort()
+    xs = [x for x, _ in found]
+    ys = [y if math.isfinite(y) else math.nan for _, y in found]
+    _mark_spikes(xs, ys, finest * 1.5, scale)
+    xs, ys = _single_gaps(xs, ys)
+    xs, ys = downsample(xs, ys, points)
+    gaps = sum(1 for i in range(1, len(ys)) if ys[i] != ys[i] and ys[i - 1] == ys[i - 1])
+    return {"x": xs, "y": ys, "evaluations": evaluations, "gaps": gaps}
+
+
+def _values(kernel, xs: list) -> list:
+    """Kernel values at xs as a list of floats."""
+    values = kernel(xs)
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def _span(ys: list) -> float:
+    """
+    Robust y span of a sample (2nd to 98th percentile of finite values),
+    so a few huge values near an asymptote do not flatten the rest.
+    """
+    finite = sorted(y for y in ys if math.isfinite(y))
+    if not finite:
+        return 1.0
+    low = finite[int(0.02 * (len(finite) - 1))]
+    high = finite[math.ceil(0.98 * (len(finite) - 1))]
+    span = high - low
+    if span > 0:
+        return span
+    return max(abs(high), 1.0)
+
+
+def _mark_spikes(xs: list, ys: list, width: float, scale: float) -> None:
+    """
+    Turn sampled spikes into gaps, in place: points at most `width` from
+    both neighbours that are above (or below) both by more than the y span.
+    A continuous curve cannot jump that far at the finest width, so these
+    are poles without a sign change (1/x^2).
+    """
+    for i in range(1, len(ys) - 1):
+        left, middle, right = ys[i - 1], ys[i], ys[i + 1]
+        if xs[i] - xs[i - 1] > width or xs[i + 1] - xs[i] > width:
+            continue
+        if (min(middle - left, middle - right) > scale
+                or max(middle - left, middle - right) < -scale):
+            ys[i] = math.nan
+
+
+def _single_gaps(xs: list, ys: list) -> tuple:
+    """Drop every NaN that follows another NaN (one point per gap)."""
+    out_x, out_y = [], []
+    for x, y in zip(xs, ys):
+        if y != y and out_y and out_y[-1] != out_y[-1]:
+            continue
+        out_x.append(x)
+        out_y.append(y)
+    return out_x, out_y
+
+
+def _needs_midpoint(interval: tuple) -> bool:
+    """Whether an interval is evaluated at its midpoint (not both ends undefined)."""
+    return math.isfinite(interval[1]) or math.isfinite(interval[3])
+
+
+def _jump(interval: tuple) -> float:
+    """Size of the jump across an interval (infinite at a domain edge)."""
+    jump = abs(interval[3] - interval[1])
+    return jump if jump == jump else math.inf
+
+
+def _bends(y0: float, ym: float, y1: float, limit: float) -> bool:
+    """Whether the midpoint of a defined interval is off the straight segment."""
+    if not (math.isfinite(y0) and math.isfinite(ym) and math.isfinite(y1)):
+        return False
+    return abs(ym - (y0 + y1) / 2) > limit
+
+
+def downsample(xs: list, ys: list, points: int) -> tuple:
+    """
+    Reduce a curve to at most `points` points (gaps are kept).
+
+    Each segment between NaN values gets a share of the points in
+    proportion to its length (at least its two ends while the budget
+    allows) and is reduced with Largest-Triangle-Three-Buckets. When there
+    are more segments than points, the shortest ones are dropped into the
+    surrounding gaps.
+
+    Args:
+        xs: Increasing abscissas (one NaN per gap in ys)
+        ys: Values, NaN at gaps
+        points: Target number of points
+
+    Returns:
+        tuple: (xs, ys) lists
+    """
+    if len(xs) <= points:
+        return xs, ys
+
+    segments = _segments(ys)
+    markers = len(ys) - sum(end - begin for begin, end in segments)
+    while segments and markers + len(segments) > points:
+        begin, end = min(segments, key=lambda segment: segment[1] - segment[0])
+        ys = ys[:begin] + [math.nan] * (end - begin) + ys[end:]
+        xs, ys = _single_gaps(xs, ys)
+        segments = _segments(ys)
+        markers = len(ys) - sum(end - begin for begin, end in segments)
+
+    shares = _shares([end - begin for begin, end in segments], points - markers)
+    out_x, out_y = [], []
+    previous_end = 0
+    for (begin, end), share in zip(segments, shares):
+        if begin > previous_end:
+            out_x.append(xs[previous_end])  # One NaN marks the gap
+            out_y.append(math.nan)
+        for index in _lttb(xs, ys, begin, end, share):
+            out_x.append(xs[index])
+            out_y.append(ys[index])
+        previous_end = end
+    if previous_end < len(xs):
+        out_x.append(xs[previous_end])
+        out_y.append(math.nan)
+    return out_x, out_y
+
+
+def _segments(ys: list) -> list:
+    """(begin, end) index ranges of the runs of defined values."""
+    segments = []
+    start = None
+    for index, y in enumerate(ys + [math.nan]):
+        if y == y and start is None:
+            start = index
+        elif y != y and start is not None:
+            segments.append((start, index))
+            start = None
+    return segments
+
+
+def _shares(counts: list, budget: int) -> list:
+    """
+    Points kept per segment: at most its count, at least two (one when the
+    budget is short), the rest in proportion to the counts; the shares add
+    up to at most `budget` (at least one per segment).
+    """
+    minimum = 2 if budget >= 2 * len(counts) else 1
+    shares = [min(count, minimum) for count in counts]
+    spare = budget - sum(shares)
+    extra = sum(counts) - sum(shares)
+    if spare <= 0 or extra <= 0:
+        return shares
+    remainders = []
+    for i, count in enumerate(counts):
+        exact = spare * (count - shares[i]) / extra
+        shares[i] += int(exact)
+        remainders.append((exact - int(exact), i))
+    spare = budget - sum(shares)
+    for _, i in sorted(remainders, reverse=True)[:spare]:
+        if shares[i] < counts[i]:
+            shares[i] += 1
+    return shares
+
+
+def _lttb(xs: list, ys: list, begin: int, end: int, target: int) -> list:
+    """
+    Largest-Triangle-Three-Buckets indices of xs/ys[begin:end].
+
+    The run is split into target - 2 buckets between its fixed first and
+    last points; from each bucket the point forming the largest triangle
+    with the previously chosen point and the next bucket's average is kept.
+    """
+    count = end - begin
+    if count <= target:
+        return range(begin, end)
+    if target <= 2:
+        return [begin, end - 1][:target]  # No buckets: the ends only
+
+    chosen = [begin]
+    width = (count - 2) / (target - 2)
+    previous = begin
+    for bucket in range(target - 2):
+        low = begin + 1 + int(bucket * width)
+        high = begin + 1 + int((bucket + 1) * width)
+        following = min(begin + 1 + int((bucket + 2) * width), end)
+        if high >= following:  # Last bucket: the next "bucket" is the end point
+            average_x, average_y = xs[end - 1], ys[end - 1]
+        else:
+            average_x = math.fsum(xs[high:following]) / (following - high)
+            average_y = math.fsum(ys[high:following]) / (following - high)
+        px, py = xs[previous], ys[previous]
+        dx, dy = average_x - px, average_y - py
+        best, best_area = low, -1.0
+        for index in range(low, high):
+            area = abs(dx * (ys[index] - py) - dy * (xs[index] - px))
+            if area > best_area:
+                best, best_area = index, area
+        chosen.append(best)
+        previous = best
+    chosen.append(end - 1)
+    return chosen
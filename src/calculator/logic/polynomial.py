@@ -0,0 +1,378 @@
+"""
+Polynomials in one variable, evaluated with Horner's scheme.
+The optimizer recognizes expanded polynomials (a*x^5 + b*x^4 + ...) in
+parsed expressions and replaces them with a PolynomialNode, so the
+evaluator, kernels and automatic differentiation evaluate them with one
+multiply-add per degree instead of computing every power separately.
+Over NumPy arrays the scheme runs in place, block by block, so many points
+are evaluated at once without temporaries.
+"""
+import ast
+import copy
+import math
+import operator
+from src.calculator.config.constants import (
+    POLY_MAX_DEGREE,
+    POLY_BLOCK_SIZE,
+    POLY_CONVOLVE_MIN
+)
+
+
+# Largest integer exactly representable as a float
+_EXACT_FLOAT_INT = 2 ** 53
+
+
+class Polynomial:
+    """
+    Polynomial with constant coefficients, immutable and hashable.
+
+    Evaluation uses sparse Horner: gaps between nonzero terms are bridged
+    with one power, so x^100 + 1 costs one power, not a hundred products.
+    Arithmetic with other polynomials and numbers (+, -, *, / by a number,
+    ^ by a non-negative integer) returns new polynomials; int coefficients
+    stay exact.
+
+    Attributes:
+        coefficients: Coefficients from the constant term up (no trailing zeros)
+    """
+
+    __slots__ = ("coefficients", "_horner")
+
+    def __init__(self, coefficients):
+        """
+        Create a polynomial.
+
+        Args:
+            coefficients: Sequence of numbers, constant term first
+        """
+        coefficients = list(coefficients) or [0]
+        while len(coefficients) > 1 and coefficients[-1] == 0:
+            coefficients.pop()
+        self.coefficients = tuple(coefficients)
+        self._horner = None  # Built on first evaluation (see _scheme)
+
+    def _scheme(self) -> tuple:
+        """
+        Sparse Horner scheme: (leading coefficient, steps, lowest exponent).
+
+        Steps go from the leading term down as (gap to the next nonzero
+        term, its coefficient); the result is finally multiplied by x to
+        the lowest exponent.
+        """
+        if self._horner is None:
+            coefficients = self.coefficients
+            exponents = [k for k, c in enumerate(coefficients) if c != 0] or [0]
+            exponents.reverse()
+            steps = tuple((higher - lower, coefficients[lower])
+                          for higher, lower in zip(exponents, exponents[1:]))
+            self._horner = (coefficients[exponents[0]], steps, exponents[-1])
+        return self._horner
+
+    @property
+    def degree(self) -> int:
+        """Highest exponent with a nonzero coefficient (0 for constants)."""
+        return len(self.coefficients) - 1
+
+    @property
+    def terms(self) -> int:
+        """Number of nonzero coefficients."""
+        return len(self.coefficients) - self.coefficients.count(0)
+
+    def __repr__(self) -> str:
+        return f"Polynomial({self.coefficients!r})"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Polynomial) and self.coefficients == other.coefficients
+
+    def __hash__(self) -> int:
+        return hash(self.coefficients)
+
+    def __call__(self, x):
+        """Value at x (a number or an array of points)."""
+        return self.evaluate(x)
+
+    def evaluate(self, x, add=operator.add, mul=operator.mul, power=operator.pow):
+        """
+        Value at x with the given arithmetic (e.g. a kernel's tables).
+
+        NumPy arrays always take the in-place array path.
+
+        Args:
+            x: Number, array or any value the operations accept
+            add: Binary addition
+            mul: Binary multiplication
+            power: Binary power (for gaps between nonzero terms)
+
+        Returns:
+            Value of the polynomial
+        """
+        if getattr(x, "ndim", 0) > 0:
+            return self._evaluate_array(x)
+
+        lead, steps, tail = self._scheme()
+        powers = {1: x}
+        result = lead
+        for gap, coefficient in steps:
+            factor = powers.get(gap)
+            if factor is None:
+                factor = powers[gap] = power(x, gap)
+            result = add(mul(result, factor), coefficient)
+        if tail:
+            factor = powers.get(tail)
+            result = mul(result, power(x, tail) if factor is None else factor)
+        return result
+
+    def _evaluate_array(self, x):
+        """Horner in place over blocks of POLY_BLOCK_SIZE points."""
+        import numpy as np
+        lead, steps, tail = self._scheme()
+        x = np.asarray(x, dtype=float)
+        result = np.empty_like(x)
+        points, values = x.reshape(-1), result.reshape(-1)
+        with np.errstate(over="ignore", invalid="ignore"):
+            for start in range(0, points.size, POLY_BLOCK_SIZE):
+                block = points[start:start + POLY_BLOCK_SIZE]
+                accumulator = values[start:start + POLY_BLOCK_SIZE]
+                accumulator.fill(lead)
+                powers = {1: block}
+                for gap, coefficient in steps:
+                    factor = powers.get(gap)
+                    if factor is None:
+                        factor = powers[gap] = block ** gap
+                    accumulator *= factor
+                    accumulator += coefficient
+                if tail:
+                    factor = powers.get(tail)
+                    accumulator *= block ** tail if factor is None else factor
+        return result
+
+    def derivative(self) -> "Polynomial":
+        """First derivative."""
+        return Polynomial([k * c for k, c in enumerate(self.coefficients)][1:])
+
+    def __neg__(self) -> "Polynomial":
+        return Polynomial([-c for c in self.coefficients])
+
+    def __pos__(self) -> "Polynomial":
+        return self
+
+    def __add__(self, other) -> "Polynomial":
+        other = _coerce(other)
+        if other is None:
+            return NotImplemented
+        a, b = self.coefficients, other.coefficients
+        if len(a) < len(b):
+            a, b = b, a
+        result = list(a)
+        for k, c in enumerate(b):
+            result[k] += c
+        return Polynomial(result)
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> "Polynomial":
+        other = _coerce(other)
+        if other is None:
+            return NotImplemented
+        return self + (-other)
+
+    def __rsub__(self, other) -> "Polynomial":
+        return (-self) + other
+
+    def __mul__(self, other) -> "Polynomial":
+        other = _coerce(other)
+        if other is None:
+            return NotImplemented
+        return Polynomial(_convolve(self.coefficients, other.coefficients))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> "Polynomial":
+        """Division by a number."""
+        if type(other) not in (int, float):
+            return NotImplemented
+        if other == 0:
+            raise ZeroDivisionError()
+        return Polynomial([c / other for c in self.coefficients])
+
+    def __pow__(self, exponent: int) -> "Polynomial":
+        """Power by a non-negative integer (repeated squaring)."""
+        if type(exponent) is not int or exponent < 0:
+            return NotImplemented
+        if self.terms == 1:
+            # (c*x^k)^n = c^n * x^(k*n)
+            degree = self.degree
+            return Polynomial([0] * (degree * exponent) + [self.coefficients[degree] ** exponent])
+        result, base = Polynomial([1]), self
+        while exponent:
+            if exponent & 1:
+                result = result * base
+            exponent >>= 1
+            if exponent:
+                base = base * base
+        return result
+
+
+def _coerce(value):
+    """A polynomial for a polynomial or plain number operand, else None."""
+    if isinstance(value, Polynomial):
+        return value
+    if type(value) in (int, float):
+        return Polynomial([value])
+    return None
+
+
+def _convolve(a: tuple, b: tuple) -> list:
+    """
+    Coefficients of a product.
+
+    Products of two long dense polynomials use numpy.convolve when the
+    float result is exact (float coefficients, or ints small enough not to
+    lose digits); the rest (single terms, huge ints) loops over nonzero
+    terms only, in exact Python arithmetic.
+    """
+    left = [(i, x) for i, x in enumerate(a) if x != 0]
+    right = [(j, y) for j, y in enumerate(b) if y != 0]
+    if min(len(left), len(right)) >= POLY_CONVOLVE_MIN:
+        from src.calculator.logic.kernel import numpy_available
+        integers = all(type(c) is int for c in a + b)
+        bound = max(abs(c) for c in a) * max(abs(c) for c in b) * min(len(a), len(b))
+        if numpy_available() and (not integers or bound < _EXACT_FLOAT_INT):
+            import numpy as np
+            product = np.convolve(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+            return [int(c) for c in product] if integers else product.tolist()
+
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in left:
+        for j, y in right:
+            result[i + j] += x * y
+    return result
+
+
+class PolynomialNode(ast.expr):
+    """
+    Optimized-tree node: a polynomial of its operand (a variable name).
+
+    Produced by ExpressionOptimizer; ast.dump shows the coefficients, so
+    compile and kernel caches key on them.
+
+    Horner's scheme and the expanded form differ where the operand is not
+    finite (x^2 - x is inf - inf = NaN at x = inf, but (x - 1)*x = inf), so
+    the node also keeps the tree it replaced: `expanded` (without
+    PolynomialNodes) in the variable `variable`. Evaluation falls back to
+    it for non-finite operands.
+    """
+
+    _fields = ("polynomial", "operand")
+
+
+def finite(x) -> bool:
+    """Whether a number, array or dual number (autodiff) is finite everywhere."""
+    x = getattr(x, "value", x)  # Value of a dual number
+    if getattr(x, "ndim", 0) > 0:
+        import numpy as np
+        return bool(np.isfinite(x).all())
+    try:
+        return math.isfinite(x)
+    except OverflowError:
+        return True  # Int too large for a float
+
+
+def expanded(node: ast.AST) -> ast.AST:
+    """
+    A tree with every PolynomialNode replaced by its expanded tree.
+
+    Only the paths down to PolynomialNodes are copied, so expanding a sum
+    whose first operand is already a PolynomialNode costs one step.
+    """
+    if isinstance(node, PolynomialNode):
+        return node.expanded
+    copied = None
+    for field, value in ast.iter_fields(node):
+        if isinstance(value, ast.AST):
+            new = expanded(value)
+            if new is not value:
+                copied = copied or copy.copy(node)
+                setattr(copied, field, new)
+    return copied or node
+
+
+def from_tree(node: ast.AST, cache: dict = None):
+    """
+    Recognize an expanded polynomial in one variable.
+
+    Accepted: numeric constants, one variable name, + and -, products in
+    which one factor is a single term (c*x^k), division by a constant,
+    powers of a single term by an integer constant, and PolynomialNodes.
+    Products and powers of multi-term polynomials are not expanded, since
+    expanding (x-1)^20 would lose the accuracy of the original form.
+
+    Args:
+        node: Expression node (optimized tree)
+        cache: Results by node id, shared across calls on one tree (the
+            node is kept with its result so the id stays valid)
+
+    Returns:
+        tuple: (variable name or None, Polynomial), or None if the node is
+            not such a polynomial or its degree exceeds POLY_MAX_DEGREE
+    """
+    if cache is not None:
+        entry = cache.get(id(node))
+        if entry is not None and entry[0] is node:
+            return entry[1]
+    result = _convert(node, cache)
+    if cache is not None:
+        cache[id(node)] = (node, result)
+    return result
+
+
+def _convert(node: ast.AST, cache: dict):
+    """from_tree without the cache lookup."""
+    if isinstance(node, ast.Constant):
+        if type(node.value) in (int, float):
+            return None, Polynomial([node.value])
+        return None
+    if isinstance(node, ast.Name):
+        return node.id, Polynomial([0, 1])
+    if isinstance(node, PolynomialNode):
+        if isinstance(node.operand, ast.Name):
+            return node.operand.id, node.polynomial
+        return None
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = from_tree(node.operand, cache)
+        if operand is None or isinstance(node.op, ast.UAdd):
+            return operand
+        return operand[0], -operand[1]
+    if not isinstance(node, ast.BinOp):
+        return None
+
+    left = from_tree(node.left, cache)
+    if left is None:
+        return None
+    right = from_tree(node.right, cache)
+    if right is None:
+        return None
+    if left[0] and right[0] and left[0] != right[0]:
+        return None  # Two variables
+    variable = left[0] or right[0]
+    a, b = left[1], right[1]
+
+    if isinstance(node.op, ast.Add):
+        return variable, a + b
+    if isinstance(node.op, ast.Sub):
+        return variable, a - b
+    if isinstance(node.op, ast.Mult):
+        if min(a.terms, b.terms) > 1 or a.degree + b.degree > POLY_MAX_DEGREE:
+            return None
+        return variable, a * b
+    if isinstance(node.op, ast.Div):
+        if b.degree or b.coefficients[0] == 0:
+            return None
+        return variable, a / b.coefficients[0]
+    if isinstance(node.op, ast.Pow):
+        exponent = b.coefficients[0]
+        if (b.degree or type(exponent) is not int or exponent < 0 or a.terms > 1
+                or a.degree * exponent > POLY_MAX_DEGREE):
+            return None
+        return variable, a ** exponent
+    return None
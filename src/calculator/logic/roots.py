@@ -0,0 +1,234 @@
+"""
+Root finding over expression kernels.
+The kernel is sampled on a uniform grid in one call; every sign change
+between two defined samples brackets a root, and all brackets are refined
+together with Brent's method (one kernel call per iteration for all of
+them). Undefined samples (NaN, e.g. sqrt or ln of negatives) mask their
+region instead of aborting the search.
+"""
+import math
+from src.calculator.config.constants import (
+    SOLVE_GRID_POINTS,
+    SOLVE_X_TOLERANCE,
+    SOLVE_MAX_ITERATIONS
+)
+from src.calculator.config.locale import ERROR_MATH_DOMAIN
+
+
+# Relative x tolerance of Brent's method (as in scipy.optimize.brentq)
+_REL_TOLERANCE = 4 * 2.220446049250313e-16
+
+
+def find_roots(kernel, lower: float, upper: float,
+               grid_points: int = SOLVE_GRID_POINTS) -> dict:
+    """
+    Find every root of a one-variable kernel in [lower, upper].
+
+    Roots are found where the sampled function changes sign or is exactly
+    zero at a sample. Roots that touch zero without a sign change between
+    samples (even multiplicity) are only found if a sample hits them.
+    Sign changes across a pole (|f| growing towards the crossing) are
+    discarded.
+
+    Args:
+        kernel: ExpressionKernel of one variable
+        lower: Interval start
+        upper: Interval end
+        grid_points: Number of samples (at least 2)
+
+    Returns:
+        dict with keys:
+            - roots (list): Sorted roots (floats)
+            - brackets (int): Number of sign changes refined
+            - masked (int): Number of undefined samples
+            - evaluations (int): Number of function evaluations
+
+    Raises:
+        ValueError: If a bound is not finite
+    """
+    if not (math.isfinite(lower) and math.isfinite(upper)):
+        raise ValueError(ERROR_MATH_DOMAIN)
+    if lower > upper:
+        lower, upper = upper, lower
+
+    if kernel.vectorized:
+        return _find_roots_numpy(kernel, lower, upper, grid_points)
+    return _find_roots_python(kernel, lower, upper, grid_points)
+
+
+def _find_roots_numpy(kernel, lower: float, upper: float, grid_points: int) -> dict:
+    """find_roots() with the grid and all Brent iterations vectorized."""
+    import numpy as np  # Vectorized kernels imply NumPy is installed
+
+    grid = np.linspace(lower, upper, grid_points)
+    values = kernel(grid)
+    defined = np.isfinite(values)
+
+    roots = [grid[defined & (values == 0)]]
+    left, right = values[:-1], values[1:]
+    crossing = defined[:-1] & defined[1:] & (np.sign(left) * np.sign(right) < 0)
+    index = np.flatnonzero(crossing)
+    refined, evaluations = _brent_numpy(np, kernel, grid[index], grid[index + 1],
+                                        left[index], right[index])
+    roots.append(refined)
+
+    return {
+        "roots": sorted(np.concatenate(roots).tolist()),
+        "brackets": len(index),
+        "masked": int(grid_points - np.count_nonzero(defined)),
+        "evaluations": grid_points + evaluations
+    }
+
+
+def _brent_numpy(np, kernel, xa, xb, fa, fb) -> tuple:
+    """
+    Refine many brackets at once with Brent's method.
+
+    Same steps as scipy.optimize.brentq, applied to arrays of brackets;
+    converged brackets leave the working set, so each iteration evaluates
+    the kernel only at the brackets still running.
+
+    Returns:
+        tuple: (roots array, kernel evaluations)
+    """
+    pole_limit = np.minimum(np.abs(fa), np.abs(fb))
+    xpre, xcur, fpre, fcur = xa, xb, fa, fb
+    xblk, fblk = xa, fa
+    spre = scur = xb - xa
+    ids = np.arange(len(xa))
+    found = []
+    evaluations = 0
+
+    with np.errstate(all="ignore"):
+        for _ in range(SOLVE_MAX_ITERATIONS):
+            if not len(ids):
+                break
+
+            flip = (fpre != 0) & (fcur != 0) & (np.signbit(fpre) != np.signbit(fcur))
+            xblk = np.where(flip, xpre, xblk)
+            fblk = np.where(flip, fpre, fblk)
+            spre = np.where(flip, xcur - xpre, spre)
+            scur = np.where(flip, xcur - xpre, scur)
+
+            # Keep the best estimate in xcur
+            swap = np.abs(fblk) < np.abs(fcur)
+            xpre, xcur, xblk = (np.where(swap, xcur, xpre), np.where(swap, xblk, xcur),
+                                np.where(swap, xcur, xblk))
+            fpre, fcur, fblk = (np.where(swap, fcur, fpre), np.where(swap, fblk, fcur),
+                                np.where(swap, fcur, fblk))
+
+            delta = (SOLVE_X_TOLERANCE + _REL_TOLERANCE * np.abs(xcur)) / 2
+            sbis = (xblk - xcur) / 2
+            done = (fcur == 0) | (np.abs(sbis) < delta) | np.isnan(fcur)
+            if done.any():
+                keep = ~done
+                accept = done & (np.abs(fcur) <= pole_limit[ids])
+                found.append(xcur[accept])
+                (ids, xpre, xcur, xblk, fpre, fcur, fblk, spre, scur, delta, sbis) = (
+                    array[keep] for array in
+                    (ids, xpre, xcur, xblk, fpre, fcur, fblk, spre, scur, delta, sbis)
+                )
+                if not len(ids):
+                    break
+
+            # Secant (two distinct points) or inverse quadratic interpolation
+            secant = -fcur * (xcur - xpre) / (fcur - fpre)
+            dpre = (fpre - fcur) / (xpre - xcur)
+            dblk = (fblk - fcur) / (xblk - xcur)
+            quadratic = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            stry = np.where(xpre == xblk, secant, quadratic)
+
+            interpolate = (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre))
+            good = interpolate & (2 * np.abs(stry) < np.minimum(np.abs(spre), 3 * np.abs(sbis) - delta))
+            spre = np.where(good, scur, sbis)
+            scur = np.where(good, stry, sbis)
+
+            xpre, fpre = xcur, fcur
+            xcur = xcur + np.where(np.abs(scur) > delta, scur, np.where(sbis > 0, delta, -delta))
+            fcur = kernel(xcur)
+            evaluations += len(ids)
+
+    if len(ids):
+        # Iteration limit: keep the best estimates that are not poles
+        found.append(xcur[np.abs(fcur) <= pole_limit[ids]])
+    return np.concatenate(found) if found else np.empty(0), evaluations
+
+
+def _find_roots_python(kernel, lower: float, upper: float, grid_points: int) -> dict:
+    """find_roots() point by point (scalar kernels)."""
+    step = (upper - lower) / (grid_points - 1)
+    grid = [lower + i * step for i in range(grid_points - 1)] + [upper]
+    values = kernel(grid)
+    defined = [math.isfinite(value) for value in values]
+
+    roots = [x for x, value, ok in zip(grid, values, defined) if ok and value == 0]
+    brackets = 0
+    evaluations = grid_points
+    for i in range(grid_points - 1):
+        fa, fb = values[i], values[i + 1]
+        if defined[i] and defined[i + 1] and fa * fb < 0:
+            brackets += 1
+            root, count = _brent_python(kernel, grid[i], grid[i + 1], fa, fb)
+            evaluations += count
+            if root is not None:
+                roots.append(root)
+
+    return {
+        "roots": sorted(roots),
+        "brackets": brackets,
+        "masked": defined.count(False),
+        "evaluations": evaluations
+    }
+
+
+def _brent_python(kernel, xa: float, xb: float, fa: float, fb: float) -> tuple:
+    """
+    Brent's method on one bracket (same steps as _brent_numpy).
+
+    Returns:
+        tuple: (root or None for a pole / undefined point, evaluations)
+    """
+    pole_limit = min(abs(fa), abs(fb))
+    xpre, xcur, fpre, fcur = xa, xb, fa, fb
+    xblk, fblk = xa, fa
+    spre = scur = xb - xa
+    evaluations = 0
+
+    for _ in range(SOLVE_MAX_ITERATIONS):
+        if fpre != 0 and fcur != 0 and (fpre < 0) != (fcur < 0):
+            xblk, fblk = xpre, fpre
+            spre = scur = xcur - xpre
+        if abs(fblk) < abs(fcur):
+            xpre, xcur, xblk = xcur, xblk, xcur
+            fpre, fcur, fblk = fcur, fblk, fcur
+
+        delta = (SOLVE_X_TOLERANCE + _REL_TOLERANCE * abs(xcur)) / 2
+        sbis = (xblk - xcur) / 2
+        if fcur == 0 or abs(sbis) < delta or math.isnan(fcur):
+            break
+
+        if abs(spre) > delta and abs(fcur) < abs(fpre):
+            try:
+                if xpre == xblk:
+                    stry = -fcur * (xcur - xpre) / (fcur - fpre)
+                else:
+                    dpre = (fpre - fcur) / (xpre - xcur)
+                    dblk = (fblk - fcur) / (xblk - xcur)
+                    stry = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            except ZeroDivisionError:
+                stry = math.inf
+            if 2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - delta):
+                spre, scur = scur, stry
+            else:
+                spre = scur = sbis
+        else:
+            spre = scur = sbis
+
+        xpre, fpre = xcur, fcur
+        xcur += scur if abs(scur) > delta else (delta if sbis > 0 else -delta)
+        fcur = kernel([xcur])[0]
+        evaluations += 1
+
+    if abs(fcur) <= pole_limit:
+        return xcur, evaluations
+    return None, evaluations
@@ -0,0 +1,318 @@
+"""
+Finite sums and products over expression kernels.
+Arithmetic and geometric series are recognized on the expression tree and
+evaluated in closed form; any other term is compiled once and evaluated
+over the index in fixed-size chunks (one kernel call per chunk), so long
+series run in bounded memory.
+"""
+import ast
+import math
+from src.calculator.config.constants import (
+    SERIES_CHUNK_SIZE,
+    SERIES_MAX_TERMS,
+    SERIES_MAX_BOUND
+)
+from src.calculator.logic.optimizer import IMPURE_FUNCTIONS
+from src.calculator.config.locale import (
+    ERROR_MATH_DOMAIN,
+    ERROR_OVERFLOW,
+    ERROR_SERIES_BOUNDS,
+    ERROR_SERIES_TOO_LONG
+)
+
+
+# Ints with more bits do not convert to float
+_EXACT_INT_BITS = 1024
+
+
+def integer_bounds(lower, upper) -> tuple:
+    """
+    Validate series bounds.
+
+    Args:
+        lower: First index value
+        upper: Last index value (inclusive)
+
+    Returns:
+        tuple: (lower, upper) as ints
+
+    Raises:
+        ValueError: If a bound is not an integer, is too large, or the
+            series has more than SERIES_MAX_TERMS terms
+    """
+    bounds = []
+    for bound in (lower, upper):
+        bound = float(bound)
+        if not bound.is_integer() or abs(bound) > SERIES_MAX_BOUND:
+            raise ValueError(ERROR_SERIES_BOUNDS)
+        bounds.append(int(bound))
+    lower, upper = bounds
+    if upper - lower + 1 > SERIES_MAX_TERMS:
+        raise ValueError(ERROR_SERIES_TOO_LONG)
+    return lower, upper
+
+
+def closed_form(body: ast.AST, variable: str, constant, lower: int, upper: int,
+                product: bool, max_bits: int = _EXACT_INT_BITS) -> dict:
+    """
+    Evaluate a series in closed form, if its term is recognized.
+
+    Recognized terms: a + b*k (arithmetic sums) and c*r^(p+q*k) with a
+    positive constant base (geometric sums and products, including
+    constant terms). With int coefficients the value is an exact int.
+
+    Args:
+        body: Term expression node (optimized tree)
+        variable: Index variable name
+        constant: Function evaluating a node without the index to a number
+        lower: First index value
+        upper: Last index value (inclusive)
+        product: Product instead of sum
+        max_bits: Largest exact int result, in bits (the evaluator passes
+            its power limit)
+
+    Returns:
+        dict: Same keys as evaluate_series() (value is an int when exact),
+            or None if the term is not recognized
+
+    Raises:
+        OverflowError: If the result is too large
+    """
+    terms = max(upper - lower + 1, 0)
+    index_sum = (lower + upper) * terms // 2  # Sum of k over the range (exact)
+
+    if isinstance(body, ast.Expr):
+        body = body.value
+    recognizer = _Terms(variable, constant)
+    exponential = recognizer.exponential(body)
+    affine = None if exponential is not None or product else recognizer.affine(body)
+    if exponential is not None:
+        c, r = exponential
+        value = None
+        if type(c) is int and type(r) is int:
+            value = _exact_geometric(c, r, lower, terms, index_sum, product, max_bits)
+        if value is None:
+            value = _geometric(float(c), float(r), lower, terms, index_sum, product)
+        kind = "geometric"
+    elif affine is not None:
+        a, b = affine
+        if type(a) is int and type(b) is int:
+            value = a * terms + b * index_sum
+        else:
+            value = float(a) * terms + float(b) * index_sum
+        kind = "arithmetic"
+    else:
+        return None
+
+    if type(value) is float and not math.isfinite(value):
+        raise OverflowError(ERROR_OVERFLOW)
+    return {"value": value, "terms": terms, "closed_form": kind, "evaluations": 0}
+
+
+def _exact_geometric(c: int, r: int, lower: int, terms: int, index_sum: int,
+                     product: bool, max_bits: int):
+    """
+    Exact int sum or product of c*r^k over the range, or None when it
+    needs a negative power of r.
+
+    Raises:
+        OverflowError: If the result would have more than max_bits bits
+            (estimated from the logarithms, before computing it)
+    """
+    if c == 0:
+        return 0
+    exponent = index_sum if product else lower + terms  # Sums stay below c*r^exponent
+    if r != 1 and (lower < 0 if not product else index_sum < 0):
+        return None
+    bits = (terms if product else 1) * math.log2(abs(c)) + exponent * math.log2(r)
+    if bits > max_bits:
+        raise OverflowError(ERROR_OVERFLOW)
+    return _geometric(c, r, lower, terms, index_sum, product)
+
+
+def _geometric(c, r, lower: int, terms: int, index_sum: int, product: bool):
+    """Sum or product of c*r^k over the range, in the arithmetic of c and r."""
+    if product:
+        return c ** terms * r ** index_sum
+    if r == 1:
+        return c * terms
+    if type(r) is int:
+        return c * r ** lower * ((r ** terms - 1) // (r - 1))  # Exact division
+    return c * r ** lower * (r ** terms - 1) / (r - 1)
+
+
+class _Terms:
+    """Recognizes affine and exponential terms of the index variable."""
+
+    def __init__(self, variable: str, constant):
+        self.variable = variable
+        self.constant = constant
+
+    def _value(self, node: ast.AST):
+        """Value of a node without the index (or impure calls), or None."""
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and (child.id == self.variable
+                                                or child.id in IMPURE_FUNCTIONS):
+                return None
+        try:
+            value = self.constant(node)
+        except Exception:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        if isinstance(value, int) and value.bit_length() > _EXACT_INT_BITS:
+            return None  # Beyond float range: left to term-by-term evaluation
+        return value
+
+    def affine(self, node: ast.AST):
+        """(a, b) with node = a + b*k, or None."""
+        value = self._value(node)
+        if value is not None:
+            return value, 0
+        if isinstance(node, ast.Name):
+            return (0, 1) if node.id == self.variable else None
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            inner = self.affine(node.operand)
+            if inner is None or isinstance(node.op, ast.UAdd):
+                return inner
+            return -inner[0], -inner[1]
+        if not isinstance(node, ast.BinOp):
+            return None
+
+        left, right = self.affine(node.left), self.affine(node.right)
+        if left is None or right is None:
+            return None
+        (la, lb), (ra, rb) = left, right
+        if isinstance(node.op, ast.Add):
+            return la + ra, lb + rb
+        if isinstance(node.op, ast.Sub):
+            return la - ra, lb - rb
+        if isinstance(node.op, ast.Mult) and (lb == 0 or rb == 0):
+            return la * ra, lb * ra + la * rb
+        if isinstance(node.op, ast.Div) and rb == 0 and ra != 0:
+            return la / ra, lb / ra
+        return None
+
+    def exponential(self, node: ast.AST):
+        """(c, r) with node = c * r^k, or None."""
+        value = self._value(node)
+        if value is not None:
+            return value, 1
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            inner = self.exponential(node.operand)
+            if inner is None or isinstance(node.op, ast.UAdd):
+                return inner
+            return -inner[0], inner[1]
+        if not isinstance(node, ast.BinOp):
+            return None
+
+        if isinstance(node.op, ast.Pow):
+            base = self._value(node.left)
+            exponent = self.affine(node.right)
+            if base is None or base <= 0 or exponent is None:
+                return None
+            p, q = exponent
+            return base ** p, base ** q
+
+        left, right = self.exponential(node.left), self.exponential(node.right)
+        if left is None or right is None:
+            return None
+        (lc, lr), (rc, rr) = left, right
+        if isinstance(node.op, ast.Mult):
+            return lc * rc, lr * rr
+        if isinstance(node.op, ast.Div) and rc != 0:
+            return lc / rc, lr / rr
+        return None
+
+
+def evaluate_series(kernel, lower: int, upper: int, product: bool,
+                    chunk_size: int = SERIES_CHUNK_SIZE, term=None) -> dict:
+    """
+    Sum or multiply the kernel values for k = lower..upper.
+
+    Args:
+        kernel: ExpressionKernel of the index variable
+        lower: First index value
+        upper: Last index value (inclusive)
+        product: Product instead of sum
+        chunk_size: Terms per kernel call
+        term: Function evaluating one term at an int index with the scalar
+            evaluator; called on the first non-finite term so its own
+            error (e.g. factorial too large) is raised
+
+    Returns:
+        dict with keys:
+            - value (float): Sum or product (0 / 1 for an empty range)
+            - terms (int): Number of terms
+            - closed_form (str): None (term by term)
+            - evaluations (int): Number of terms evaluated
+
+    Raises:
+        ValueError: If a term is undefined
+        OverflowError: If a term or the result is infinite
+    """
+    terms = max(upper - lower + 1, 0)
+    if kernel.vectorized:
+        import numpy as np  # Vectorized kernels imply NumPy is installed
+        reduce = np.prod if product else np.sum
+        chunk = lambda start, stop: kernel(np.arange(start, stop, dtype=float))
+        with np.errstate(all="ignore"):
+            total, evaluations, bad = _accumulate(chunk, reduce, lower, upper, product,
+                                                  chunk_size)
+    else:
+        reduce = math.prod if product else math.fsum
+        chunk = lambda start, stop: kernel([float(k) for k in range(start, stop)])
+        total, evaluations, bad = _accumulate(chunk, reduce, lower, upper, product, chunk_size)
+
+    if not math.isfinite(total) and bad is not None and term is not None:
+        term(bad)  # Raises the term's own error, if the evaluator reports one
+    if math.isnan(total):
+        raise ValueError(ERROR_MATH_DOMAIN)
+    if math.isinf(total):
+        raise OverflowError(ERROR_OVERFLOW)
+    return {
+        "value": total,
+        "terms": terms,
+        "closed_form": None,
+        "evaluations": evaluations
+    }
+
+
+def _accumulate(chunk, reduce, lower: int, upper: int, product: bool,
+                chunk_size: int) -> tuple:
+    """
+    Reduce the series chunk by chunk (compensated sum across chunks).
+
+    Stops at the first non-finite partial result.
+
+    Returns:
+        tuple: (sum or product, terms evaluated, index of the first
+            non-finite term or None)
+    """
+    total = 1.0 if product else 0.0
+    compensation = 0.0  # Neumaier compensation of the running sum
+    evaluations = 0
+    for start in range(lower, upper + 1, chunk_size):
+        stop = min(start + chunk_size, upper + 1)
+        values = chunk(start, stop)
+        partial = float(reduce(values))
+        evaluations += stop - start
+        if not math.isfinite(partial):
+            bad = next((start + i for i, value in enumerate(values)
+                        if not math.isfinite(value)), None)
+            return partial, evaluations, bad
+        if product:
+            total *= partial
+            if not math.isfinite(total):
+                break
+        else:
+            running = total + partial
+            if abs(total) >= abs(partial):
+                compensation += (total - running) + partial
+            else:
+                compensation += (partial - running) + total
+            total = running
+
+    if product or not math.isfinite(total):
+        return total, evaluations, None
+    return total + compensation, evaluations, None
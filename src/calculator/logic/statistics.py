@@ -0,0 +1,319 @@
+"""
+Streaming statistics over numbers arriving in chunks.
+Mean and variance are accumulated in one pass (Welford's algorithm, with
+chunks merged by Chan's formula); quantiles are exact for short streams
+and estimated with a merging t-digest for long ones, so memory stays
+bounded whatever the stream length. Chunks are NumPy arrays when NumPy is
+installed, lists otherwise.
+"""
+import math
+from src.calculator.logic.kernel import numpy_available
+from src.calculator.config.constants import STATS_EXACT_VALUES, STATS_DIGEST_COMPRESSION
+from src.calculator.config.locale import (
+    ERROR_MATH_DOMAIN,
+    ERROR_STATS_NO_DATA,
+    ERROR_STATS_INVALID_VALUE
+)
+
+
+class StreamingStatistics:
+    """
+    One-pass summary of a stream of numbers.
+
+    Values are added chunk by chunk with update(); statistics can be read
+    at any time. Variance and standard deviation are sample statistics
+    (n - 1 denominator). Quantiles use linear interpolation between order
+    statistics (the NumPy default); past STATS_EXACT_VALUES values they
+    are t-digest estimates, most accurate in the tails.
+
+    Attributes:
+        count: Number of values seen
+        minimum: Smallest value (inf before any value)
+        maximum: Largest value (-inf before any value)
+    """
+
+    def __init__(self, exact_values: int = STATS_EXACT_VALUES,
+                 compression: int = STATS_DIGEST_COMPRESSION):
+        """
+        Create an empty summary.
+
+        Args:
+            exact_values: Values kept for exact quantiles
+            compression: t-digest compression (accuracy vs. size)
+        """
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._mean = 0.0
+        self._m2 = 0.0  # Sum of squared deviations from the mean
+        self._exact_values = exact_values
+        self._compression = compression
+        self._values = []  # Chunks kept while the stream is short
+        self._digest = None  # (sorted centroid means, weights) once it is long
+        if numpy_available():
+            import numpy as np
+            self._np = np
+        else:
+            self._np = None
+
+    def update(self, values) -> None:
+        """
+        Add a chunk of values.
+
+        Args:
+            values: Sequence or array of numbers
+
+        Raises:
+            ValueError: If a value is not a finite number
+        """
+        np = self._np
+        if np is not None:
+            chunk = np.asarray(values, dtype=float).ravel()
+            if not chunk.size:
+                return
+            if not np.isfinite(chunk).all():
+                raise ValueError(ERROR_STATS_INVALID_VALUE)
+            mean = float(chunk.mean())
+            m2 = float(np.square(chunk - mean).sum())
+            lowest, highest = float(chunk.min()), float(chunk.max())
+        else:
+            chunk = [float(value) for value in values]
+            if not chunk:
+                return
+            if not all(math.isfinite(value) for value in chunk):
+                raise ValueError(ERROR_STATS_INVALID_VALUE)
+            mean = math.fsum(chunk) / len(chunk)
+            m2 = math.fsum((value - mean) ** 2 for value in chunk)
+            lowest, highest = min(chunk), max(chunk)
+
+        # Chan et al.: merge (count, mean, M2) of the chunk into the totals
+        size = len(chunk)
+        total = self.count + size
+        delta = mean - self._mean
+        self._mean += delta * size / total
+        self._m2 += m2 + delta * delta * self.count * size / total
+        self.count = total
+        self.minimum = min(self.minimum, lowest)
+        self.maximum = max(self.maximum, highest)
+
+        if self._digest is None:
+            self._values.append(chunk)
+            if self.count > self._exact_values:
+                self._digest = self._compress(self._concatenate(self._values), None)
+                self._values = []
+        else:
+            means, weights = self._digest
+            ones = self._np.ones(size) if self._np is not None else [1.0] * size
+            self._digest = self._compress(self._concatenate([means, chunk]),
+                                          self._concatenate([weights, ones]))
+
+    def _concatenate(self, parts):
+        """Join chunks into one array (or list)."""
+        if self._np is not None:
+            return self._np.concatenate([self._np.asarray(part, dtype=float) for part in parts])
+        return [value for part in parts for value in part]
+
+    def _compress(self, means, weights) -> tuple:
+        """
+        Merge centroids (means with weights, None = all 1) into a t-digest.
+
+        Centroids are sorted and grouped by unit intervals of the scale
+        function k(q) = compression / (2 pi) * asin(2q - 1), which keeps
+        centroids small near the tails.
+
+        Returns:
+            tuple: (sorted centroid means, weights)
+        """
+        scale = self._compression / (2 * math.pi)
+        np = self._np
+        if np is not None:
+            if weights is None:
+                weights = np.ones(len(means))
+            order = np.argsort(means, kind="stable")
+            means, weights = means[order], weights[order]
+            left = (np.cumsum(weights) - weights) / weights.sum()
+            bucket = np.floor(scale * np.arcsin(np.clip(2 * left - 1, -1, 1)))
+            starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+            merged = np.add.reduceat(weights, starts)
+            return np.add.reduceat(weights * means, starts) / merged, merged
+
+        if weights is None:
+            weights = [1.0] * len(means)
+        pairs = sorted(zip(means, weights))
+        total = math.fsum(weights)
+        centroid_means, centroid_weights = [], []
+        cumulative = 0.0
+        current = None
+        for mean, weight in pairs:
+            bucket = math.floor(scale * math.asin(max(-1.0, min(1.0, 2 * cumulative / total - 1))))
+            if bucket != current:
+                centroid_means.append(0.0)
+                centroid_weights.append(0.0)
+                current = bucket
+            centroid_means[-1] += weight * mean
+            centroid_weights[-1] += weight
+            cumulative += weight
+        return ([mean / weight for mean, weight in zip(centroid_means, centroid_weights)],
+                centroid_weights)
+
+    def _require(self, count: int) -> None:
+        """Raise unless at least `count` values were seen."""
+        if self.count < count:
+            raise ValueError(ERROR_STATS_NO_DATA)
+
+    def mean(self) -> float:
+        """Arithmetic mean."""
+        self._require(1)
+        return self._mean
+
+    def variance(self) -> float:
+        """Sample variance (needs two values)."""
+        self._require(2)
+        return max(self._m2, 0.0) / (self.count - 1)
+
+    def stdev(self) -> float:
+        """Sample standard deviation (needs two values)."""
+        return math.sqrt(self.variance())
+
+    def min(self) -> float:
+        """Smallest value."""
+        self._require(1)
+        return self.minimum
+
+    def max(self) -> float:
+        """Largest value."""
+        self._require(1)
+        return self.maximum
+
+    def median(self) -> float:
+        """Median (50th percentile)."""
+        return self.quantile(0.5)
+
+    def percentile(self, p: float) -> float:
+        """
+        Percentile p of the values.
+
+        Args:
+            p: Percent, 0 to 100
+
+        Raises:
+            ValueError: If p is outside [0, 100] or there are no values
+        """
+        return self.quantile(p / 100)
+
+    def quantile(self, q: float) -> float:
+        """
+        Quantile q of the values.
+
+        Args:
+            q: Fraction, 0 to 1
+
+        Raises:
+            ValueError: If q is outside [0, 1] or there are no values
+        """
+        self._require(1)
+        if not 0 <= q <= 1:
+            raise ValueError(ERROR_MATH_DOMAIN)
+
+        if self._digest is None:
+            # Exact: interpolate between the order statistics around (n - 1) * q
+            values = self._concatenate(self._values)
+            if self._np is not None:
+                return float(self._np.quantile(values, q))
+            values = sorted(values)
+            position = (len(values) - 1) * q
+            index = math.floor(position)
+            if index + 1 >= len(values):
+                return values[-1]
+            return values[index] + (values[index + 1] - values[index]) * (position - index)
+
+        # t-digest: interpolate between centroid centers (min and max at the ends)
+        means, weights = self._digest
+        if self._np is not None:
+            means, weights = means.tolist(), weights.tolist()
+        target = q * self.count
+        previous_center, previous_mean = 0.0, self.minimum
+        cumulative = 0.0
+        for mean, weight in zip(means, weights):
+            center = cumulative + weight / 2
+            if target <= center:
+                return _interpolate(previous_center, previous_mean, center, mean, target)
+            previous_center, previous_mean = center, mean
+            cumulative += weight
+        return _interpolate(previous_center, previous_mean, float(self.count), self.maximum, target)
+
+
+def _interpolate(x0: float, y0: float, x1: float, y1: float, x: float) -> float:
+    """Linear interpolation between (x0, y0) and (x1, y1)."""
+    if x1 <= x0:
+        return y1
+    return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+
+
+# Statistic name -> function(summary, *parameters)
+STATISTICS = {
+    'mean': StreamingStatistics.mean,
+    'variance': StreamingStatistics.variance,
+    'stdev': StreamingStatistics.stdev,
+    'min': StreamingStatistics.min,
+    'max': StreamingStatistics.max,
+    'median': StreamingStatistics.median,
+    'percentile': StreamingStatistics.percentile,
+}
+
+
+def summarize(chunks) -> StreamingStatistics:
+    """
+    Summarize a stream of chunks in one pass.
+
+    Args:
+        chunks: Iterable of sequences or arrays of numbers
+
+    Returns:
+        StreamingStatistics: Summary of all values
+    """
+    summary = StreamingStatistics()
+    for chunk in chunks:
+        summary.update(chunk)
+    return summary
+
+
+def literal_functions() -> dict:
+    """
+    Statistics over their arguments, for the evaluator's function table.
+
+    mean(1, 2, 3), ..., and percentile(p, x1, x2, ...) with the percent
+    first. min and max return the argument itself, and the mean of ints is
+    exact (an int when it is whole), so big ints keep every digit.
+
+    Returns:
+        dict: Function name -> function
+    """
+    def over_arguments(statistic):
+        return lambda *values: statistic(summarize([values]))
+
+    def extreme(statistic, pick):
+        def function(*values):
+            if not _all_ints(values):
+                statistic(summarize([values]))  # Raises for no data or invalid values
+            return pick(values)
+        return function
+
+    def mean(*values):
+        if not _all_ints(values):
+            return summarize([values]).mean()
+        total = sum(values)
+        whole, remainder = divmod(total, len(values))
+        return total / len(values) if remainder else whole
+
+    functions = {name: over_arguments(statistic) for name, statistic in STATISTICS.items()}
+    functions['min'] = extreme(StreamingStatistics.min, min)
+    functions['max'] = extreme(StreamingStatistics.max, max)
+    functions['mean'] = mean
+    functions['percentile'] = lambda p, *values: summarize([values]).percentile(p)
+    return functions
+
+
+def _all_ints(values) -> bool:
+    """Whether there are values and every one is an int (not bool)."""
+    return bool(values) and all(type(value) is int for value in values)
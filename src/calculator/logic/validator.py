@@ -2,6 +2,7 @@
 InputValidator - validates calculator input expressions.
 Checks parentheses balance, syntax, and returns Polish error messages.
 Extended to support scientific functions, ^ operator, and math constants.
+IncrementalValidator keeps the same validity state per keystroke in O(1).
 """
 import re
 from src.calculator.config.locale import (
@@ -13,6 +14,25 @@ from src.calculator.config.locale import (
 )
 from src.calculator.config.constants import BASIC_FUNCTIONS, ALL_FUNCTIONS
 
+# Character classes tracked by IncrementalValidator
+CLASS_DIGIT = 'digit'
+CLASS_NAME = 'name'
+CLASS_OPERATOR = 'operator'
+CLASS_COMPARISON = 'comparison'  # '<' or '>', which may still become '<=' / '>='
+CLASS_OPEN = 'open'
+CLASS_CLOSE = 'close'
+
+# Same character set as InputValidator._validate_syntax, one char at a time
+_VALID_CHAR = re.compile(r'[\d+\-*/^().,<>=!@\[\]eE\s\w]')
+
+# Operator tokens: comparisons first, so '<=' is one token; a lone '=' or
+# '!' is matched (and rejected) as an incomplete comparison
+_OPERATOR_TOKEN = re.compile(r'<=|>=|==|!=|[<>=!+\-*/^@]')
+_INCOMPLETE_COMPARISONS = ('=', '!')
+
+# Token classes after which an expression cannot end
+_OPERATOR_CLASSES = (CLASS_OPERATOR, CLASS_COMPARISON)
+
 
 class InputValidator:
     """
@@ -116,7 +136,8 @@ class InputValidator:
         Checks for:
         - Consecutive operators (except unary minus)
         - Trailing operators
-        - Invalid characters (allows functions, ^, and constants)
+        - Incomplete comparisons (a lone = or !)
+        - Invalid characters (allows functions, ^, constants and comparisons)
 
         Args:
             expression: The expression to check
@@ -125,8 +146,11 @@ class InputValidator:
             dict with valid, error, position keys
         """
         # Allow: digits, operators (including ^), parentheses, decimal point,
-        # whitespace, and letters (for function names and constants like pi, e)
-        valid_chars = re.compile(r'^[\d+\-*/^().eE\s\w]+$')
+        # whitespace, letters (for function names and constants like pi, e)
+        # commas (argument separators, e.g. integrate(x^2, x, 0, 1))
+        # comparisons (<, >, <=, >=, ==, !=, e.g. if(x < 0, -x, x))
+        # and matrices ([[1, 2], [3, 4]] @ [1, 1])
+        valid_chars = re.compile(r'^[\d+\-*/^().,<>=!@\[\]eE\s\w]+$')
         if not valid_chars.match(expression):
             return {
                 "valid": False,
@@ -134,40 +158,208 @@ class InputValidator:
                 "position": None
             }
 
-        # Remove whitespace for operator checking
-        expr_no_space = expression.replace(' ', '')
+        # Remove whitespace (any, as in IncrementalValidator) for operator checking
+        expr_no_space = ''.join(expression.split())
 
         # Check for trailing operators
-        if expr_no_space and expr_no_space[-1] in '+-*/^':
+        if expr_no_space and expr_no_space[-1] in '+-*/^<>=!@':
             return {
                 "valid": False,
                 "error": ERROR_INVALID_EXPRESSION,
                 "position": len(expr_no_space) - 1
             }
 
-        # Check for consecutive operators (excluding unary minus)
-        operators = ['+', '-', '*', '/', '^']
-        for i in range(len(expr_no_space) - 1):
-            current = expr_no_space[i]
-            next_char = expr_no_space[i + 1]
-
-            # Check if we have two operators in a row
-            if current in operators and next_char in operators:
-                # Allow unary minus after operators or at start
-                if next_char == '-' and (i == 0 or current in operators or expr_no_space[i] == '('):
-                    continue
-                # Allow unary minus after opening parenthesis
-                if current == '(' and next_char == '-':
-                    continue
-                # Otherwise, it's invalid
+        # Check for incomplete comparisons and consecutive operators
+        # (unary minus may follow any operator)
+        previous_end = None
+        for token in _OPERATOR_TOKEN.finditer(expr_no_space):
+            incomplete = token.group() in _INCOMPLETE_COMPARISONS
+            consecutive = token.start() == previous_end and token.group() != '-'
+            if incomplete or consecutive:
                 return {
                     "valid": False,
                     "error": ERROR_INVALID_EXPRESSION,
-                    "position": i + 1
+                    "position": token.start()
                 }
+            previous_end = token.end()
 
         return {
             "valid": True,
             "error": None,
             "position": None
         }
+
+
+class IncrementalValidator:
+    """
+    Validator state maintained one keystroke at a time.
+
+    Applies the same rules as InputValidator.validate (parentheses,
+    allowed characters, trailing and consecutive operators), but keeps a
+    small state snapshot after every character. Appending or removing a
+    character is O(1), independent of the expression length.
+
+    Positions are indices into the typed text (whitespace included).
+    """
+
+    def __init__(self):
+        """Initialize an empty validator state."""
+        # One snapshot per character:
+        # (depth, innermost_open, last_class, unmatched_close, invalid_char, bad_operator,
+        #  pending) - pending is the index of a lone '=' or '!' awaiting '='
+        self._states = []
+
+    def __len__(self) -> int:
+        """Number of characters fed so far."""
+        return len(self._states)
+
+    def _top(self) -> tuple:
+        """State after the last character (initial state when empty)."""
+        if self._states:
+            return self._states[-1]
+        return (0, None, None, None, None, None, None)
+
+    @property
+    def depth(self) -> int:
+        """Current parenthesis nesting depth."""
+        return self._top()[0]
+
+    @property
+    def last_class(self):
+        """Class of the last non-whitespace character (None if none)."""
+        return self._top()[2]
+
+    @property
+    def valid(self) -> bool:
+        """True if InputValidator.validate would accept the text."""
+        depth, _, last_class, unmatched, invalid, bad_operator, _ = self._top()
+        return (
+            depth == 0
+            and last_class is not None
+            and last_class not in _OPERATOR_CLASSES
+            and unmatched is None
+            and invalid is None
+            and bad_operator is None
+        )
+
+    def status(self) -> dict:
+        """
+        Validation result in the same format as InputValidator.validate.
+
+        Returns:
+            dict with valid, error, position keys
+        """
+        depth, innermost_open, last_class, unmatched, invalid, bad_operator, _ = self._top()
+
+        if last_class is None:
+            return {"valid": False, "error": ERROR_EMPTY_EXPRESSION, "position": None}
+        if unmatched is not None:
+            return {
+                "valid": False,
+                "error": ERROR_MISSING_OPENING_PARENTHESIS.format(unmatched),
+                "position": unmatched
+            }
+        if depth > 0:
+            return {
+                "valid": False,
+                "error": ERROR_MISSING_CLOSING_PARENTHESIS,
+                "position": innermost_open
+            }
+        if invalid is not None:
+            return {"valid": False, "error": ERROR_INVALID_EXPRESSION, "position": None}
+        if last_class in _OPERATOR_CLASSES:
+            return {"valid": False, "error": ERROR_INVALID_EXPRESSION, "position": len(self) - 1}
+        if bad_operator is not None:
+            return {"valid": False, "error": ERROR_INVALID_EXPRESSION, "position": bad_operator}
+
+        return {"valid": True, "error": None, "position": None}
+
+    def push(self, token: str) -> None:
+        """
+        Feed a token appended to the expression.
+
+        Args:
+            token: Appended text (e.g. "7", "+", "sin(")
+        """
+        for char in token:
+            self._push_char(char)
+
+    def _push_char(self, char: str) -> None:
+        """Compute the state after one more character."""
+        state = self._top()
+        depth, innermost_open, last_class, unmatched, invalid, bad_operator, pending = state
+        index = len(self._states)
+
+        if invalid is None and not _VALID_CHAR.match(char):
+            invalid = index
+
+        if char.isspace():
+            # Whitespace never changes the token class
+            self._states.append(
+                (depth, innermost_open, last_class, unmatched, invalid, bad_operator, pending)
+            )
+            return
+
+        if char == '=' and (pending is not None or last_class == CLASS_COMPARISON):
+            # Second character of <=, >=, == or !=
+            self._states.append(
+                (depth, innermost_open, CLASS_OPERATOR, unmatched, invalid, bad_operator, None)
+            )
+            return
+        if pending is not None and bad_operator is None:
+            bad_operator = pending  # Lone '=' or '!'
+        pending = None
+
+        if char == '(':
+            depth += 1
+            innermost_open = index
+            char_class = CLASS_OPEN
+        elif char == ')':
+            depth -= 1
+            if depth < 0 and unmatched is None:
+                unmatched = index
+            # Innermost open paren before the one just closed
+            if innermost_open:
+                innermost_open = self._states[innermost_open - 1][1]
+            else:
+                innermost_open = None
+            char_class = CLASS_CLOSE
+        elif char == '[':
+            # Matrix brackets are matched by the parser, not counted here
+            char_class = CLASS_OPEN
+        elif char == ']':
+            char_class = CLASS_CLOSE
+        elif char in '+-*/^<>=!@':
+            # Any operator may be followed by unary minus
+            if last_class in _OPERATOR_CLASSES and char != '-' and bad_operator is None:
+                bad_operator = index
+            if char in _INCOMPLETE_COMPARISONS:
+                pending = index
+            char_class = CLASS_COMPARISON if char in '<>' else CLASS_OPERATOR
+        elif char.isdigit() or char == '.':
+            char_class = CLASS_DIGIT
+        else:
+            char_class = CLASS_NAME
+
+        self._states.append(
+            (depth, innermost_open, char_class, unmatched, invalid, bad_operator, pending)
+        )
+
+    def pop(self, count: int = 1) -> None:
+        """
+        Remove characters from the end (backspace).
+
+        Args:
+            count: Number of characters removed
+        """
+        del self._states[max(len(self._states) - count, 0):]
+
+    def reset(self, text: str = "") -> None:
+        """
+        Restart from a given expression.
+
+        Args:
+            text: Expression to feed from scratch
+        """
+        self._states.clear()
+        self.push(text)
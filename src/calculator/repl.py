@@ -0,0 +1,209 @@
+"""
+SciCalc - Terminal REPL
+Text interface over CalculatorEngine. Never imports Tk, so it starts fast.
+
+Usage:
+    python -m src.calculator.repl          # interactive prompt
+    echo "2+2" | python -m src.calculator.repl   # pipe mode (one result per line)
+    python -m src.calculator.repl --pipe   # force pipe mode
+"""
+
+import sys
+from collections import deque
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.config.constants import (
+    MAX_HISTORY_ENTRIES,
+    ANGLE_MODE_DEGREES,
+    ANGLE_MODE_RADIANS,
+    ANGLE_MODE_GRADIANS
+)
+from src.calculator.config.locale import (
+    MSG_WELCOME,
+    MSG_PROMPT,
+    MSG_GOODBYE,
+    HELP_USAGE,
+    INFO_RESULT,
+    INFO_ANGLE_MODE_CHANGED,
+    HIST_EMPTY,
+    ANGLE_MODE_DEGREES as ANGLE_NAME_DEGREES,
+    ANGLE_MODE_RADIANS as ANGLE_NAME_RADIANS,
+    ANGLE_MODE_GRADIANS as ANGLE_NAME_GRADIANS
+)
+
+
+# Command word -> angle mode constant
+ANGLE_COMMANDS = {
+    "deg": ANGLE_MODE_DEGREES,
+    "rad": ANGLE_MODE_RADIANS,
+    "grad": ANGLE_MODE_GRADIANS,
+}
+
+# Angle mode constant -> Polish display name
+ANGLE_MODE_NAMES = {
+    ANGLE_MODE_DEGREES: ANGLE_NAME_DEGREES,
+    ANGLE_MODE_RADIANS: ANGLE_NAME_RADIANS,
+    ANGLE_MODE_GRADIANS: ANGLE_NAME_GRADIANS,
+}
+
+QUIT_COMMANDS = ("quit", "exit")
+HELP_COMMAND = "help"
+HISTORY_COMMAND = "history"
+
+
+class CalculatorRepl:
+    """
+    Read-eval-print loop for calculator expressions.
+
+    Lines are either commands (quit, help, history, deg/rad/grad) or
+    expressions evaluated through CalculatorEngine. History is kept in a
+    bounded deque of (expression, result) tuples.
+    """
+
+    def __init__(self, engine=None, output=None):
+        """
+        Initialize the REPL.
+
+        Args:
+            engine: CalculatorEngine instance (or mock for testing)
+            output: Text stream for output (defaults to sys.stdout)
+        """
+        self.engine = engine or CalculatorEngine()
+        self.output = output or sys.stdout
+        self.history = deque(maxlen=MAX_HISTORY_ENTRIES)
+
+    def handle(self, line: str):
+        """
+        Handle one input line in interactive mode.
+
+        Args:
+            line: Raw input line
+
+        Returns:
+            str: Text to print (may be empty), or None to quit
+        """
+        command = line.strip()
+        lowered = command.lower()
+
+        if lowered in QUIT_COMMANDS:
+            return None
+        if lowered == HELP_COMMAND:
+            return HELP_USAGE.strip("\n")
+        if lowered == HISTORY_COMMAND:
+            return self._format_history()
+        if lowered in ANGLE_COMMANDS:
+            return self._set_angle_mode(ANGLE_COMMANDS[lowered])
+        if not command:
+            return ""
+
+        result = self.evaluate(command)
+        if result["success"]:
+            return INFO_RESULT.format(result["result"])
+        return result["error"]
+
+    def evaluate(self, expression: str) -> dict:
+        """
+        Calculate an expression and record successful results in history.
+
+        Args:
+            expression: Expression string
+
+        Returns:
+            dict: CalculatorEngine.calculate() result
+        """
+        result = self.engine.calculate(expression)
+        if result["success"]:
+            self.history.append((expression, result["result"]))
+        return result
+
+    def _set_angle_mode(self, mode: str) -> str:
+        """Switch the engine angle mode and return the confirmation message."""
+        self.engine.set_angle_mode(mode)
+        return INFO_ANGLE_MODE_CHANGED.format(ANGLE_MODE_NAMES[mode])
+
+    def _format_history(self) -> str:
+        """Format history entries, oldest first."""
+        if not self.history:
+            return HIST_EMPTY
+        return "\n".join(f"{expression} = {result}" for expression, result in self.history)
+
+    def run_interactive(self, input_stream=None) -> int:
+        """
+        Run the interactive prompt until quit or end of input.
+
+        Args:
+            input_stream: Text stream to read from (defaults to sys.stdin)
+
+        Returns:
+            int: Exit code
+        """
+        input_stream = input_stream or sys.stdin
+        self._write(MSG_WELCOME)
+        while True:
+            self.output.write(MSG_PROMPT)
+            self.output.flush()
+            line = input_stream.readline()
+            if not line:  # End of input (Ctrl+D)
+                self._write("")
+                break
+            response = self.handle(line)
+            if response is None:
+                break
+            if response:
+                self._write(response)
+        self._write(MSG_GOODBYE)
+        return 0
+
+    def run_pipe(self, input_stream=None) -> int:
+        """
+        Evaluate one expression per input line and print one output line each.
+
+        Successful lines print the bare result, failed lines the error
+        message; empty lines are skipped. Angle mode commands are honored.
+
+        Args:
+            input_stream: Text stream to read from (defaults to sys.stdin)
+
+        Returns:
+            int: 0 if every expression succeeded, 1 otherwise
+        """
+        input_stream = input_stream or sys.stdin
+        exit_code = 0
+        for line in input_stream:
+            expression = line.strip()
+            if not expression:
+                continue
+            if expression.lower() in ANGLE_COMMANDS:
+                self.engine.set_angle_mode(ANGLE_COMMANDS[expression.lower()])
+                continue
+            result = self.evaluate(expression)
+            if result["success"]:
+                self._write(result["result"])
+            else:
+                self._write(result["error"])
+                exit_code = 1
+        return exit_code
+
+    def _write(self, text: str) -> None:
+        """Write one line of output."""
+        self.output.write(text + "\n")
+
+
+def main(argv=None) -> int:
+    """
+    REPL entry point.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        int: Exit code
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    repl = CalculatorRepl()
+    if "--pipe" in argv or not sys.stdin.isatty():
+        return repl.run_pipe()
+    return repl.run_interactive()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
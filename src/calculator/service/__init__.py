@@ -0,0 +1,3 @@
+"""
+Service module - Headless calculation services (daemon, network server).
+"""
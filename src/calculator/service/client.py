@@ -0,0 +1,183 @@
+"""
+SciCalc - Thin daemon client
+Sends expressions to the warm daemon over its Unix socket and falls back to
+in-process evaluation when no daemon is running. The engine is imported only
+for the fallback, and the C-level _socket module is used instead of socket
+(which pulls in enum and selectors), so a client talking to the daemon starts
+fast.
+
+Usage (output matches `python -m src.calculator.repl --pipe`):
+    python -m src.calculator.service.client "2+2" "sqrt(16)"
+    echo "2+2" | python -m src.calculator.service.client
+    python -m src.calculator.service.client --socket PATH ...
+"""
+
+import _socket
+import sys
+from src.calculator.config.constants import (
+    DEFAULT_ANGLE_MODE,
+    DAEMON_CONNECT_TIMEOUT,
+    ANGLE_MODE_DEGREES,
+    ANGLE_MODE_RADIANS,
+    ANGLE_MODE_GRADIANS
+)
+from src.calculator.service.protocol import (
+    default_socket_path,
+    encode_message,
+    decode_message
+)
+
+
+# Pipe-mode angle commands (same words as the REPL)
+ANGLE_COMMANDS = {
+    "deg": ANGLE_MODE_DEGREES,
+    "rad": ANGLE_MODE_RADIANS,
+    "grad": ANGLE_MODE_GRADIANS,
+}
+
+
+class DaemonClient:
+    """
+    Calculator client preferring the daemon over in-process evaluation.
+
+    The connection is opened lazily and reused for every expression. If the
+    daemon is missing or the connection breaks, the client switches to a
+    local ModeEngines for the rest of its life.
+    """
+
+    def __init__(self, socket_path: str = None, timeout: float = DAEMON_CONNECT_TIMEOUT):
+        """
+        Initialize the client (no connection is made yet).
+
+        Args:
+            socket_path: Daemon socket path (defaults to default_socket_path())
+            timeout: Connect timeout in seconds
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self._socket = None
+        self._buffer = b""  # Received bytes not yet returned as a line
+        self._local = None  # ModeEngines once fallen back
+
+    @property
+    def connected(self) -> bool:
+        """True while requests go to the daemon."""
+        return self._socket is not None
+
+    @property
+    def fallback(self) -> bool:
+        """True once the client evaluates in-process."""
+        return self._local is not None
+
+    def calculate(self, expression: str, angle_mode: str = DEFAULT_ANGLE_MODE) -> dict:
+        """
+        Calculate an expression on the daemon, or locally if it is unavailable.
+
+        Args:
+            expression: Expression string
+            angle_mode: Angle mode for trigonometric functions
+
+        Returns:
+            dict: CalculatorEngine.calculate() result
+        """
+        request = {"expression": expression, "angle_mode": angle_mode}
+        if self._local is None and (self._socket is not None or self._connect()):
+            try:
+                return self._request(request)
+            except (OSError, ValueError):
+                self.close()
+                self._start_fallback()
+        return self._local.handle(request)
+
+    def close(self) -> None:
+        """Close the daemon connection."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            self._buffer = b""
+
+    def _connect(self) -> bool:
+        """Connect to the daemon, switching to fallback on failure."""
+        connection = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+        connection.settimeout(self.timeout)
+        try:
+            connection.connect(self.socket_path)
+        except OSError:
+            connection.close()
+            self._start_fallback()
+            return False
+        connection.settimeout(None)  # Slow expressions must not trigger fallback
+        self._socket = connection
+        return True
+
+    def _request(self, request: dict) -> dict:
+        """Send one request and read its response line."""
+        self._socket.sendall(encode_message(request))
+        while b"\n" not in self._buffer:
+            chunk = self._socket.recv(65536)
+            if not chunk:
+                raise ConnectionResetError("daemon closed the connection")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return decode_message(line)
+
+    def _start_fallback(self) -> None:
+        """Create the in-process engines (imports the engine on first use)."""
+        from src.calculator.service.protocol import ModeEngines
+        self._local = ModeEngines()
+
+
+def main(argv=None, input_stream=None, output=None) -> int:
+    """
+    Client entry point.
+
+    Expressions come from the arguments, or from input lines if there are
+    none. Prints one result or error message per expression.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+        input_stream: Text stream used without expression arguments
+        output: Text stream for results (defaults to sys.stdout)
+
+    Returns:
+        int: 0 if every expression succeeded, 1 otherwise, 2 if --socket
+            has no value
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    output = output or sys.stdout
+    socket_path = None
+    if "--socket" in argv:
+        # Parsed by hand: argparse would add to every client start
+        index = argv.index("--socket")
+        if index + 1 == len(argv):
+            sys.stderr.write("usage: python -m src.calculator.service.client "
+                             "[--socket PATH] [EXPRESSION ...]\n")
+            return 2
+        socket_path = argv[index + 1]
+        del argv[index:index + 2]
+
+    lines = argv or (input_stream or sys.stdin)
+    client = DaemonClient(socket_path)
+    angle_mode = DEFAULT_ANGLE_MODE
+    exit_code = 0
+    try:
+        for line in lines:
+            expression = line.strip()
+            if not expression:
+                continue
+            if expression.lower() in ANGLE_COMMANDS:
+                angle_mode = ANGLE_COMMANDS[expression.lower()]
+                continue
+            result = client.calculate(expression, angle_mode)
+            if result["success"]:
+                output.write(result["result"] + "\n")
+            else:
+                output.write(result["error"] + "\n")
+                exit_code = 1
+    finally:
+        client.close()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
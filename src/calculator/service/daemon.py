@@ -0,0 +1,174 @@
+"""
+SciCalc - Warm calculation daemon
+Keeps CalculatorEngine instances (and their compile caches) alive and serves
+them over a Unix domain socket, so clients skip interpreter and engine startup.
+
+Opt-in; run in the foreground (or background it from the shell):
+    python -m src.calculator.service.daemon [--socket PATH]
+"""
+
+import os
+import sys
+import socketserver
+import threading
+from src.calculator.config.locale import ERROR_INVALID_EXPRESSION
+from src.calculator.service.protocol import (
+    ModeEngines,
+    default_socket_path,
+    encode_message,
+    decode_message,
+    error_response
+)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers every JSON line of one connection with one JSON line."""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = decode_message(line)
+            except ValueError:
+                response = error_response(ERROR_INVALID_EXPRESSION)
+            else:
+                response = self.server.calculator.calculate(request)
+            self.wfile.write(encode_message(response))
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    """Threaded Unix socket server carrying a reference to the daemon."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, calculator):
+        self.calculator = calculator
+        super().__init__(socket_path, _RequestHandler)
+
+
+class CalculatorDaemon:
+    """
+    Unix socket server around warm calculator engines.
+
+    Connections are handled in threads; engine access is serialized by a
+    lock (the engines and their caches are not thread-safe). One engine is
+    kept per angle mode so no request ever invalidates another's cache.
+    """
+
+    def __init__(self, socket_path: str = None, engines: ModeEngines = None):
+        """
+        Initialize the daemon (the socket is created by start()).
+
+        Args:
+            socket_path: Socket path (defaults to default_socket_path())
+            engines: ModeEngines instance (or mock for testing)
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.engines = engines or ModeEngines()
+        self._lock = threading.Lock()
+        self._server = None
+
+    def calculate(self, request: dict) -> dict:
+        """
+        Evaluate one decoded request.
+
+        Args:
+            request: Request message
+
+        Returns:
+            dict: Response in CalculatorEngine format
+        """
+        with self._lock:
+            return self.engines.handle(request)
+
+    def start(self) -> None:
+        """
+        Bind the socket, replacing a stale socket file left by a dead daemon.
+
+        Raises:
+            OSError: If another daemon is already listening on the path
+        """
+        if os.path.exists(self.socket_path):
+            if _is_listening(self.socket_path):
+                raise OSError(f"daemon already running on {self.socket_path}")
+            os.unlink(self.socket_path)
+
+        # Private socket: only the owner may connect
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(self.socket_path, self)
+        finally:
+            os.umask(old_umask)
+
+    def serve_forever(self) -> None:
+        """Serve requests until shutdown() is called."""
+        if self._server is None:
+            self.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._close()
+
+    def shutdown(self) -> None:
+        """Stop serve_forever() (call from another thread)."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _close(self) -> None:
+        """Close the server socket and remove the socket file."""
+        self._server.server_close()
+        self._server = None
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def _is_listening(socket_path: str) -> bool:
+    """Check whether a process accepts connections on a socket path."""
+    import socket
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def main(argv=None) -> int:
+    """
+    Daemon entry point.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        int: Exit code (argparse exits with 2 on a wrong command line)
+    """
+    import argparse  # Only the command line needs it
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.calculator.service.daemon",
+        description="Serve warm calculator engines over a Unix socket."
+    )
+    parser.add_argument("--socket", metavar="PATH", help="socket path (default: per user)")
+    arguments = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    daemon = CalculatorDaemon(arguments.socket)
+    try:
+        daemon.start()
+    except OSError as error:
+        sys.stderr.write(f"{error}\n")
+        return 1
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Wire protocol shared by the calculation services.
+Messages are newline-delimited JSON objects (one request or response per line).
+
+Request:  {"expression": "2+2", "angle_mode": "degrees"}   (angle_mode optional)
+Response: {"success": true, "result": "4", "error": null}   (CalculatorEngine format)
+"""
+
+import json
+import os
+from src.calculator.config.constants import (
+    DEFAULT_ANGLE_MODE,
+    ANGLE_MODE_DEGREES,
+    ANGLE_MODE_RADIANS,
+    ANGLE_MODE_GRADIANS,
+    DAEMON_SOCKET_ENV,
+    DAEMON_SOCKET_NAME
+)
+from src.calculator.config.locale import ERROR_INVALID_EXPRESSION, ERROR_INVALID_ANGLE_MODE
+
+VALID_ANGLE_MODES = (ANGLE_MODE_DEGREES, ANGLE_MODE_RADIANS, ANGLE_MODE_GRADIANS)
+
+
+def default_socket_path() -> str:
+    """
+    Socket path shared by the daemon and the client.
+
+    Uses $SCICALC_SOCKET if set, otherwise scicalc.sock in $XDG_RUNTIME_DIR
+    (per-user, private) or the temporary directory.
+
+    Returns:
+        str: Filesystem path of the Unix socket
+    """
+    path = os.environ.get(DAEMON_SOCKET_ENV)
+    if path:
+        return path
+    directory = os.environ.get("XDG_RUNTIME_DIR")
+    if not directory:
+        import tempfile  # Deferred: costs more than the rest of the client
+        directory = tempfile.gettempdir()
+    return os.path.join(directory, DAEMON_SOCKET_NAME)
+
+
+def encode_message(message: dict) -> bytes:
+    """
+    Encode a message as one JSON line.
+
+    Args:
+        message: Request or response dict
+
+    Returns:
+        bytes: UTF-8 JSON followed by a newline
+    """
+    return json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def decode_message(line: bytes) -> dict:
+    """
+    Decode one JSON line.
+
+    Args:
+        line: Raw line (with or without trailing newline)
+
+    Returns:
+        dict: Decoded message
+
+    Raises:
+        ValueError: If the line is not a JSON object
+    """
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("message must be a JSON object")
+    return message
+
+
+def error_response(error: str) -> dict:
+    """Build a failed response in CalculatorEngine format."""
+    return {
+        "success": False,
+        "result": None,
+        "error": error
+    }
+
+
+class ModeEngines:
+    """
+    One warm CalculatorEngine per angle mode.
+
+    Switching the angle mode of a single engine clears its compile cache,
+    so clients alternating between modes would keep it cold. Keeping an
+    engine per mode preserves every cache. Not thread-safe; callers
+    serialize access.
+    """
+
+    def __init__(self, engine_factory=None):
+        """
+        Initialize with no engines (created on first use per mode).
+
+        Args:
+            engine_factory: Callable returning a new CalculatorEngine
+        """
+        if engine_factory is None:
+            from src.calculator.logic.calculator import CalculatorEngine
+            engine_factory = CalculatorEngine
+        self._engine_factory = engine_factory
+        self._engines = {}
+
+    def get(self, angle_mode: str):
+        """Return the engine for an angle mode, creating it on first use."""
+        engine = self._engines.get(angle_mode)
+        if engine is None:
+            engine = self._engine_factory()
+            engine.set_angle_mode(angle_mode)
+            self._engines[angle_mode] = engine
+        return engine
+
+    def handle(self, request: dict, default_mode: str = DEFAULT_ANGLE_MODE) -> dict:
+        """
+        Evaluate one request.
+
+        Args:
+            request: Decoded request message
+            default_mode: Angle mode used when the request has none
+
+        Returns:
+            dict: Response in CalculatorEngine format
+        """
+        expression = request.get("expression")
+        if not isinstance(expression, str):
+            return error_response(ERROR_INVALID_EXPRESSION)
+
+        angle_mode = request.get("angle_mode") or default_mode
+        if angle_mode not in VALID_ANGLE_MODES:
+            return error_response(ERROR_INVALID_ANGLE_MODE)
+
+        return self.get(angle_mode).calculate(expression)
@@ -0,0 +1,311 @@
+"""
+SciCalc - Network calculation service
+asyncio TCP server speaking the JSON-lines protocol (see protocol.py).
+
+- Pipelining: a client may send many requests without waiting; responses
+  come back in request order, each echoing the request's optional "id".
+- Per-connection angle mode: {"command": "angle_mode", "angle_mode": "radians"}
+  sets the default for later requests on the same connection.
+- Backpressure: at most SERVER_PIPELINE_DEPTH requests are in flight per
+  connection; reading pauses until responses are written and drained.
+- Offloading: expressions that may be slow (powers, factorials, special
+  forms such as sum/integrate/solve, matrices, very long input) run in a
+  process pool so the event loop stays responsive.
+
+Usage:
+    python -m src.calculator.service.server [--host HOST] [--port PORT] [--workers N]
+"""
+
+import ast
+import asyncio
+import re
+import sys
+from src.calculator.config.constants import (
+    DEFAULT_ANGLE_MODE,
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_PIPELINE_DEPTH,
+    SERVER_MAX_LINE_BYTES,
+    SERVER_INLINE_MAX_LENGTH
+)
+from src.calculator.config.locale import ERROR_INVALID_EXPRESSION, ERROR_INVALID_ANGLE_MODE
+from src.calculator.logic import linalg
+from src.calculator.logic.optimizer import BINDING_FORMS
+from src.calculator.service.protocol import (
+    ModeEngines,
+    VALID_ANGLE_MODES,
+    encode_message,
+    decode_message,
+    error_response
+)
+
+
+# Calls whose cost is not bounded by the expression length: special forms
+# (sum(sin(k), k, 1, 10^8) runs 10^8 terms), factorial and matrix functions
+HEAVY_CALLS = frozenset(BINDING_FORMS) | {"factorial"} | frozenset(linalg.functions())
+
+# Operators likewise (2^999999 takes over a second to format; @ multiplies matrices)
+HEAVY_OPERATORS = (ast.Pow, ast.MatMult)
+
+# if( call, rewritten as the evaluator does before parsing (if is a keyword)
+_IF_CALL = re.compile(r'\bif\s*\(')
+
+ANGLE_MODE_COMMAND = "angle_mode"
+
+# Engines of a process pool worker (created by _init_worker)
+_worker_engines = None
+
+
+def is_heavy(expression: str) -> bool:
+    """
+    Decide whether an expression should leave the event loop.
+
+    The parsed tree is inspected: powers, @, matrix literals, factorial,
+    special forms and matrix functions are heavy. Input that does not
+    parse is cheap (the evaluator rejects it at once).
+
+    Args:
+        expression: Expression string
+
+    Returns:
+        bool: True if evaluation may take noticeably long
+    """
+    if len(expression) > SERVER_INLINE_MAX_LENGTH:
+        return True
+    try:
+        tree = ast.parse(_IF_CALL.sub("piecewise(", expression.replace("^", "**")),
+                         mode="eval")
+    except (SyntaxError, ValueError):
+        return False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.BinOp) and isinstance(node.op, HEAVY_OPERATORS):
+            return True
+        if isinstance(node, ast.List):
+            return True
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                and node.func.id in HEAVY_CALLS):
+            return True
+    return False
+
+
+def _init_worker() -> None:
+    """Create the warm engines of a pool worker process."""
+    global _worker_engines
+    _worker_engines = ModeEngines()
+
+
+def _evaluate_in_worker(request: dict, angle_mode: str) -> dict:
+    """Evaluate one request inside a pool worker."""
+    return _worker_engines.handle(request, angle_mode)
+
+
+class CalculationServer:
+    """
+    asyncio JSON-lines server around shared calculator engines.
+
+    Cheap requests are evaluated directly on the event loop with engines
+    shared by all connections (no locking needed, the loop is single
+    threaded). Heavy requests go to a lazily created process pool.
+    """
+
+    def __init__(self, host: str = SERVER_HOST, port: int = SERVER_PORT,
+                 workers: int = None, engines: ModeEngines = None):
+        """
+        Initialize the server (sockets are bound by start()).
+
+        Args:
+            host: Interface to listen on
+            port: TCP port (0 picks a free port)
+            workers: Process pool size (None = CPU count, 0 = no pool)
+            engines: ModeEngines for inline evaluation (or mock for testing)
+        """
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.engines = engines or ModeEngines()
+        self._server = None
+        self._pool = None
+
+    async def start(self) -> None:
+        """Bind the listening socket; self.port is updated to the bound port."""
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=SERVER_MAX_LINE_BYTES
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening and shut down the process pool."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _handle_connection(self, reader, writer) -> None:
+        """
+        Serve one connection.
+
+        The reader loop submits requests and queues their futures in order;
+        the writer task resolves them one by one, so slow requests never
+        reorder responses and fast ones still overlap with reading.
+        """
+        pending = asyncio.Queue(maxsize=SERVER_PIPELINE_DEPTH)
+        writer_task = asyncio.create_task(self._write_responses(pending, writer))
+        angle_mode = DEFAULT_ANGLE_MODE
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # Line longer than SERVER_MAX_LINE_BYTES
+                    await pending.put((None, _resolved(error_response(ERROR_INVALID_EXPRESSION))))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = decode_message(line)
+                except ValueError:
+                    await pending.put((None, _resolved(error_response(ERROR_INVALID_EXPRESSION))))
+                    continue
+
+                if request.get("command") == ANGLE_MODE_COMMAND:
+                    response, angle_mode = _set_angle_mode(request, angle_mode)
+                    future = _resolved(response)
+                else:
+                    future = self._submit(request, angle_mode)
+                # Blocks while SERVER_PIPELINE_DEPTH responses are unwritten
+                await pending.put((request.get("id"), future))
+        except ConnectionError:
+            pass
+        finally:
+            await pending.put(None)
+            await writer_task
+
+    async def _write_responses(self, pending: asyncio.Queue, writer) -> None:
+        """Write responses in request order until the end marker."""
+        try:
+            while True:
+                item = await pending.get()
+                if item is None:
+                    break
+                request_id, future = item
+                try:
+                    response = await future
+                except Exception:  # e.g. a pool worker died
+                    response = error_response(ERROR_INVALID_EXPRESSION)
+                if request_id is not None:
+                    response = dict(response, id=request_id)
+                writer.write(encode_message(response))
+                await writer.drain()  # Backpressure from a slow client
+        except ConnectionError:
+            # Client went away: drain the queue so the reader is not blocked
+            while True:
+                item = await pending.get()
+                if item is None:
+                    break
+                item[1].cancel()
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def _submit(self, request: dict, angle_mode: str) -> asyncio.Future:
+        """Start evaluating a request; returns a future of its response."""
+        expression = request.get("expression")
+        if isinstance(expression, str) and self._pool_size() and is_heavy(expression):
+            future = asyncio.get_running_loop().run_in_executor(
+                self._get_pool(), _evaluate_in_worker, request, angle_mode
+            )
+        else:
+            future = _resolved(self.engines.handle(request, angle_mode))
+        return future
+
+    def _pool_size(self) -> int:
+        """Configured pool size (None means one worker per CPU)."""
+        if self.workers is None:
+            import os
+            return os.cpu_count() or 1
+        return self.workers
+
+    def _get_pool(self):
+        """Create the process pool on first heavy request."""
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._pool_size(), initializer=_init_worker
+            )
+        return self._pool
+
+
+def _resolved(response: dict) -> asyncio.Future:
+    """Wrap an immediate response in a completed future."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(response)
+    return future
+
+
+def _set_angle_mode(request: dict, current: str) -> tuple:
+    """
+    Handle an angle mode command.
+
+    Returns:
+        tuple: (response, new connection angle mode)
+    """
+    mode = request.get("angle_mode")
+    if mode not in VALID_ANGLE_MODES:
+        return error_response(ERROR_INVALID_ANGLE_MODE), current
+    return {"success": True, "result": mode, "error": None}, mode
+
+
+def main(argv=None) -> int:
+    """
+    Server entry point; prints the bound address once listening.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        int: Exit code (argparse exits with 2 on a wrong command line)
+    """
+    import argparse  # Only the command line needs it
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.calculator.service.server",
+        description="Serve the JSON-lines calculation protocol over TCP."
+    )
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--workers", type=int, help="processes for slow expressions")
+    arguments = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    server = CalculationServer(arguments.host, arguments.port, arguments.workers)
+
+    async def run():
+        await server.start()
+        print(f"{server.host}:{server.port}", flush=True)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
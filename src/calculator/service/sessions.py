@@ -0,0 +1,252 @@
+"""
+Headless calculator sessions.
+Compact per-user state with the button semantics of CalculatorController,
+for serving many users from one process without a Tk view per user.
+"""
+
+import time
+from collections import OrderedDict
+from src.calculator.config.constants import (
+    DEFAULT_ANGLE_MODE,
+    MAX_HISTORY_ENTRIES,
+    CURSOR_MARKER,
+    SESSION_IDLE_TIMEOUT
+)
+from src.calculator.config.locale import (
+    BTN_BACKSPACE,
+    BTN_DELETE,
+    BTN_CURSOR_LEFT,
+    BTN_CURSOR_RIGHT,
+    BTN_CURSOR_HOME,
+    BTN_CURSOR_END
+)
+from src.calculator.controller.calculator_controller import LABEL_TO_TOKEN
+from src.calculator.controller.expression_buffer import TOKEN_PATTERN
+from src.calculator.service.protocol import ModeEngines
+
+
+class HeadlessSession:
+    """
+    State of one calculator session, without a view.
+
+    The expression is a tuple of tokens split exactly like ExpressionBuffer
+    splits them, so backspace/delete remove the same tokens as in the GUI.
+    Tokens are mostly shared strings (single characters and the
+    LABEL_TO_TOKEN values), the initial values are shared constants and the
+    history list is only created on the first result, so an idle session
+    costs little more than its slots. Behaviour lives in methods; the engine
+    is passed in by the caller and never stored.
+    """
+
+    __slots__ = (
+        "tokens", "cursor", "last_result", "result_text",
+        "error_state", "history", "angle_mode", "last_active"
+    )
+
+    def __init__(self, now: float = 0.0):
+        """
+        Initialize an empty session.
+
+        Args:
+            now: Creation time (SessionStore clock)
+        """
+        self.tokens = ()  # Expression tokens
+        self.cursor = 0  # Cursor position as a token index
+        self.last_result = "0"
+        self.result_text = "0"  # Result display: last result or error message
+        self.error_state = False
+        self.history = None  # List of (expression, result), created on first result
+        self.angle_mode = DEFAULT_ANGLE_MODE
+        self.last_active = now
+
+    @property
+    def expression(self) -> str:
+        """Current expression text."""
+        return "".join(self.tokens)
+
+    @property
+    def display_expression(self) -> str:
+        """Expression display text, with a cursor marker unless at the end."""
+        if self.cursor == len(self.tokens):
+            return self.expression
+        return (
+            "".join(self.tokens[:self.cursor]) + CURSOR_MARKER
+            + "".join(self.tokens[self.cursor:])
+        )
+
+    def on_button_click(self, label: str, engine) -> None:
+        """
+        Apply a button press (same semantics as CalculatorController).
+
+        Args:
+            label: Button label
+            engine: CalculatorEngine for the session's angle mode
+        """
+        if label == "=":
+            self._calculate(engine)
+        elif label == "C":
+            self.clear()
+        elif label == BTN_BACKSPACE:
+            if self.cursor:
+                self.tokens = self.tokens[:self.cursor - 1] + self.tokens[self.cursor:]
+                self.cursor -= 1
+        elif label == BTN_DELETE:
+            if self.cursor < len(self.tokens):
+                self.tokens = self.tokens[:self.cursor] + self.tokens[self.cursor + 1:]
+        elif label == BTN_CURSOR_LEFT:
+            self.cursor = max(self.cursor - 1, 0)
+        elif label == BTN_CURSOR_RIGHT:
+            self.cursor = min(self.cursor + 1, len(self.tokens))
+        elif label == BTN_CURSOR_HOME:
+            self.cursor = 0
+        elif label == BTN_CURSOR_END:
+            self.cursor = len(self.tokens)
+        else:
+            self.insert(LABEL_TO_TOKEN.get(label, label))
+
+    def insert(self, text: str) -> None:
+        """
+        Insert text at the cursor, leaving an error state first.
+
+        Args:
+            text: Token, pasted text or recalled history result
+        """
+        if self.error_state:
+            self.clear()
+        new_tokens = tuple(TOKEN_PATTERN.findall(text))
+        self.tokens = self.tokens[:self.cursor] + new_tokens + self.tokens[self.cursor:]
+        self.cursor += len(new_tokens)
+
+    def clear(self) -> None:
+        """Clear expression and result (the C button)."""
+        self.tokens = ()
+        self.cursor = 0
+        self.last_result = "0"
+        self.result_text = "0"
+        self.error_state = False
+
+    def _calculate(self, engine) -> None:
+        """Evaluate the expression and record a successful result."""
+        expression = self.expression
+        if not expression:
+            return
+
+        result = engine.calculate(expression)
+        if result["success"]:
+            self.last_result = self.result_text = result["result"]
+            self.error_state = False
+            if self.history is None:
+                self.history = []
+            self.history.append((expression, self.last_result))
+            if len(self.history) > MAX_HISTORY_ENTRIES:
+                self.history.pop(0)  # Remove oldest entry
+        else:
+            self.result_text = result["error"]
+            self.error_state = True
+
+
+class SessionStore:
+    """
+    Sessions by id, sharing one warm engine per angle mode.
+
+    Sessions are kept in least-recently-used order, so evicting idle ones
+    only looks at the front of the store. Eviction runs on every access;
+    call evict_idle() periodically if the store may sit unused. Not
+    thread-safe: drive it from one thread (e.g. an asyncio loop).
+    """
+
+    def __init__(self, engines: ModeEngines = None, idle_timeout: float = SESSION_IDLE_TIMEOUT,
+                 clock=time.monotonic):
+        """
+        Initialize an empty store.
+
+        Args:
+            engines: Shared ModeEngines (or mock for testing)
+            idle_timeout: Seconds of inactivity before a session is evicted
+            clock: Function returning the current time in seconds
+        """
+        self.engines = engines or ModeEngines()
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._sessions = OrderedDict()  # session id -> HeadlessSession (LRU first)
+
+    def __len__(self) -> int:
+        """Number of live sessions."""
+        return len(self._sessions)
+
+    def __contains__(self, session_id) -> bool:
+        """Check whether a session is live."""
+        return session_id in self._sessions
+
+    def get(self, session_id) -> HeadlessSession:
+        """
+        Return a session, creating it on first use, and mark it active.
+
+        Args:
+            session_id: Hashable session key
+
+        Returns:
+            HeadlessSession: The session state
+        """
+        now = self._clock()
+        self.evict_idle(now)
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._sessions[session_id] = HeadlessSession(now)
+        else:
+            session.last_active = now
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def on_button_click(self, session_id, label: str) -> HeadlessSession:
+        """
+        Apply a button press to a session.
+
+        Args:
+            session_id: Session key
+            label: Button label
+
+        Returns:
+            HeadlessSession: The updated session
+        """
+        session = self.get(session_id)
+        session.on_button_click(label, self.engines.get(session.angle_mode))
+        return session
+
+    def on_angle_mode_change(self, session_id, mode: str) -> None:
+        """Set the angle mode used by a session's calculations."""
+        self.get(session_id).angle_mode = mode
+
+    def on_history_recall(self, session_id, result: str) -> None:
+        """Insert a history result at a session's cursor."""
+        self.get(session_id).insert(result)
+
+    def clear_history(self, session_id) -> None:
+        """Forget a session's history."""
+        self.get(session_id).history = None
+
+    def remove(self, session_id) -> None:
+        """End a session."""
+        self._sessions.pop(session_id, None)
+
+    def evict_idle(self, now: float = None) -> int:
+        """
+        Remove sessions idle for longer than idle_timeout.
+
+        Args:
+            now: Current time (defaults to the store clock)
+
+        Returns:
+            int: Number of evicted sessions
+        """
+        if now is None:
+            now = self._clock()
+        deadline = now - self.idle_timeout
+        evicted = 0
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_active > deadline:
+                break
+            del self._sessions[session_id]
+            evicted += 1
+        return evicted
@@ -19,27 +19,37 @@ class ButtonPanel(ctk.CTkFrame):
     """
     Grid of calculator buttons with basic and scientific layouts.
     Supports mode switching and responsive resizing.
+
+    Scientific buttons are created the first time scientific mode is shown
+    (unless lazy=False), which keeps them out of the startup path.
     """
 
-    def __init__(self, master):
+    def __init__(self, master, lazy=True):
         super().__init__(master)
 
         self.callback = None
         self.mode = "basic"
         self.buttons = {}
+        self._scientific_created = False
 
         self._create_buttons()
+        if not lazy:
+            self._create_scientific_buttons()
         self._configure_grid()
 
     def _create_buttons(self):
-        """Create all buttons for basic and scientific modes."""
-        # Basic layout (always visible)
+        """Create buttons for the basic layout (always visible)."""
         for row_idx, row in enumerate(BASIC_LAYOUT):
             for col_idx, label in enumerate(row):
                 btn = self._create_button(label, row_idx, col_idx)
                 self.buttons[f"basic_{row_idx}_{col_idx}"] = btn
 
-        # Scientific rows (hidden initially)
+    def _create_scientific_buttons(self):
+        """Create the scientific rows (hidden until scientific mode is shown)."""
+        if self._scientific_created:
+            return
+        self._scientific_created = True
+
         for row_idx, label in enumerate(SCIENTIFIC_ROW_1):
             btn = self._create_button(label, row_idx, row_idx)
             btn.grid_remove()  # Hide initially
@@ -118,6 +128,8 @@ class ButtonPanel(ctk.CTkFrame):
         self.mode = mode
 
         if mode == "scientific":
+            self._create_scientific_buttons()
+
             # Show scientific rows above basic layout
             # Shift basic layout down by 3 rows
             for row_idx, row in enumerate(BASIC_LAYOUT):
@@ -6,7 +6,16 @@ import customtkinter as ctk
 from src.calculator.ui.display import DisplayPanel
 from src.calculator.ui.button_panel import ButtonPanel
 from src.calculator.ui.history_panel import HistoryPanel
-from src.calculator.config.locale import WINDOW_TITLE, BTN_MODE_BASIC, BTN_MODE_SCIENTIFIC
+from src.calculator.config.locale import (
+    WINDOW_TITLE,
+    BTN_MODE_BASIC,
+    BTN_MODE_SCIENTIFIC,
+    BTN_DELETE,
+    BTN_CURSOR_LEFT,
+    BTN_CURSOR_RIGHT,
+    BTN_CURSOR_HOME,
+    BTN_CURSOR_END
+)
 from src.calculator.config.constants import (
     WINDOW_MIN_WIDTH,
     WINDOW_MIN_HEIGHT,
@@ -20,9 +29,13 @@ from src.calculator.config.constants import (
 class CalculatorWindow(ctk.CTk):
     """
     Main calculator window with dark theme and responsive grid layout.
+
+    With lazy=True (default) the scientific buttons are built on first use
+    and the history panel right after the first frame is drawn (or earlier,
+    on first use), so the calculator appears sooner.
     """
 
-    def __init__(self):
+    def __init__(self, lazy=True):
         super().__init__()
 
         # Window configuration
@@ -48,7 +61,7 @@ class CalculatorWindow(ctk.CTk):
         self.display.grid(row=1, column=0, padx=0, pady=(0, 10), sticky="ew")
 
         # Button panel
-        self.button_panel = ButtonPanel(self.calc_frame)
+        self.button_panel = ButtonPanel(self.calc_frame, lazy=lazy)
         self.button_panel.grid(row=2, column=0, padx=0, pady=0, sticky="nsew")
 
         # Configure calc_frame grid weights
@@ -57,14 +70,23 @@ class CalculatorWindow(ctk.CTk):
         self.calc_frame.grid_rowconfigure(2, weight=1)  # Buttons expand
         self.calc_frame.grid_columnconfigure(0, weight=1)
 
-        # History panel (right column)
-        self.history_panel = HistoryPanel(self)
-        self.history_panel.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="nsew")
+        # History panel (right column), built lazily
+        self.history_panel = None
+        self._history_recall_callback = None
+        self._history_clear_callback = None
 
         # Configure main window grid weights (2-column layout)
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)  # Calculator column expands
-        self.grid_columnconfigure(1, weight=0)  # History column fixed width
+        # History column fixed width, reserved so the layout does not shift
+        self.grid_columnconfigure(1, weight=0, minsize=HISTORY_PANEL_WIDTH)
+
+        if lazy:
+            # after_idle fires once the first redraw is queued; the nested
+            # after(0) lets that frame paint before the panel is built
+            self.after_idle(lambda: self.after(0, self._ensure_history_panel))
+        else:
+            self._ensure_history_panel()
 
         # Callbacks (set by controller)
         self.button_callback = None
@@ -108,6 +130,14 @@ class CalculatorWindow(ctk.CTk):
         """Update result display."""
         self.display.update_result(text)
 
+    def update_preview(self, text):
+        """Show a tentative result while typing."""
+        self.display.update_preview(text)
+
+    def update_validity(self, valid):
+        """Update the live expression validity indicator."""
+        self.display.update_validity(valid)
+
     def set_keyboard_callback(self, callback):
         """Set callback for keyboard events."""
         self.keyboard_callback = callback
@@ -120,9 +150,18 @@ class CalculatorWindow(ctk.CTk):
         # Escape = clear (same as C)
         self.bind("<Escape>", lambda e: self._on_key("C"))
 
-        # Backspace = delete last char
+        # Backspace = delete token before cursor
         self.bind("<BackSpace>", lambda e: self._on_key("\u232b"))
 
+        # Delete = delete token after cursor
+        self.bind("<Delete>", lambda e: self._on_key(BTN_DELETE))
+
+        # Cursor movement within the expression
+        self.bind("<Left>", lambda e: self._on_key(BTN_CURSOR_LEFT))
+        self.bind("<Right>", lambda e: self._on_key(BTN_CURSOR_RIGHT))
+        self.bind("<Home>", lambda e: self._on_key(BTN_CURSOR_HOME))
+        self.bind("<End>", lambda e: self._on_key(BTN_CURSOR_END))
+
         # Ctrl+C = copy result to clipboard
         self.bind("<Control-c>", lambda e: self._handle_copy())
 
@@ -164,18 +203,35 @@ class CalculatorWindow(ctk.CTk):
 
     # History panel convenience methods
 
+    def _ensure_history_panel(self):
+        """Create the history panel on first use and wire stored callbacks."""
+        if self.history_panel is not None:
+            return self.history_panel
+
+        self.history_panel = HistoryPanel(self)
+        self.history_panel.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="nsew")
+        if self._history_recall_callback:
+            self.history_panel.set_recall_callback(self._history_recall_callback)
+        if self._history_clear_callback:
+            self.history_panel.set_clear_callback(self._history_clear_callback)
+        return self.history_panel
+
     def add_history_entry(self, expression, result):
         """Add entry to history panel."""
-        self.history_panel.add_entry(expression, result)
+        self._ensure_history_panel().add_entry(expression, result)
 
     def set_history_recall_callback(self, callback):
         """Set callback for history entry clicks."""
-        self.history_panel.set_recall_callback(callback)
+        self._history_recall_callback = callback
+        if self.history_panel is not None:
+            self.history_panel.set_recall_callback(callback)
 
     def set_history_clear_callback(self, callback):
         """Set callback for history clear button."""
-        self.history_panel.set_clear_callback(callback)
+        self._history_clear_callback = callback
+        if self.history_panel is not None:
+            self.history_panel.set_clear_callback(callback)
 
     def clear_history(self):
         """Clear all history entries."""
-        self.history_panel.clear_history()
+        self._ensure_history_panel().clear_history()
@@ -3,9 +3,12 @@ Display panel for calculator showing expression and result.
 """
 
 import customtkinter as ctk
+from src.calculator.ui.update_scheduler import UpdateScheduler
 from src.calculator.config.constants import (
     FONT_EXPRESSION,
     FONT_RESULT,
+    PREVIEW_TEXT_COLOR,
+    INVALID_EXPRESSION_COLOR,
     ANGLE_MODE_DEGREES,
     ANGLE_MODE_RADIANS
 )
@@ -16,6 +19,9 @@ class DisplayPanel(ctk.CTkFrame):
     """
     Display panel with expression label (top) and result label (bottom).
     Uses StringVar for dynamic updates from controller.
+
+    Updates are coalesced by an UpdateScheduler and applied once per idle
+    cycle; update_scheduler.applied_count counts the Tk updates performed.
     """
 
     def __init__(self, master):
@@ -37,6 +43,7 @@ class DisplayPanel(ctk.CTkFrame):
             justify="right"
         )
         self.expression_label.pack(fill="x", padx=10, pady=(10, 0))
+        self._expression_text_color = self.expression_label.cget("text_color")
 
         # Result label (larger, bottom)
         self.result_label = ctk.CTkLabel(
@@ -48,6 +55,20 @@ class DisplayPanel(ctk.CTkFrame):
         )
         self.result_label.pack(fill="x", padx=10, pady=(0, 10))
 
+        # Tentative (preview) results are dimmed until = is pressed
+        self._result_text_color = self.result_label.cget("text_color")
+
+        # Coalesce updates: at most one Tk update per property per frame
+        self.update_scheduler = UpdateScheduler(
+            self.after_idle,
+            initial={
+                "expression": "",
+                "result": "0",
+                "expression_color": self._expression_text_color,
+                "result_color": self._result_text_color,
+            }
+        )
+
         # Angle mode selector (DEG/RAD toggle)
         self.angle_mode_selector = ctk.CTkSegmentedButton(
             self,
@@ -61,11 +82,30 @@ class DisplayPanel(ctk.CTkFrame):
 
     def update_expression(self, text):
         """Update expression display."""
-        self.expression_var.set(text)
+        self.update_scheduler.set("expression", text, self.expression_var.set)
 
     def update_result(self, text):
         """Update result display."""
-        self.result_var.set(text)
+        self.update_scheduler.set("result_color", self._result_text_color, self._set_result_color)
+        self.update_scheduler.set("result", text, self.result_var.set)
+
+    def update_preview(self, text):
+        """Show a tentative result in dimmed color."""
+        self.update_scheduler.set("result_color", PREVIEW_TEXT_COLOR, self._set_result_color)
+        self.update_scheduler.set("result", text, self.result_var.set)
+
+    def update_validity(self, valid):
+        """Color the expression label by validity."""
+        color = self._expression_text_color if valid else INVALID_EXPRESSION_COLOR
+        self.update_scheduler.set("expression_color", color, self._set_expression_color)
+
+    def _set_result_color(self, color):
+        """Apply result label text color."""
+        self.result_label.configure(text_color=color)
+
+    def _set_expression_color(self, color):
+        """Apply expression label text color."""
+        self.expression_label.configure(text_color=color)
 
     def set_angle_mode_callback(self, callback):
         """Set callback for angle mode changes."""
@@ -80,4 +120,4 @@ class DisplayPanel(ctk.CTkFrame):
 
     def get_result(self):
         """Get current result text for clipboard operations."""
-        return self.result_var.get()
+        return self.update_scheduler.get("result", self.result_var.get())
@@ -0,0 +1,84 @@
+"""
+Coalescing scheduler for display widget updates.
+"""
+
+from typing import Any, Callable, Dict, Tuple
+
+
+class UpdateScheduler:
+    """
+    Collects widget updates and applies them once per Tk idle cycle.
+
+    Every update is stored under a key (e.g. "result"); only the latest
+    value per key is kept until the scheduled flush runs. Values equal to
+    what is already shown are skipped, so rapid keystrokes or a paste cause
+    at most one Tk update per key per frame.
+
+    Attributes:
+        requested_count: Number of updates requested by callers
+        applied_count: Number of updates actually applied to Tk
+    """
+
+    def __init__(self, schedule_idle: Callable[[Callable[[], None]], Any],
+                 initial: Dict[str, Any] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            schedule_idle: Function scheduling a callback for the next idle
+                cycle (e.g. widget.after_idle)
+            initial: Values already shown, by key
+        """
+        self._schedule_idle = schedule_idle
+        self._pending: Dict[str, Tuple[Any, Callable[[Any], None]]] = {}
+        self._applied: Dict[str, Any] = dict(initial or {})
+        self._scheduled = False
+
+        self.requested_count = 0
+        self.applied_count = 0
+
+    def set(self, key: str, value: Any, apply: Callable[[Any], None]) -> None:
+        """
+        Request an update; it is applied on the next flush.
+
+        Args:
+            key: Identifies the widget property being updated
+            value: New value
+            apply: Function that writes the value to Tk
+        """
+        self.requested_count += 1
+        self._pending[key] = (value, apply)
+        if not self._scheduled:
+            self._scheduled = True
+            self._schedule_idle(self.flush)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Latest value for a key, including updates not yet flushed.
+
+        Args:
+            key: Widget property key
+            default: Returned if the key was never set
+
+        Returns:
+            The pending value if any, otherwise the applied value
+        """
+        if key in self._pending:
+            return self._pending[key][0]
+        return self._applied.get(key, default)
+
+    def flush(self) -> None:
+        """Apply all pending updates whose value differs from the shown one."""
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        for key, (value, apply) in pending.items():
+            if key in self._applied and self._applied[key] == value:
+                continue
+            apply(value)
+            self._applied[key] = value
+            self.applied_count += 1
+
+    def reset_counters(self) -> None:
+        """Reset the requested/applied counters (e.g. before measuring a keystroke)."""
+        self.requested_count = 0
+        self.applied_count = 0
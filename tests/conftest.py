@@ -0,0 +1,22 @@
+"""
+Shared fixtures for the test suite.
+"""
+import pytest
+from src.calculator.logic import kernel
+from src.calculator.logic.evaluator import SafeEvaluator
+
+
+@pytest.fixture(params=["numpy", "scalar"])
+def backend(request, monkeypatch):
+    """Run with NumPy kernels, or with NumPy unavailable."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(kernel, "_numpy_module", False)
+    return request.param
+
+
+@pytest.fixture
+def evaluator(backend):
+    """Evaluator on the selected backend."""
+    return SafeEvaluator()
@@ -0,0 +1,109 @@
+"""
+Tests for forward-mode automatic differentiation.
+Tests diff(), gradient() and gradient kernels, angle-mode chain factors
+and error mapping, with NumPy kernels and with the scalar fallback.
+"""
+import math
+import pytest
+from decimal import Decimal
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.config.constants import ANGLE_MODE_RADIANS, ANGLE_MODE_GRADIANS
+from src.calculator.config.locale import (
+    ERROR_INVALID_EXPRESSION,
+    ERROR_MATH_DOMAIN,
+    ERROR_OVERFLOW
+)
+
+
+class TestDiff:
+    """Test suite for the diff(expr, var, x0) form."""
+
+    def test_polynomial(self, evaluator):
+        """Test exact derivatives of polynomials."""
+        assert evaluator.evaluate("diff(x^3, x, 2)")["result"] == Decimal("12")
+        assert evaluator.evaluate("diff(3*x^2-5*x+1, x, -1)")["result"] == Decimal("-11")
+
+    def test_degrees_chain_factor(self, evaluator):
+        """Test that trig derivatives include the angle-mode factor."""
+        result = evaluator.evaluate("diff(sin(x), x, 60)")["result"]
+        assert float(result) == pytest.approx(math.pi / 180 * 0.5, abs=1e-10)
+
+    def test_gradians_and_radians(self, evaluator):
+        """Test the chain factor in the other angle modes."""
+        evaluator.set_angle_mode(ANGLE_MODE_GRADIANS)
+        result = evaluator.evaluate("diff(cos(x), x, 50)")["result"]
+        assert float(result) == pytest.approx(-math.pi / 200 * math.sqrt(0.5), abs=1e-10)
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        assert evaluator.evaluate("diff(tan(x), x, 0)")["result"] == Decimal("1")
+
+    def test_variable_exponent(self, evaluator):
+        """Test d/dx 2^x = 2^x*ln(2) and x^x."""
+        result = evaluator.evaluate("diff(2^x, x, 3)")["result"]
+        assert float(result) == pytest.approx(8 * math.log(2), abs=1e-9)
+        result = evaluator.evaluate("diff(x^x, x, 2)")["result"]
+        assert float(result) == pytest.approx(4 * (math.log(2) + 1), abs=1e-9)
+
+    def test_undefined_derivative(self, evaluator):
+        """Test domain errors of the value and of the derivative."""
+        assert evaluator.evaluate("diff(ln(x), x, -1)")["error"] == ERROR_MATH_DOMAIN
+        assert evaluator.evaluate("diff(sqrt(x), x, 0)")["error"] == ERROR_MATH_DOMAIN
+        assert evaluator.evaluate("diff(factorial(x), x, 3)")["error"] == ERROR_MATH_DOMAIN
+
+    def test_in_expression(self, evaluator):
+        """Test diff() inside a larger expression and with an expression point."""
+        assert evaluator.evaluate("1+diff(x^2, x, 2*3)")["result"] == Decimal("13")
+
+    def test_invalid_forms(self, evaluator):
+        """Test wrong arity and a constant as the variable."""
+        assert evaluator.evaluate("diff(x^2, x)")["error"] == ERROR_INVALID_EXPRESSION
+        assert evaluator.evaluate("diff(x^2, pi, 1)")["error"] == ERROR_INVALID_EXPRESSION
+
+
+class TestGradient:
+    """Test suite for gradient() and gradient kernels."""
+
+    def test_partial_derivatives(self, evaluator):
+        """Test value and gradient of a two-variable expression."""
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        result = evaluator.gradient("x^2*y+sin(x*y)", {"x": 1, "y": 2})
+        assert result["success"]
+        assert float(result["result"]) == pytest.approx(2 + math.sin(2), abs=1e-9)
+        assert float(result["gradient"]["x"]) == pytest.approx(4 + 2 * math.cos(2), abs=1e-9)
+        assert float(result["gradient"]["y"]) == pytest.approx(1 + math.cos(2), abs=1e-9)
+
+    def test_constant_factorial_argument(self, evaluator):
+        """Test that non-differentiable functions of constants are allowed."""
+        result = evaluator.gradient("factorial(3)*x", {"x": 2})
+        assert result["result"] == Decimal("12")
+        assert result["gradient"] == {"x": Decimal("6")}
+
+    def test_errors(self, evaluator):
+        """Test division by zero and unknown names."""
+        assert evaluator.gradient("x/y", {"x": 1, "y": 0})["error"] == ERROR_OVERFLOW
+        result = evaluator.gradient("x+z", {"x": 1})
+        assert not result["success"]
+        assert result["gradient"] is None
+
+    def test_kernel_matches_analytic(self, evaluator):
+        """Test the gradient kernel on many points against analytic values."""
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        gradient_kernel = evaluator.compile_gradient("e^(x/2)*cos(y)+abs(x)", ("x", "y"))
+        xs = [-2.0, -0.5, 0.5, 1.0, 3.0]
+        ys = [0.0, 1.0, 2.0, -1.0, 0.25]
+        values, (dx, dy) = gradient_kernel(xs, ys)
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            assert values[i] == pytest.approx(math.exp(x / 2) * math.cos(y) + abs(x))
+            assert dx[i] == pytest.approx(math.exp(x / 2) / 2 * math.cos(y) + math.copysign(1, x))
+            assert dy[i] == pytest.approx(-math.exp(x / 2) * math.sin(y))
+
+    def test_kernel_is_cached(self, evaluator):
+        """Test that gradient kernels are cached apart from value kernels."""
+        first = evaluator.compile_gradient("x^2", ("x",))
+        assert evaluator.compile_gradient("x^2", ("x",)) is first
+        assert evaluator.compile_kernel("x^2", ("x",)) is not first
+
+
+def test_calculator_accepts_diff():
+    """Test diff() through validation and formatting."""
+    result = CalculatorEngine().calculate("diff(x^2, x, 3)")
+    assert result == {"success": True, "result": "6", "error": None}
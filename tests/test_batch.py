@@ -0,0 +1,201 @@
+"""
+Tests for memory-mapped batch evaluation.
+Tests chunk alignment, line iteration, ordered merging, file evaluation
+and computed CSV columns.
+"""
+import io
+import pytest
+from src.calculator.batch.reader import MappedFile, find_chunks, iter_lines
+from src.calculator.batch.runner import OrderedMerger, evaluate_file, compute_file, main
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.config.constants import ANGLE_MODE_RADIANS
+from src.calculator.config.locale import (
+    ERROR_DIVISION_BY_ZERO,
+    ERROR_MATH_DOMAIN,
+    ERROR_STATS_INVALID_VALUE,
+    ERROR_UNDEFINED_VARIABLE,
+    ERROR_DATA_RESERVED_COLUMN
+)
+
+
+EXPRESSIONS = ["2+2", "sqrt(16)", "1/0", "sin(30)*2", "", "factorial(5)", "10/4"]
+
+
+@pytest.fixture
+def expression_file(tmp_path):
+    """File with many lines, including an empty one and no final newline."""
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join(EXPRESSIONS * 30))
+    return str(path)
+
+
+def expected_output(expressions):
+    """Pipe-mode output computed line by line."""
+    engine = CalculatorEngine()
+    lines = []
+    for expression in expressions:
+        if expression:
+            result = engine.calculate(expression)
+            lines.append(result["result"] if result["success"] else result["error"])
+    return "".join(line + "\n" for line in lines)
+
+
+class TestReader:
+    """Test suite for chunking and line iteration."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 16, 1000])
+    def test_chunks_are_line_aligned_and_complete(self, chunk_size):
+        """Test that chunks cover the buffer and end at line ends."""
+        data = b"1+1\n22*3\n\n4\n555"
+        chunks = find_chunks(data, chunk_size)
+        assert b"".join(data[start:end] for start, end in chunks) == data
+        for _, end in chunks[:-1]:
+            assert data[end - 1:end] == b"\n"
+
+    def test_iter_lines_offsets(self):
+        """Test line offsets, stripping and skipped empty lines."""
+        data = b"1+1\r\n\n  2 \n3"
+        assert list(iter_lines(data, 0, len(data))) == [(0, "1+1"), (6, "2"), (11, "3")]
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file maps to an empty buffer."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        with MappedFile(str(path)) as mapped:
+            assert len(mapped) == 0
+            assert find_chunks(mapped.buffer, 10) == []
+
+
+def test_merger_restores_order():
+    """Test that out-of-order chunks are written in index order."""
+    written = []
+    merger = OrderedMerger(written.append)
+    merger.add(2, "c")
+    merger.add(1, "b")
+    assert written == []
+    assert merger.pending_count == 2
+    merger.add(0, "a")
+    assert written == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_evaluate_file_matches_pipe_output(expression_file, workers):
+    """Test that parallel output equals line-by-line evaluation, in order."""
+    output = io.BytesIO()
+    stats = evaluate_file(expression_file, output, workers=workers, chunk_size=64)
+    assert output.getvalue().decode("utf-8") == expected_output(EXPRESSIONS * 30)
+    assert stats["lines"] == 6 * 30
+    assert stats["errors"] == 30
+    assert stats["lines_per_second"] > 0
+
+
+def test_evaluate_file_reports_errors(tmp_path):
+    """Test that errors are written as Polish messages."""
+    path = tmp_path / "errors.txt"
+    path.write_text("1/0\n")
+    output = io.BytesIO()
+    evaluate_file(str(path), output, workers=0)
+    assert output.getvalue().decode("utf-8") == ERROR_DIVISION_BY_ZERO + "\n"
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """CSV file with a text column, a missing field and failing rows."""
+    path = tmp_path / "data.csv"
+    rows = ["3,4,x", "5,12,y", "1,,z", "0,0,w", "-1,2,v"] * 20
+    path.write_text("a,b,label\n" + "\n".join(rows) + "\n")
+    return str(path)
+
+
+class TestComputedColumn:
+    """Test suite for compute_file (formula applied to every CSV row)."""
+
+    def compute(self, path, expression, **options):
+        """Computed column lines and run statistics."""
+        output = io.BytesIO()
+        stats = compute_file(path, expression, output, **options)
+        return output.getvalue().decode("utf-8").splitlines(), stats
+
+    def test_values_and_row_errors(self, csv_file, backend):
+        """Test values, bad fields and failing rows, in input order."""
+        lines, stats = self.compute(csv_file, "a/b", workers=0, chunk_size=32)
+        assert lines[:6] == ["result", "0.75", "0.4166666667", ERROR_STATS_INVALID_VALUE,
+                             ERROR_DIVISION_BY_ZERO, "-0.5"]
+        assert len(lines) == 101
+        assert stats["lines"] == 100
+        assert stats["errors"] == 40
+
+    def test_matches_calculate(self, csv_file, backend):
+        """Test that rows equal calculate() with the row values substituted."""
+        engine = CalculatorEngine()
+        lines, _ = self.compute(csv_file, "sqrt(a^2+b^2)+ln(a)", workers=0, name="c")
+        assert lines[0] == "c"
+        for line, (a, b) in zip(lines[1:6], [(3, 4), (5, 12), (1, None), (0, 0), (-1, 2)]):
+            if b is None:
+                assert line == ERROR_STATS_INVALID_VALUE
+            else:
+                result = engine.calculate(f"sqrt(({a})^2+({b})^2)+ln({a})")
+                assert line == (result["result"] if result["success"] else ERROR_MATH_DOMAIN)
+
+    def test_angle_mode_and_forms(self, csv_file, backend):
+        """Test the angle mode and formulas evaluated row by row."""
+        lines, _ = self.compute(csv_file, "sin(a*pi/6)", workers=0, angle_mode=ANGLE_MODE_RADIANS)
+        assert lines[1:3] == ["1", "0.5"]
+        lines, _ = self.compute(csv_file, "integrate(t*a, t, 0, b)", workers=0)
+        assert lines[1:3] == ["24", "360"]
+
+    def test_parallel_matches_in_process(self, csv_file):
+        """Test that worker processes produce the same column in order."""
+        serial, _ = self.compute(csv_file, "a*b+1", workers=0, chunk_size=40)
+        parallel, _ = self.compute(csv_file, "a*b+1", workers=2, chunk_size=40)
+        assert parallel == serial
+
+    def test_invalid_formula(self, csv_file):
+        """Test that unknown names and syntax errors stop before any row."""
+        with pytest.raises(ValueError, match=ERROR_UNDEFINED_VARIABLE):
+            self.compute(csv_file, "a+c", workers=0)
+        with pytest.raises(ValueError):
+            self.compute(csv_file, "sqrt((a)", workers=0)
+
+    def test_exact_int_rows(self, tmp_path, backend):
+        """Test that whole results beyond float precision match calculate()."""
+        path = tmp_path / "ints.csv"
+        path.write_text("a,b\n3,40\n25,2\n2.5,3\n10,400\n")
+        engine = CalculatorEngine()
+        lines, _ = self.compute(str(path), "a^b", workers=0)
+        assert lines[1:] == [engine.calculate(expression)["result"]
+                             for expression in ("3^40", "25^2", "2.5^3", "10^400")]
+        assert lines[1] == "12157665459056928801"
+        lines, _ = self.compute(str(path), "factorial(a)", workers=0)
+        assert lines[2] == engine.calculate("factorial(25)")["result"]
+
+    def test_reserved_column_names(self, tmp_path):
+        """Test that columns named like constants or functions are rejected."""
+        path = tmp_path / "reserved.csv"
+        path.write_text("e,pi,x\n1,2,3\n")
+        with pytest.raises(ValueError, match=ERROR_DATA_RESERVED_COLUMN.format("e")):
+            self.compute(str(path), "e*x", workers=0)
+        with pytest.raises(ValueError, match=ERROR_DATA_RESERVED_COLUMN.format("pi")):
+            self.compute(str(path), "x+pi", workers=0)
+        lines, _ = self.compute(str(path), "x*2", workers=0)  # Unused columns are fine
+        assert lines[1:] == ["6"]
+
+    def test_command_line(self, csv_file, tmp_path):
+        """Test the --compute option of the runner."""
+        output = tmp_path / "column.txt"
+        code = main([csv_file, "--compute", "a+b", "--name", "s", "-o", str(output),
+                     "--workers", "0"])
+        assert code == 1  # Some rows failed
+        assert output.read_text().splitlines()[:3] == ["s", "7", "17"]
+        assert main([csv_file, "--compute", "a+c", "--workers", "0"]) == 2
+
+    @pytest.mark.parametrize("argv", [
+        [], ["input.txt", "--workers"], ["input.txt", "--workers", "two"],
+        ["input.txt", "-o"], ["input.txt", "--format", "csv"],
+    ])
+    def test_command_line_errors(self, argv, capsys):
+        """Test that a wrong command line prints the usage and exits with 2."""
+        with pytest.raises(SystemExit) as exit_info:
+            main(argv)
+        assert exit_info.value.code == 2
+        assert "usage:" in capsys.readouterr().err
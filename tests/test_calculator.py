@@ -4,7 +4,9 @@ Tests integration of validator + evaluator with Decimal precision and formatting
 """
 import pytest
 from decimal import Decimal
+from src.calculator.logic import optimizer
 from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.config.locale import ERROR_DIVISION_BY_ZERO
 
 
 class TestCalculatorEngine:
@@ -284,3 +286,52 @@ class TestScientificCalculator:
         assert result["success"] is True
         # factorial(4) = 24, sqrt(24) ≈ 4.898
         assert abs(Decimal(result["result"]) - Decimal("4.898")) < Decimal("0.01")
+
+
+class TestBatchCalculation:
+    """Test suite for CalculatorEngine.calculate_batch with subexpression reuse."""
+
+    def setup_method(self):
+        """Initialize calculator before each test."""
+        self.calc = CalculatorEngine()
+
+    def test_batch_matches_single_results(self):
+        """Test that batch results equal per-expression results."""
+        expressions = ["sqrt(3^2+4^2)+1", "sqrt(3^2+4^2)*2", "1/0", "", "factorial(5)"]
+        batch = self.calc.calculate_batch(expressions)
+        single = [CalculatorEngine().calculate(e) for e in expressions]
+        assert batch["results"] == single
+
+    def test_batch_reports_hit_rate(self):
+        """Test that repeated subexpressions are reused and reported."""
+        batch = self.calc.calculate_batch(
+            ["factorial(50)+1", "factorial(50)+2", "factorial(50)*factorial(50)"]
+        )
+        stats = batch["stats"]
+        assert stats["hits"] == 3
+        assert stats["lookups"] > stats["hits"]
+        assert stats["hit_rate"] == stats["hits"] / stats["lookups"]
+
+    def test_batch_errors_not_shared(self):
+        """Test that a failing subexpression errors in every expression."""
+        batch = self.calc.calculate_batch(["1/0+1", "1/0+2"])
+        assert [r["error"] for r in batch["results"]] == [ERROR_DIVISION_BY_ZERO] * 2
+
+    def test_batch_matches_structure(self):
+        """Test that spacing does not matter and number types do."""
+        batch = self.calc.calculate_batch(["sqrt(3^2+4^2)", "sqrt(3^2 + 4^2)", "2+3", "2.5 + 3"])
+        assert [r["result"] for r in batch["results"]] == ["5", "5", "5", "5.5"]
+        assert batch["stats"]["hits"] == 1
+
+    def test_batch_memo_bounded(self, monkeypatch):
+        """Test that the memo restarts after MAX_MEMO_SUBTREES subtrees."""
+        monkeypatch.setattr(optimizer, "MAX_MEMO_SUBTREES", 50)
+        evaluator, reference = self.calc.evaluator, CalculatorEngine().evaluator
+        evaluator.start_batch()
+        sizes = []
+        for n in range(200):
+            expression = f"sqrt({n})+{n}*2"
+            assert evaluator.evaluate(expression) == reference.evaluate(expression)
+            sizes.append(len(evaluator._optimizer._subtrees))
+        evaluator.end_batch()
+        assert max(sizes) <= 60  # The limit plus one expression's subtrees
@@ -0,0 +1,116 @@
+"""
+Tests for the columnar batch result file.
+Tests writing from result blocks, zero-copy reading and the NumPy layout.
+"""
+import os
+import pytest
+from src.calculator.batch import columnar
+from src.calculator.batch.columnar import ColumnarWriter, ColumnarFile, load_numpy, read_header
+from src.calculator.batch.runner import evaluate_file_blocks, main
+from src.calculator.batch.transport import RESULT_NUMBER
+from src.calculator.logic.calculator import CalculatorEngine
+
+
+EXPRESSIONS = ["2+2", "1/0", "2^100", "(1+2", "1+2)", "sqrt(2)", "0.1+0.2"]
+
+
+@pytest.fixture
+def columnar_file(tmp_path):
+    """Columnar file from several result blocks (small chunks)."""
+    source = tmp_path / "input.txt"
+    source.write_text("\n".join(EXPRESSIONS * 10) + "\n")
+    path = str(tmp_path / "results.scol")
+    with ColumnarWriter(path) as writer:
+        evaluate_file_blocks(str(source), writer.append_block, workers=0, chunk_size=40)
+    return path
+
+
+def expected_results():
+    """Line-by-line results of the test input."""
+    engine = CalculatorEngine()
+    return [engine.calculate(expression) for expression in EXPRESSIONS * 10]
+
+
+def test_round_trip(columnar_file):
+    """Test that every row reads back as the original result."""
+    with ColumnarFile(columnar_file) as columns:
+        assert len(columns) == len(EXPRESSIONS) * 10
+        assert [columns.result(row) for row in range(len(columns))] == expected_results()
+
+
+def test_offsets_and_timings(columnar_file):
+    """Test input offsets across blocks and recorded timings."""
+    line_length = [len(expression) + 1 for expression in EXPRESSIONS * 10]
+    expected = [sum(line_length[:row]) for row in range(len(line_length))]
+    with ColumnarFile(columnar_file) as columns:
+        assert list(columns.input_offset) == expected
+        assert all(timing > 0 for timing in columns.timing)
+
+
+def test_columns_are_aligned(columnar_file):
+    """Test that every column starts on an 8-byte boundary."""
+    with open(columnar_file, "rb") as file:
+        header = read_header(file.read(128))
+    assert all(header[name] % 8 == 0 for name in ("input_offset", "value", "timing", "text_offset", "code", "arena"))
+
+
+def test_rejects_other_files(tmp_path):
+    """Test the magic number check."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\0" * 200)
+    with pytest.raises(ValueError):
+        ColumnarFile(str(path))
+
+
+def test_failed_run_writes_nothing(tmp_path):
+    """Test that an exception discards the spills and writes no output."""
+    source = tmp_path / "input.txt"
+    source.write_text("\n".join(EXPRESSIONS) + "\n")
+    with pytest.raises(RuntimeError):
+        with ColumnarWriter(str(tmp_path / "results.scol")) as writer:
+            evaluate_file_blocks(str(source), writer.append_block, workers=0)
+            raise RuntimeError("run failed")
+    assert sorted(os.listdir(tmp_path)) == ["input.txt"]
+
+
+def test_big_endian_host(tmp_path, monkeypatch):
+    """Test byte-swapped writing and reading (as on a big-endian host)."""
+    monkeypatch.setattr(columnar, "_LITTLE_ENDIAN", False)
+    source = tmp_path / "input.txt"
+    source.write_text("\n".join(EXPRESSIONS * 10) + "\n")
+    path = str(tmp_path / "results.scol")
+    with ColumnarWriter(path) as writer:
+        evaluate_file_blocks(str(source), writer.append_block, workers=0, chunk_size=40)
+    with ColumnarFile(path) as columns:
+        assert [columns.result(row) for row in range(len(columns))] == expected_results()
+
+
+def test_empty_input(tmp_path):
+    """Test a file without rows."""
+    source = tmp_path / "empty.txt"
+    source.write_text("")
+    path = str(tmp_path / "empty.scol")
+    with ColumnarWriter(path) as writer:
+        evaluate_file_blocks(str(source), writer.append_block, workers=0)
+    with ColumnarFile(path) as columns:
+        assert len(columns) == 0
+
+
+def test_cli_columnar(tmp_path):
+    """Test the --format columnar option."""
+    source = tmp_path / "input.txt"
+    source.write_text("1+1\n2*3\n")
+    path = str(tmp_path / "out.scol")
+    assert main([str(source), "-o", path, "--format", "columnar", "--workers", "0"]) == 0
+    with ColumnarFile(path) as columns:
+        assert list(columns.value) == [2.0, 6.0]
+
+
+def test_numpy_view(columnar_file):
+    """Test that NumPy maps the columns without parsing."""
+    np = pytest.importorskip("numpy")
+    columns = load_numpy(columnar_file)
+    numeric = columns["code"] == RESULT_NUMBER
+    assert columns["value"][numeric][0] == 4.0
+    assert columns["text_offset"][-1] == len(columns["arena"])
+    assert columns["input_offset"].dtype == np.dtype("<i8")
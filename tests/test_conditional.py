@@ -0,0 +1,110 @@
+"""
+Tests for comparisons and lazy conditionals.
+Tests if() / piecewise() branch selection, short-circuiting of untaken
+branches and masked kernel evaluation, with NumPy kernels and with the
+scalar fallback.
+"""
+import pytest
+from decimal import Decimal
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.config.locale import ERROR_INVALID_EXPRESSION, ERROR_MATH_DOMAIN
+
+
+class TestComparisons:
+    """Test suite for comparison operators."""
+
+    @pytest.mark.parametrize("expression,expected", [
+        ("2<3", Decimal("1")),
+        ("2>=3", Decimal("0")),
+        ("2*2==4", Decimal("1")),
+        ("pi!=3", Decimal("1")),
+        ("1<2<3", Decimal("1")),
+        ("3<2<4", Decimal("0")),
+        ("(1<2)+(2<3)", Decimal("2")),
+    ])
+    def test_values(self, evaluator, expression, expected):
+        """Test that comparisons evaluate to 1 or 0."""
+        assert evaluator.evaluate(expression)["result"] == expected
+
+    def test_kernel(self, evaluator):
+        """Test comparisons in kernels, including chains."""
+        compiled = evaluator.compile_kernel("(0<x<=2)+(x==3)", ("x",))
+        assert list(compiled([-1, 0.5, 2, 3])) == [0, 1, 1, 1]
+
+
+class TestConditionals:
+    """Test suite for if() and piecewise()."""
+
+    def test_if(self, evaluator):
+        """Test branch selection."""
+        assert evaluator.evaluate("if(2>1, 5, 7)")["result"] == Decimal("5")
+        assert evaluator.evaluate("if(2<1, 5, 7)")["result"] == Decimal("7")
+        assert evaluator.evaluate("if (0, 5, 7)")["result"] == Decimal("7")
+
+    def test_untaken_branch_not_evaluated(self, evaluator):
+        """Test that domain errors in the untaken branch are not raised."""
+        assert evaluator.evaluate("if(2>1, 5, sqrt(-1))")["result"] == Decimal("5")
+        assert evaluator.evaluate("if(2<1, 1/0, 7)")["result"] == Decimal("7")
+        assert evaluator.evaluate("if(2<1, 1/0, sqrt(-1))")["error"] == ERROR_MATH_DOMAIN
+
+    def test_piecewise(self, evaluator):
+        """Test the first true condition wins, and the default."""
+        source = "piecewise(x<0, -1, x<10, 1, 100)"
+        for x, expected in ((-5, "-1"), (5, "1"), (50, "100")):
+            result = evaluator.evaluate(source.replace("x", str(x)))
+            assert result["result"] == Decimal(expected)
+
+    def test_piecewise_without_default(self, evaluator):
+        """Test that no true condition without a default is undefined."""
+        assert evaluator.evaluate("piecewise(1>2, 1, 2>3, 2)")["error"] == ERROR_MATH_DOMAIN
+
+    def test_invalid_forms(self, evaluator):
+        """Test wrong arity."""
+        assert evaluator.evaluate("if(1)")["error"] == ERROR_INVALID_EXPRESSION
+        assert evaluator.evaluate("piecewise(1)")["error"] == ERROR_INVALID_EXPRESSION
+
+
+class TestMaskedKernels:
+    """Test suite for conditionals evaluated over arrays."""
+
+    def test_each_point_takes_its_branch(self, evaluator):
+        """Test that undefined branches only affect points that take them."""
+        compiled = evaluator.compile_kernel("if(x>0, sqrt(x), ln(-x))", ("x",))
+        values = list(compiled([-1, 4, 9]))
+        assert values == [0, 2, 3]
+
+    def test_two_variables(self, evaluator):
+        """Test piecewise over broadcast columns."""
+        compiled = evaluator.compile_kernel("piecewise(x<0, 0, x<y, x, y)", ("x", "y"))
+        assert list(compiled([-1, 1, 3], [2, 2, 2])) == [0, 1, 2]
+
+    def test_undefined_condition(self, evaluator):
+        """Test that an undefined condition makes the point undefined."""
+        compiled = evaluator.compile_kernel("if(sqrt(x)>1, 1, 0)", ("x",))
+        values = list(compiled([-1, 0, 4]))
+        assert values[0] != values[0]  # NaN
+        assert values[1:] == [0, 1]
+
+    def test_with_numerical_forms(self, evaluator):
+        """Test conditionals inside integrate, solve, sum and diff."""
+        assert evaluator.evaluate("integrate(if(x<0, -x, x), x, -1, 1)")["result"] == Decimal("1")
+        assert evaluator.evaluate("solve(if(x<0, x+1, x-1), x, -5, 5)")["result"] == Decimal("-1")
+        assert evaluator.evaluate("sum(if(k<=5, k, 0), k, 1, 100)")["result"] == Decimal("15")
+        assert evaluator.evaluate("diff(if(x>0, x^2, -x), x, 3)")["result"] == Decimal("6")
+        assert evaluator.evaluate("diff(if(x>0, x^2, -x), x, -3)")["result"] == Decimal("-1")
+
+    def test_gradient_kernel(self, evaluator):
+        """Test values and derivatives of each selected branch."""
+        gradient = evaluator.compile_gradient("piecewise(x<y, x*y, y)", ("x", "y"))
+        values, (dx, dy) = gradient([1, 3], [2, 2])
+        assert list(values) == [2, 2]
+        assert list(dx) == [2, 0]
+        assert list(dy) == [1, 1]
+
+
+def test_calculator_accepts_conditionals():
+    """Test comparisons and if() through validation and formatting."""
+    engine = CalculatorEngine()
+    assert engine.calculate("if(2>=1, 10, 20)") == {"success": True, "result": "10", "error": None}
+    assert engine.calculate("3!=3")["result"] == "0"
+    assert not engine.calculate("x=3")["success"]
@@ -2,10 +2,13 @@
 Unit tests for CalculatorController with mocked view.
 """
 
+import threading
+import time
 import pytest
 from unittest.mock import Mock
 from src.calculator.controller.calculator_controller import CalculatorController
 from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.config.constants import ANGLE_MODE_RADIANS
 
 
 @pytest.fixture
@@ -362,3 +365,169 @@ def test_history_cleared_by_controller(controller, mock_view):
     # Simulate clear button callback
     controller._on_history_cleared()
     assert len(controller.history) == 0
+
+
+# --- Live preview tests ---
+
+class FakeScheduler:
+    """Collects view.after callbacks so tests can run them explicitly."""
+
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, delay, callback):
+        self.next_id += 1
+        self.pending[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run_pending(self):
+        """Run callbacks until the preview settles."""
+        while self.pending:
+            after_id = min(self.pending)
+            self.pending.pop(after_id)()
+
+
+@pytest.fixture
+def scheduler(mock_view):
+    """Route the mock view's after/after_cancel through a FakeScheduler."""
+    fake = FakeScheduler()
+    mock_view.after = Mock(side_effect=fake.after)
+    mock_view.after_cancel = Mock(side_effect=fake.after_cancel)
+    return fake
+
+
+def test_preview_shown_after_idle(controller, mock_view, scheduler):
+    """Idle debounce computes and shows a tentative result."""
+    for key in "2+3":
+        controller.on_button_click(key)
+    assert len(scheduler.pending) == 1  # Only the latest debounce is pending
+    scheduler.run_pending()
+    mock_view.update_preview.assert_called_once_with("5")
+
+
+def test_preview_skipped_for_incomplete_expression(controller, mock_view, scheduler):
+    """No preview for unbalanced parentheses or trailing operator."""
+    for key in "(2+3":
+        controller.on_button_click(key)
+    scheduler.run_pending()
+    controller.on_button_click(")")
+    controller.on_button_click("*")
+    scheduler.run_pending()
+    mock_view.update_preview.assert_not_called()
+
+
+def test_equals_reuses_preview(controller, mock_view, scheduler):
+    """Pressing = returns the preview result without recalculating."""
+    for key in "6*7":
+        controller.on_button_click(key)
+    scheduler.run_pending()
+    controller.engine = Mock()  # Any new calculation would fail the test
+    controller.on_button_click("=")
+    mock_view.update_result.assert_called_with("42")
+    controller.engine.calculate.assert_not_called()
+
+
+def test_new_input_drops_stale_preview(controller, mock_view, scheduler):
+    """A preview for an older expression is not reused by =."""
+    for key in "6*7":
+        controller.on_button_click(key)
+    scheduler.run_pending()
+    controller.on_button_click("1")
+    controller.on_button_click("=")
+    mock_view.update_result.assert_called_with("426")
+
+
+def test_backspace_drops_shown_preview(controller, mock_view, scheduler):
+    """An edit replaces the shown preview with the last result at once."""
+    for key in "6*7":
+        controller.on_button_click(key)
+    scheduler.run_pending()
+    mock_view.update_result.reset_mock()
+    controller.on_button_click("\u232b")  # backspace -> "6*" does not validate
+    mock_view.update_result.assert_called_once_with("0")
+    scheduler.run_pending()
+    mock_view.update_preview.assert_called_once_with("42")  # No new preview
+
+
+def test_equals_does_not_wait_for_stale_preview(controller, mock_view, scheduler):
+    """= evaluates at once while a superseded preview is still running."""
+    release = threading.Event()
+    started = threading.Event()
+
+    class SlowEngine(CalculatorEngine):
+        def calculate(self, expression, point=None):
+            started.set()
+            release.wait(5)
+            return super().calculate(expression, point)
+
+    controller._preview_engine = SlowEngine()
+    for key in "1+1":
+        controller.on_button_click(key)
+    scheduler.pending.pop(min(scheduler.pending))()  # Debounce: start the preview
+    assert started.wait(5)
+    controller.on_button_click("+")
+    controller.on_button_click("1")
+    begin = time.perf_counter()
+    controller.on_button_click("=")
+    elapsed = time.perf_counter() - begin
+    release.set()
+    mock_view.update_result.assert_called_with("3")
+    assert elapsed < 1
+
+
+def test_preview_follows_angle_mode(controller, mock_view, scheduler):
+    """The preview engine uses the angle mode set on the controller."""
+    controller.on_angle_mode_change(ANGLE_MODE_RADIANS)
+    for label in ("cos", "\u03c0", ")"):
+        controller.on_button_click(label)
+    scheduler.run_pending()
+    mock_view.update_preview.assert_called_once_with("-1")
+
+
+# --- Validity indicator tests ---
+
+def test_validity_indicator_updates_on_change(controller, mock_view):
+    """Indicator is only updated when validity flips."""
+    controller.on_button_click("2")
+    controller.on_button_click("+")
+    controller.on_button_click("3")
+    controller.on_button_click("\u232b")  # backspace -> "2+" invalid again
+    calls = [c.args[0] for c in mock_view.update_validity.call_args_list]
+    assert calls == [False, True, False]
+
+
+def test_validity_reset_on_clear(controller, mock_view):
+    """Clearing an invalid expression resets the indicator."""
+    controller.on_button_click("(")
+    controller.on_button_click("C")
+    mock_view.update_validity.assert_called_with(True)
+
+
+# --- Cursor editing tests ---
+
+def test_backspace_removes_function_token(controller, mock_view):
+    """Backspace removes a whole function token."""
+    controller.on_button_click("2")
+    controller.on_button_click("+")
+    controller.on_button_click("sin")
+    controller.on_button_click("\u232b")
+    assert controller.expression == "2+"
+
+
+def test_insert_at_cursor(controller, mock_view):
+    """Digits typed after moving the cursor are inserted in place."""
+    from src.calculator.config.locale import BTN_CURSOR_LEFT
+    from src.calculator.config.constants import CURSOR_MARKER
+
+    for key in "2+3":
+        controller.on_button_click(key)
+    controller.on_button_click(BTN_CURSOR_LEFT)
+    mock_view.update_expression.assert_called_with("2+" + CURSOR_MARKER + "3")
+    controller.on_button_click("1")
+    assert controller.expression == "2+13"
+    controller.on_button_click("=")
+    mock_view.update_result.assert_called_with("15")
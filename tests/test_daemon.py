@@ -0,0 +1,121 @@
+"""
+Tests for the warm calculation daemon and its client.
+Tests the JSON-lines protocol, per-mode engines and in-process fallback.
+"""
+import io
+import os
+import shutil
+import tempfile
+import threading
+import pytest
+from src.calculator.config.constants import ANGLE_MODE_RADIANS
+from src.calculator.config.locale import ERROR_DIVISION_BY_ZERO, ERROR_INVALID_ANGLE_MODE
+from src.calculator.service.protocol import ModeEngines, decode_message, encode_message
+from src.calculator.service import daemon as daemon_module
+from src.calculator.service.daemon import CalculatorDaemon
+from src.calculator.service.client import DaemonClient, main
+
+
+@pytest.fixture
+def socket_path():
+    """Short temporary socket path (AF_UNIX paths are length-limited)."""
+    directory = tempfile.mkdtemp(prefix="sc")
+    yield os.path.join(directory, "d.sock")
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path):
+    """Daemon serving in a background thread."""
+    daemon = CalculatorDaemon(socket_path)
+    daemon.start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon
+    daemon.shutdown()
+    thread.join(timeout=5)
+
+
+def test_protocol_round_trip():
+    """Test that messages survive encoding."""
+    message = {"expression": "2+2", "angle_mode": None}
+    assert decode_message(encode_message(message)) == message
+
+
+def test_protocol_rejects_non_object():
+    """Test that a JSON line must be an object."""
+    with pytest.raises(ValueError):
+        decode_message(b"[1, 2]")
+
+
+def test_mode_engines_keep_one_engine_per_mode():
+    """Test that angle modes do not share (and clear) one engine."""
+    engines = ModeEngines()
+    assert engines.handle({"expression": "sin(90)"})["result"] == "1"
+    assert engines.handle({"expression": "sin(90)", "angle_mode": ANGLE_MODE_RADIANS})["result"] != "1"
+    assert engines.get(ANGLE_MODE_RADIANS) is not engines.get("degrees")
+
+
+def test_mode_engines_invalid_angle_mode():
+    """Test the error for an unknown angle mode."""
+    result = ModeEngines().handle({"expression": "1", "angle_mode": "turns"})
+    assert result["error"] == ERROR_INVALID_ANGLE_MODE
+
+
+def test_client_uses_daemon(daemon):
+    """Test evaluation through the daemon."""
+    client = DaemonClient(daemon.socket_path)
+    assert client.calculate("2+3*4")["result"] == "14"
+    assert client.calculate("1/0")["error"] == ERROR_DIVISION_BY_ZERO
+    assert client.connected is True
+    assert client.fallback is False
+    client.close()
+
+
+def test_client_falls_back_without_daemon(socket_path):
+    """Test in-process evaluation when no daemon is listening."""
+    client = DaemonClient(socket_path)
+    assert client.calculate("2+2")["result"] == "4"
+    assert client.fallback is True
+
+
+def test_client_falls_back_when_daemon_stops(daemon):
+    """Test that a broken connection switches to in-process evaluation."""
+    client = DaemonClient(daemon.socket_path)
+    assert client.calculate("1+1")["result"] == "2"
+    daemon.shutdown()
+    client._socket.shutdown(2)  # Simulate the daemon dropping the connection
+    assert client.calculate("2+2")["result"] == "4"
+    assert client.fallback is True
+
+
+def test_daemon_replaces_stale_socket(socket_path):
+    """Test that a leftover socket file does not block startup."""
+    open(socket_path, "w").close()
+    daemon = CalculatorDaemon(socket_path)
+    daemon.start()
+    daemon._close()
+    assert not os.path.exists(socket_path)
+
+
+def test_second_daemon_refused(daemon):
+    """Test that a running daemon is not replaced."""
+    with pytest.raises(OSError):
+        CalculatorDaemon(daemon.socket_path).start()
+
+
+def test_client_main_pipe_output(daemon):
+    """Test CLI output and angle commands from input lines."""
+    output = io.StringIO()
+    exit_code = main(["--socket", daemon.socket_path], io.StringIO("2+2\nrad\ncos(0)\n1/0\n"), output)
+    assert output.getvalue().splitlines() == ["4", "1", ERROR_DIVISION_BY_ZERO]
+    assert exit_code == 1
+
+
+def test_command_line_errors(capsys):
+    """Test that an option without its value prints the usage and exits with 2."""
+    with pytest.raises(SystemExit) as exit_info:
+        daemon_module.main(["--socket"])
+    assert exit_info.value.code == 2
+    assert main(["--socket"], io.StringIO(""), io.StringIO()) == 2
+    assert capsys.readouterr().err.count("usage:") == 2
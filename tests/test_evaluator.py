@@ -347,3 +347,26 @@ class TestScientificFunctions:
         assert result["success"] is True
         # log(100) = 2, sqrt(2) ≈ 1.414
         assert abs(result["result"] - Decimal("1.414")) < Decimal("0.01")
+
+
+class TestBoundVariables:
+    """Test suite for evaluate() with variable values (point)."""
+
+    def setup_method(self):
+        """Initialize evaluator before each test."""
+        self.evaluator = SafeEvaluator()
+
+    def test_point_values(self):
+        """Test that variables take the given values."""
+        assert self.evaluator.evaluate("x*y+1", {"x": 2.0, "y": 3})["result"] == Decimal("7.0")
+
+    def test_bound_names_are_kept(self):
+        """Test that a form's own variable is not replaced."""
+        result = self.evaluator.evaluate("sum(k*x, k, 1, 3)", {"x": 2, "k": 100})
+        assert result["result"] == Decimal("12")
+
+    def test_cached_tree_stays_unbound(self):
+        """Test that values do not leak into later evaluations."""
+        self.evaluator.evaluate("x+1", {"x": 1})
+        assert self.evaluator.evaluate("x+1", {"x": 5})["result"] == Decimal("6")
+        assert self.evaluator.evaluate("x+1")["success"] is False
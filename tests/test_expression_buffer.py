@@ -0,0 +1,89 @@
+"""
+Tests for ExpressionBuffer.
+Tests token-aware editing, cursor movement and validity tracking.
+"""
+import pytest
+from src.calculator.controller.expression_buffer import ExpressionBuffer
+
+
+class TestExpressionBuffer:
+    """Test suite for the token gap buffer."""
+
+    def setup_method(self):
+        """Create an empty buffer before each test."""
+        self.buffer = ExpressionBuffer()
+
+    def test_insert_at_end(self):
+        """Test appending tokens."""
+        self.buffer.insert("sin(")
+        self.buffer.insert("9")
+        self.buffer.insert("0")
+        assert self.buffer.text == "sin(90"
+        assert self.buffer.cursor == 6
+        assert len(self.buffer) == 6
+
+    def test_backspace_removes_function_token(self):
+        """Test that backspace removes sin( as one unit."""
+        self.buffer.insert("2*sin(")
+        assert self.buffer.backspace() == "sin("
+        assert self.buffer.text == "2*"
+
+    def test_pasted_text_is_tokenized(self):
+        """Test that pasted formulas keep function tokens and digit tokens."""
+        self.buffer.insert("sqrt(2e5)+pi")
+        removed = [self.buffer.backspace() for _ in range(4)]
+        assert removed == ["pi", "+", ")", "5"]
+        assert self.buffer.text == "sqrt(2e"
+
+    def test_insert_in_middle(self):
+        """Test editing at the cursor position."""
+        self.buffer.insert("2+3")
+        self.buffer.move_left()
+        self.buffer.move_left()
+        self.buffer.insert("0")
+        assert self.buffer.text == "20+3"
+        assert self.buffer.cursor == 2
+
+    def test_delete_forward(self):
+        """Test removing the token after the cursor."""
+        self.buffer.insert("ln(5)")
+        self.buffer.move_home()
+        assert self.buffer.delete() == "ln("
+        assert self.buffer.text == "5)"
+        assert self.buffer.delete() == "5"
+
+    def test_cursor_bounds(self):
+        """Test that cursor movement stops at both ends."""
+        self.buffer.insert("12")
+        assert self.buffer.move_right() is False
+        self.buffer.move_home()
+        assert self.buffer.cursor == 0
+        assert self.buffer.move_left() is False
+        assert self.buffer.backspace() == ""
+
+    def test_display_text_marker(self):
+        """Test that the cursor marker is shown only mid-expression."""
+        self.buffer.insert("12")
+        assert self.buffer.display_text("|") == "12"
+        self.buffer.move_left()
+        assert self.buffer.display_text("|") == "1|2"
+
+    @pytest.mark.parametrize("moves", [0, 1, 3])
+    def test_validity_with_cursor(self, moves):
+        """Test that validity covers text on both sides of the cursor."""
+        self.buffer.insert("(2+3")
+        for _ in range(moves):
+            self.buffer.move_left()
+        assert self.buffer.valid is False
+        self.buffer.move_end()
+        self.buffer.insert(")")
+        assert self.buffer.valid is True
+
+    def test_set_text_and_clear(self):
+        """Test replacing and clearing the text."""
+        self.buffer.set_text("1+1")
+        assert self.buffer.text == "1+1"
+        assert self.buffer.valid
+        self.buffer.clear()
+        assert self.buffer.text == ""
+        assert self.buffer.status()["valid"] is False
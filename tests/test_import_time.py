@@ -0,0 +1,78 @@
+"""
+Import-time regression tests.
+Uses `python -X importtime` in a fresh interpreter to enforce cold-import
+budgets and to check that the engine never pulls in GUI or simpleeval.
+"""
+import os
+import subprocess
+import sys
+import pytest
+
+# Cold-import budgets in milliseconds (generous to tolerate slow CI machines)
+ENGINE_IMPORT_BUDGET_MS = 150
+GUI_ENTRY_IMPORT_BUDGET_MS = 200
+REPL_IMPORT_BUDGET_MS = 100
+GUI_WINDOW_IMPORT_BUDGET_MS = 800
+
+# Best of N runs, to ignore one-off scheduling noise
+IMPORT_RUNS = 3
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_profile(module):
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        dict: imported module name -> cumulative import time in ms
+    """
+    best = None
+    for _ in range(IMPORT_RUNS):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+        profile = {}
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            profile[name.strip()] = int(cumulative) / 1000
+        if best is None or profile[module] < best[module]:
+            best = profile
+    return best
+
+
+def test_engine_import_has_no_gui_or_simpleeval():
+    """The engine imports without Tk, customtkinter, simpleeval or NumPy."""
+    profile = import_profile("src.calculator.logic.calculator")
+    for heavy in ("tkinter", "customtkinter", "simpleeval", "numpy"):
+        assert heavy not in profile
+
+
+def test_engine_import_budget():
+    """The engine cold import stays within budget."""
+    profile = import_profile("src.calculator.logic.calculator")
+    assert profile["src.calculator.logic.calculator"] < ENGINE_IMPORT_BUDGET_MS
+
+
+def test_gui_entry_import_budget():
+    """Importing the entry point defers the GUI toolkit to main()."""
+    profile = import_profile("src.calculator.main")
+    assert "customtkinter" not in profile
+    assert profile["src.calculator.main"] < GUI_ENTRY_IMPORT_BUDGET_MS
+
+
+def test_repl_import_budget():
+    """The terminal REPL never imports Tk and stays within budget."""
+    profile = import_profile("src.calculator.repl")
+    assert "tkinter" not in profile
+    assert profile["src.calculator.repl"] < REPL_IMPORT_BUDGET_MS
+
+
+def test_gui_window_import_budget():
+    """The GUI window (with customtkinter) cold import stays within budget."""
+    pytest.importorskip("customtkinter")
+    profile = import_profile("src.calculator.ui.calculator_window")
+    assert profile["src.calculator.ui.calculator_window"] < GUI_WINDOW_IMPORT_BUDGET_MS
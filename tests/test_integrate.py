@@ -0,0 +1,123 @@
+"""
+Tests for expression kernels and numerical integration.
+Tests integrate() results, angle modes, error estimates and error mapping,
+with NumPy kernels and with the scalar fallback.
+"""
+import math
+import pytest
+from decimal import Decimal
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.config.constants import ANGLE_MODE_RADIANS, ANGLE_MODE_GRADIANS
+from src.calculator.config.locale import (
+    ERROR_INVALID_EXPRESSION,
+    ERROR_MATH_DOMAIN,
+    ERROR_INTEGRAL_NOT_CONVERGED
+)
+
+
+class TestIntegrate:
+    """Test suite for integrate(expr, var, a, b)."""
+
+    def test_polynomial(self, evaluator):
+        """Test an exact polynomial integral."""
+        result = evaluator.evaluate("integrate(x^2, x, 0, 3)")
+        assert result["success"]
+        assert result["result"] == Decimal("9")
+
+    def test_degrees_mode(self, evaluator):
+        """Test that trig integrands follow the angle mode (degrees)."""
+        result = evaluator.evaluate("integrate(sin(x), x, 0, 180)")
+        assert float(result["result"]) == pytest.approx(360 / math.pi, abs=1e-9)
+
+    def test_radians_and_gradians(self, evaluator):
+        """Test the radians and gradians angle modes."""
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        assert evaluator.evaluate("integrate(sin(x), x, 0, pi)")["result"] == Decimal("2")
+        evaluator.set_angle_mode(ANGLE_MODE_GRADIANS)
+        result = evaluator.evaluate("integrate(cos(x), x, 0, 100)")
+        assert float(result["result"]) == pytest.approx(200 / math.pi, abs=1e-9)
+
+    def test_oscillatory(self, evaluator):
+        """Test an oscillatory integrand over many periods."""
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        result = evaluator.evaluate("integrate(x*sin(50*x), x, 0, 10)")
+        expected = (math.sin(500) - 500 * math.cos(500)) / 2500
+        assert float(result["result"]) == pytest.approx(expected, abs=1e-9)
+
+    def test_endpoint_singularity(self, evaluator):
+        """Test an integrable singularity at a bound."""
+        assert evaluator.evaluate("integrate(1/sqrt(x), x, 0, 1)")["result"] == Decimal("2")
+
+    def test_reversed_and_expression_bounds(self, evaluator):
+        """Test reversed bounds and bounds given as expressions."""
+        result = evaluator.evaluate("integrate(2*x, x, sqrt(16), 2^0)")
+        assert result["result"] == Decimal("-15")
+
+    def test_nested_in_expression(self, evaluator):
+        """Test integrate() as part of a larger expression."""
+        assert evaluator.evaluate("1+2*integrate(e^x, x, 0, ln(3))")["result"] == Decimal("5")
+
+    def test_error_estimate(self, evaluator):
+        """Test the integrate() API reporting the error estimate."""
+        result = evaluator.integrate("e^(-x^2)", "x", -5, 5)
+        assert float(result["result"]) == pytest.approx(math.sqrt(math.pi), abs=1e-9)
+        assert 0 <= result["error_estimate"] < 1e-9
+        assert evaluator.last_integration["converged"]
+
+    def test_domain_error(self, evaluator):
+        """Test an integrand undefined on part of the interval."""
+        result = evaluator.evaluate("integrate(sqrt(x), x, -1, 1)")
+        assert result["error"] == ERROR_MATH_DOMAIN
+
+    def test_divergent(self, evaluator):
+        """Test that a divergent integral is reported, not approximated."""
+        result = evaluator.integrate("1/x", "x", 0, 1)
+        assert result["error"] == ERROR_INTEGRAL_NOT_CONVERGED
+        assert result["error_estimate"] is None
+
+    def test_undefined_name(self, evaluator):
+        """Test a free name other than the integration variable (as for y+1)."""
+        result = evaluator.evaluate("integrate(x*y, x, 0, 1)")
+        assert result["error"] == evaluator.evaluate("y+1")["error"]
+
+    @pytest.mark.parametrize("expression", [
+        "integrate(x, x, 1)",
+        "integrate(x, pi, 0, 1)",
+        "integrate(x, 2, 0, 1)",
+        "integrate(integrate(x, x, 0, 1), x, 0, 1)",
+    ])
+    def test_invalid_forms(self, evaluator, expression):
+        """Test wrong arity, bad variables and nested forms."""
+        assert evaluator.evaluate(expression)["error"] == ERROR_INVALID_EXPRESSION
+
+
+class TestKernel:
+    """Test suite for compiled expression kernels."""
+
+    def test_matches_evaluator(self, evaluator):
+        """Test kernel values against scalar evaluation."""
+        compiled = evaluator.compile_kernel("sin(x)^2+sqrt(x)/ln(x+2)-factorial(3)", ("x",))
+        points = [0.5, 1.0, 30.0, 100.0]
+        for point, value in zip(points, compiled(points)):
+            expected = evaluator.evaluate(f"sin({point})^2+sqrt({point})/ln({point}+2)-factorial(3)")
+            assert value == pytest.approx(float(expected["result"]), abs=1e-9)
+
+    def test_undefined_points(self, evaluator):
+        """Test NaN for domain errors and inf for division by zero."""
+        values = evaluator.compile_kernel("1/x+sqrt(x)", ("x",))([-1.0, 0.0, 4.0])
+        assert math.isnan(values[0])
+        assert math.isinf(values[1])
+        assert values[2] == 2.25
+
+    def test_kernel_cache(self, evaluator):
+        """Test that kernels are cached and reset by the angle mode."""
+        first = evaluator.compile_kernel("sin(x)", ("x",))
+        assert evaluator.compile_kernel("sin(x)", ("x",)) is first
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        assert evaluator.compile_kernel("sin(x)", ("x",))([math.pi / 2])[0] == pytest.approx(1.0)
+
+
+def test_calculator_accepts_integrate():
+    """Test integrate() through validation and formatting."""
+    result = CalculatorEngine().calculate("integrate(3*x^2, x, 0, 2)")
+    assert result == {"success": True, "result": "8", "error": None}
@@ -0,0 +1,158 @@
+"""
+Tests for matrix and vector values.
+Tests literals, elementwise operators and @, the linear algebra functions,
+the display summary of large results and the error messages (including
+NumPy being unavailable).
+"""
+import pytest
+from src.calculator.logic import kernel, linalg
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.batch import transport
+from src.calculator.config.locale import (
+    ERROR_DIVISION_BY_ZERO,
+    ERROR_MATH_DOMAIN,
+    ERROR_OVERFLOW,
+    ERROR_MATRIX_NUMPY,
+    ERROR_MATRIX_SHAPE,
+    ERROR_MATRIX_SINGULAR,
+    ERROR_MATRIX_TOO_LARGE
+)
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def engine():
+    """Calculator engine."""
+    return CalculatorEngine()
+
+
+def result(engine, expression: str) -> str:
+    """Displayed result of an expression (asserting success)."""
+    outcome = engine.calculate(expression)
+    assert outcome["success"], outcome["error"]
+    return outcome["result"]
+
+
+class TestLiterals:
+    """Test suite for matrix literals and operators."""
+
+    def test_literals(self, engine):
+        """Test vector and matrix literals with expression elements."""
+        assert result(engine, "[1, 2, 3]") == "[1, 2, 3]"
+        assert result(engine, "[[1, 2], [3, 4]]") == "[[1, 2], [3, 4]]"
+        assert result(engine, "[sin(30), 2^3, -1/4]") == "[0.5, 8, -0.25]"
+
+    def test_elementwise(self, engine):
+        """Test elementwise operators with scalar broadcasting."""
+        assert result(engine, "2*[1, 2]+[1, 1]") == "[3, 5]"
+        assert result(engine, "[1, 2]^2") == "[1, 4]"
+        assert result(engine, "-[1, 2]-1") == "[-2, -3]"
+        assert result(engine, "[[1, 2], [3, 4]]*[[1, 2], [3, 4]]") == "[[1, 4], [9, 16]]"
+
+    def test_matrix_product(self, engine):
+        """Test @ for matrix-matrix, matrix-vector and vector-vector."""
+        assert result(engine, "[[1, 2], [3, 4]]@[[0, 1], [1, 0]]") == "[[2, 1], [4, 3]]"
+        assert result(engine, "[[1, 2], [3, 4]]@[1, 1]") == "[3, 7]"
+        assert result(engine, "[1, 2]@[3, 4]") == "11"
+
+    def test_evaluate_returns_array(self, engine):
+        """Test that evaluate returns a float array for matrix results."""
+        outcome = engine.evaluator.evaluate("[[1, 2], [3, 4]]@[1, 1]")
+        assert isinstance(outcome["result"], np.ndarray)
+        assert outcome["result"].tolist() == [3.0, 7.0]
+
+    def test_scalar_results_unchanged(self, engine):
+        """Test that matrices reduced to numbers behave as numbers."""
+        assert result(engine, "det([[1, 2], [3, 4]])*2+1") == "-3"
+        assert result(engine, "trace(eye(4))") == "4"
+        assert result(engine, "mean([1, 2, 3])") == "2"
+
+
+class TestFunctions:
+    """Test suite for the linear algebra functions."""
+
+    def test_det_inv_transpose(self, engine):
+        """Test det, inv and transpose."""
+        assert result(engine, "det([[1, 2], [3, 4]])") == "-2"
+        assert result(engine, "inv([[1, 2], [3, 4]])") == "[[-2, 1], [1.5, -0.5]]"
+        assert result(engine, "transpose([[1, 2, 3], [4, 5, 6]])") == "[[1, 4], [2, 5], [3, 6]]"
+
+    def test_solve(self, engine):
+        """Test solve(A, b) next to the root-finding solve form."""
+        assert result(engine, "solve([[2, 1], [1, 3]], [3, 5])") == "[0.8, 1.4]"
+        assert result(engine, "solve(x^2-4, x, 0, 5)") == "2"
+
+    def test_eig(self, engine):
+        """Test eigenvalues of symmetric and general matrices."""
+        assert result(engine, "eig([[2, 1], [1, 2]])") == "[1, 3]"
+        assert result(engine, "eig([[1, 2], [3, 4]])") == "[-0.3722813233, 5.3722813233]"
+
+    def test_constructors(self, engine):
+        """Test eye, zeros and ones."""
+        assert result(engine, "eye(2)") == "[[1, 0], [0, 1]]"
+        assert result(engine, "zeros(2, 3)") == "[[0, 0, 0], [0, 0, 0]]"
+        assert result(engine, "ones(3)+1") == "[2, 2, 2]"
+
+    def test_large_system(self, engine):
+        """Test a 1000 x 1000 solve against the known solution."""
+        n = 1000
+        a = np.random.default_rng(1).random((n, n)) + n * np.eye(n)
+        x = np.arange(n, dtype=float)
+        assert np.allclose(linalg.solve(a, a @ x), x)
+        assert linalg.det(np.eye(n) * 2) == pytest.approx(2.0 ** n)
+
+
+class TestDisplay:
+    """Test suite for the summary of large results."""
+
+    def test_large_matrix_summary(self, engine):
+        """Test that a large matrix is shown by size and corners."""
+        text = result(engine, "eye(1000)*2")
+        assert text.startswith("Macierz 1000×1000: [[2, 0, …, 0, 0], [0, 2, …, 0, 0], …")
+        assert len(text) < 200
+
+    def test_large_vector_summary(self, engine):
+        """Test that a long vector keeps its first and last elements."""
+        assert result(engine, "ones(100)*3") == "Wektor (100): [3, 3, …, 3, 3]"
+
+    def test_summary_is_transported_as_text(self, engine):
+        """Test that a summary survives the columnar result transport."""
+        text = result(engine, "eye(100)")
+        row = transport.encode_result({"success": True, "result": text, "error": None})
+        assert row[0] == transport.RESULT_TEXT
+        assert transport.decode_result(*row)["result"] == text
+
+    def test_errors_have_codes(self):
+        """Test that matrix errors are stored as compact error codes."""
+        for message in (ERROR_MATRIX_SHAPE, ERROR_MATRIX_SINGULAR):
+            row = transport.encode_result({"success": False, "result": None, "error": message})
+            assert row[0] != transport.ERROR_OTHER
+            assert transport.decode_result(*row)["error"] == message
+
+
+class TestErrors:
+    """Test suite for matrix error messages."""
+
+    @pytest.mark.parametrize("expression,error", [
+        ("[1, 2]+[1, 2, 3]", ERROR_MATRIX_SHAPE),
+        ("[[1, 2], [3]]", ERROR_MATRIX_SHAPE),
+        ("det([1, 2])", ERROR_MATRIX_SHAPE),
+        ("[[1, 2]]@[[1, 2]]", ERROR_MATRIX_SHAPE),
+        ("solve([[1, 2], [3, 4]], [1, 2, 3])", ERROR_MATRIX_SHAPE),
+        ("inv([[1, 2], [2, 4]])", ERROR_MATRIX_SINGULAR),
+        ("eye(5000)", ERROR_MATRIX_TOO_LARGE),
+        ("eig([[0, -1], [1, 0]])", ERROR_MATH_DOMAIN),
+        ("[1, 2]/0", ERROR_DIVISION_BY_ZERO),
+        ("[1e308]*10", ERROR_OVERFLOW),
+    ])
+    def test_errors(self, engine, expression, error):
+        """Test that each failure maps to its locale message."""
+        assert engine.calculate(expression)["error"] == error
+
+    def test_without_numpy(self, engine, monkeypatch):
+        """Test that matrices report a missing NumPy; numbers still work."""
+        monkeypatch.setattr(kernel, "_numpy_module", False)
+        assert engine.calculate("[1, 2]")["error"] == ERROR_MATRIX_NUMPY
+        assert engine.calculate("det(eye(2))")["error"] == ERROR_MATRIX_NUMPY
+        assert result(engine, "2+3*4") == "14"
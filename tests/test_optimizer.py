@@ -0,0 +1,101 @@
+"""
+Tests for ExpressionOptimizer and the SafeEvaluator compile cache.
+Tests constant folding, identity simplification, power rewriting and error preservation.
+"""
+import ast
+import pytest
+from decimal import Decimal
+from src.calculator.logic.evaluator import SafeEvaluator
+from src.calculator.config.constants import ANGLE_MODE_RADIANS
+from src.calculator.config.locale import ERROR_DIVISION_BY_ZERO, ERROR_MATH_DOMAIN
+
+
+class TestExpressionOptimizer:
+    """Test suite for the optimization pass."""
+
+    def setup_method(self):
+        """Initialize evaluator before each test."""
+        self.evaluator = SafeEvaluator()
+
+    def optimized(self, expression):
+        """Return the unparsed optimized tree for an expression."""
+        return ast.unparse(self.evaluator.compile(expression).optimized)
+
+    # Constant folding
+    def test_fold_literal_chain(self):
+        """Test that literal arithmetic folds into one constant."""
+        assert self.optimized("1+2*3-4") == "3"
+
+    def test_fold_constants_and_functions(self):
+        """Test folding of pi and pure function calls."""
+        compiled = self.evaluator.compile("sqrt(2)/2")
+        assert isinstance(compiled.optimized.value, ast.Constant)
+        assert isinstance(self.evaluator.compile("pi/180").optimized.value, ast.Constant)
+
+    def test_fold_keeps_original_tree(self):
+        """Test that the parsed tree is cached alongside the optimized one."""
+        compiled = self.evaluator.compile("2^3")
+        assert ast.unparse(compiled.tree) == "2 ** 3"
+        assert ast.unparse(compiled.optimized) == "8"
+
+    def test_impure_functions_not_folded(self):
+        """Test that random functions are never folded."""
+        assert "rand" in self.optimized("rand()+1")
+
+    # Error semantics
+    def test_division_by_zero_not_folded(self):
+        """Test that 1/0 stays in the tree and still errors."""
+        assert self.optimized("2+1/0") == "2 + 1 / 0"
+        result = self.evaluator.evaluate("2+1/0")
+        assert result["success"] is False
+        assert result["error"] == ERROR_DIVISION_BY_ZERO
+
+    def test_domain_error_not_folded(self):
+        """Test that sqrt(-1) still reports a domain error."""
+        result = self.evaluator.evaluate("sqrt(-1)*1")
+        assert result["success"] is False
+        assert result["error"] == ERROR_MATH_DOMAIN
+
+    # Identities and powers (need a non-constant operand)
+    @pytest.mark.parametrize("expression", ["x*1", "1*x", "x+0", "0+x", "x-0", "x^1"])
+    def test_identities_removed(self, expression):
+        """Test identity simplification."""
+        assert self.optimized(expression) == "x"
+
+    def test_float_identity_kept(self):
+        """Test that x*1.0 is kept (it would change int to float)."""
+        assert self.optimized("x*1.0") == "x * 1.0"
+
+    def test_repeated_multiplication_to_power(self):
+        """Test that x*x*x becomes x**3."""
+        assert self.optimized("x*x*x") == "x ** 3"
+        assert self.optimized("x^2*x*y") == "x ** 3 * y"
+
+    @pytest.mark.parametrize("expression,expected", [
+        ("rand()*rand()", "rand() * rand()"),
+        ("randint(1, 6)*randint(1, 6)*x*x", "randint(1, 6) * randint(1, 6) * x ** 2"),
+        ("(rand()+1)^2*(rand()+1)", "(rand() + 1) ** 2 * (rand() + 1)"),
+    ])
+    def test_random_factors_not_combined(self, expression, expected):
+        """Test that independent random draws are not merged into a power."""
+        assert self.optimized(expression) == expected
+
+    def test_repeated_subexpression_to_power(self):
+        """Test power rewriting of structurally equal subtrees."""
+        assert self.optimized("sqrt(x)*sqrt(x)") == "sqrt(x) ** 2"
+
+    # Results and cache
+    def test_results_unchanged(self):
+        """Test that optimized evaluation matches expected results."""
+        assert self.evaluator.evaluate("0.1+0.2")["result"] == Decimal("0.3")
+        assert self.evaluator.evaluate("factorial(5)*1")["result"] == Decimal("120")
+
+    def test_compile_cache_hit(self):
+        """Test that repeated compiles return the cached object."""
+        assert self.evaluator.compile("1+1") is self.evaluator.compile("1+1")
+
+    def test_angle_mode_invalidates_cache(self):
+        """Test that folded trig values follow the angle mode."""
+        assert self.evaluator.evaluate("sin(90)")["result"] == Decimal("1")
+        self.evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        assert self.evaluator.evaluate("sin(90)")["result"] != Decimal("1")
@@ -0,0 +1,168 @@
+"""
+Tests for plot sampling.
+Tests adaptive refinement (dense where the curve bends), gaps at domain
+edges and asymptotes, LTTB downsampling and the plot() result format.
+"""
+import math
+import pytest
+from src.calculator.logic import plotting
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.config.constants import ANGLE_MODE_RADIANS
+from src.calculator.config.locale import (
+    ERROR_PLOT_RANGE,
+    ERROR_UNDEFINED_VARIABLE,
+    ERROR_MISSING_CLOSING_PARENTHESIS
+)
+
+
+def gaps(result: dict) -> list:
+    """Abscissas of the NaN points of a plot."""
+    return [x for x, y in zip(result["x"], result["y"]) if math.isnan(y)]
+
+
+class TestSampling:
+    """Test suite for adaptive sampling."""
+
+    def setup_method(self):
+        """Initialize engine before each test."""
+        self.engine = CalculatorEngine()
+
+    def test_values(self, backend):
+        """Test that points lie on the curve, in increasing x."""
+        result = self.engine.plot("x^3 - 2*x", -3, 3)
+        assert result["success"] and result["error"] is None
+        assert result["x"][0] == -3 and result["x"][-1] == 3
+        assert result["x"] == sorted(result["x"])
+        assert all(y == pytest.approx(x ** 3 - 2 * x, abs=1e-9)
+                   for x, y in zip(result["x"], result["y"]))
+
+    def test_angle_mode(self, backend):
+        """Test that trigonometric plots follow the angle mode."""
+        degrees = self.engine.plot("sin(x)", 0, 360)
+        assert max(degrees["y"]) == pytest.approx(1, abs=1e-4)
+        assert degrees["y"][-1] == pytest.approx(0, abs=1e-12)
+        self.engine.set_angle_mode(ANGLE_MODE_RADIANS)
+        radians = self.engine.plot("sin(x)", 0, 360)
+        assert radians["y"] != degrees["y"]
+        assert all(y == pytest.approx(math.sin(x)) for x, y in zip(radians["x"], radians["y"]))
+
+    def test_dense_where_curved(self, backend):
+        """Test that a narrow peak gets more points than a flat part."""
+        result = self.engine.plot("1/(1 + (100*x)^2)", -1, 1)
+        near = sum(1 for x in result["x"] if abs(x) < 0.05)
+        far = sum(1 for x in result["x"] if 0.5 < x < 0.6)
+        assert near > 4 * far
+        assert max(result["y"]) == 1
+
+    def test_line_not_refined(self, backend):
+        """Test that a straight line stops after one round of midpoints."""
+        result = self.engine.plot("2*x + 1", -10, 10)
+        assert result["evaluations"] == 2 * plotting.PLOT_INITIAL_POINTS - 1
+
+    def test_poles(self, backend):
+        """Test gaps at the asymptotes of tan (degrees) and 1/(x^2-1)."""
+        assert gaps(self.engine.plot("tan(x)", -180, 180)) == pytest.approx([-90, 90], abs=1e-3)
+        assert gaps(self.engine.plot("1/(x^2 - 1)", -3, 3)) == pytest.approx([-1, 1], abs=1e-3)
+
+    def test_even_pole(self, backend):
+        """Test a gap at a pole without a sign change."""
+        result = self.engine.plot("1/x^2", -1, 2)
+        assert gaps(result) == pytest.approx([0], abs=1e-3)
+        assert gaps(self.engine.plot("-1/(x - 0.3)^2", -1, 2)) == pytest.approx([0.3], abs=1e-3)
+
+    def test_many_poles(self, backend):
+        """Test that every pole is found when the budget runs short."""
+        self.engine.set_angle_mode(ANGLE_MODE_RADIANS)
+        result = self.engine.plot("tan(x)", -100, 100)
+        assert result["evaluations"] <= plotting.PLOT_MAX_EVALUATIONS
+        poles = [math.pi / 2 + k * math.pi for k in range(-32, 32)]
+        assert gaps(result) == pytest.approx(poles, abs=1e-3)
+
+    def test_domain_edges(self, backend):
+        """Test one gap where a function is undefined, refined to its edge."""
+        result = self.engine.plot("sqrt(x)", -4, 4)
+        assert len(gaps(result)) == 1
+        defined = [x for x, y in zip(result["x"], result["y"]) if not math.isnan(y)]
+        assert min(defined) < 1e-3
+        assert len(gaps(self.engine.plot("ln(x)", -1, 5))) == 1
+
+    def test_continuous_no_gaps(self, backend):
+        """Test that steep but continuous curves get no gaps."""
+        assert gaps(self.engine.plot("x^9", -3, 3)) == []
+        assert gaps(self.engine.plot("1/(x^2 + 0.001)", -1, 1)) == []
+
+
+class TestDownsample:
+    """Test suite for LTTB downsampling."""
+
+    def test_target(self, backend):
+        """Test the point count and the returned subset."""
+        result = CalculatorEngine().plot("sin(x)*x", -3600, 3600, points=200)
+        assert len(result["x"]) <= 200
+        assert result["x"][0] == -3600 and result["x"][-1] == 3600
+
+    @pytest.mark.parametrize("points", [3, 4, 5, 10])
+    def test_few_points(self, backend, points):
+        """Test the smallest targets, with and without gaps."""
+        line = CalculatorEngine().plot("x", 0, 1, points)
+        assert len(line["x"]) == points
+        assert line["x"][0] == 0 and line["x"][-1] == 1
+        engine = CalculatorEngine()
+        engine.set_angle_mode(ANGLE_MODE_RADIANS)
+        result = engine.plot("tan(x)", -100, 100, points)
+        assert result["success"] and len(result["x"]) <= points
+
+    @pytest.mark.parametrize("points", [5, 50, 400, 1000])
+    def test_many_gaps(self, points):
+        """Test that the cap holds with more segments than points."""
+        xs = [float(i) for i in range(3000)]
+        ys = [x if x % 10 else math.nan for x in xs]
+        out_x, out_y = plotting.downsample(xs, ys, points)
+        assert len(out_x) <= points
+        assert out_x == sorted(out_x)
+        assert not any(math.isnan(a) and math.isnan(b) for a, b in zip(out_y, out_y[1:]))
+        assert all(y == x for x, y in zip(out_x, out_y) if not math.isnan(y))
+
+    def test_keeps_extremes(self):
+        """Test that a single spike survives heavy downsampling."""
+        xs = [float(i) for i in range(10000)]
+        ys = [0.0] * 10000
+        ys[4321] = 5.0
+        out_x, out_y = plotting.downsample(xs, ys, 50)
+        assert len(out_x) <= 50 and 4321.0 in out_x and max(out_y) == 5.0
+
+    def test_keeps_gaps(self):
+        """Test that gaps and segment ends are kept."""
+        xs = [float(i) for i in range(3000)]
+        ys = [x if x % 1000 else math.nan for x in xs]
+        out_x, out_y = plotting.downsample(xs, ys, 100)
+        assert len(out_x) <= 100
+        assert sum(1 for y in out_y if math.isnan(y)) == 3
+        assert {1.0, 999.0, 1001.0, 1999.0, 2001.0, 2999.0} <= set(out_x)
+
+
+class TestErrors:
+    """Test suite for plot errors."""
+
+    def setup_method(self):
+        """Initialize engine before each test."""
+        self.engine = CalculatorEngine()
+
+    @pytest.mark.parametrize("lower,upper,points", [
+        (1, 1, 100), (2, 1, 100), (0, math.inf, 100), (0, 1, 2),
+    ])
+    def test_range(self, lower, upper, points):
+        """Test empty, reversed and infinite ranges and too few points."""
+        result = self.engine.plot("x", lower, upper, points)
+        assert result == {"success": False, "x": None, "y": None,
+                          "error": ERROR_PLOT_RANGE, "evaluations": None}
+
+    def test_expression(self):
+        """Test unknown names and invalid input."""
+        assert self.engine.plot("x + y", 0, 1)["error"] == ERROR_UNDEFINED_VARIABLE
+        assert self.engine.plot("sin(x", 0, 1)["error"] == ERROR_MISSING_CLOSING_PARENTHESIS
+
+    def test_other_variable(self, backend):
+        """Test a variable other than x."""
+        result = self.engine.plot("t^2", 0, 2, variable="t")
+        assert result["success"] and result["y"][-1] == 4
@@ -0,0 +1,187 @@
+"""
+Tests for polynomials evaluated with Horner's scheme.
+Tests the Polynomial type (evaluation, arithmetic), recognition of
+expanded polynomials by the optimizer and unchanged results through the
+evaluator, kernels, autodiff and the special forms.
+"""
+import ast
+import math
+import random
+import pytest
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.logic.evaluator import SafeEvaluator
+from src.calculator.logic.polynomial import Polynomial, PolynomialNode, from_tree
+from src.calculator.config.constants import POLY_BLOCK_SIZE, POLY_CONVOLVE_MIN
+from src.calculator.config.locale import ERROR_OVERFLOW
+
+
+def expanded(coefficients: list, x: float) -> float:
+    """Value of a polynomial computed term by term."""
+    return sum(c * x ** k for k, c in enumerate(coefficients))
+
+
+class TestPolynomial:
+    """Test suite for the Polynomial type."""
+
+    def test_evaluate(self):
+        """Test dense and sparse polynomials against term-by-term sums."""
+        dense = Polynomial([2, -1, 0, 3])
+        sparse = Polynomial([1] + [0] * 99 + [2])
+        for x in (-1.5, 0.0, 0.3, 2.0):
+            assert dense(x) == pytest.approx(expanded(dense.coefficients, x))
+            assert sparse(x) == pytest.approx(1 + 2 * x ** 100)
+        assert Polynomial([0, 0, 5])(3) == 45
+
+    def test_int_exact(self):
+        """Test that int coefficients at an int point give an exact int."""
+        value = Polynomial([1, 0, 0, 7] + [0] * 36 + [1])(3)
+        assert value == 3 ** 40 + 7 * 27 + 1 and type(value) is int
+
+    def test_array(self):
+        """Test array evaluation (several blocks) against NumPy."""
+        np = pytest.importorskip("numpy")
+        rng = random.Random(2)
+        coefficients = [rng.uniform(-1, 1) for _ in range(31)]
+        points = np.linspace(-1.2, 1.2, 2 * POLY_BLOCK_SIZE + 7).reshape(-1, 1)
+        values = Polynomial(coefficients)(points)
+        assert values.shape == points.shape
+        assert np.allclose(values, np.polynomial.polynomial.polyval(points, coefficients))
+
+    def test_arithmetic(self, backend):
+        """Test +, -, *, / and ^ on polynomials and numbers."""
+        p, q = Polynomial([1, 1]), Polynomial([-1, 0, 2])
+        assert p + q == Polynomial([0, 1, 2])
+        assert 1 - p == Polynomial([0, -1])
+        assert p * q == Polynomial([-1, -1, 2, 2])
+        assert (p ** 5).coefficients == (1, 5, 10, 10, 5, 1)
+        assert (q / 2).coefficients == (-0.5, 0.0, 1.0)
+        assert (p - p).coefficients == (0,)
+        assert q.derivative() == Polynomial([0, 4])
+
+    def test_long_product(self, backend):
+        """Test that long products are exact for ints on every path."""
+        rng = random.Random(4)
+        a = [rng.randint(-9, 9) for _ in range(4 * POLY_CONVOLVE_MIN)]
+        b = [rng.randint(-9, 9) for _ in range(3 * POLY_CONVOLVE_MIN)]
+        product = (Polynomial(a) * Polynomial(b)).coefficients
+        reference = [sum(a[i] * b[k - i] for i in range(len(a)) if 0 <= k - i < len(b))
+                     for k in range(len(a) + len(b) - 1)]
+        assert list(product) == reference
+        assert all(type(c) is int for c in product)
+
+
+class TestRecognition:
+    """Test suite for polynomial recognition in the optimizer."""
+
+    def setup_method(self):
+        """Initialize evaluator before each test."""
+        self.evaluator = SafeEvaluator()
+
+    def optimized(self, expression: str) -> ast.AST:
+        """Optimized tree of an expression (without the Expr wrapper)."""
+        return self.evaluator.compile(expression).optimized.value
+
+    @pytest.mark.parametrize("expression,coefficients", [
+        ("3*x^3 - x + 2", (2, -1, 0, 3)),
+        ("x^2+1", (1, 0, 1)),
+        ("x*x + x", (0, 1, 1)),
+        ("x^3/6 + x^2/2 + x + 1", (1.0, 1.0, 0.5, 1 / 6)),
+        ("-(x^2) + 2*(x^3 - x)", (0, -2, -1, 2)),
+    ])
+    def test_recognized(self, expression, coefficients):
+        """Test expanded polynomials that become one PolynomialNode."""
+        node = self.optimized(expression)
+        assert isinstance(node, PolynomialNode)
+        assert node.polynomial.coefficients == coefficients
+        assert node.operand.id == "x"
+
+    @pytest.mark.parametrize("expression", [
+        "x^2", "2*x+1", "(x-1)^20", "(x+1)*(x-1)", "x^2+y", "2^x+x^2",
+    ])
+    def test_not_recognized(self, expression):
+        """Test single terms, non-expanded forms and several variables."""
+        node = self.optimized(expression)
+        assert not any(isinstance(child, PolynomialNode) for child in ast.walk(node))
+
+    def test_inside_larger_expression(self):
+        """Test a polynomial argument of a function."""
+        node = self.optimized("sqrt(x^4 + 2*x^2 + 1)")
+        assert isinstance(node.args[0], PolynomialNode)
+
+    def test_from_tree(self):
+        """Test the recognizer directly."""
+        tree = ast.parse("2*t**2 - t/4", mode="eval").body
+        assert from_tree(tree) == ("t", Polynomial([0, -0.25, 2]))
+        assert from_tree(ast.parse("x*y", mode="eval").body) is None
+
+
+class TestResults:
+    """Test suite for results computed through PolynomialNodes."""
+
+    def test_evaluate(self):
+        """Test evaluation at bound points, including exact ints."""
+        engine = CalculatorEngine()
+        assert engine.calculate("3*x^3 - x + 2", {"x": 2})["result"] == "24"
+        assert engine.calculate("x^2/2 + x", {"x": 0.5})["result"] == "0.625"
+        assert engine.calculate("x^30 + 1", {"x": 3})["result"] == str(3 ** 30 + 1)
+
+    def test_overflow(self):
+        """Test that an overflowing polynomial still reports overflow."""
+        engine = CalculatorEngine()
+        assert engine.calculate("x^400 + x", {"x": 10.0})["error"] == ERROR_OVERFLOW
+
+    def test_kernel(self, backend):
+        """Test kernels against term-by-term values."""
+        evaluator = SafeEvaluator()
+        compiled = evaluator.compile_kernel("3*x^5 - 2*x^3 + x - 7", ("x",))
+        points = [-2.0, -0.5, 0.0, 1.25, 3.0]
+        expected = [expanded([-7, 1, 0, -2, 0, 3], x) for x in points]
+        assert list(compiled(points)) == pytest.approx(expected)
+
+    def test_gradient(self, backend):
+        """Test automatic differentiation through a PolynomialNode."""
+        engine = CalculatorEngine()
+        assert engine.calculate("diff(x^3 + 2*x^2, x, 2)")["result"] == "20"
+        gradient = engine.evaluator.compile_gradient("x^4 - 3*x^2 + x", ("x",))
+        values, (partials,) = gradient([2.0])
+        assert list(values) == pytest.approx([6.0])
+        assert list(partials) == pytest.approx([4 * 8 - 6 * 2 + 1])
+
+    def test_forms(self, backend):
+        """Test integrate, solve and sum over polynomial bodies."""
+        engine = CalculatorEngine()
+        assert engine.calculate("integrate(x^2 + 2*x + 1, x, 0, 1)")["result"] == "2.3333333333"
+        root = float(engine.calculate("solve(x^3 - 2*x - 5, x, 0, 3)")["result"])
+        assert root ** 3 - 2 * root - 5 == pytest.approx(0, abs=1e-8)
+        assert engine.calculate("sum(k^2 + k, k, 1, 100)")["result"] == "343400"
+
+    def test_matches_unoptimized(self):
+        """Test random polynomials against the plain evaluator."""
+        rng = random.Random(7)
+        evaluator = SafeEvaluator()
+        plain = evaluator._evaluator
+        for _ in range(20):
+            degree = rng.randint(2, 12)
+            terms = [f"{rng.randint(-9, 9)}*x^{k}" for k in range(degree, 0, -1)]
+            expression = " + ".join(terms) + f" - {rng.randint(0, 9)}"
+            x = rng.uniform(-3, 3)
+            reference = plain.eval(expression.replace("^", "**").replace("x", f"({x!r})"))
+            result = evaluator.evaluate(expression, {"x": x})["result"]
+            assert float(result) == pytest.approx(reference, rel=1e-9, abs=1e-9)
+            assert not math.isnan(float(result))
+
+    def test_non_finite(self):
+        """Test that non-finite points keep the expanded form's results."""
+        np = pytest.importorskip("numpy")
+        evaluator = SafeEvaluator()
+        # inf**2 is rejected by the plain evaluator; Horner would give inf
+        assert not evaluator.evaluate("x^2 - x", {"x": math.inf})["success"]
+        assert evaluator.evaluate("x^2 - x", {"x": 3})["result"] == 6
+        compiled = evaluator.compile_kernel("x^2 - x", ("x",))
+        points = np.array([math.inf, -math.inf, math.nan, 3.0])
+        with np.errstate(all="ignore"):
+            expected = points ** 2 - points
+        np.testing.assert_array_equal(compiled(points), expected)
+        assert math.isnan(compiled([math.inf])[0])
+        values, _ = evaluator.compile_gradient("x^2 - x", ("x",))([math.inf])
+        assert math.isnan(values[0])
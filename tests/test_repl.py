@@ -0,0 +1,67 @@
+"""
+Tests for the terminal REPL.
+Tests commands, bounded history, angle modes and pipe mode.
+"""
+import io
+import pytest
+from src.calculator.repl import CalculatorRepl
+from src.calculator.config.constants import MAX_HISTORY_ENTRIES
+from src.calculator.config.locale import (
+    MSG_WELCOME,
+    MSG_GOODBYE,
+    HIST_EMPTY,
+    ERROR_DIVISION_BY_ZERO
+)
+
+
+@pytest.fixture
+def repl():
+    """Create a REPL writing to an in-memory stream."""
+    return CalculatorRepl(output=io.StringIO())
+
+
+def test_expression_result(repl):
+    """Expressions print the Polish result message."""
+    assert repl.handle("2+3\n") == "Wynik: 5"
+
+
+def test_expression_error(repl):
+    """Errors print the Polish error message."""
+    assert repl.handle("5/0") == ERROR_DIVISION_BY_ZERO
+
+
+def test_quit_returns_none(repl):
+    """quit and exit end the loop."""
+    assert repl.handle("quit") is None
+    assert repl.handle("EXIT") is None
+
+
+def test_angle_mode_command(repl):
+    """deg/rad switch the engine angle mode."""
+    assert repl.handle("rad") == "Tryb kątów zmieniony na: radiany"
+    assert repl.handle("sin(pi/2)") == "Wynik: 1"
+
+
+def test_history_bounded(repl):
+    """History keeps only the newest MAX_HISTORY_ENTRIES results."""
+    assert repl.handle("history") == HIST_EMPTY
+    for i in range(MAX_HISTORY_ENTRIES + 3):
+        repl.handle(f"{i}+1")
+    assert len(repl.history) == MAX_HISTORY_ENTRIES
+    assert repl.history[0] == ("3+1", "4")
+
+
+def test_interactive_session(repl):
+    """Interactive mode prints welcome, prompts and goodbye."""
+    repl.run_interactive(io.StringIO("1+1\nquit\n"))
+    output = repl.output.getvalue()
+    assert output.startswith(MSG_WELCOME)
+    assert "Wynik: 2" in output
+    assert output.endswith(MSG_GOODBYE + "\n")
+
+
+def test_pipe_mode(repl):
+    """Pipe mode prints one bare result per expression line."""
+    exit_code = repl.run_pipe(io.StringIO("2*3\n\nrad\ncos(0)\n1/0\n"))
+    assert repl.output.getvalue().splitlines() == ["6", "1", ERROR_DIVISION_BY_ZERO]
+    assert exit_code == 1
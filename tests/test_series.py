@@ -0,0 +1,137 @@
+"""
+Tests for series sums and products.
+Tests closed-form detection, chunked kernel evaluation, bounds and error
+mapping, with NumPy kernels and with the scalar fallback.
+"""
+import math
+import pytest
+from decimal import Decimal
+from src.calculator.logic import series
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.config.constants import ANGLE_MODE_RADIANS
+from src.calculator.config.locale import (
+    ERROR_DIVISION_BY_ZERO,
+    ERROR_FACTORIAL_TOO_LARGE,
+    ERROR_INVALID_EXPRESSION,
+    ERROR_MATH_DOMAIN,
+    ERROR_OVERFLOW,
+    ERROR_SERIES_BOUNDS,
+    ERROR_SERIES_TOO_LONG
+)
+
+
+class TestClosedForm:
+    """Test suite for series evaluated without visiting the terms."""
+
+    @pytest.mark.parametrize("expression,expected,kind", [
+        ("sum(k, k, 1, 100)", Decimal("5050"), "arithmetic"),
+        ("sum(3-2*k, k, 0, 10)", Decimal("-77"), "arithmetic"),
+        ("sum((k+1)/2, k, 1, 4)", Decimal("7"), "arithmetic"),
+        ("sum(2^k, k, 0, 10)", Decimal("2047"), "geometric"),
+        ("sum(3*2^(k-1), k, 1, 5)", Decimal("93"), "geometric"),
+        ("sum(7, k, 1, 6)", Decimal("42"), "geometric"),
+        ("prod(2, k, 1, 10)", Decimal("1024"), "geometric"),
+        ("prod(10^k, k, 1, 3)", Decimal("1000000"), "geometric"),
+    ])
+    def test_recognized(self, evaluator, expression, expected, kind):
+        """Test arithmetic and geometric series in closed form."""
+        assert evaluator.evaluate(expression)["result"] == expected
+        assert evaluator.last_series["closed_form"] == kind
+        assert evaluator.last_series["evaluations"] == 0
+
+    @pytest.mark.parametrize("expression,expected", [
+        ("sum(2^k, k, 1, 60)", 2 ** 61 - 2),
+        ("prod(2, k, 1, 70)", 2 ** 70),
+        ("sum(3^k, k, 0, 40)", (3 ** 41 - 1) // 2),
+        ("sum(12345678901*k, k, 1, 10^8)", 12345678901 * (10 ** 8 * (10 ** 8 + 1) // 2)),
+    ])
+    def test_integer_series_exact(self, evaluator, expression, expected):
+        """Test that int series keep every digit (no float rounding)."""
+        assert evaluator.evaluate(expression)["result"] == Decimal(expected)
+
+    def test_exact_beyond_float_range(self, evaluator):
+        """Test int series past float range, bounded by the power limit."""
+        assert evaluator.evaluate("prod(2, k, 1, 2000)")["result"] == Decimal(2 ** 2000)
+        assert evaluator.evaluate("sum(2^k, k, 1, 2000)")["result"] == Decimal(2 ** 2001 - 2)
+        assert evaluator.evaluate("prod(2, k, 1, 4000001)")["error"] == ERROR_OVERFLOW
+        assert evaluator.evaluate("sum(2^k, k, 1, 4000001)")["error"] == ERROR_OVERFLOW
+
+    def test_huge_bounds(self, evaluator):
+        """Test that closed forms do not depend on the number of terms."""
+        assert evaluator.evaluate("sum(k, k, 1, 10^9)")["result"] == Decimal("500000000500000000")
+        assert evaluator.evaluate("sum(0.5^k, k, 1, 10^9)")["result"] == Decimal("1")
+
+    def test_matches_term_by_term(self, evaluator):
+        """Test the closed form against chunked evaluation of the same terms."""
+        body = evaluator.compile("2*k+1/3").optimized
+        report = series.closed_form(body, "k", evaluator._evaluator._eval, -5, 20, False)
+        chunked = series.evaluate_series(evaluator.compile_kernel(body, ("k",)), -5, 20, False,
+                                         chunk_size=7)
+        assert report["value"] == pytest.approx(chunked["value"])
+
+    def test_random_terms_are_not_folded(self, evaluator):
+        """Test that rand() is evaluated per term."""
+        evaluator.evaluate("sum(rand(), k, 1, 10)")
+        assert evaluator.last_series["closed_form"] is None
+
+
+class TestChunked:
+    """Test suite for series evaluated term by term."""
+
+    def test_basel(self, evaluator):
+        """Test a slowly converging sum over several chunks."""
+        body = evaluator.compile("1/k^2").optimized
+        report = series.evaluate_series(evaluator.compile_kernel(body, ("k",)), 1, 10000, False,
+                                        chunk_size=999)
+        assert report["value"] == pytest.approx(math.pi ** 2 / 6 - 1 / 10000, rel=1e-8)
+        assert report["evaluations"] == 10000
+
+    def test_product(self, evaluator):
+        """Test products (factorial and telescoping)."""
+        assert evaluator.evaluate("prod(k, k, 1, 10)")["result"] == Decimal("3628800")
+        assert evaluator.evaluate("prod(1+1/k, k, 1, 1000)")["result"] == Decimal("1001")
+
+    def test_angle_mode(self, evaluator):
+        """Test that trig terms follow the angle mode."""
+        assert evaluator.evaluate("sum(sin(k)^2, k, 1, 360)")["result"] == Decimal("180")
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        result = evaluator.evaluate("sum(cos(k), k, 1, 10)")["result"]
+        assert float(result) == pytest.approx(sum(math.cos(k) for k in range(1, 11)), abs=1e-10)
+
+    def test_empty_range(self, evaluator):
+        """Test the empty sum and product."""
+        assert evaluator.evaluate("sum(1/k, k, 5, 1)")["result"] == Decimal("0")
+        assert evaluator.evaluate("prod(k, k, 5, 1)")["result"] == Decimal("1")
+
+    def test_term_errors(self, evaluator):
+        """Test undefined and infinite terms."""
+        assert evaluator.evaluate("sum(sqrt(k), k, -1, 5)")["error"] == ERROR_MATH_DOMAIN
+        assert evaluator.evaluate("sum(1/k, k, 0, 5)")["error"] == ERROR_DIVISION_BY_ZERO
+        assert evaluator.evaluate("prod(k^100, k, 1, 100)")["error"] == ERROR_OVERFLOW
+
+    def test_term_error_from_evaluator(self, evaluator):
+        """Test that a non-finite chunk reports the failing term's own error."""
+        result = evaluator.evaluate("sum(factorial(k), k, 1, 200)")
+        assert result["error"] == ERROR_FACTORIAL_TOO_LARGE
+
+
+class TestBounds:
+    """Test suite for bound validation and invalid forms."""
+
+    def test_bounds(self, evaluator):
+        """Test non-integer bounds, expression bounds and the term limit."""
+        assert evaluator.evaluate("sum(k, k, 1.5, 3)")["error"] == ERROR_SERIES_BOUNDS
+        assert evaluator.evaluate("sum(k, k, 2^2, 2*3)")["result"] == Decimal("15")
+        assert evaluator.evaluate("sum(k^2, k, 1, 10^10)")["error"] == ERROR_SERIES_TOO_LONG
+
+    def test_invalid_forms(self, evaluator):
+        """Test wrong arity and a constant as the index."""
+        assert evaluator.evaluate("sum(k, k, 1)")["error"] == ERROR_INVALID_EXPRESSION
+        assert evaluator.evaluate("prod(k, pi, 1, 2)")["error"] == ERROR_INVALID_EXPRESSION
+
+
+def test_calculator_accepts_series():
+    """Test sum() and prod() through validation and formatting."""
+    engine = CalculatorEngine()
+    assert engine.calculate("sum(k^2, k, 1, 10)") == {"success": True, "result": "385", "error": None}
+    assert engine.calculate("prod(k, k, 1, 5)")["result"] == "120"
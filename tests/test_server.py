@@ -0,0 +1,154 @@
+"""
+Tests for the asyncio JSON-lines calculation server.
+Tests pipelining order, per-connection angle mode, request ids and offloading.
+"""
+import asyncio
+import json
+import pytest
+from src.calculator.config.constants import ANGLE_MODE_RADIANS, SERVER_INLINE_MAX_LENGTH
+from src.calculator.config.locale import ERROR_INVALID_EXPRESSION, ERROR_INVALID_ANGLE_MODE
+from src.calculator.service.server import CalculationServer, is_heavy, main
+
+
+async def exchange(server, messages):
+    """Send all messages at once (pipelined) and read one response each."""
+    reader, writer = await asyncio.open_connection(server.host, server.port)
+    for message in messages:
+        line = message if isinstance(message, bytes) else json.dumps(message).encode()
+        writer.write(line + b"\n")
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in messages]
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+def run_with_server(messages, workers=0):
+    """Start a server on a free port, exchange messages and stop it."""
+    async def scenario():
+        server = CalculationServer(port=0, workers=workers)
+        await server.start()
+        try:
+            return await exchange(server, messages)
+        finally:
+            await server.close()
+    return asyncio.run(scenario())
+
+
+def test_is_heavy():
+    """Test the offload heuristic."""
+    assert is_heavy("2^999999")
+    assert is_heavy("factorial(100)")
+    assert is_heavy("1+" * SERVER_INLINE_MAX_LENGTH + "1")
+    assert not is_heavy("sqrt(16)+sin(30)")
+
+
+@pytest.mark.parametrize("expression", [
+    "sum(sin(k), k, 1, 100000000)",
+    "prod(1 + 1/k, k, 1, 1000000)",
+    "integrate(sin(x), x, 0, 1)",
+    "solve(x - cos(x), x, 0, 1)",
+    "diff(sin(x), x, 1)",
+    "if(1 > 0, sum(k, k, 1, 10), 0)",
+    "det(eye(300))",
+    "inv(ones(2, 2))",
+    "eig([[1, 2], [3, 4]])",
+    "[1, 2] @ [3, 4]",
+])
+def test_special_forms_and_matrices_are_heavy(expression):
+    """Test that special forms and matrix calls leave the event loop."""
+    assert is_heavy(expression)
+
+
+def test_long_series_does_not_block_other_connections():
+    """Test that a cheap request is answered while a long series runs."""
+    async def scenario():
+        server = CalculationServer(port=0, workers=1)
+        await server.start()
+        try:
+            slow = asyncio.create_task(
+                exchange(server, [{"expression": "sum(sin(k), k, 1, 50000000)"}])
+            )
+            await asyncio.sleep(0.2)
+            fast = await exchange(server, [{"expression": "1+1"}])
+            slow_done = slow.done()
+            return fast, slow_done, await slow
+        finally:
+            await server.close()
+
+    fast, slow_done, slow = asyncio.run(scenario())
+    assert fast[0]["result"] == "2"
+    assert not slow_done
+    assert slow[0]["success"]
+
+
+def test_pipelined_responses_in_order():
+    """Test that pipelined requests are answered in order."""
+    responses = run_with_server([{"expression": f"{n}*2"} for n in range(50)])
+    assert [r["result"] for r in responses] == [str(n * 2) for n in range(50)]
+
+
+def test_request_id_echoed():
+    """Test that an optional id is copied into the response."""
+    responses = run_with_server([{"id": 7, "expression": "1+1"}, {"expression": "2"}])
+    assert responses[0]["id"] == 7
+    assert "id" not in responses[1]
+
+
+def test_per_connection_angle_mode():
+    """Test that the angle mode command applies to later requests only."""
+    responses = run_with_server([
+        {"expression": "sin(90)"},
+        {"command": "angle_mode", "angle_mode": ANGLE_MODE_RADIANS},
+        {"expression": "sin(90)"},
+        {"command": "angle_mode", "angle_mode": "turns"},
+    ])
+    assert responses[0]["result"] == "1"
+    assert responses[1]["success"] is True
+    assert responses[2]["result"] != "1"
+    assert responses[3]["error"] == ERROR_INVALID_ANGLE_MODE
+
+
+def test_invalid_json_does_not_close_connection():
+    """Test that a malformed line gets an error and the next line is served."""
+    responses = run_with_server([b"{not json", {"expression": "3+3"}])
+    assert responses[0]["error"] == ERROR_INVALID_EXPRESSION
+    assert responses[1]["result"] == "6"
+
+
+def test_heavy_requests_offloaded_in_order():
+    """Test process pool evaluation keeps response order."""
+    responses = run_with_server(
+        [{"expression": "2^10"}, {"expression": "1+1"}, {"expression": "factorial(5)"}],
+        workers=1
+    )
+    assert [r["result"] for r in responses] == ["1024", "2", "120"]
+
+
+def test_connections_have_independent_angle_modes():
+    """Test that one connection's angle mode does not leak to another."""
+    async def scenario():
+        server = CalculationServer(port=0, workers=0)
+        await server.start()
+        try:
+            first = await exchange(server, [
+                {"command": "angle_mode", "angle_mode": ANGLE_MODE_RADIANS},
+                {"expression": "cos(pi)"},
+            ])
+            second = await exchange(server, [{"expression": "cos(180)"}])
+            return first, second
+        finally:
+            await server.close()
+
+    first, second = asyncio.run(scenario())
+    assert first[1]["result"] == "-1"
+    assert second[0]["result"] == "-1"
+
+
+@pytest.mark.parametrize("argv", [["--port"], ["--port", "http"], ["--workers", "1.5"]])
+def test_command_line_errors(argv, capsys):
+    """Test that a wrong command line prints the usage and exits with 2."""
+    with pytest.raises(SystemExit) as exit_info:
+        main(argv)
+    assert exit_info.value.code == 2
+    assert "usage:" in capsys.readouterr().err
@@ -0,0 +1,157 @@
+"""
+Tests for headless sessions and the session store.
+Tests controller-equivalent button semantics, idle eviction and memory use.
+"""
+import gc
+import tracemalloc
+from src.calculator.config.constants import (
+    ANGLE_MODE_RADIANS,
+    CURSOR_MARKER,
+    MAX_HISTORY_ENTRIES,
+    SESSION_MEMORY_BUDGET
+)
+from src.calculator.config.locale import (
+    BTN_BACKSPACE,
+    BTN_DELETE,
+    BTN_CURSOR_LEFT,
+    BTN_CURSOR_HOME,
+    ERROR_DIVISION_BY_ZERO
+)
+from src.calculator.service.sessions import HeadlessSession, SessionStore
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def click(store, session_id, *labels):
+    """Press several buttons in one session."""
+    for label in labels:
+        session = store.on_button_click(session_id, label)
+    return session
+
+
+class TestHeadlessSession:
+    """Test suite for button semantics."""
+
+    def setup_method(self):
+        """Create a store with a controllable clock."""
+        self.clock = FakeClock()
+        self.store = SessionStore(idle_timeout=60, clock=self.clock)
+
+    def test_session_uses_slots(self):
+        """Test that sessions carry no per-instance dict."""
+        assert not hasattr(HeadlessSession(), "__dict__")
+
+    def test_calculate_and_history(self):
+        """Test = stores the result and a history entry."""
+        session = click(self.store, "a", "2", "+", "3", "=")
+        assert session.result_text == "5"
+        assert session.last_result == "5"
+        assert session.history == [("2+3", "5")]
+
+    def test_label_tokens(self):
+        """Test that scientific labels become their tokens."""
+        session = click(self.store, "a", "\u221a", "1", "6", ")", "=")
+        assert session.expression == "sqrt(16)"
+        assert session.result_text == "4"
+
+    def test_error_state_cleared_by_input(self):
+        """Test that typing after an error starts a new expression."""
+        session = click(self.store, "a", "1", "/", "0", "=")
+        assert session.error_state is True
+        assert session.result_text == ERROR_DIVISION_BY_ZERO
+        click(self.store, "a", "7")
+        assert session.expression == "7"
+        assert session.error_state is False
+
+    def test_backspace_removes_whole_token(self):
+        """Test that backspace removes "sin(" at once, like the GUI."""
+        session = click(self.store, "a", "2", "sin", BTN_BACKSPACE)
+        assert session.expression == "2"
+
+    def test_cursor_editing(self):
+        """Test insertion and delete at the cursor."""
+        session = click(self.store, "a", "1", "2", "3", BTN_CURSOR_LEFT, "+")
+        assert session.expression == "12+3"
+        assert session.display_expression == "12+" + CURSOR_MARKER + "3"
+        click(self.store, "a", BTN_CURSOR_HOME, BTN_DELETE)
+        assert session.expression == "2+3"
+
+    def test_clear(self):
+        """Test C resets expression and result."""
+        session = click(self.store, "a", "9", "=", "C")
+        assert session.expression == ""
+        assert session.result_text == "0"
+
+    def test_history_limit(self):
+        """Test that history keeps only the newest entries."""
+        for _ in range(MAX_HISTORY_ENTRIES + 5):
+            session = click(self.store, "a", "1", "=")
+        assert len(session.history) == MAX_HISTORY_ENTRIES
+
+    def test_history_recall_inserts_result(self):
+        """Test recalling a history result at the cursor."""
+        self.store.on_history_recall("a", "42")
+        assert self.store.get("a").expression == "42"
+
+    def test_angle_mode_per_session(self):
+        """Test that sessions keep their own angle mode."""
+        self.store.on_angle_mode_change("rad", ANGLE_MODE_RADIANS)
+        assert click(self.store, "deg", "sin", "9", "0", ")", "=").result_text == "1"
+        assert click(self.store, "rad", "sin", "9", "0", ")", "=").result_text != "1"
+
+
+class TestSessionStore:
+    """Test suite for eviction and memory use."""
+
+    def setup_method(self):
+        """Create a store with a controllable clock."""
+        self.clock = FakeClock()
+        self.store = SessionStore(idle_timeout=60, clock=self.clock)
+
+    def test_idle_sessions_evicted(self):
+        """Test that only sessions idle past the timeout are removed."""
+        self.store.get("old")
+        self.clock.now = 30
+        self.store.get("recent")
+        self.clock.now = 61
+        assert self.store.evict_idle() == 1
+        assert "old" not in self.store
+        assert "recent" in self.store
+
+    def test_activity_keeps_session_alive(self):
+        """Test that touching a session resets its idle time."""
+        self.store.get("a")
+        self.clock.now = 50
+        click(self.store, "a", "1")
+        self.clock.now = 100
+        self.store.get("b")
+        assert "a" in self.store
+
+    def test_remove(self):
+        """Test ending a session explicitly."""
+        self.store.get("a")
+        self.store.remove("a")
+        assert len(self.store) == 0
+
+    def test_memory_budget(self):
+        """Test per-session memory of many sessions with one result each."""
+        click(self.store, -1, "1", "+", "2", "=")  # Warm the shared engine
+        count = 10000
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for session_id in range(count):
+                click(self.store, session_id, "1", "+", "2", "=")
+            used = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        assert used / count < SESSION_MEMORY_BUDGET
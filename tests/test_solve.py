@@ -0,0 +1,93 @@
+"""
+Tests for equation solving.
+Tests solve() roots, masked domain errors, poles and the scalar fallback.
+"""
+import math
+import pytest
+from decimal import Decimal
+from src.calculator.logic import kernel
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.logic.evaluator import SafeEvaluator
+from src.calculator.logic.roots import find_roots
+from src.calculator.config.constants import ANGLE_MODE_RADIANS
+from src.calculator.config.locale import ERROR_INVALID_EXPRESSION, ERROR_NO_ROOT
+
+
+class TestSolve:
+    """Test suite for solve(expr, var, lo, hi)."""
+
+    def test_every_root(self, evaluator):
+        """Test that all roots in the interval are returned, sorted."""
+        result = evaluator.solve("x^2-2", "x", -2, 2)
+        assert result["roots"] == [Decimal("-1.4142135624"), Decimal("1.4142135624")]
+        assert result["result"] == Decimal("-1.4142135624")
+
+    def test_many_roots(self, evaluator):
+        """Test many brackets refined together."""
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        roots = evaluator.solve("sin(x)", "x", 0.5, 100)["roots"]
+        assert len(roots) == 31
+        assert all(float(root) == pytest.approx(k * math.pi, abs=1e-9)
+                   for k, root in enumerate(roots, start=1))
+
+    def test_degrees_mode(self, evaluator):
+        """Test that trig equations follow the angle mode."""
+        assert evaluator.solve("cos(x)", "x", 0, 200)["roots"] == [Decimal("90")]
+
+    def test_exact_sample_roots(self, evaluator):
+        """Test roots hit exactly by the grid (no sign change needed)."""
+        result = evaluator.solve("x^3-x", "x", -2, 2)
+        assert [float(root) for root in result["roots"]] == [-1.0, 0.0, 1.0]
+        assert evaluator.solve("(x-1)^2", "x", 0, 2)["roots"] == [Decimal("1")]
+
+    def test_domain_errors_are_masked(self, evaluator):
+        """Test that ln/sqrt/log domain errors do not abort the solve."""
+        assert evaluator.solve("ln(x)-1", "x", -5, 5)["roots"] == [Decimal("2.7182818285")]
+        assert evaluator.solve("sqrt(x)-2", "x", -10, 10)["roots"] == [Decimal("4")]
+        assert evaluator.solve("log(x)-1", "x", -100, 100)["roots"] == [Decimal("10")]
+        assert evaluator.last_solve["masked"] > 0
+
+    def test_poles_are_not_roots(self, evaluator):
+        """Test that sign changes across a pole are discarded."""
+        result = evaluator.solve("1/x", "x", -1, 2)
+        assert result["error"] == ERROR_NO_ROOT
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        roots = evaluator.solve("tan(x)", "x", 1, 10)["roots"]
+        assert [float(root) for root in roots] == pytest.approx([math.pi, 2 * math.pi, 3 * math.pi])
+
+    def test_no_root(self, evaluator):
+        """Test an equation without real roots."""
+        result = evaluator.solve("x^2+1", "x", -10, 10)
+        assert not result["success"]
+        assert result["error"] == ERROR_NO_ROOT
+        assert result["roots"] is None
+
+    def test_in_expression(self, evaluator):
+        """Test solve() as a value inside a larger expression."""
+        assert evaluator.evaluate("2*solve(x^3-8, x, 0, 5)")["result"] == Decimal("4")
+
+    def test_invalid_forms(self, evaluator):
+        """Test wrong arity and a constant as the unknown."""
+        assert evaluator.evaluate("solve(x, x, 1)")["error"] == ERROR_INVALID_EXPRESSION
+        assert evaluator.evaluate("solve(x, e, 0, 1)")["error"] == ERROR_INVALID_EXPRESSION
+
+
+def test_backends_agree(monkeypatch):
+    """Test that the vectorized and scalar searches find the same roots."""
+    pytest.importorskip("numpy")
+    source = "sin(3*x)*e^(-x/5)+0.1"
+    found = []
+    for numpy_module in (kernel._numpy(), False):
+        monkeypatch.setattr(kernel, "_numpy_module", numpy_module)
+        evaluator = SafeEvaluator()
+        evaluator.set_angle_mode(ANGLE_MODE_RADIANS)
+        found.append(find_roots(evaluator.compile_kernel(source, ("x",)), 0, 20)["roots"])
+    vectorized, scalar = found
+    assert len(vectorized) == len(scalar) == 10
+    assert vectorized == pytest.approx(scalar, abs=1e-11)
+
+
+def test_calculator_accepts_solve():
+    """Test solve() through validation and formatting."""
+    result = CalculatorEngine().calculate("solve(x^2-9, x, 0, 10)")
+    assert result == {"success": True, "result": "3", "error": None}
@@ -0,0 +1,157 @@
+"""
+Tests for streaming statistics.
+Tests the statistics functions, exact and t-digest quantiles, one-pass
+variance, data files (plain and CSV) and the scalar fallback.
+"""
+import math
+import random
+import statistics as reference
+import pytest
+from decimal import Decimal
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.logic.statistics import StreamingStatistics, summarize
+from src.calculator.batch.dataset import Dataset
+from src.calculator.config.locale import (
+    ERROR_INVALID_EXPRESSION,
+    ERROR_MATH_DOMAIN,
+    ERROR_STATS_NO_DATA,
+    ERROR_STATS_INVALID_VALUE,
+    ERROR_DATA_UNKNOWN_COLUMN,
+    ERROR_DATA_FILE
+)
+
+
+@pytest.fixture
+def engine(backend):
+    """Calculator engine on the selected backend."""
+    return CalculatorEngine()
+
+
+def chunked(values: list, size: int) -> list:
+    """Split values into chunks of `size`."""
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
+
+class TestFunctions:
+    """Test suite for statistics over their arguments."""
+
+    def test_values(self, engine):
+        """Test every statistic against hand-computed values."""
+        data = "2, 4, 4, 4, 5, 5, 7, 9"
+        assert engine.calculate(f"mean({data})")["result"] == "5"
+        assert engine.calculate(f"variance({data})")["result"] == "4.5714285714"
+        assert engine.calculate(f"stdev({data})")["result"] == "2.1380899353"
+        assert engine.calculate(f"min({data})")["result"] == "2"
+        assert engine.calculate(f"max({data})")["result"] == "9"
+        assert engine.calculate(f"median({data})")["result"] == "4.5"
+        assert engine.calculate(f"percentile(25, {data})")["result"] == "4"
+
+    def test_in_expression(self, engine):
+        """Test statistics as values inside larger expressions."""
+        assert engine.calculate("2*max(1, 5)+mean(1, 3)")["result"] == "12"
+        assert engine.calculate("percentile(100, 1, sqrt(16), 2)")["result"] == "4"
+
+    def test_big_ints_exact(self, engine):
+        """Test that min, max and the mean of ints keep every digit."""
+        assert engine.calculate("min(2^60+1, 2^61)")["result"] == str(2 ** 60 + 1)
+        assert engine.calculate("max(3, 2^60+1)")["result"] == str(2 ** 60 + 1)
+        assert engine.calculate("mean(2^60+1, 2^60+3)")["result"] == str(2 ** 60 + 2)
+        assert engine.calculate("mean(1, 2)")["result"] == "1.5"
+        assert engine.calculate("max(0.5, 1)")["result"] == "1"
+
+    def test_errors(self, engine):
+        """Test too little data and an out-of-range percentile."""
+        assert engine.calculate("mean()")["error"] == ERROR_STATS_NO_DATA
+        assert engine.calculate("max()")["error"] == ERROR_STATS_NO_DATA
+        assert engine.calculate("stdev(1)")["error"] == ERROR_STATS_NO_DATA
+        assert engine.calculate("percentile(101, 1, 2)")["error"] == ERROR_MATH_DOMAIN
+
+    def test_in_kernel(self, engine):
+        """Test statistics applied point by point in kernels."""
+        compiled = engine.evaluator.compile_kernel("mean(x, 1, 2)*max(x, y)", ("x", "y"))
+        assert list(compiled([1, 2, 3], [0, 5, 0])) == pytest.approx([4 / 3, 25 / 3, 6])
+
+
+class TestStreaming:
+    """Test suite for StreamingStatistics."""
+
+    def test_chunks_match_reference(self, backend):
+        """Test that chunked accumulation matches the statistics module."""
+        rng = random.Random(3)
+        values = [rng.gauss(10, 3) for _ in range(5000)]
+        summary = summarize(chunked(values, 333))
+        assert summary.count == 5000
+        assert summary.mean() == pytest.approx(reference.fmean(values), rel=1e-12)
+        assert summary.variance() == pytest.approx(reference.variance(values), rel=1e-10)
+        assert summary.median() == pytest.approx(reference.median(values), rel=1e-12)
+        assert summary.min() == min(values) and summary.max() == max(values)
+
+    def test_variance_is_stable(self, backend):
+        """Test one-pass variance with a large offset (no cancellation)."""
+        values = [1e9 + v for v in (4.0, 7.0, 13.0, 16.0)] * 1000
+        summary = summarize(chunked(values, 7))
+        assert summary.variance() == pytest.approx(reference.variance(values), rel=1e-7)
+
+    def test_digest_quantiles(self, backend):
+        """Test t-digest quantile accuracy past the exact limit."""
+        rng = random.Random(5)
+        values = [rng.expovariate(1.0) for _ in range(40000)]
+        summary = StreamingStatistics(exact_values=1000, compression=200)
+        for chunk in chunked(values, 4096):
+            summary.update(chunk)
+        ordered = sorted(values)
+        for q in (0.01, 0.1, 0.5, 0.9, 0.99):
+            exact = ordered[int(q * (len(ordered) - 1))]
+            assert summary.quantile(q) == pytest.approx(exact, rel=0.02)
+        assert summary.quantile(0) == ordered[0]
+        assert summary.quantile(1) == ordered[-1]
+
+    def test_invalid_values(self, backend):
+        """Test that NaN and infinity are rejected."""
+        with pytest.raises(ValueError, match=ERROR_STATS_INVALID_VALUE):
+            StreamingStatistics().update([1.0, math.nan])
+        with pytest.raises(ValueError, match=ERROR_STATS_NO_DATA):
+            StreamingStatistics().mean()
+
+
+class TestFiles:
+    """Test suite for statistics over data files."""
+
+    def test_plain_file(self, engine, tmp_path):
+        """Test a file with one number per line, read in small chunks."""
+        path = tmp_path / "values.txt"
+        path.write_text("\n".join(str(v) for v in range(1, 1001)) + "\n\n")
+        result = engine.statistic("mean", str(path))
+        assert result == {"success": True, "result": "500.5", "error": None, "count": 1000}
+        with Dataset(str(path)) as dataset:
+            chunks = list(dataset.chunks(chunk_size=100))
+        assert len(chunks) > 1
+        assert sum(len(columns[0]) for columns in chunks) == 1000
+
+    def test_csv_column(self, engine, tmp_path):
+        """Test a CSV column selected by header name."""
+        path = tmp_path / "data.csv"
+        path.write_text("x,y\n1,10\n2,20\n3,60\n")
+        assert engine.statistic("max", str(path), column="y")["result"] == "60"
+        assert engine.statistic("percentile", str(path), p=50, column="x")["result"] == "2"
+
+    def test_file_errors(self, engine, tmp_path):
+        """Test missing files, unknown columns and bad values."""
+        path = tmp_path / "data.csv"
+        path.write_text("x,y\n1,10\n2,abc\n")
+        assert engine.statistic("mean", str(tmp_path / "missing.txt"))["error"] == ERROR_DATA_FILE
+        assert engine.statistic("mean", str(path), column="z")["error"] == ERROR_DATA_UNKNOWN_COLUMN
+        assert engine.statistic("mean", str(path), column="y")["error"] == ERROR_STATS_INVALID_VALUE
+        assert engine.statistic("mean", str(path), column="x")["result"] == "1.5"
+
+    def test_invalid_request(self, engine):
+        """Test an unknown statistic and a percentile without p."""
+        assert engine.statistic("mode", [1, 2])["error"] == ERROR_INVALID_EXPRESSION
+        assert engine.statistic("percentile", [1, 2])["error"] == ERROR_INVALID_EXPRESSION
+        assert engine.statistic("stdev", [3, 5])["result"] == "1.4142135624"
+
+
+def test_evaluator_reports_count():
+    """Test the evaluator-level result with Decimal and count."""
+    result = CalculatorEngine().evaluator.statistic("mean", [[1, 2], [3]])
+    assert result == {"success": True, "result": Decimal("2.0"), "error": None, "count": 3}
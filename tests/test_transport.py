@@ -0,0 +1,126 @@
+"""
+Tests for the shared-memory result transport.
+Tests result encoding, error codes, block layout and ordered block delivery.
+"""
+import os
+import pytest
+from src.calculator.batch.transport import (
+    ResultBlock,
+    encode_result,
+    decode_result,
+    RESULT_NUMBER,
+    RESULT_TEXT,
+    ERROR_OTHER,
+    ERROR_MESSAGES,
+    FIRST_ERROR_CODE
+)
+from src.calculator.batch.runner import evaluate_file_blocks
+from src.calculator.logic.calculator import CalculatorEngine
+from src.calculator.config.locale import (
+    ERROR_DIVISION_BY_ZERO,
+    ERROR_MISSING_OPENING_PARENTHESIS
+)
+
+
+EXPRESSIONS = ["2+2", "0.1+0.2", "1/3", "2^100", "1/0", "(1+2", "1+2)", "sqrt(-1)", "-0.5", "1e20"]
+
+
+@pytest.fixture(scope="module")
+def results():
+    """calculate() results covering every row kind."""
+    engine = CalculatorEngine()
+    return [engine.calculate(expression) for expression in EXPRESSIONS]
+
+
+class TestEncoding:
+    """Test suite for row encoding."""
+
+    def test_round_trip(self, results):
+        """Test that decoding restores every result exactly."""
+        for result in results:
+            assert decode_result(*encode_result(result)) == result
+
+    def test_short_numbers_use_value_column(self):
+        """Test that float-exact results need no arena text."""
+        assert encode_result({"success": True, "result": "0.3", "error": None}) == (RESULT_NUMBER, 0.3, "")
+
+    def test_long_numbers_use_arena(self):
+        """Test that results beyond float64 precision keep their digits."""
+        code, _, text = encode_result({"success": True, "result": "12345678901234567890", "error": None})
+        assert code == RESULT_TEXT
+        assert text == "12345678901234567890"
+
+    def test_locale_error_code(self):
+        """Test that locale messages map to their code."""
+        code, _, text = encode_result({"success": False, "result": None, "error": ERROR_DIVISION_BY_ZERO})
+        assert ERROR_MESSAGES[code - FIRST_ERROR_CODE] == ERROR_DIVISION_BY_ZERO
+        assert text == ""
+
+    def test_positional_error_keeps_position(self):
+        """Test that the position of a template message goes to the value column."""
+        message = ERROR_MISSING_OPENING_PARENTHESIS.format(7)
+        code, value, _ = encode_result({"success": False, "result": None, "error": message})
+        assert value == 7
+        assert decode_result(code, value, "")["error"] == message
+
+    def test_unknown_error_in_arena(self):
+        """Test that messages outside the locale table are kept verbatim."""
+        code, _, text = encode_result({"success": False, "result": None, "error": "inny błąd"})
+        assert (code, text) == (ERROR_OTHER, "inny błąd")
+
+
+class TestResultBlock:
+    """Test suite for the shared memory block."""
+
+    def test_write_and_attach(self, results):
+        """Test that another handle reads the same columns."""
+        offsets = list(range(0, 10 * len(results), 10))
+        written = ResultBlock.write(results, offsets)
+        name = written.name
+        written.close()
+
+        with ResultBlock.attach(name) as block:
+            assert len(block) == len(results)
+            assert list(block.line_offsets) == offsets
+            assert [block.result(row) for row in range(len(block))] == results
+            assert block.error_count() == 4
+
+    def test_empty_block(self):
+        """Test a chunk without lines."""
+        written = ResultBlock.write([], [])
+        name = written.name
+        written.close()
+        with ResultBlock.attach(name) as block:
+            assert len(block) == 0
+            assert block.error_count() == 0
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_evaluate_file_blocks_in_order(tmp_path, results, workers):
+    """Test that blocks arrive in input order with all results."""
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join(EXPRESSIONS * 20) + "\n")
+    received = []
+
+    def consume(block):
+        received.extend(block.result(row) for row in range(len(block)))
+
+    stats = evaluate_file_blocks(str(path), consume, workers=workers, chunk_size=50)
+    assert received == results * 20
+    assert stats["errors"] == 4 * 20
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="needs /dev/shm")
+@pytest.mark.parametrize("workers", [0, 2])
+def test_failed_consume_frees_blocks(tmp_path, workers):
+    """Test that blocks queued or in flight are freed when consume() raises."""
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join(EXPRESSIONS * 50) + "\n")
+    before = set(os.listdir("/dev/shm"))
+
+    def consume(block):
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        evaluate_file_blocks(str(path), consume, workers=workers, chunk_size=50)
+    assert set(os.listdir("/dev/shm")) - before == set()
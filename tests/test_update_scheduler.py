@@ -0,0 +1,58 @@
+"""
+Tests for UpdateScheduler.
+Tests coalescing of display updates into one flush per idle cycle.
+"""
+from src.calculator.ui.update_scheduler import UpdateScheduler
+
+
+class TestUpdateScheduler:
+    """Test suite for coalesced display updates."""
+
+    def setup_method(self):
+        """Create a scheduler with a fake idle queue and a fake widget."""
+        self.idle = []
+        self.shown = {}
+        self.scheduler = UpdateScheduler(self.idle.append, initial={"result": "0"})
+
+    def apply(self, key):
+        """Return an apply function recording writes to the fake widget."""
+        return lambda value: self.shown.__setitem__(key, value)
+
+    def test_single_flush_scheduled(self):
+        """Test that many updates schedule only one idle callback."""
+        for text in ["1", "12", "123"]:
+            self.scheduler.set("expression", text, self.apply("expression"))
+        assert len(self.idle) == 1
+        assert self.shown == {}
+
+    def test_flush_applies_latest_value_once(self):
+        """Test that only the latest value per key reaches the widget."""
+        for text in ["1", "12", "123"]:
+            self.scheduler.set("expression", text, self.apply("expression"))
+        self.idle.pop()()
+        assert self.shown == {"expression": "123"}
+        assert self.scheduler.requested_count == 3
+        assert self.scheduler.applied_count == 1
+
+    def test_unchanged_value_skipped(self):
+        """Test that re-setting the shown value causes no Tk update."""
+        self.scheduler.set("result", "0", self.apply("result"))
+        self.scheduler.flush()
+        assert self.scheduler.applied_count == 0
+        assert self.shown == {}
+
+    def test_get_returns_pending_value(self):
+        """Test that readers see values before they are flushed."""
+        assert self.scheduler.get("result") == "0"
+        self.scheduler.set("result", "42", self.apply("result"))
+        assert self.scheduler.get("result") == "42"
+
+    def test_reschedules_after_flush(self):
+        """Test that a new frame gets a new flush."""
+        self.scheduler.set("result", "1", self.apply("result"))
+        self.idle.pop()()
+        self.scheduler.set("result", "2", self.apply("result"))
+        assert len(self.idle) == 1
+        self.scheduler.reset_counters()
+        self.idle.pop()()
+        assert self.scheduler.applied_count == 1
@@ -3,7 +3,12 @@ Tests for InputValidator module.
 Tests parentheses validation, syntax checking, and Polish error messages.
 """
 import pytest
-from src.calculator.logic.validator import InputValidator
+from src.calculator.logic.validator import (
+    InputValidator,
+    IncrementalValidator,
+    CLASS_OPEN,
+    CLASS_OPERATOR
+)
 
 
 class TestInputValidator:
@@ -210,3 +215,80 @@ class TestScientificValidation:
         """Test consecutive ^^ operators are invalid."""
         result = self.validator.validate("2^^3")
         assert result["valid"] is False
+
+
+class TestComparisonValidation:
+    """Test suite for comparison operators in expressions."""
+
+    def setup_method(self):
+        """Initialize validator before each test."""
+        self.validator = InputValidator()
+
+    @pytest.mark.parametrize("expression", [
+        "x<2", "x<=2", "x>2", "x>=-2", "x==2", "x!=2", "1<x<3", "if(x<0, -x, x)",
+    ])
+    def test_valid_comparisons(self, expression):
+        """Test that all comparison operators are accepted."""
+        assert self.validator.validate(expression)["valid"]
+
+    @pytest.mark.parametrize("expression,position", [
+        ("x=3", 1), ("3!", 1), ("2!3", 1), ("x<>2", 2), ("x<", 1), ("x<=*2", 3),
+    ])
+    def test_invalid_comparisons(self, expression, position):
+        """Test assignment, incomplete and consecutive comparison operators."""
+        result = self.validator.validate(expression)
+        assert not result["valid"]
+        assert result["position"] == position
+
+
+class TestIncrementalValidator:
+    """Test suite for per-keystroke validation state."""
+
+    @pytest.mark.parametrize("expression", [
+        "2+3", "(2+3)*4", "sin(90)", "2*-3", "5+", "2++3", "(2+3", "2+3)", "2$3", "",
+        "x<=2", "x<-1", "2==2", "x!=3", "x=3", "3!", "x<>2", "2<", "2!=", "<==", "2=-3",
+        "[[1,2],[3,4]]@[1,1]", "[1,2]@", "[1]@*[2]",
+    ])
+    def test_matches_full_validator(self, expression):
+        """Test that the incremental state agrees with InputValidator."""
+        incremental = IncrementalValidator()
+        for char in expression:
+            incremental.push(char)
+        assert incremental.status() == InputValidator().validate(expression)
+
+    @pytest.mark.parametrize("expression,valid", [
+        ("1\t+\n2", True), ("1+\t*2", False), ("5*\t", False), ("(1\t+2)\n*3", True),
+    ])
+    def test_whitespace_rule(self, expression, valid):
+        """Test that tabs and newlines count as whitespace in both validators."""
+        incremental = IncrementalValidator()
+        incremental.push(expression)
+        assert incremental.valid is valid
+        assert InputValidator().validate(expression)["valid"] is valid
+
+    def test_tracks_depth_and_class(self):
+        """Test paren depth and last token class while typing."""
+        incremental = IncrementalValidator()
+        incremental.push("sin(")
+        assert incremental.depth == 1
+        assert incremental.last_class == CLASS_OPEN
+        incremental.push("90)")
+        assert incremental.depth == 0
+        assert incremental.valid
+
+    def test_backspace_pops_state(self):
+        """Test that pop restores the previous state."""
+        incremental = IncrementalValidator()
+        incremental.push("2+")
+        assert not incremental.valid
+        incremental.pop()
+        assert incremental.valid
+        assert len(incremental) == 1
+
+    def test_pop_token(self):
+        """Test removing a multi-character token at once."""
+        incremental = IncrementalValidator()
+        incremental.push("2*")
+        incremental.push("sqrt(")
+        incremental.pop(len("sqrt("))
+        assert incremental.last_class == CLASS_OPERATOR
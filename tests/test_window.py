@@ -0,0 +1,71 @@
+"""
+Tests for lazy construction of the GUI window.
+Tests that the scientific rows are built on the first switch to
+scientific mode and that the history panel is built after the first frame
+(or on first use) with the callbacks and entries recorded before it.
+Skipped without customtkinter or a display.
+"""
+import pytest
+from src.calculator.config.locale import BTN_MODE_BASIC, BTN_MODE_SCIENTIFIC
+
+tkinter = pytest.importorskip("tkinter")
+pytest.importorskip("customtkinter")
+calculator_window = pytest.importorskip("src.calculator.ui.calculator_window")
+
+
+def scientific_keys(window) -> list:
+    """Keys of the scientific buttons created so far."""
+    return [key for key in window.button_panel.buttons if key.startswith("sci")]
+
+
+@pytest.fixture
+def window():
+    """Hidden lazy calculator window (skipped without a display)."""
+    try:
+        window = calculator_window.CalculatorWindow()
+    except tkinter.TclError:
+        pytest.skip("No display")
+    window.withdraw()
+    yield window
+    window.destroy()
+
+
+def test_scientific_rows_built_on_first_toggle(window):
+    """Scientific buttons appear on the first toggle, and only once."""
+    assert scientific_keys(window) == []
+    window._on_mode_change(BTN_MODE_BASIC)
+    assert scientific_keys(window) == []
+    window._on_mode_change(BTN_MODE_SCIENTIFIC)
+    created = {key: window.button_panel.buttons[key] for key in scientific_keys(window)}
+    assert created
+    window._on_mode_change(BTN_MODE_BASIC)
+    window._on_mode_change(BTN_MODE_SCIENTIFIC)
+    assert {key: window.button_panel.buttons[key] for key in scientific_keys(window)} == created
+
+
+def test_history_recorded_before_panel(window):
+    """History used before the panel exists shows up once it is built."""
+    assert window.history_panel is None
+    recalled = []
+    window.set_history_recall_callback(recalled.append)
+    window.add_history_entry("2+2", "4")
+    panel = window.history_panel
+    assert panel is not None
+    assert len(panel._entry_widgets) == 1
+    panel._on_entry_click("4")
+    assert recalled == ["4"]
+
+
+def test_history_panel_built_after_first_frame(window):
+    """The lazy window builds the panel from the event loop, keeping callbacks."""
+    assert window.history_panel is None
+    cleared = []
+    window.set_history_clear_callback(lambda: cleared.append(True))
+    for _ in range(3):
+        window.update()
+    panel = window.history_panel
+    assert panel is not None
+    panel._on_clear()
+    assert cleared == [True]
+    window.add_history_entry("1+1", "2")
+    assert window.history_panel is panel and len(panel._entry_widgets) == 1